@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import ast
 import functools
 import os
 import sys
@@ -19,7 +18,10 @@ from jamb.storage.items import dump_yaml
 
 if TYPE_CHECKING:
     from jamb.core.models import Item
+    from jamb.coverage.history import HistoryStore
     from jamb.publish import OutputFormat, PublishDocument
+    from jamb.pytest_plugin.events import EventTarget, RunProgress
+    from jamb.storage.test_index import ReferenceIndex
 
 F = TypeVar("F", bound=Callable[..., Any])
 
@@ -362,7 +364,10 @@ def check(documents: str | None, root: Path | None) -> None:
     click.echo(f"Checking coverage for documents: {', '.join(test_docs)}")
 
     # Scan test files for requirement markers
-    linked_items = _scan_tests_for_requirements(root or Path.cwd())
+    project_root = root or Path.cwd()
+    index = _load_reference_index(project_root)
+    linked_items = _scan_tests_for_requirements(project_root, index)
+    _save_reference_index(index)
 
     # Detect unknown UIDs (UIDs in tests that don't exist in graph)
     unknown_items = {uid for uid in linked_items if uid not in graph.items}
@@ -403,7 +408,7 @@ def check(documents: str | None, root: Path | None) -> None:
             sys.exit(1)
 
 
-def _scan_tests_for_requirements(root: Path) -> set[str]:
+def _scan_tests_for_requirements(root: Path, index: ReferenceIndex | None = None) -> set[str]:
     """Scan test files for requirement markers.
 
     Walks all ``test_*.py`` files under *root*, parses them into ASTs,
@@ -416,73 +421,53 @@ def _scan_tests_for_requirements(root: Path) -> set[str]:
 
     Args:
         root: Project root directory to search for test files.
+        index: Index to read the test files through (default: a fresh
+            in-memory index).
 
     Returns:
         Set of requirement UID strings found in test markers.
     """
+    from jamb.storage.test_index import ReferenceIndex
+
+    if index is None:
+        index = ReferenceIndex()
     linked: set[str] = set()
 
-    # Find test files
-    for pattern in ("test_*.py", "*_test.py"):
-        for test_file in root.rglob(pattern):
-            try:
-                source = test_file.read_text()
-                tree = ast.parse(source)
-
-                for node in ast.walk(tree):
-                    # Look for pytest.mark.requirement(...)
-                    if isinstance(node, ast.Call) and _is_requirement_marker(node):
-                        for arg in node.args:
-                            if isinstance(arg, ast.Constant) and isinstance(arg.value, str):
-                                linked.add(arg.value)
-                        for kw in node.keywords:
-                            if isinstance(kw.value, ast.Constant) and isinstance(kw.value.value, str):
-                                linked.add(kw.value.value)
-            except SyntaxError as e:
-                click.echo(f"Warning: Skipping {test_file} (syntax error: {e})", err=True)
-                continue
-            except OSError as e:
-                click.echo(f"Warning: Skipping {test_file} (read error: {e})", err=True)
-                continue
-            except UnicodeDecodeError as e:
-                click.echo(f"Warning: Skipping {test_file} (encoding error: {e})", err=True)
-                continue
+    for indexed in index.scan(root):
+        if indexed.error is not None:
+            click.echo(f"Warning: Skipping {indexed.path} ({indexed.error})", err=True)
+            continue
+        linked.update(ref[3] for ref in indexed.references)
 
     return linked
 
 
-def _is_requirement_marker(node: ast.Call) -> bool:
-    """Check if an AST Call node is a requirement marker.
-
-    Handles multiple import styles:
-    - pytest.mark.requirement(...)
-    - mark.requirement(...)
-    - requirement(...)
+def _load_reference_index(root: Path) -> ReferenceIndex:
+    """Load the test reference index cached under *root*.
 
     Args:
-        node: An ``ast.Call`` node to inspect.
+        root: Project root directory.
 
     Returns:
-        ``True`` if the node represents a requirement marker call,
-        ``False`` otherwise.
+        The index, saved to ``.jamb-cache/test-references.json`` under
+        *root* by :func:`_save_reference_index`.
     """
-    func = node.func
+    from jamb.storage.test_index import TEST_INDEX_CACHE, ReferenceIndex
+    from jamb.storage.validation_cache import CACHE_DIR
 
-    # @pytest.mark.requirement(...)
-    if isinstance(func, ast.Attribute) and func.attr == "requirement":
-        if (
-            isinstance(func.value, ast.Attribute)
-            and func.value.attr == "mark"
-            and isinstance(func.value.value, ast.Name)
-            and func.value.value.id == "pytest"
-        ):
-            return True
-        # @mark.requirement(...)
-        if isinstance(func.value, ast.Name) and func.value.id == "mark":
-            return True
+    return ReferenceIndex.load(root / CACHE_DIR / TEST_INDEX_CACHE)
 
-    # @requirement(...)
-    return bool(isinstance(func, ast.Name) and func.id == "requirement")
+
+def _save_reference_index(index: ReferenceIndex) -> None:
+    """Save the test reference index, warning if it cannot be written.
+
+    Args:
+        index: The index.
+    """
+    try:
+        index.save()
+    except OSError as e:
+        click.echo(f"Warning: Could not write test reference cache: {e}", err=True)
 
 
 # =============================================================================
@@ -543,6 +528,7 @@ def reorder(prefix: str, no_update_tests: bool, clean_orphans: bool, root: Path
 
     doc_path = dag.document_paths[prefix]
     config = dag.documents[prefix]
+    index = _load_reference_index(project_root)
     all_doc_paths = dict(dag.document_paths)
 
     # Build set of valid UIDs across all documents
@@ -563,13 +549,13 @@ def reorder(prefix: str, no_update_tests: bool, clean_orphans: bool, root: Path
 
     # Check for collisions if we're updating tests
     if preview_rename_map and not no_update_tests:
-        collisions = detect_reference_collisions(preview_rename_map, project_root, valid_uids)
+        collisions = detect_reference_collisions(preview_rename_map, project_root, valid_uids, index)
         if collisions:
             if clean_orphans:
                 # Remove orphaned references that would collide
                 orphan_uids = {ref.uid for _, ref in collisions}
                 for orphan_uid in orphan_uids:
-                    orphan_changes = remove_test_reference(orphan_uid, project_root, remove_empty=True)
+                    orphan_changes = remove_test_reference(orphan_uid, project_root, remove_empty=True, index=index)
                     if orphan_changes:
                         click.echo(f"Removed orphaned references to {orphan_uid}")
             else:
@@ -592,12 +578,13 @@ def reorder(prefix: str, no_update_tests: bool, clean_orphans: bool, root: Path
     if rename_map and not no_update_tests:
         # Cast to dict[str, str] since we know rename_map contains strings
         rename_map_dict = {str(k): str(v) for k, v in rename_map.items()}  # type: ignore[union-attr]
-        test_changes = update_test_references(rename_map_dict, project_root)
+        test_changes = update_test_references(rename_map_dict, project_root, index)
         if test_changes:
             click.echo(f"Updated test references in {len(test_changes)} files:")
             for test_file, changes in test_changes.items():
                 rel_path = test_file.relative_to(project_root) if test_file.is_relative_to(project_root) else test_file
                 click.echo(f"  {rel_path}: {', '.join(changes)}")
+        _save_reference_index(index)
 
 
 # =============================================================================
@@ -870,7 +857,9 @@ def item_add(
 
         # Update test references if items were shifted
         if rename_map and not no_update_tests:
-            test_changes = update_test_references(rename_map, project_root)
+            index = _load_reference_index(project_root)
+            test_changes = update_test_references(rename_map, project_root, index)
+            _save_reference_index(index)
             if test_changes:
                 click.echo(f"Updated test references in {len(test_changes)} file(s)")
                 for test_file, changes in test_changes.items():
@@ -1005,7 +994,8 @@ def item_remove(uid: str, force: bool, no_update_tests: bool, root: Path | None)
         pass  # Best-effort warning
 
     # Check for test references
-    test_refs = find_test_references(project_root, uid)
+    index = _load_reference_index(project_root)
+    test_refs = find_test_references(project_root, uid, index)
     has_test_refs = len(test_refs) > 0
 
     if test_refs and not force:
@@ -1023,7 +1013,7 @@ def item_remove(uid: str, force: bool, no_update_tests: bool, root: Path | None)
 
     # Remove orphaned test references unless --no-update-tests is set
     if has_test_refs and not no_update_tests:
-        test_changes = remove_test_reference(uid, project_root, remove_empty=True)
+        test_changes = remove_test_reference(uid, project_root, remove_empty=True, index=index)
         if test_changes:
             click.echo(f"Removed test references from {len(test_changes)} file(s)")
             for test_file, changes in test_changes.items():
@@ -1031,6 +1021,7 @@ def item_remove(uid: str, force: bool, no_update_tests: bool, root: Path | None)
                 click.echo(f"  {rel_path}: {', '.join(changes)}")
     elif has_test_refs:
         click.echo("Note: Update test files to remove orphaned references.")
+    _save_reference_index(index)
 
 
 @item.command("edit")
@@ -1768,6 +1759,51 @@ def template(path: str, include_docx: bool) -> None:
     is_flag=True,
     help="Display all warning-level issues as errors",
 )
+@click.option(
+    "--cache",
+    "use_cache",
+    is_flag=True,
+    help="Reuse results for unchanged items from .jamb-cache/",
+)
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Number of processes reading and checking documents",
+)
+@click.option(
+    "--staged",
+    is_flag=True,
+    help="Only check staged item files and the items they link with",
+)
+@click.option(
+    "--max-issues",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Stop after reporting this many issues",
+)
+@click.option(
+    "--fail-fast",
+    is_flag=True,
+    help="Stop at the first error",
+)
+@click.option(
+    "--format",
+    "report_format",
+    type=click.Choice(["json", "sarif", "junit"]),
+    default=None,
+    help="Also write reported issues to --output in this format",
+)
+@click.option(
+    "--output",
+    "-o",
+    "output_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Report file for --format, written as issues are found",
+)
 @_cli_error_handler
 def validate(
     verbose: int,
@@ -1778,6 +1814,13 @@ def validate(
     skip_prefix: tuple[str, ...],
     warn_all: bool,
     error_all: bool,
+    use_cache: bool,
+    jobs: int,
+    staged: bool,
+    max_issues: int | None,
+    fail_fast: bool,
+    report_format: str | None,
+    output_path: Path | None,
 ) -> None:
     r"""Validate the requirements tree.
 
@@ -1787,6 +1830,7 @@ def validate(
     - Invalid or missing links
     - Suspect links (items needing re-review)
     - Items without required links
+    - Custom attributes that break the document schema
 
     \b
     Examples::
@@ -1795,14 +1839,55 @@ def validate(
         jamb validate -v           # Verbose output
         jamb validate --skip UT    # Skip unit test document
         jamb validate -S           # Skip suspect checks
+        jamb validate --cache      # Only re-check changed items
+        jamb validate -j 4         # Use 4 processes
+        jamb validate --staged     # Pre-commit check of staged items
+        jamb validate --fail-fast  # Stop at the first error
+        jamb validate --format sarif -o jamb.sarif  # Also write a SARIF log
     """
     from jamb.storage import build_traceability_graph, discover_documents
-    from jamb.storage.validation import validate as run_validate
+    from jamb.storage.validation import iter_validate
+    from jamb.storage.validation_cache import ValidationCache
+    from jamb.storage.validation_report import open_issue_writer
+
+    if use_cache and jobs > 1:
+        click.echo("Error: --cache cannot be combined with --jobs", err=True)
+        sys.exit(1)
+    if use_cache and staged:
+        click.echo("Error: --cache cannot be combined with --staged", err=True)
+        sys.exit(1)
+    if (report_format is None) != (output_path is None):
+        click.echo("Error: --format and --output must be used together", err=True)
+        sys.exit(1)
+
+    cache = ValidationCache.load() if use_cache else None
 
     dag = discover_documents()
-    graph = build_traceability_graph(dag, include_inactive=True)
 
-    issues = run_validate(
+    uids = None
+    if staged:
+        from jamb.storage.changes import get_staged_changes
+        from jamb.storage.graph_builder import build_link_closure_graph
+
+        changes = get_staged_changes(dag)
+        if changes.documents:
+            # A changed configuration can affect every item
+            if not quiet:
+                click.echo("Document configuration is staged; validating the whole tree")
+        elif not changes.item_uids:
+            click.echo("Validation passed - no staged items")
+            return
+        else:
+            graph, uids = build_link_closure_graph(dag, changes.item_uids)
+            if verbose:
+                click.echo(
+                    f"Checking {len(uids)} staged and child items ({len(graph.items)} loaded, "
+                    f"{len(changes.item_uids)} staged)"
+                )
+    if uids is None:
+        graph = build_traceability_graph(dag, include_inactive=True, cache=cache, jobs=jobs)
+
+    issues = iter_validate(
         dag,
         graph,
         check_links=True,
@@ -1810,34 +1895,67 @@ def validate(
         check_review=not no_review_check,
         check_children=not no_child_check,
         skip_prefixes=list(skip_prefix),
+        cache=cache,
+        jobs=jobs,
+        uids=uids,
     )
+    writer = open_issue_writer(report_format, output_path, dag) if report_format and output_path else None
 
-    # Promote/demote issue levels based on flags
-    for issue in issues:
-        if warn_all and issue.level == "info":
-            issue.level = "warning"
-        if error_all and issue.level == "warning":
-            issue.level = "error"
-
-    # Display issues
-    has_errors = False
-    for issue in issues:
-        if quiet and issue.level not in ("error",):
-            continue
-        if not verbose and issue.level == "info":
-            continue
-        click.echo(str(issue))
-        if issue.level == "error":
-            has_errors = True
+    # Display issues as they are found
+    counts = {"error": 0, "warning": 0, "info": 0}
+    reported = 0
+    stopped_by = None
+    try:
+        for issue in issues:
+            # Promote/demote issue levels based on flags
+            if warn_all and issue.level == "info":
+                issue.level = "warning"
+            if error_all and issue.level == "warning":
+                issue.level = "error"
+            counts[issue.level] += 1
+
+            if quiet and issue.level not in ("error",):
+                continue
+            if not verbose and issue.level == "info":
+                continue
+            click.echo(str(issue))
+            if writer is not None:
+                writer.write(issue)
+            reported += 1
+
+            if fail_fast and issue.level == "error":
+                stopped_by = "--fail-fast"
+                break
+            if max_issues is not None and reported >= max_issues:
+                stopped_by = "--max-issues"
+                break
+    finally:
+        if writer is not None:
+            writer.close()
+
+    # A partial run would drop the unvisited items from the cache
+    if cache is not None and stopped_by is None:
+        try:
+            cache.save()
+        except OSError as e:
+            click.echo(f"Warning: Could not write validation cache: {e}", err=True)
+        if verbose:
+            click.echo(
+                f"Validation cache: reused {cache.files_reused} of "
+                f"{cache.files_reused + cache.files_read} item files, "
+                f"{cache.items_reused} of {cache.items_reused + cache.items_checked} item checks"
+            )
 
-    if not issues:
+    if stopped_by is not None:
+        click.echo(f"\nValidation stopped after {reported} issues ({stopped_by}); remaining checks were skipped")
+        if counts["error"]:
+            sys.exit(1)
+    elif not any(counts.values()):
         click.echo("Validation passed - no issues found")
-    elif not has_errors:
-        warnings_count = sum(1 for i in issues if i.level == "warning")
-        click.echo(f"\nValidation passed with {warnings_count} warnings")
+    elif not counts["error"]:
+        click.echo(f"\nValidation passed with {counts['warning']} warnings")
     else:
-        errors_count = sum(1 for i in issues if i.level == "error")
-        click.echo(f"\nValidation failed with {errors_count} errors")
+        click.echo(f"\nValidation failed with {counts['error']} errors")
         sys.exit(1)
 
 
@@ -2075,6 +2193,12 @@ def import_yaml_cmd(
     multiple=True,
     help="Document prefix(es) to exclude from the matrix (repeatable)",
 )
+@click.option(
+    "--durations",
+    is_flag=True,
+    default=False,
+    help="Add a Duration column to the test records matrix",
+)
 @_cli_error_handler
 def matrix(
     output: Path,
@@ -2083,6 +2207,7 @@ def matrix(
     test_records: bool,
     include_ancestors: bool,
     trace_to_ignore: tuple[str, ...],
+    durations: bool,
 ) -> None:
     """Generate matrix from saved coverage data.
 
@@ -2094,6 +2219,7 @@ def matrix(
         jamb matrix trace.html --trace-from=UN
         jamb matrix trace.html --trace-from=SYS
         jamb matrix test-records.html --test-records
+        jamb matrix test-records.html --test-records --durations
         jamb matrix trace.html --trace-from=UN --include-ancestors
 
     The .jamb file is automatically created when running pytest with --jamb.
@@ -2133,6 +2259,7 @@ def matrix(
             str(output),
             output_format,
             metadata=metadata,
+            show_duration=durations or config.test_matrix_durations,
         )
         click.echo(f"Generated test records matrix: {output}")
     else:
@@ -2168,6 +2295,67 @@ def matrix(
         click.echo(f"Generated trace matrix: {output}")
 
 
+# =============================================================================
+# Coverage Commands
+# =============================================================================
+
+
+@cli.group("coverage")
+def coverage_group() -> None:
+    """Manage saved coverage (.jamb) files.
+
+    Provides subcommands for combining coverage data produced by
+    separate pytest runs.
+    """
+    pass
+
+
+@coverage_group.command("merge")
+@click.argument(
+    "inputs",
+    nargs=-1,
+    required=True,
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+)
+@click.option(
+    "--output",
+    "-o",
+    "output_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=".jamb",
+    help="Merged coverage file (default: .jamb)",
+)
+@_cli_error_handler
+def coverage_merge(inputs: tuple[Path, ...], output_path: Path) -> None:
+    """Merge sharded coverage files into one.
+
+    INPUTS are .jamb files from test runs split across machines. All shards
+    must be produced from the same requirements tree. When the same test is
+    reported by several shards with different outcomes, the most severe
+    outcome wins (error > failed > passed > skipped).
+
+    \b
+    Examples:
+        jamb coverage merge shard1.jamb shard2.jamb -o merged.jamb
+        jamb coverage merge shards/*.jamb
+    """
+    from jamb.coverage.merge import merge_coverage
+
+    stats = merge_coverage([str(p) for p in inputs], str(output_path))
+
+    click.echo(
+        f"Merged {stats['shards']} coverage files ({stats['items']} items, {stats['links']} test links) "
+        f"into {output_path}"
+    )
+    if stats["conflicts"]:
+        click.echo(
+            click.style(
+                f"Resolved conflicting outcomes of {stats['conflicts']} test(s) (most severe outcome kept)",
+                fg="yellow",
+            )
+        )
+
+
 @cli.command("lock-tc")
 @click.option(
     "--test-dir",
@@ -2213,23 +2401,7 @@ def lock_tc(
     # Load jamb config for tc_id_prefix
     config = load_config()
 
-    # Auto-discover .jamb file if not specified
-    if coverage_path is None:
-        coverage_path = Path(".jamb")
-        if not coverage_path.exists():
-            # Search parent directories
-            for parent in Path.cwd().parents:
-                candidate = parent / ".jamb"
-                if candidate.exists():
-                    coverage_path = candidate
-                    break
-
-    if not coverage_path.exists():
-        click.echo(
-            "Error: No .jamb file found. Run 'pytest --jamb' first.",
-            err=True,
-        )
-        sys.exit(1)
+    coverage_path = _discover_coverage_file(coverage_path)
 
     # Load coverage data
     coverage, _, _, manual_tc_ids = load_coverage(str(coverage_path))
@@ -2267,7 +2439,10 @@ def lock_tc(
     # Type narrowing: test_dir is guaranteed to be set at this point
     assert test_dir is not None
     # Insert tc_id markers
-    changes = insert_tc_id_markers(tc_mapping, test_dir, dry_run=dry_run)
+    index = _load_reference_index(Path.cwd())
+    changes = insert_tc_id_markers(tc_mapping, test_dir, dry_run=dry_run, index=index)
+    if not dry_run:
+        _save_reference_index(index)
 
     if not changes:
         click.echo("No changes needed - all tests already have tc_id markers or no test files found.")
@@ -2286,5 +2461,658 @@ def lock_tc(
         click.echo(f"\nLocked TC IDs in {len(changes)} file(s).")
 
 
+def _find_coverage_file() -> Path | None:
+    """Return the ``.jamb`` file in the cwd or its parents, if any."""
+    for directory in (Path("."), *Path.cwd().parents):
+        candidate = directory / ".jamb"
+        if candidate.exists():
+            return candidate
+    return None
+
+
+def _discover_coverage_file(coverage_path: Path | None) -> Path:
+    """Return *coverage_path*, or find ``.jamb`` in the cwd or its parents.
+
+    Exits with an error if no coverage file exists.
+    """
+    if coverage_path is None:
+        coverage_path = _find_coverage_file() or Path(".jamb")
+
+    if not coverage_path.exists():
+        click.echo(
+            "Error: No .jamb file found. Run 'pytest --jamb' first.",
+            err=True,
+        )
+        sys.exit(1)
+    return coverage_path
+
+
+# =============================================================================
+# Test Selection Commands
+# =============================================================================
+
+
+@cli.command("impact")
+@click.argument("ref", required=False)
+@click.option(
+    "--suspect",
+    is_flag=True,
+    help="Report the items downstream of suspect links instead of a git diff.",
+)
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(["text", "json"]),
+    default="text",
+    show_default=True,
+    help="Output format for --suspect.",
+)
+@click.option(
+    "--coverage",
+    "coverage_path",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    default=None,
+    help="Path to .jamb coverage file (default: auto-discover).",
+)
+@click.option(
+    "--root",
+    type=click.Path(exists=True, path_type=Path),
+    help="Project root directory",
+)
+@_cli_error_handler
+def impact(ref: str | None, suspect: bool, output_format: str, coverage_path: Path | None, root: Path | None) -> None:
+    """List tests affected by changes since a git REF.
+
+    Compares the working tree against REF with ``git diff``, maps changed
+    item files to their UIDs and descendants, and prints the node IDs of
+    tests from the last ``pytest --jamb`` run that trace to them, followed
+    by changed test modules. Node IDs go to stdout, one per line, so they
+    can be passed straight to pytest; the summary goes to stderr.
+
+    With --suspect, no REF is needed: items whose content no longer matches
+    the link hashes stored by their children are taken as changed, and
+    every item downstream of them is listed by depth, with its linked tests
+    if a .jamb file exists.
+
+    \b
+    Examples:
+        jamb impact origin/main
+        jamb impact HEAD~1 | xargs pytest
+        jamb impact --suspect
+        jamb impact --suspect --format json
+    """
+    from jamb.config.loader import load_config
+    from jamb.coverage.serializer import load_coverage
+    from jamb.storage import build_traceability_graph, discover_documents
+    from jamb.storage.changes import get_changes_since
+
+    if suspect:
+        if ref is not None:
+            click.echo("Error: REF cannot be combined with --suspect", err=True)
+            sys.exit(1)
+        _suspect_impact(output_format, coverage_path, root)
+        return
+    if ref is None:
+        click.echo("Error: Missing argument 'REF' (or use --suspect)", err=True)
+        sys.exit(1)
+    if output_format != "text":
+        click.echo("Error: --format json requires --suspect", err=True)
+        sys.exit(1)
+
+    coverage_path = _discover_coverage_file(coverage_path)
+    coverage, _, _, _ = load_coverage(str(coverage_path))
+
+    dag = discover_documents(root)
+    config = load_config()
+    graph = build_traceability_graph(dag, exclude_patterns=config.exclude_patterns or None)
+    changes = get_changes_since(ref, dag, root)
+    affected_uids = changes.affected_uids(graph)
+
+    # Node IDs in the .jamb file are relative to the pytest rootdir, which
+    # is where the coverage file is written.
+    test_root = coverage_path.resolve().parent
+    nodeids: set[str] = set()
+    known_files: set[Path] = set()
+    for item_cov in coverage.values():
+        for link in item_cov.linked_tests:
+            test_file = test_root / link.test_nodeid.split("::")[0]
+            known_files.add(test_file.resolve())
+            if link.item_uid in affected_uids or changes.touches_test_file(test_file):
+                nodeids.add(link.test_nodeid)
+
+    # Test modules that are new or carry no requirement markers yet
+    new_test_files = sorted(
+        path for path in changes.python_files if path.exists() and path not in known_files and _is_test_module(path)
+    )
+
+    click.echo(
+        f"{len(changes.item_uids)} changed items, {len(changes.documents)} changed documents, "
+        f"{len(changes.python_files)} changed Python files since {ref}; "
+        f"{len(affected_uids)} affected items",
+        err=True,
+    )
+    for nodeid in sorted(nodeids):
+        click.echo(nodeid)
+    for path in new_test_files:
+        click.echo(os.path.relpath(path, Path.cwd()))
+
+
+def _suspect_impact(output_format: str, coverage_path: Path | None, root: Path | None) -> None:
+    """Print the downstream impact of suspect links for ``jamb impact --suspect``."""
+    import json
+
+    from jamb.config.loader import load_config
+    from jamb.coverage.serializer import load_coverage
+    from jamb.storage import build_traceability_graph, discover_documents
+    from jamb.storage.changes import suspect_impact
+
+    if coverage_path is None:
+        coverage_path = _find_coverage_file()
+    tests_by_uid: dict[str, list[str]] = {}
+    if coverage_path is not None:
+        coverage, _, _, _ = load_coverage(str(coverage_path))
+        for uid, item_cov in coverage.items():
+            tests_by_uid[uid] = list(dict.fromkeys(link.test_nodeid for link in item_cov.linked_tests))
+
+    dag = discover_documents(root)
+    config = load_config()
+    graph = build_traceability_graph(dag, exclude_patterns=config.exclude_patterns or None)
+    impacted = suspect_impact(graph)
+
+    # Tests ranked by the depth of the nearest item they verify
+    tests = list(dict.fromkeys(nodeid for entry in impacted for nodeid in tests_by_uid.get(entry.uid, [])))
+    changed = sum(1 for entry in impacted if entry.depth == 0)
+
+    if output_format == "json":
+        data = {
+            "items": [
+                {
+                    "uid": entry.uid,
+                    "document": graph.items[entry.uid].document_prefix,
+                    "depth": entry.depth,
+                    "suspect_links": entry.suspect_links,
+                    "via": entry.via,
+                    "tests": tests_by_uid.get(entry.uid, []),
+                }
+                for entry in impacted
+            ],
+            "tests": tests,
+        }
+        click.echo(json.dumps(data, indent=2))
+        return
+
+    click.echo(
+        f"{changed} changed items, {len(impacted) - changed} affected downstream items, {len(tests)} linked tests",
+        err=True,
+    )
+    for entry in impacted:
+        if entry.depth == 0:
+            reason = "changed"
+        elif entry.suspect_links:
+            reason = f"suspect link to {', '.join(entry.suspect_links)}"
+        else:
+            reason = f"via {entry.via}"
+        click.echo(f"{entry.depth}  {graph.items[entry.uid].document_prefix}:{entry.uid}  {reason}")
+        for nodeid in tests_by_uid.get(entry.uid, []):
+            click.echo(f"     {nodeid}")
+
+
+def _is_test_module(path: Path) -> bool:
+    """Return True if *path* follows pytest's default test module naming."""
+    return path.name.startswith("test_") or path.name.endswith("_test.py")
+
+
+def _parse_budget(ctx: click.Context, param: click.Parameter, value: str | None) -> float | None:
+    """Click callback converting ``--budget`` text to seconds."""
+    if value is None:
+        return None
+    from jamb.coverage.plan import parse_duration
+
+    try:
+        return parse_duration(value)
+    except ValueError as e:
+        raise click.BadParameter(str(e)) from e
+
+
+@cli.command("plan")
+@click.option(
+    "--cover-all",
+    is_flag=True,
+    help="Select a small set of tests that touches every testable requirement.",
+)
+@click.option(
+    "--budget",
+    callback=_parse_budget,
+    metavar="DURATION",
+    help="Maximum estimated run time of the plan (e.g. 90, 120s, 2m, 1h).",
+)
+@click.option(
+    "--weight",
+    type=click.Choice(["duration", "count"]),
+    default="duration",
+    show_default=True,
+    help="Prefer fast tests (duration) or fewest tests (count).",
+)
+@click.option(
+    "--coverage",
+    "coverage_path",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    default=None,
+    help="Path to .jamb coverage file (default: auto-discover).",
+)
+@click.option(
+    "--output",
+    "-o",
+    "output_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Write node IDs to this file for 'pytest --jamb --jamb-select-nodeids FILE' instead of stdout.",
+)
+@_cli_error_handler
+def plan(
+    cover_all: bool,
+    budget: float | None,
+    weight: str,
+    coverage_path: Path | None,
+    output_path: Path | None,
+) -> None:
+    """Plan a reduced test run from the last coverage file.
+
+    With --cover-all, picks tests greedily by requirements covered per
+    second of recorded run time until every testable requirement is
+    touched at least once, which makes a fast traceability smoke run.
+    Node IDs are printed one per line; the summary goes to stderr.
+
+    \b
+    Examples:
+        jamb plan --cover-all
+        jamb plan --cover-all --budget 2m -o smoke.txt
+        pytest --jamb --jamb-select-nodeids smoke.txt
+    """
+    from jamb.coverage.plan import plan_cover_all
+    from jamb.coverage.serializer import load_coverage
+
+    if not cover_all:
+        click.echo("Error: Specify a planning strategy: --cover-all", err=True)
+        sys.exit(1)
+
+    coverage_path = _discover_coverage_file(coverage_path)
+    coverage, _, _, _ = load_coverage(str(coverage_path))
+
+    result = plan_cover_all(coverage, budget=budget, weight_by_duration=weight == "duration")
+
+    if output_path is not None:
+        output_path.write_text("".join(f"{nodeid}\n" for nodeid in result.nodeids), encoding="utf-8")
+    else:
+        for nodeid in result.nodeids:
+            click.echo(nodeid)
+
+    total = len(result.covered_uids) + len(result.dropped_uids) + len(result.uncoverable_uids)
+    click.echo(
+        f"Selected {len(result.nodeids)} tests covering {len(result.covered_uids)} of {total} testable "
+        f"requirements (estimated {result.estimated_duration:.1f}s)"
+        + (f"; wrote {output_path}" if output_path is not None else ""),
+        err=True,
+    )
+    if result.dropped_uids:
+        click.echo(
+            click.style(
+                f"Over budget, not covered: {', '.join(sorted(result.dropped_uids))}",
+                fg="yellow",
+            ),
+            err=True,
+        )
+    if result.uncoverable_uids:
+        click.echo(
+            click.style(
+                f"No linked tests: {', '.join(sorted(result.uncoverable_uids))}",
+                fg="yellow",
+            ),
+            err=True,
+        )
+
+
+def _parse_event_target(ctx: click.Context, param: click.Parameter, value: str) -> EventTarget:
+    """Click callback converting ``unix:PATH``/``file:PATH`` to an event target."""
+    from jamb.pytest_plugin.events import parse_event_target
+
+    try:
+        return parse_event_target(value)
+    except ValueError as e:
+        raise click.BadParameter(str(e)) from e
+
+
+@cli.command("watch-run")
+@click.argument("source", callback=_parse_event_target)
+@click.option(
+    "--no-follow",
+    is_flag=True,
+    help="Summarize the events already in a file: source and exit instead of waiting for more.",
+)
+@click.option(
+    "--interval",
+    type=click.FloatRange(min=0),
+    default=0.5,
+    show_default=True,
+    help="Minimum seconds between screen refreshes.",
+)
+@_cli_error_handler
+def watch_run(source: EventTarget, no_follow: bool, interval: float) -> None:
+    """Show live requirement coverage of a running pytest session.
+
+    SOURCE is the event stream written by 'pytest --jamb --jamb-events':
+    unix:PATH listens on a Unix socket that pytest connects to (start the
+    viewer first), file:PATH follows a JSON Lines file (a file left by a
+    finished session is emptied first, so the viewer waits for the next
+    one). Per test document, the view shows how many testable requirements
+    have a finished test and whether those tests passed. The viewer exits
+    when the session ends.
+
+    \b
+    Examples:
+        jamb watch-run unix:/tmp/jamb.sock
+        pytest --jamb --jamb-events=unix:/tmp/jamb.sock
+        jamb watch-run file:events.jsonl --no-follow
+    """
+    import time
+
+    from jamb.pytest_plugin.events import RunProgress, read_events
+
+    progress = RunProgress()
+    live = sys.stdout.isatty()
+    last_render = 0.0
+    try:
+        for event in read_events(source, follow=not no_follow):
+            progress.update(event)
+            if live and time.monotonic() - last_render >= interval:
+                click.clear()
+                _echo_run_progress(progress)
+                last_render = time.monotonic()
+    except KeyboardInterrupt:
+        pass
+
+    if live:
+        click.clear()
+    _echo_run_progress(progress)
+
+
+def _echo_run_progress(progress: RunProgress) -> None:
+    """Print a :class:`~jamb.pytest_plugin.events.RunProgress` summary."""
+    counts = progress.outcome_counts()
+    done = sum(counts.values())
+    total = f"/{progress.total_tests}" if progress.total_tests else ""
+    breakdown = ", ".join(f"{n} {outcome}" for outcome, n in sorted(counts.items()))
+    click.echo(f"Tests finished: {done}{total}" + (f" ({breakdown})" if breakdown else ""))
+
+    rows = progress.document_progress()
+    if rows:
+        width = max(len("Document"), *(len(r.prefix) for r in rows))
+        click.echo(f"{'Document':<{width}}  {'Testable':>8}  {'Covered':>15}  {'Passing':>7}  {'Failing':>7}")
+        for r in rows:
+            pct = f"{100 * r.covered / r.testable:.1f}%" if r.testable else "-"
+            covered = f"{r.covered} ({pct})"
+            failing = click.style(f"{r.failing:>7}", fg="red") if r.failing else f"{r.failing:>7}"
+            click.echo(f"{r.prefix:<{width}}  {r.testable:>8}  {covered:>15}  {r.passing:>7}  {failing}")
+
+    if progress.finished:
+        click.echo(f"Session finished with exit status {progress.exitstatus}")
+        if progress.dropped:
+            click.echo(click.style(f"{progress.dropped} events were dropped", fg="yellow"))
+
+
+# =============================================================================
+# Report Commands
+# =============================================================================
+
+
+@cli.group()
+def report() -> None:
+    """Report on saved coverage (.jamb) data.
+
+    Provides subcommands that analyze the results of the last
+    ``pytest --jamb`` run without re-running tests.
+    """
+    pass
+
+
+@report.command("durations")
+@click.option(
+    "--coverage",
+    "coverage_path",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    default=None,
+    help="Path to .jamb coverage file (default: auto-discover).",
+)
+@click.option(
+    "--document",
+    "-d",
+    "documents",
+    multiple=True,
+    help="Only list items of this document prefix (repeatable)",
+)
+@click.option(
+    "--top",
+    "-n",
+    type=click.IntRange(min=0),
+    default=20,
+    show_default=True,
+    help="Number of items to list (0 for all)",
+)
+@_cli_error_handler
+def report_durations(coverage_path: Path | None, documents: tuple[str, ...], top: int) -> None:
+    """List the requirements that cost the most test time.
+
+    Each item is charged for the setup, call and teardown time of every
+    distinct test linked to it or to any of its descendants, so system
+    requirements show the CI time spent verifying everything derived from
+    them. "Direct" is the time of tests linked to the item itself.
+
+    \b
+    Examples:
+        jamb report durations
+        jamb report durations -d SYS --top 10
+    """
+    from jamb.coverage.durations import rollup_durations
+    from jamb.coverage.serializer import load_coverage
+    from jamb.matrix.utils import format_duration
+
+    coverage_path = _discover_coverage_file(coverage_path)
+    coverage, graph, _, _ = load_coverage(str(coverage_path))
+
+    rows = rollup_durations(coverage, graph)
+    if documents:
+        rows = [r for r in rows if r.document_prefix in documents]
+    if top:
+        rows = rows[:top]
+
+    if not rows:
+        click.echo("No linked tests found.")
+        return
+
+    uid_width = max(len("UID"), *(len(r.uid) for r in rows))
+    click.echo(f"{'UID':<{uid_width}}  {'Tests':>5}  {'Total':>9}  {'Direct':>9}")
+    for r in rows:
+        click.echo(
+            f"{r.uid:<{uid_width}}  {r.test_count:>5}  "
+            f"{format_duration(r.total_duration):>9}  {format_duration(r.direct_duration):>9}"
+        )
+
+
+# =============================================================================
+# History Commands
+# =============================================================================
+
+
+_history_db_option = click.option(
+    "--db",
+    "db_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="History database (default: .jamb-history/history.sqlite3).",
+)
+_history_runs_option = click.option(
+    "--runs",
+    "-n",
+    type=click.IntRange(min=1),
+    default=20,
+    show_default=True,
+    help="Number of most recent runs to analyze.",
+)
+
+
+def _open_history(db_path: Path | None, must_exist: bool = True) -> HistoryStore:
+    """Open the history database, or exit if there is nothing to analyze yet."""
+    from jamb.coverage.history import HISTORY_DB, HISTORY_DIR, HistoryStore
+
+    path = db_path or Path(HISTORY_DIR) / HISTORY_DB
+    if must_exist and not path.exists():
+        click.echo(
+            f"Error: History database '{path}' not found. Run 'jamb history ingest' or 'pytest --jamb --jamb-history'.",
+            err=True,
+        )
+        sys.exit(1)
+    return HistoryStore(path)
+
+
+@cli.group()
+def history() -> None:
+    """Track coverage across runs.
+
+    Ingested .jamb files are kept in an append-only SQLite database under
+    .jamb-history/, so coverage trends and flaky tests can be analyzed
+    across many runs.
+    """
+    pass
+
+
+@history.command("ingest")
+@click.argument(
+    "inputs",
+    nargs=-1,
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+)
+@_history_db_option
+@_cli_error_handler
+def history_ingest(inputs: tuple[Path, ...], db_path: Path | None) -> None:
+    """Add coverage files to the history database.
+
+    INPUTS are .jamb files (default: the auto-discovered .jamb file). Files
+    whose content was ingested before are skipped.
+
+    \b
+    Examples:
+        jamb history ingest
+        jamb history ingest shard-1.jamb shard-2.jamb
+    """
+    paths = list(inputs) or [_discover_coverage_file(None)]
+    with _open_history(db_path, must_exist=False) as store:
+        for path in paths:
+            run_id = store.ingest(path)
+            if run_id is None:
+                click.echo(f"Skipped {path} (already ingested)")
+            else:
+                click.echo(f"Ingested {path} as run {run_id}")
+
+
+@history.command("trend")
+@_history_db_option
+@_history_runs_option
+@click.option(
+    "--document",
+    "-d",
+    "documents",
+    multiple=True,
+    help="Only count items of this document prefix (repeatable)",
+)
+@_cli_error_handler
+def history_trend(db_path: Path | None, runs: int, documents: tuple[str, ...]) -> None:
+    """Show requirement coverage over the most recent runs.
+
+    \b
+    Examples:
+        jamb history trend
+        jamb history trend -n 50 -d SRS
+    """
+    with _open_history(db_path) as store:
+        rows = store.trend(runs, list(documents) or None)
+
+    if not rows:
+        click.echo("No runs recorded.")
+        return
+
+    click.echo(f"{'Run':>5}  {'Timestamp':<20}  {'Testable':>8}  {'Covered':>15}  {'Passing':>15}")
+    for r in rows:
+        covered = f"{r.covered} ({100 * r.covered / r.testable:.1f}%)" if r.testable else "-"
+        passing = f"{r.passed} ({100 * r.passed / r.testable:.1f}%)" if r.testable else "-"
+        click.echo(f"{r.run_id:>5}  {r.timestamp:<20}  {r.testable:>8}  {covered:>15}  {passing:>15}")
+
+
+@history.command("flaky")
+@_history_db_option
+@_history_runs_option
+@click.option(
+    "--min-flips",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Only list tests whose outcome flipped at least this often.",
+)
+@_cli_error_handler
+def history_flaky(db_path: Path | None, runs: int, min_flips: int) -> None:
+    """List tests whose outcome flips between passed and failed.
+
+    A flip is a change between consecutive runs in which the test passed or
+    failed; skipped runs are ignored.
+
+    \b
+    Examples:
+        jamb history flaky
+        jamb history flaky -n 100 --min-flips 3
+    """
+    with _open_history(db_path) as store:
+        rows = store.flaky(runs, min_flips)
+
+    if not rows:
+        click.echo("No flaky tests found.")
+        return
+
+    click.echo(f"{'Flips':>5}  {'Runs':>4}  {'Pass':>4}  {'Fail':>4}  Test")
+    for r in rows:
+        uids = f"  [{', '.join(r.uids)}]" if r.uids else ""
+        click.echo(f"{r.flips:>5}  {r.runs:>4}  {r.passed:>4}  {r.failed:>4}  {r.nodeid}{uids}")
+
+
+@history.command("requirement")
+@click.argument("uid")
+@_history_db_option
+@_history_runs_option
+@_cli_error_handler
+def history_requirement(uid: str, db_path: Path | None, runs: int) -> None:
+    """Show the test results of one requirement over the most recent runs.
+
+    \b
+    Examples:
+        jamb history requirement SRS042
+    """
+    with _open_history(db_path) as store:
+        rows = store.requirement(uid, runs)
+        flaky = store.flaky(runs, uid=uid)
+
+    if not rows:
+        click.echo("No runs recorded.")
+        return
+
+    click.echo(f"{'Run':>5}  {'Timestamp':<20}  {'Tests':>5}  {'Passed':>6}  {'Failed':>6}  {'Skipped':>7}  Status")
+    for r in rows:
+        click.echo(
+            f"{r.run_id:>5}  {r.timestamp:<20}  {r.tests:>5}  {r.passed:>6}  {r.failed:>6}  {r.skipped:>7}  {r.status}"
+        )
+    if flaky:
+        click.echo("")
+        click.echo(click.style(f"Flaky tests linked to {uid}:", fg="yellow"))
+        for f in flaky:
+            click.echo(f"  {f.nodeid} ({f.flips} flips in {f.runs} runs)")
+
+
 if __name__ == "__main__":
     cli()
@@ -28,6 +28,8 @@ class JambConfig:
         test_matrix_output (str | None): File path for the generated test records
             matrix, or ``None`` to skip generation. Format is inferred from
             file extension (``.html``, ``.json``, ``.csv``, ``.md``, ``.xlsx``).
+        test_matrix_durations (bool): Add a "Duration" column with each
+            test's setup, call and teardown time to the test records matrix.
         trace_matrix_output (str | None): File path for the generated traceability
             matrix, or ``None`` to skip generation. Format is inferred from
             file extension (``.html``, ``.json``, ``.csv``, ``.md``, ``.xlsx``).
@@ -76,6 +78,7 @@ class JambConfig:
     fail_uncovered: bool = False
     require_all_pass: bool = True
     test_matrix_output: str | None = None
+    test_matrix_durations: bool = False
     trace_matrix_output: str | None = None
     exclude_patterns: list[str] = field(default_factory=list)
     trace_to_ignore: list[str] = field(default_factory=list)
@@ -256,6 +259,7 @@ def load_config(config_path: Path | None = None) -> JambConfig:
         "fail_uncovered",
         "require_all_pass",
         "test_matrix_output",
+        "test_matrix_durations",
         "trace_matrix_output",
         "exclude_patterns",
         "trace_to_ignore",
@@ -337,6 +341,7 @@ def load_config(config_path: Path | None = None) -> JambConfig:
         fail_uncovered=jamb_config.get("fail_uncovered", False),
         require_all_pass=jamb_config.get("require_all_pass", True),
         test_matrix_output=jamb_config.get("test_matrix_output"),
+        test_matrix_durations=jamb_config.get("test_matrix_durations", False),
         trace_matrix_output=jamb_config.get("trace_matrix_output"),
         exclude_patterns=jamb_config.get("exclude_patterns", []),
         trace_to_ignore=jamb_config.get("trace_to_ignore", []),
@@ -1,5 +1,5 @@
 """Core domain models for jamb."""
 
-from jamb.core.models import Item, LinkedTest, TraceabilityGraph
+from jamb.core.models import Item, LinkedTest, TestResult, TraceabilityGraph
 
-__all__ = ["Item", "LinkedTest", "TraceabilityGraph"]
+__all__ = ["Item", "LinkedTest", "TestResult", "TraceabilityGraph"]
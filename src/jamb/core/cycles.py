@@ -0,0 +1,207 @@
+"""Strongly connected components and cycle detection.
+
+A single linear-time engine for every graph in jamb that may contain
+cycles: the document hierarchy (:meth:`DocumentDAG.validate_acyclic
+<jamb.storage.document_dag.DocumentDAG.validate_acyclic>`,
+:meth:`DocumentDAG.topological_sort
+<jamb.storage.document_dag.DocumentDAG.topological_sort>`,
+:func:`~jamb.matrix.chain_builder.get_document_paths`) and the item link
+graph checked by :func:`~jamb.storage.validation.validate`.
+
+Graphs are given as an iterable of nodes and a function returning the
+successors of a node. Successors that are not among the nodes are
+ignored, so callers can pass e.g. an item's raw links without filtering
+out missing or inactive targets first.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable, Hashable, Iterable
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+T = TypeVar("T", bound=Hashable)
+
+
+@dataclass(frozen=True)
+class Cycle(Generic[T]):
+    """A cyclic strongly connected component.
+
+    Attributes:
+        members (list): Every node of the component, in input order.
+        path (list): A shortest cycle through the first member:
+            ``path[0] -> path[1] -> ... -> path[-1] -> path[0]``.
+    """
+
+    members: list[T]
+    path: list[T]
+
+
+def strongly_connected_components(nodes: Iterable[T], successors: Callable[[T], Iterable[T]]) -> list[list[T]]:
+    """Return the strongly connected components of a directed graph.
+
+    Uses an iterative version of Tarjan's algorithm, so it runs in time
+    linear in the number of nodes and edges and does not recurse.
+
+    Args:
+        nodes: The graph's nodes. Duplicates are ignored.
+        successors: Returns the targets of a node's outgoing edges.
+
+    Returns:
+        The components in reverse topological order: every component comes
+        after all components reachable from it. Members of a component are
+        in input order.
+    """
+    order = {node: i for i, node in enumerate(dict.fromkeys(nodes))}
+    index: dict[T, int] = {}
+    low: dict[T, int] = {}
+    on_stack: set[T] = set()
+    stack: list[T] = []
+    components: list[list[T]] = []
+
+    for root in order:
+        if root in index:
+            continue
+        index[root] = low[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+        # Stack of (node, iterator over its remaining successors)
+        work = [(root, iter(successors(root)))]
+
+        while work:
+            node, remaining = work[-1]
+            for succ in remaining:
+                if succ not in order:
+                    continue
+                if succ not in index:
+                    index[succ] = low[succ] = len(index)
+                    stack.append(succ)
+                    on_stack.add(succ)
+                    work.append((succ, iter(successors(succ))))
+                    break
+                if succ in on_stack and index[succ] < low[node]:
+                    low[node] = index[succ]
+            else:
+                # All successors visited
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    if low[node] < low[parent]:
+                        low[parent] = low[node]
+                if low[node] == index[node]:
+                    component: list[T] = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    if len(component) > 1:
+                        component.sort(key=order.__getitem__)
+                    components.append(component)
+
+    return components
+
+
+def find_cycles(nodes: Iterable[T], successors: Callable[[T], Iterable[T]]) -> list[Cycle[T]]:
+    """Return every cyclic component of a directed graph.
+
+    A component is cyclic if it has more than one node or its only node
+    has an edge to itself.
+
+    Args:
+        nodes: The graph's nodes. Duplicates are ignored.
+        successors: Returns the targets of a node's outgoing edges.
+
+    Returns:
+        One :class:`Cycle` per cyclic component, ordered by the input
+        position of their first member.
+    """
+    nodes = list(dict.fromkeys(nodes))
+    order = {node: i for i, node in enumerate(nodes)}
+    cycles = []
+    for component in strongly_connected_components(nodes, successors):
+        if len(component) == 1 and component[0] not in successors(component[0]):
+            continue
+        cycles.append(Cycle(component, _shortest_cycle(component, successors)))
+    cycles.sort(key=lambda cycle: order[cycle.members[0]])
+    return cycles
+
+
+def _shortest_cycle(component: list[T], successors: Callable[[T], Iterable[T]]) -> list[T]:
+    """Return a shortest cycle through the first member of *component*.
+
+    Breadth-first search from the first member, restricted to the
+    component, until an edge leads back to it.
+    """
+    start = component[0]
+    members = set(component)
+    came_from: dict[T, T | None] = {start: None}
+    queue = deque([start])
+    while queue:
+        node = queue.popleft()
+        for succ in successors(node):
+            if succ == start:
+                path = [node]
+                while (prev := came_from[path[-1]]) is not None:
+                    path.append(prev)
+                path.reverse()
+                return path
+            if succ in members and succ not in came_from:
+                came_from[succ] = node
+                queue.append(succ)
+    # Unreachable for a cyclic component
+    return list(component)
+
+
+def topological_order(nodes: Iterable[T], successors: Callable[[T], Iterable[T]]) -> list[T]:
+    """Order nodes so that each comes before its successors.
+
+    Kahn's algorithm over the components: nodes without predecessors are
+    taken in input order, and each node's successors become available in
+    the order they are listed. The members of a cycle cannot be ordered
+    among themselves; they are kept together, in input order, once all
+    their predecessors outside the cycle have been placed.
+
+    Args:
+        nodes: The graph's nodes. Duplicates are ignored.
+        successors: Returns the targets of a node's outgoing edges.
+
+    Returns:
+        Every node exactly once.
+    """
+    nodes = list(dict.fromkeys(nodes))
+    components = strongly_connected_components(nodes, successors)
+    component_of = {node: i for i, component in enumerate(components) for node in component}
+
+    # Edges between components, without duplicates, in discovery order
+    targets: list[list[int]] = [[] for _ in components]
+    in_degree = [0] * len(components)
+    for i, component in enumerate(components):
+        seen = {i}
+        for node in component:
+            for succ in successors(node):
+                j = component_of.get(succ)
+                if j is not None and j not in seen:
+                    seen.add(j)
+                    targets[i].append(j)
+                    in_degree[j] += 1
+
+    queue: deque[int] = deque()
+    queued: set[int] = set()
+    for node in nodes:
+        i = component_of[node]
+        if in_degree[i] == 0 and i not in queued:
+            queued.add(i)
+            queue.append(i)
+
+    result: list[T] = []
+    while queue:
+        i = queue.popleft()
+        result.extend(components[i])
+        for j in targets[i]:
+            in_degree[j] -= 1
+            if in_degree[j] == 0:
+                queue.append(j)
+    return result
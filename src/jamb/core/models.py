@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import contextlib
 from collections import deque
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from typing import Any, Literal
 
@@ -34,6 +35,10 @@ class Item:
         testable (bool): Whether the item can be verified by testing. If False,
             the item shows "N/A" instead of "NOT COVERED" in the matrix.
         custom_attributes (dict[str, Any]): Arbitrary user-defined key-value pairs.
+        link_hashes (dict[str, str] | None): Content hash of each link target
+            recorded when the link was last verified, as stored in the item
+            file, or ``None`` if the item was not read from storage. Not
+            compared between items.
 
     Examples:
         Construct an item and access its display text::
@@ -72,6 +77,7 @@ class Item:
     derived: bool = False
     testable: bool = True
     custom_attributes: dict[str, Any] = field(default_factory=dict)
+    link_hashes: dict[str, str] | None = field(default=None, compare=False, repr=False)
 
     @property
     def display_text(self) -> str:
@@ -121,13 +127,14 @@ class MatrixColumnConfig:
 
 
 @dataclass
-class LinkedTest:
-    """Represents a link from a pytest test to a requirements item.
+class TestResult:
+    """Outcome and captured data of one test execution.
+
+    A test marked with several requirement UIDs produces one ``TestResult``
+    that all of its :class:`LinkedTest` entries reference, so notes, failure
+    text and results are stored once per test rather than once per link.
 
     Attributes:
-        test_nodeid (str): The pytest node ID of the test (e.g.
-            ``tests/test_foo.py::test_bar``).
-        item_uid (str): UID of the requirements item the test covers.
         test_outcome (str | None): Result of the test — ``"passed"``, ``"failed"``,
             ``"skipped"``, or ``"error"``. ``None`` before execution.
         notes (list[str]): Free-form notes captured during test execution.
@@ -135,16 +142,187 @@ class LinkedTest:
         expected_results (list[str]): Expected outcomes for each test action.
         actual_results (list[str]): Actual outcomes observed during test execution.
         execution_timestamp (str | None): ISO 8601 UTC timestamp of test execution.
+        duration (float | None): Duration of the test's call phase in seconds,
+            or ``None`` if the test body did not run.
+        setup_duration (float | None): Duration of the setup phase in seconds.
+        teardown_duration (float | None): Duration of the teardown phase in
+            seconds.
     """
 
-    test_nodeid: str
-    item_uid: str
+    __test__ = False  # Prevent pytest from collecting this as a test class
+
     test_outcome: Literal["passed", "failed", "skipped", "error"] | None = None
     notes: list[str] = field(default_factory=list)
     test_actions: list[str] = field(default_factory=list)
     expected_results: list[str] = field(default_factory=list)
     actual_results: list[str] = field(default_factory=list)
     execution_timestamp: str | None = None
+    duration: float | None = None
+    setup_duration: float | None = None
+    teardown_duration: float | None = None
+
+    @property
+    def total_duration(self) -> float | None:
+        """Return setup, call and teardown time combined, or None if none was recorded."""
+        phases = [d for d in (self.setup_duration, self.duration, self.teardown_duration) if d is not None]
+        return sum(phases) if phases else None
+
+
+@dataclass(init=False)
+class LinkedTest:
+    """Represents a link from a pytest test to a requirements item.
+
+    The outcome and captured data live in :attr:`result`, which is shared
+    by every link of the same test when recorded by the pytest plugin or
+    loaded from a ``.jamb`` file. The result attributes are also available
+    directly on the link (``link.test_outcome``, ``link.notes``, ...);
+    assigning one updates the shared result, and therefore every link of
+    that test.
+
+    Attributes:
+        test_nodeid (str): The pytest node ID of the test (e.g.
+            ``tests/test_foo.py::test_bar``).
+        item_uid (str): UID of the requirements item the test covers.
+        result (TestResult): The test's outcome and captured data.
+    """
+
+    test_nodeid: str
+    item_uid: str
+    result: TestResult
+
+    def __init__(
+        self,
+        test_nodeid: str,
+        item_uid: str,
+        test_outcome: Literal["passed", "failed", "skipped", "error"] | None = None,
+        notes: list[str] | None = None,
+        test_actions: list[str] | None = None,
+        expected_results: list[str] | None = None,
+        actual_results: list[str] | None = None,
+        execution_timestamp: str | None = None,
+        duration: float | None = None,
+        setup_duration: float | None = None,
+        teardown_duration: float | None = None,
+        result: TestResult | None = None,
+    ) -> None:
+        """Create a link, either to an existing shared *result* or a new one.
+
+        Args:
+            test_nodeid: The pytest node ID of the test.
+            item_uid: UID of the requirements item the test covers.
+            test_outcome: Outcome for a new result.
+            notes: Notes for a new result.
+            test_actions: Test actions for a new result.
+            expected_results: Expected results for a new result.
+            actual_results: Actual results for a new result.
+            execution_timestamp: Execution timestamp for a new result.
+            duration: Call-phase duration for a new result.
+            setup_duration: Setup-phase duration for a new result.
+            teardown_duration: Teardown-phase duration for a new result.
+            result: Existing result to share. When given, the other result
+                arguments are ignored.
+        """
+        self.test_nodeid = test_nodeid
+        self.item_uid = item_uid
+        if result is None:
+            result = TestResult(
+                test_outcome=test_outcome,
+                notes=notes if notes is not None else [],
+                test_actions=test_actions if test_actions is not None else [],
+                expected_results=expected_results if expected_results is not None else [],
+                actual_results=actual_results if actual_results is not None else [],
+                execution_timestamp=execution_timestamp,
+                duration=duration,
+                setup_duration=setup_duration,
+                teardown_duration=teardown_duration,
+            )
+        self.result = result
+
+    @property
+    def test_outcome(self) -> Literal["passed", "failed", "skipped", "error"] | None:
+        """Outcome of the test (see :attr:`TestResult.test_outcome`)."""
+        return self.result.test_outcome
+
+    @test_outcome.setter
+    def test_outcome(self, value: Literal["passed", "failed", "skipped", "error"] | None) -> None:
+        self.result.test_outcome = value
+
+    @property
+    def notes(self) -> list[str]:
+        """Notes captured during execution (see :attr:`TestResult.notes`)."""
+        return self.result.notes
+
+    @notes.setter
+    def notes(self, value: list[str]) -> None:
+        self.result.notes = value
+
+    @property
+    def test_actions(self) -> list[str]:
+        """Steps performed by the test (see :attr:`TestResult.test_actions`)."""
+        return self.result.test_actions
+
+    @test_actions.setter
+    def test_actions(self, value: list[str]) -> None:
+        self.result.test_actions = value
+
+    @property
+    def expected_results(self) -> list[str]:
+        """Expected outcomes (see :attr:`TestResult.expected_results`)."""
+        return self.result.expected_results
+
+    @expected_results.setter
+    def expected_results(self, value: list[str]) -> None:
+        self.result.expected_results = value
+
+    @property
+    def actual_results(self) -> list[str]:
+        """Observed outcomes (see :attr:`TestResult.actual_results`)."""
+        return self.result.actual_results
+
+    @actual_results.setter
+    def actual_results(self, value: list[str]) -> None:
+        self.result.actual_results = value
+
+    @property
+    def execution_timestamp(self) -> str | None:
+        """Execution timestamp (see :attr:`TestResult.execution_timestamp`)."""
+        return self.result.execution_timestamp
+
+    @execution_timestamp.setter
+    def execution_timestamp(self, value: str | None) -> None:
+        self.result.execution_timestamp = value
+
+    @property
+    def duration(self) -> float | None:
+        """Call-phase duration (see :attr:`TestResult.duration`)."""
+        return self.result.duration
+
+    @duration.setter
+    def duration(self, value: float | None) -> None:
+        self.result.duration = value
+
+    @property
+    def setup_duration(self) -> float | None:
+        """Setup-phase duration (see :attr:`TestResult.setup_duration`)."""
+        return self.result.setup_duration
+
+    @setup_duration.setter
+    def setup_duration(self, value: float | None) -> None:
+        self.result.setup_duration = value
+
+    @property
+    def teardown_duration(self) -> float | None:
+        """Teardown-phase duration (see :attr:`TestResult.teardown_duration`)."""
+        return self.result.teardown_duration
+
+    @teardown_duration.setter
+    def teardown_duration(self, value: float | None) -> None:
+        self.result.teardown_duration = value
+
+    @property
+    def total_duration(self) -> float | None:
+        """Return setup, call and teardown time combined, or None if none was recorded."""
+        return self.result.total_duration
 
 
 @dataclass
@@ -208,6 +386,8 @@ class TestRecord:
         actual_results (list[str]): Actual outcomes observed during test execution.
         notes (list[str]): Free-form notes captured during test execution.
         execution_timestamp (str | None): ISO 8601 UTC timestamp of test execution.
+        duration (float | None): Total setup, call and teardown time in
+            seconds, or ``None`` if not recorded.
     """
 
     __test__ = False  # Prevent pytest from collecting this as a test class
@@ -222,6 +402,7 @@ class TestRecord:
     actual_results: list[str] = field(default_factory=list)
     notes: list[str] = field(default_factory=list)
     execution_timestamp: str | None = None
+    duration: float | None = None
 
 
 @dataclass
@@ -417,6 +598,32 @@ class TraceabilityGraph:
 
         return descendants
 
+    def get_descendant_uids(self, uids: Iterable[str]) -> set[str]:
+        """Get the given UIDs plus the UIDs of all their descendants.
+
+        Equivalent to the union of :meth:`get_descendants` over every UID,
+        but walks each item at most once, so selecting many overlapping
+        roots stays linear in the size of the graph.
+
+        Args:
+            uids: Starting item UIDs. They are always included in the
+                result, even if they are not part of the graph.
+
+        Returns:
+            Set of the starting UIDs and every descendant UID in the graph.
+        """
+        result = set(uids)
+        to_visit = deque(result)
+
+        while to_visit:
+            uid = to_visit.popleft()
+            for child_uid in self.item_children.get(uid, []):
+                if child_uid not in result and child_uid in self.items:
+                    result.add(child_uid)
+                    to_visit.append(child_uid)
+
+        return result
+
     def get_neighbors(self, uid: str) -> list[Item]:
         """
         Get all neighbor items: ancestors + descendants + self.
@@ -1,9 +1,13 @@
 """Coverage serialization for jamb."""
 
+from jamb.coverage.merge import merge_coverage
+from jamb.coverage.plan import plan_cover_all
 from jamb.coverage.serializer import COVERAGE_FILE, load_coverage, save_coverage
 
 __all__ = [
     "COVERAGE_FILE",
     "load_coverage",
+    "merge_coverage",
+    "plan_cover_all",
     "save_coverage",
 ]
@@ -0,0 +1,149 @@
+"""Content-addressed side store for large test evidence.
+
+Oversized log entries, full failure reports and attachments are written to
+``.jamb-artifacts/`` next to the ``.jamb`` file, named by the SHA-256 of
+their content. The coverage file only keeps a short excerpt and an
+``[artifact: <path>]`` reference, which the matrix formatters turn into
+links.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import tempfile
+from pathlib import Path, PurePath
+
+ARTIFACTS_DIR = ".jamb-artifacts"
+
+# Text entries longer than this are stored in full as an artifact and kept
+# inline only as an excerpt.
+INLINE_TEXT_LIMIT = 500
+
+ARTIFACT_REF_PATTERN = re.compile(r"\[artifact: (?P<path>[^\]\n]+)\]")
+
+
+def format_artifact_ref(path: str) -> str:
+    """Return the inline reference for an artifact path.
+
+    Args:
+        path: Artifact path, as returned by :meth:`ArtifactStore.put`.
+
+    Returns:
+        The ``[artifact: <path>]`` reference text.
+    """
+    return f"[artifact: {path}]"
+
+
+class ArtifactStore:
+    """Write-once store of files keyed by the SHA-256 of their content.
+
+    Storing the same content twice returns the existing file, so evidence
+    shared by many tests (e.g. identical tracebacks) takes space once.
+    The directory is only created when the first artifact is written.
+
+    Attributes:
+        root (Path): Directory holding the artifacts.
+    """
+
+    def __init__(self, root: str | os.PathLike[str] = ARTIFACTS_DIR) -> None:
+        """Create a store rooted at *root*.
+
+        Args:
+            root: Artifact directory (default: ``.jamb-artifacts``).
+        """
+        self.root = Path(root)
+
+    def put(self, data: bytes, suffix: str = "") -> str:
+        """Store *data* and return its path.
+
+        Args:
+            data: Content to store.
+            suffix: File extension including the dot (e.g. ``".txt"``).
+
+        Returns:
+            The artifact path as a POSIX string, relative to the current
+            directory when :attr:`root` is relative.
+
+        Raises:
+            OSError: If the artifact cannot be written.
+        """
+        name = hashlib.sha256(data).hexdigest() + suffix
+        path = self.root / name
+        if not path.exists():
+            self.root.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(dir=self.root, delete=False, suffix=".tmp") as f:
+                f.write(data)
+                temp_path = f.name
+            os.replace(temp_path, path)
+        return path.as_posix()
+
+    def put_text(self, text: str) -> str:
+        """Store *text* as a UTF-8 ``.txt`` artifact.
+
+        Args:
+            text: Text to store.
+
+        Returns:
+            The artifact path.
+        """
+        return self.put(text.encode("utf-8"), ".txt")
+
+    def put_file(self, source: str | os.PathLike[str]) -> str:
+        """Copy the file at *source* into the store and return its path.
+
+        The original file extension is kept so browsers open the artifact
+        with a suitable viewer.
+
+        Args:
+            source: Path of the file to store.
+
+        Returns:
+            The artifact path.
+
+        Raises:
+            OSError: If *source* cannot be read or the artifact written.
+        """
+        return self.put(Path(source).read_bytes(), PurePath(source).suffix)
+
+    def spill(self, text: str, limit: int = INLINE_TEXT_LIMIT) -> str:
+        """Shorten *text* to *limit* characters, storing the full text.
+
+        Args:
+            text: Text to keep inline.
+            limit: Maximum number of characters kept inline.
+
+        Returns:
+            *text* unchanged when it fits, otherwise its first *limit*
+            characters followed by ``... (truncated)`` and a reference to
+            the artifact holding the full text.
+        """
+        if len(text) <= limit:
+            return text
+        return f"{text[:limit]}\n... (truncated) {format_artifact_ref(self.put_text(text))}"
+
+
+def relink_artifact_refs(text: str, base_dir: str | os.PathLike[str]) -> str:
+    """Rewrite artifact references in *text* relative to *base_dir*.
+
+    References are recorded relative to the directory pytest ran in;
+    matrices written elsewhere need paths relative to their own location.
+
+    Args:
+        text: Text that may contain ``[artifact: <path>]`` references.
+        base_dir: Directory of the file the text is written to.
+
+    Returns:
+        The text with every relative artifact path rewritten.
+    """
+    if "[artifact: " not in text:
+        return text
+
+    def _relink(match: re.Match[str]) -> str:
+        path = match.group("path")
+        if os.path.isabs(path):
+            return match.group(0)
+        return format_artifact_ref(Path(os.path.relpath(path, base_dir)).as_posix())
+
+    return ARTIFACT_REF_PATTERN.sub(_relink, text)
@@ -0,0 +1,97 @@
+"""Roll recorded test durations up the traceability graph."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from jamb.core.cycles import strongly_connected_components
+from jamb.core.models import ItemCoverage, TraceabilityGraph
+
+
+@dataclass
+class RequirementDuration:
+    """Test time attributed to one item and everything beneath it.
+
+    Attributes:
+        uid (str): The item UID.
+        document_prefix (str): Prefix of the item's document.
+        test_count (int): Number of distinct tests linked to the item or any
+            of its descendants.
+        total_duration (float): Combined setup, call and teardown time of
+            those tests in seconds. A test linked to several descendants is
+            counted once.
+        direct_duration (float): Time of the tests linked to the item itself.
+    """
+
+    uid: str
+    document_prefix: str
+    test_count: int
+    total_duration: float
+    direct_duration: float
+
+
+def rollup_durations(
+    coverage: dict[str, ItemCoverage],
+    graph: TraceabilityGraph,
+) -> list[RequirementDuration]:
+    """Attribute recorded test time to every item in *graph*.
+
+    Each item is charged for the distinct tests linked to it or to any of
+    its descendants, so a system requirement shows the CI time spent
+    verifying everything derived from it. Tests without a recorded
+    duration count towards ``test_count`` but add no time.
+
+    Args:
+        coverage: Coverage data, as loaded from a ``.jamb`` file.
+        graph: The traceability graph saved alongside the coverage.
+
+    Returns:
+        One entry per item that has at least one linked test beneath it,
+        sorted by total duration (longest first), then UID.
+    """
+    tests_by_uid: dict[str, set[str]] = {}
+    duration_by_nodeid: dict[str, float] = {}
+    for uid, cov in coverage.items():
+        for link in cov.linked_tests:
+            tests_by_uid.setdefault(uid, set()).add(link.test_nodeid)
+            total = link.total_duration
+            if total is not None:
+                duration_by_nodeid[link.test_nodeid] = max(total, duration_by_nodeid.get(link.test_nodeid, 0.0))
+
+    # Children come before their parents, so each item's test set is built
+    # from its children's in one pass. Items in a link cycle share a set.
+    below: dict[str, set[str]] = {}
+    for component in strongly_connected_components(graph.items, lambda uid: graph.item_children.get(uid, [])):
+        members = set(component)
+        child_sets = {
+            id(below[child]): below[child]
+            for uid in component
+            for child in graph.item_children.get(uid, [])
+            if child in below and child not in members
+        }
+        direct = [tests_by_uid[uid] for uid in component if uid in tests_by_uid]
+        if len(child_sets) == 1 and not direct:
+            # Nothing new below this component: reuse the child's set
+            (nodeids,) = child_sets.values()
+        else:
+            nodeids = set().union(*child_sets.values(), *direct)
+        for uid in component:
+            below[uid] = nodeids
+
+    results: list[RequirementDuration] = []
+    for uid, item in graph.items.items():
+        nodeids = below[uid]
+        if not nodeids:
+            continue
+        results.append(
+            RequirementDuration(
+                uid=uid,
+                document_prefix=item.document_prefix,
+                test_count=len(nodeids),
+                total_duration=sum(duration_by_nodeid.get(n, 0.0) for n in nodeids),
+                direct_duration=sum(duration_by_nodeid.get(n, 0.0) for n in tests_by_uid.get(uid, ())),
+            )
+        )
+
+    results.sort(key=lambda r: (-r.total_duration, r.uid))
+    return results
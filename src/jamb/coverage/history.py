@@ -0,0 +1,342 @@
+"""Append-only history of coverage runs for trend and flakiness analysis.
+
+Every ingested ``.jamb`` file becomes one run in a SQLite database under
+``.jamb-history/``. Test node IDs are interned, and the tables are keyed
+by run so the queries for the last N runs read only those runs, however
+long the history grows.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import sqlite3
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+
+from jamb.coverage.snapshot import CoverageSnapshot
+
+HISTORY_DIR = ".jamb-history"
+HISTORY_DB = "history.sqlite3"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    fingerprint TEXT NOT NULL UNIQUE,
+    timestamp TEXT NOT NULL,
+    source TEXT NOT NULL,
+    software_version TEXT,
+    tester_id TEXT
+);
+CREATE TABLE IF NOT EXISTS run_documents (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    prefix TEXT NOT NULL,
+    testable INTEGER NOT NULL,
+    covered INTEGER NOT NULL,
+    passed INTEGER NOT NULL,
+    PRIMARY KEY (run_id, prefix)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS nodeids (
+    id INTEGER PRIMARY KEY,
+    nodeid TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS tests (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    nodeid_id INTEGER NOT NULL REFERENCES nodeids(id),
+    outcome TEXT,
+    duration REAL,
+    PRIMARY KEY (run_id, nodeid_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS links (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    uid TEXT NOT NULL,
+    nodeid_id INTEGER NOT NULL REFERENCES nodeids(id),
+    PRIMARY KEY (run_id, uid, nodeid_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS links_by_uid ON links (uid, run_id);
+CREATE INDEX IF NOT EXISTS tests_by_nodeid ON tests (nodeid_id, run_id);
+"""
+
+# Runs considered by the queries: the newest N, by insertion order
+_RECENT_RUNS = "SELECT id FROM runs ORDER BY id DESC LIMIT :runs"
+
+
+@dataclass
+class RunSummary:
+    """Coverage totals of one run.
+
+    Attributes:
+        run_id (int): Run number, in ingestion order.
+        timestamp (str): Execution timestamp of the run.
+        software_version (str | None): Software version recorded in the run.
+        testable (int): Testable requirements in the test documents.
+        covered (int): Testable requirements with at least one linked test.
+        passed (int): Testable requirements whose linked tests all passed.
+    """
+
+    run_id: int
+    timestamp: str
+    software_version: str | None
+    testable: int
+    covered: int
+    passed: int
+
+
+@dataclass
+class FlakyTest:
+    """A test whose pass/fail outcome changed between runs.
+
+    Attributes:
+        nodeid (str): The pytest node ID.
+        flips (int): Number of consecutive-run pairs with a different
+            pass/fail outcome. Skipped and missing runs are ignored.
+        runs (int): Runs in which the test passed or failed.
+        passed (int): Runs in which the test passed.
+        failed (int): Runs in which the test failed or errored.
+        uids (list[str]): Requirements linked to the test in its latest run.
+    """
+
+    nodeid: str
+    flips: int
+    runs: int
+    passed: int
+    failed: int
+    uids: list[str] = field(default_factory=list)
+
+
+@dataclass
+class RequirementRun:
+    """Results of the tests linked to one requirement in one run.
+
+    Attributes:
+        run_id (int): Run number.
+        timestamp (str): Execution timestamp of the run.
+        tests (int): Linked tests.
+        passed (int): Linked tests that passed.
+        failed (int): Linked tests that failed or errored.
+        skipped (int): Linked tests that were skipped.
+    """
+
+    run_id: int
+    timestamp: str
+    tests: int
+    passed: int
+    failed: int
+    skipped: int
+
+    @property
+    def status(self) -> str:
+        """``"not covered"``, ``"failed"``, ``"passed"`` or ``"incomplete"``."""
+        if not self.tests:
+            return "not covered"
+        if self.failed:
+            return "failed"
+        if self.passed == self.tests:
+            return "passed"
+        return "incomplete"
+
+
+class HistoryStore:
+    """SQLite database of ingested coverage runs.
+
+    Runs are only ever added. Ingesting the same ``.jamb`` content twice
+    records it once.
+
+    Attributes:
+        path (Path): Database file.
+    """
+
+    def __init__(self, path: str | os.PathLike[str] = Path(HISTORY_DIR) / HISTORY_DB) -> None:
+        """Open (and create, if needed) the history database.
+
+        Args:
+            path: Database file (default: ``.jamb-history/history.sqlite3``).
+
+        Raises:
+            OSError: If the directory cannot be created.
+            sqlite3.Error: If the database cannot be opened.
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path)
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+    def __enter__(self) -> HistoryStore:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def ingest(self, coverage_path: str | os.PathLike[str]) -> int | None:
+        """Add the run recorded in a ``.jamb`` file.
+
+        Args:
+            coverage_path: Path to the coverage file.
+
+        Returns:
+            The new run number, or ``None`` if this file content was already
+            ingested.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            ValueError: If the file is not a valid coverage file.
+        """
+        from jamb.coverage.serializer import load_coverage
+
+        data = Path(coverage_path).read_bytes()
+        fingerprint = hashlib.sha256(data).hexdigest()
+        if self._conn.execute("SELECT 1 FROM runs WHERE fingerprint = ?", (fingerprint,)).fetchone():
+            return None
+
+        coverage, _, metadata, _ = load_coverage(str(coverage_path))
+        timestamp = metadata.execution_timestamp if metadata and metadata.execution_timestamp else None
+        if timestamp is None:
+            mtime = os.path.getmtime(coverage_path)
+            timestamp = datetime.fromtimestamp(mtime, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+        snapshot = CoverageSnapshot.from_coverage(coverage)
+        outcomes: dict[str, tuple[str | None, float | None]] = {}
+        link_rows: set[tuple[str, str]] = set()
+        for uid, links in snapshot.links_by_uid.items():
+            for link in links:
+                outcomes.setdefault(link.test_nodeid, (link.test_outcome, link.total_duration))
+                link_rows.add((uid, link.test_nodeid))
+
+        with self._conn:
+            cursor = self._conn.execute(
+                "INSERT INTO runs (fingerprint, timestamp, source, software_version, tester_id) VALUES (?, ?, ?, ?, ?)",
+                (
+                    fingerprint,
+                    timestamp,
+                    str(coverage_path),
+                    metadata.software_version if metadata else None,
+                    metadata.tester_id if metadata else None,
+                ),
+            )
+            run_id = cursor.lastrowid
+            if run_id is None:
+                raise sqlite3.DatabaseError("inserted run has no row id")
+            self._conn.executemany(
+                "INSERT INTO run_documents (run_id, prefix, testable, covered, passed) VALUES (?, ?, ?, ?, ?)",
+                [(run_id, s.prefix, s.testable, s.covered, s.passed) for s in snapshot.documents.values()],
+            )
+            self._conn.executemany("INSERT OR IGNORE INTO nodeids (nodeid) VALUES (?)", [(n,) for n in outcomes])
+            self._conn.executemany(
+                "INSERT INTO tests (run_id, nodeid_id, outcome, duration) "
+                "SELECT ?, id, ?, ? FROM nodeids WHERE nodeid = ?",
+                [(run_id, outcome, duration, nodeid) for nodeid, (outcome, duration) in outcomes.items()],
+            )
+            self._conn.executemany(
+                "INSERT INTO links (run_id, uid, nodeid_id) SELECT ?, ?, id FROM nodeids WHERE nodeid = ?",
+                [(run_id, uid, nodeid) for uid, nodeid in sorted(link_rows)],
+            )
+        return run_id
+
+    def trend(self, runs: int = 20, documents: list[str] | None = None) -> list[RunSummary]:
+        """Return coverage totals of the last *runs* runs, oldest first.
+
+        Args:
+            runs: Number of runs.
+            documents: Only count these document prefixes.
+
+        Returns:
+            One summary per run.
+        """
+        params: dict[str, object] = {"runs": runs}
+        doc_filter = ""
+        if documents:
+            params.update({f"doc{i}": prefix for i, prefix in enumerate(documents)})
+            doc_filter = f"AND d.prefix IN ({', '.join(f':doc{i}' for i in range(len(documents)))})"
+        rows = self._conn.execute(
+            f"""
+            SELECT r.id, r.timestamp, r.software_version,
+                   COALESCE(SUM(d.testable), 0), COALESCE(SUM(d.covered), 0), COALESCE(SUM(d.passed), 0)
+            FROM runs r LEFT JOIN run_documents d ON d.run_id = r.id {doc_filter}
+            WHERE r.id IN ({_RECENT_RUNS})
+            GROUP BY r.id
+            ORDER BY r.id
+            """,
+            params,
+        ).fetchall()
+        return [RunSummary(*row) for row in rows]
+
+    def flaky(self, runs: int = 20, min_flips: int = 1, uid: str | None = None) -> list[FlakyTest]:
+        """Find tests whose pass/fail outcome flipped within the last *runs* runs.
+
+        Args:
+            runs: Number of runs to inspect.
+            min_flips: Minimum number of flips to report a test.
+            uid: Only consider tests linked to this requirement.
+
+        Returns:
+            Flaky tests, most flips first.
+        """
+        uid_filter = "AND t.nodeid_id IN (SELECT nodeid_id FROM links WHERE uid = :uid)" if uid else ""
+        rows = self._conn.execute(
+            f"""
+            WITH seq AS (
+                SELECT t.nodeid_id, t.run_id, t.outcome = 'passed' AS ok,
+                       LAG(t.outcome = 'passed') OVER (PARTITION BY t.nodeid_id ORDER BY t.run_id) AS prev_ok
+                FROM tests t
+                WHERE t.run_id IN ({_RECENT_RUNS})
+                  AND t.outcome IN ('passed', 'failed', 'error') {uid_filter}
+            )
+            SELECT n.nodeid, SUM(prev_ok IS NOT NULL AND ok != prev_ok) AS flips,
+                   COUNT(*), SUM(ok), SUM(NOT ok), MAX(seq.run_id)
+            FROM seq JOIN nodeids n ON n.id = seq.nodeid_id
+            GROUP BY seq.nodeid_id
+            HAVING flips >= :min_flips
+            ORDER BY flips DESC, n.nodeid
+            """,
+            {"runs": runs, "min_flips": max(min_flips, 1), "uid": uid},
+        ).fetchall()
+
+        result = []
+        for nodeid, flips, count, passed, failed, last_run in rows:
+            uids = [
+                row[0]
+                for row in self._conn.execute(
+                    "SELECT l.uid FROM links l JOIN nodeids n ON n.id = l.nodeid_id "
+                    "WHERE l.run_id = ? AND n.nodeid = ? ORDER BY l.uid",
+                    (last_run, nodeid),
+                )
+            ]
+            result.append(FlakyTest(nodeid, flips, count, passed, failed, uids))
+        return result
+
+    def requirement(self, uid: str, runs: int = 20) -> list[RequirementRun]:
+        """Return the linked-test results of *uid* in the last *runs* runs.
+
+        Args:
+            uid: Requirement UID.
+            runs: Number of runs.
+
+        Returns:
+            One entry per run, oldest first. Runs in which the requirement
+            had no linked test are included with zero tests.
+        """
+        rows = self._conn.execute(
+            f"""
+            SELECT r.id, r.timestamp, COUNT(l.nodeid_id),
+                   COALESCE(SUM(t.outcome = 'passed'), 0),
+                   COALESCE(SUM(t.outcome IN ('failed', 'error')), 0),
+                   COALESCE(SUM(t.outcome = 'skipped'), 0)
+            FROM runs r
+            LEFT JOIN links l ON l.run_id = r.id AND l.uid = :uid
+            LEFT JOIN tests t ON t.run_id = l.run_id AND t.nodeid_id = l.nodeid_id
+            WHERE r.id IN ({_RECENT_RUNS})
+            GROUP BY r.id
+            ORDER BY r.id
+            """,
+            {"uid": uid, "runs": runs},
+        ).fetchall()
+        return [RequirementRun(*row) for row in rows]
+
+    def run_count(self) -> int:
+        """Return the number of ingested runs."""
+        return int(self._conn.execute("SELECT COUNT(*) FROM runs").fetchone()[0])
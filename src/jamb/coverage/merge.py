@@ -0,0 +1,196 @@
+"""Merge sharded .jamb coverage files into a single coverage file."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from dataclasses import fields
+
+from jamb.core.models import (
+    ItemCoverage,
+    LinkedTest,
+    MatrixMetadata,
+    TestEnvironment,
+    TraceabilityGraph,
+)
+from jamb.coverage.serializer import COVERAGE_FILE, load_coverage, save_coverage
+
+# Conflict policy for a nodeid reported by more than one shard: the most
+# severe outcome wins so that a failure on any shard is never hidden by a
+# pass on another. Ties keep the record from the earliest shard.
+OUTCOME_PRECEDENCE: dict[str | None, int] = {
+    "error": 4,
+    "failed": 3,
+    "passed": 2,
+    "skipped": 1,
+    None: 0,
+}
+
+
+def merge_coverage(
+    input_paths: Sequence[str],
+    output_path: str = COVERAGE_FILE,
+) -> dict[str, int]:
+    """Merge several .jamb coverage files into one.
+
+    Shards are read one at a time and folded into an index keyed by
+    ``(item_uid, test_nodeid)``, so the cost is linear in the total number
+    of links and only one shard is held in memory besides the merged result.
+
+    Conflicting outcomes for the same link are resolved by
+    :data:`OUTCOME_PRECEDENCE` (``error`` > ``failed`` > ``passed`` >
+    ``skipped`` > not run); the winning shard's notes, actions and results
+    are kept with the outcome.
+
+    Args:
+        input_paths: Paths to the shard coverage files, in merge order.
+        output_path: Path to write the merged coverage file.
+
+    Returns:
+        Dict with counts: ``shards``, ``items``, ``links`` and ``conflicts``
+        (tests reported by more than one shard with different outcomes).
+
+    Raises:
+        ValueError: If no inputs are given, the shards were produced from
+            different traceability graphs, or they assign different manual
+            TC IDs to the same test.
+        FileNotFoundError: If an input file does not exist.
+    """
+    if not input_paths:
+        raise ValueError("No coverage files to merge")
+
+    graph: TraceabilityGraph | None = None
+    items: dict[str, ItemCoverage] = {}
+    links: dict[str, dict[str, LinkedTest]] = {}
+    manual_tc_ids: dict[str, str] = {}
+    metadata_list: list[MatrixMetadata] = []
+    conflicting_nodeids: set[str] = set()
+
+    for path in input_paths:
+        shard_coverage, shard_graph, shard_metadata, shard_tc_ids = load_coverage(path)
+
+        if graph is None:
+            graph = shard_graph
+        else:
+            _check_graphs_agree(graph, shard_graph, input_paths[0], path)
+
+        if shard_metadata is not None:
+            metadata_list.append(shard_metadata)
+
+        for nodeid, tc_id in shard_tc_ids.items():
+            existing = manual_tc_ids.setdefault(nodeid, tc_id)
+            if existing != tc_id:
+                raise ValueError(f"Conflicting tc_id for '{nodeid}': '{existing}' vs '{tc_id}' (in {path})")
+
+        for uid, cov in shard_coverage.items():
+            if uid not in items:
+                items[uid] = ItemCoverage(item=cov.item)
+                links[uid] = {}
+            uid_links = links[uid]
+            for lt in cov.linked_tests:
+                current = uid_links.get(lt.test_nodeid)
+                if current is None:
+                    uid_links[lt.test_nodeid] = lt
+                    continue
+                if current.test_outcome != lt.test_outcome:
+                    conflicting_nodeids.add(lt.test_nodeid)
+                if OUTCOME_PRECEDENCE.get(lt.test_outcome, 0) > OUTCOME_PRECEDENCE.get(current.test_outcome, 0):
+                    uid_links[lt.test_nodeid] = lt
+
+    assert graph is not None
+    for uid, cov in items.items():
+        cov.linked_tests = list(links[uid].values())
+
+    save_coverage(
+        items,
+        graph,
+        output_path,
+        merge_metadata(metadata_list),
+        manual_tc_ids=manual_tc_ids,
+    )
+
+    return {
+        "shards": len(input_paths),
+        "items": len(items),
+        "links": sum(len(uid_links) for uid_links in links.values()),
+        "conflicts": len(conflicting_nodeids),
+    }
+
+
+def _check_graphs_agree(
+    expected: TraceabilityGraph,
+    actual: TraceabilityGraph,
+    expected_path: str,
+    actual_path: str,
+) -> None:
+    """Raise ValueError if two shards were built from different graphs."""
+    if expected.document_parents != actual.document_parents:
+        raise ValueError(f"Document hierarchy in {actual_path} differs from {expected_path}")
+
+    differing = sorted(
+        uid for uid in expected.items.keys() | actual.items.keys() if expected.items.get(uid) != actual.items.get(uid)
+    )
+    if differing:
+        preview = differing[:5]
+        suffix = f" and {len(differing) - 5} more" if len(differing) > 5 else ""
+        raise ValueError(
+            f"Traceability graph in {actual_path} differs from {expected_path} "
+            f"for items: {preview}{suffix}. Shards must be produced from the same requirements tree."
+        )
+
+
+def merge_metadata(metadata_list: Sequence[MatrixMetadata]) -> MatrixMetadata | None:
+    """Combine per-shard metadata into a single record.
+
+    The earliest execution timestamp is kept. Tester IDs and software
+    versions that differ between shards are joined with ``", "``, as are
+    differing environment fields (e.g. one hostname per CI machine).
+
+    Args:
+        metadata_list: Metadata from each shard that recorded any.
+
+    Returns:
+        The merged metadata, or ``None`` if no shard had metadata.
+    """
+    if not metadata_list:
+        return None
+
+    timestamps = [m.execution_timestamp for m in metadata_list if m.execution_timestamp]
+    environments = [m.environment for m in metadata_list if m.environment is not None]
+    return MatrixMetadata(
+        software_version=_join_unique(m.software_version for m in metadata_list) or None,
+        tester_id=_join_unique(m.tester_id for m in metadata_list) or "Unknown",
+        execution_timestamp=min(timestamps) if timestamps else None,
+        environment=_merge_environments(environments),
+    )
+
+
+def _merge_environments(environments: Sequence[TestEnvironment]) -> TestEnvironment | None:
+    """Merge shard environments field by field."""
+    if not environments:
+        return None
+
+    merged: dict[str, object] = {}
+    for f in fields(TestEnvironment):
+        if f.name == "cpu_count":
+            counts = {env.cpu_count for env in environments}
+            merged["cpu_count"] = counts.pop() if len(counts) == 1 else None
+        elif f.name == "test_tools":
+            tools: dict[str, list[str]] = {}
+            for env in environments:
+                for name, version in env.test_tools.items():
+                    versions = tools.setdefault(name, [])
+                    if version not in versions:
+                        versions.append(version)
+            merged["test_tools"] = {name: ", ".join(versions) for name, versions in tools.items()}
+        else:
+            merged[f.name] = _join_unique(getattr(env, f.name) for env in environments)
+    return TestEnvironment(**merged)  # type: ignore[arg-type]
+
+
+def _join_unique(values: Iterable[str | None]) -> str:
+    """Join distinct non-empty values in first-seen order."""
+    seen: list[str] = []
+    for value in values:
+        if value and value not in seen:
+            seen.append(value)
+    return ", ".join(seen)
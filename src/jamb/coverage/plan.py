@@ -0,0 +1,162 @@
+"""Plan a small test subset that still covers every testable requirement."""
+
+from __future__ import annotations
+
+import heapq
+import re
+import statistics
+from dataclasses import dataclass, field
+
+from jamb.core.models import ItemCoverage
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)\s*(ms|s|m|h)?", re.IGNORECASE)
+_DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+@dataclass
+class CoveragePlan:
+    """Result of :func:`plan_cover_all`.
+
+    Attributes:
+        nodeids (list[str]): Selected test node IDs, in the order the greedy
+            algorithm picked them (most requirements per second first).
+        covered_uids (set[str]): Testable requirements touched by the plan.
+        uncoverable_uids (set[str]): Testable requirements with no linked
+            test at all in the coverage data.
+        dropped_uids (set[str]): Requirements that have linked tests but
+            could not be covered within the budget.
+        estimated_duration (float): Sum of the selected tests' recorded call
+            durations in seconds. Tests without a recorded duration count as
+            the median of the known durations.
+    """
+
+    nodeids: list[str] = field(default_factory=list)
+    covered_uids: set[str] = field(default_factory=set)
+    uncoverable_uids: set[str] = field(default_factory=set)
+    dropped_uids: set[str] = field(default_factory=set)
+    estimated_duration: float = 0.0
+
+
+def parse_duration(value: str) -> float:
+    """Parse a duration such as ``"120s"``, ``"2m"``, ``"1m30s"`` or ``"90"``.
+
+    A bare number is read as seconds.
+
+    Args:
+        value: Duration text.
+
+    Returns:
+        Duration in seconds.
+
+    Raises:
+        ValueError: If *value* is not a valid duration.
+    """
+    text = value.strip()
+    pos = 0
+    total = 0.0
+    for match in _DURATION_PART.finditer(text):
+        if match.start() != pos or (match.group(2) is None and match.end() != len(text)):
+            break
+        total += float(match.group(1)) * _DURATION_UNITS[(match.group(2) or "s").lower()]
+        pos = match.end()
+    if not text or pos != len(text):
+        raise ValueError(f"Invalid duration '{value}' (expected e.g. 90, 120s, 2m, 1m30s, 1h)")
+    return total
+
+
+def plan_cover_all(
+    coverage: dict[str, ItemCoverage],
+    budget: float | None = None,
+    weight_by_duration: bool = True,
+) -> CoveragePlan:
+    """Choose a small set of tests that touches every testable requirement.
+
+    Runs a greedy weighted set cover over the links in *coverage*: each
+    round picks the test covering the most not-yet-covered requirements per
+    unit of cost, where cost is the test's recorded call duration (or 1 per
+    test when *weight_by_duration* is False). Marginal gains only shrink as
+    the plan grows, so candidates sit in a lazily re-evaluated heap and most
+    rounds re-score only the top entry. The greedy result is within a
+    logarithmic factor of the optimal cover.
+
+    Only active, testable ``requirement`` items count. The outcome of the
+    previous run is ignored: any linked test touches its requirements.
+
+    Args:
+        coverage: Coverage data, as loaded from a ``.jamb`` file.
+        budget: Maximum total estimated duration in seconds. Tests that no
+            longer fit are skipped, and requirements only they would cover
+            are reported in :attr:`CoveragePlan.dropped_uids`.
+        weight_by_duration: Prefer fast tests by dividing gain by duration.
+
+    Returns:
+        The :class:`CoveragePlan`.
+
+    Raises:
+        ValueError: If *budget* is given but no test has a recorded duration.
+    """
+    required = {
+        uid for uid, cov in coverage.items() if cov.item.type == "requirement" and cov.item.active and cov.item.testable
+    }
+
+    covers: dict[str, set[str]] = {}
+    durations: dict[str, float] = {}
+    for uid in required:
+        for link in coverage[uid].linked_tests:
+            covers.setdefault(link.test_nodeid, set()).add(uid)
+            if link.duration is not None:
+                durations[link.test_nodeid] = max(link.duration, durations.get(link.test_nodeid, 0.0))
+
+    if budget is not None and not durations:
+        raise ValueError("--budget needs test durations; rerun 'pytest --jamb' to record them")
+    default_duration = statistics.median(durations.values()) if durations else 0.0
+    duration = {nodeid: durations.get(nodeid, default_duration) for nodeid in covers}
+
+    def cost(nodeid: str) -> float:
+        return max(duration[nodeid], 1e-6) if weight_by_duration else 1.0
+
+    plan = CoveragePlan(uncoverable_uids={uid for uid in required if not coverage[uid].linked_tests})
+    uncovered = required - plan.uncoverable_uids
+    remaining_budget = budget
+
+    # Heap of (-gain/cost, nodeid); scores may be stale and are re-checked on pop.
+    heap = [(-len(uids) / cost(nodeid), nodeid) for nodeid, uids in covers.items()]
+    heapq.heapify(heap)
+    while heap and uncovered:
+        _, nodeid = heapq.heappop(heap)
+        gain = len(covers[nodeid] & uncovered)
+        if gain == 0:
+            continue
+        score = -gain / cost(nodeid)
+        if heap and score > heap[0][0]:
+            heapq.heappush(heap, (score, nodeid))
+            continue
+        if remaining_budget is not None:
+            if duration[nodeid] > remaining_budget:
+                continue
+            remaining_budget -= duration[nodeid]
+        plan.nodeids.append(nodeid)
+        plan.estimated_duration += duration[nodeid]
+        uncovered -= covers[nodeid]
+
+    plan.covered_uids = required - plan.uncoverable_uids - uncovered
+    plan.dropped_uids = uncovered
+    return plan
+
+
+def read_nodeid_file(path: str) -> set[str]:
+    """Read a node ID file written by ``jamb plan --output``.
+
+    Blank lines and lines starting with ``#`` are ignored.
+
+    Args:
+        path: Path to the file.
+
+    Returns:
+        The set of node IDs listed in the file.
+
+    Raises:
+        OSError: If the file cannot be read.
+    """
+    with open(path, encoding="utf-8") as f:
+        return {line.strip() for line in f if line.strip() and not line.lstrip().startswith("#")}
@@ -14,14 +14,17 @@ from jamb.core.models import (
     LinkedTest,
     MatrixMetadata,
     TestEnvironment,
+    TestResult,
     TraceabilityGraph,
 )
 
 COVERAGE_FILE = ".jamb"
 
-# Supported coverage file versions for forward compatibility
-CURRENT_VERSION = 2
-SUPPORTED_VERSIONS = {1, 2}
+# Supported coverage file versions for forward compatibility. Version 3
+# stores each test's result once under "test_results" instead of inline in
+# every linked test entry.
+CURRENT_VERSION = 3
+SUPPORTED_VERSIONS = {1, 2, 3}
 
 # Required top-level fields for file validation
 REQUIRED_FIELDS = {"coverage", "graph"}
@@ -36,6 +39,11 @@ def save_coverage(
 ) -> None:
     """Save coverage data to .jamb file for later matrix generation.
 
+    Each test's result is written once under ``test_results`` and the linked
+    test entries only reference it by node ID. A link whose result differs
+    from the first one recorded for its node ID (e.g. after merging shards)
+    keeps its own copy inline.
+
     Args:
         coverage: Coverage data mapping UIDs to ItemCoverage.
         graph: The traceability graph with all items and relationships.
@@ -58,11 +66,13 @@ def save_coverage(
     if manual_tc_ids:
         data["manual_tc_ids"] = manual_tc_ids
 
-    # Serialize coverage
+    # Serialize coverage, storing each distinct test result once
+    results: dict[str, TestResult] = {}
+    data["test_results"] = {}
     for uid, cov in coverage.items():
         data["coverage"][uid] = {
             "item": _serialize_item(cov.item),
-            "linked_tests": [_serialize_linked_test(lt) for lt in cov.linked_tests],
+            "linked_tests": [_serialize_linked_test(lt, results, data["test_results"]) for lt in cov.linked_tests],
         }
 
     # Serialize all graph items (not just coverage items)
@@ -155,6 +165,11 @@ def load_coverage(
         item = _deserialize_item(item_data)
         graph.add_item(item)
 
+    # Shared per-test results (version 3+)
+    shared_results = {
+        nodeid: _deserialize_test_result(result_data) for nodeid, result_data in data.get("test_results", {}).items()
+    }
+
     # Deserialize coverage
     coverage: dict[str, ItemCoverage] = {}
     orphaned_uids: list[str] = []
@@ -172,7 +187,7 @@ def load_coverage(
             continue
 
         item = _deserialize_item(cov_data["item"])
-        linked_tests = [_deserialize_linked_test(lt) for lt in cov_data.get("linked_tests", [])]
+        linked_tests = [_deserialize_linked_test(lt, shared_results) for lt in cov_data.get("linked_tests", [])]
         coverage[uid] = ItemCoverage(item=item, linked_tests=linked_tests)
 
     # Warn about orphaned items (in coverage but not in graph)
@@ -262,17 +277,44 @@ def _deserialize_item(data: dict[str, Any]) -> Item:
     )
 
 
-def _serialize_linked_test(lt: LinkedTest) -> dict[str, Any]:
-    """Serialize a LinkedTest to a dictionary."""
+def _serialize_linked_test(
+    lt: LinkedTest,
+    results: dict[str, TestResult],
+    results_data: dict[str, dict[str, Any]],
+) -> dict[str, Any]:
+    """Serialize a LinkedTest, registering its result in *results_data*.
+
+    Args:
+        lt: The link to serialize.
+        results: Result already written for each node ID.
+        results_data: The ``test_results`` section being built.
+
+    Returns:
+        The link entry. It carries an inline ``result`` only when the link's
+        result differs from the one already written for its node ID.
+    """
+    entry: dict[str, Any] = {"test_nodeid": lt.test_nodeid, "item_uid": lt.item_uid}
+    shared = results.get(lt.test_nodeid)
+    if shared is None:
+        results[lt.test_nodeid] = lt.result
+        results_data[lt.test_nodeid] = _serialize_test_result(lt.result)
+    elif shared is not lt.result and shared != lt.result:
+        entry["result"] = _serialize_test_result(lt.result)
+    return entry
+
+
+def _serialize_test_result(result: TestResult) -> dict[str, Any]:
+    """Serialize a TestResult to a dictionary."""
     return {
-        "test_nodeid": lt.test_nodeid,
-        "item_uid": lt.item_uid,
-        "test_outcome": lt.test_outcome,
-        "notes": lt.notes,
-        "test_actions": lt.test_actions,
-        "expected_results": lt.expected_results,
-        "actual_results": lt.actual_results,
-        "execution_timestamp": lt.execution_timestamp,
+        "test_outcome": result.test_outcome,
+        "notes": result.notes,
+        "test_actions": result.test_actions,
+        "expected_results": result.expected_results,
+        "actual_results": result.actual_results,
+        "execution_timestamp": result.execution_timestamp,
+        "duration": result.duration,
+        "setup_duration": result.setup_duration,
+        "teardown_duration": result.teardown_duration,
     }
 
 
@@ -298,17 +340,41 @@ def _validate_timestamp(ts: str | None) -> str | None:
         return None
 
 
-def _deserialize_linked_test(data: dict[str, Any]) -> LinkedTest:
-    """Deserialize a dictionary to a LinkedTest."""
-    return LinkedTest(
-        test_nodeid=data["test_nodeid"],
-        item_uid=data["item_uid"],
+def _deserialize_linked_test(data: dict[str, Any], shared_results: dict[str, TestResult]) -> LinkedTest:
+    """Deserialize a dictionary to a LinkedTest.
+
+    Args:
+        data: The link entry.
+        shared_results: Results from the ``test_results`` section, keyed by
+            node ID. Links without an inline result reference these, so all
+            links of a test share one :class:`~jamb.core.models.TestResult`.
+
+    Returns:
+        Deserialized LinkedTest object.
+    """
+    nodeid = data["test_nodeid"]
+    if "result" in data:
+        result = _deserialize_test_result(data["result"])
+    elif nodeid in shared_results:
+        result = shared_results[nodeid]
+    else:
+        # Version 1/2 files store the result fields inline in each link
+        result = _deserialize_test_result(data)
+    return LinkedTest(test_nodeid=nodeid, item_uid=data["item_uid"], result=result)
+
+
+def _deserialize_test_result(data: dict[str, Any]) -> TestResult:
+    """Deserialize a dictionary to a TestResult."""
+    return TestResult(
         test_outcome=data.get("test_outcome"),
         notes=data.get("notes", []),
         test_actions=data.get("test_actions", []),
         expected_results=data.get("expected_results", []),
         actual_results=data.get("actual_results", []),
         execution_timestamp=_validate_timestamp(data.get("execution_timestamp")),
+        duration=data.get("duration"),
+        setup_duration=data.get("setup_duration"),
+        teardown_duration=data.get("teardown_duration"),
     )
 
 
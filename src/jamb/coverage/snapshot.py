@@ -0,0 +1,148 @@
+"""Immutable end-of-session view of requirement coverage."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field, fields
+
+from jamb.core.models import ItemCoverage, LinkedTest
+
+
+@dataclass(frozen=True)
+class DocumentCoverageStats:
+    """Coverage counters for one document, or for all documents combined.
+
+    An item counts as *testable* when it is an active requirement that is
+    not marked ``testable: false``. The remaining counters describe the
+    excluded items and may overlap (an inactive heading is counted as both
+    a heading and inactive).
+
+    Attributes:
+        prefix (str): Document prefix, or ``""`` for the combined totals.
+        total (int): Number of items.
+        testable (int): Number of testable items.
+        covered (int): Testable items with at least one linked test.
+        passed (int): Testable items whose linked tests all passed.
+        heading (int): Excluded items of type ``heading``.
+        info (int): Excluded items of type ``info``.
+        inactive (int): Excluded items that are inactive.
+        untestable (int): Requirements marked ``testable: false``.
+    """
+
+    prefix: str
+    total: int = 0
+    testable: int = 0
+    covered: int = 0
+    passed: int = 0
+    heading: int = 0
+    info: int = 0
+    inactive: int = 0
+    untestable: int = 0
+
+    @property
+    def excluded(self) -> int:
+        """Number of items that are not testable."""
+        return self.total - self.testable
+
+
+@dataclass(frozen=True)
+class CoverageSnapshot:
+    """Coverage of the test documents, computed once at the end of a session.
+
+    The matrix writers, the ``.jamb`` file, the coverage check and the
+    terminal summary all read the same snapshot instead of regrouping the
+    test links and rescanning the documents on their own. The containers
+    must not be modified.
+
+    Attributes:
+        coverage (dict[str, ItemCoverage]): Coverage of every item in the
+            test documents, keyed by UID.
+        links_by_uid (dict[str, list[LinkedTest]]): Every recorded test
+            link by item UID, including links to items outside the test
+            documents.
+        documents (dict[str, DocumentCoverageStats]): Counters per document
+            prefix.
+        totals (DocumentCoverageStats): Counters over all test documents.
+        uncovered_uids (tuple[str, ...]): Testable items without a linked
+            test, in document order.
+        failing_uids (tuple[str, ...]): Covered testable items with at least
+            one linked test that did not pass, in document order.
+    """
+
+    coverage: dict[str, ItemCoverage]
+    links_by_uid: dict[str, list[LinkedTest]] = field(default_factory=dict)
+    documents: dict[str, DocumentCoverageStats] = field(default_factory=dict)
+    totals: DocumentCoverageStats = field(default_factory=lambda: DocumentCoverageStats(prefix=""))
+    uncovered_uids: tuple[str, ...] = ()
+    failing_uids: tuple[str, ...] = ()
+
+    @classmethod
+    def from_coverage(
+        cls,
+        coverage: dict[str, ItemCoverage],
+        links_by_uid: dict[str, list[LinkedTest]] | None = None,
+    ) -> CoverageSnapshot:
+        """Compute the counters for *coverage* in a single pass.
+
+        Args:
+            coverage: Coverage of the items in the test documents.
+            links_by_uid: All recorded test links by item UID. Defaults to
+                the links found in *coverage*.
+
+        Returns:
+            The snapshot.
+        """
+        counters: dict[str, dict[str, int]] = {}
+        uncovered: list[str] = []
+        failing: list[str] = []
+        for uid, cov in coverage.items():
+            item = cov.item
+            counts = counters.setdefault(item.document_prefix, dict.fromkeys(_COUNTER_NAMES, 0))
+            counts["total"] += 1
+            if item.type == "requirement" and item.active and item.testable:
+                counts["testable"] += 1
+                if not cov.is_covered:
+                    uncovered.append(uid)
+                    continue
+                counts["covered"] += 1
+                if cov.all_tests_passed:
+                    counts["passed"] += 1
+                else:
+                    failing.append(uid)
+                continue
+            counts["heading"] += item.type == "heading"
+            counts["info"] += item.type == "info"
+            counts["inactive"] += not item.active
+            counts["untestable"] += item.type == "requirement" and not item.testable
+
+        documents = {prefix: DocumentCoverageStats(prefix=prefix, **counts) for prefix, counts in counters.items()}
+        totals = DocumentCoverageStats(
+            prefix="",
+            **{name: sum(counts[name] for counts in counters.values()) for name in _COUNTER_NAMES},
+        )
+        if links_by_uid is None:
+            links_by_uid = {uid: cov.linked_tests for uid, cov in coverage.items() if cov.linked_tests}
+        return cls(
+            coverage=coverage,
+            links_by_uid=links_by_uid,
+            documents=documents,
+            totals=totals,
+            uncovered_uids=tuple(uncovered),
+            failing_uids=tuple(failing),
+        )
+
+    def all_covered(self, require_all_pass: bool = True) -> bool:
+        """Check whether every testable item meets the coverage criteria.
+
+        Args:
+            require_all_pass: Also require every linked test to have passed.
+
+        Returns:
+            True if no testable item is uncovered (or failing, when
+            *require_all_pass* is set).
+        """
+        if self.uncovered_uids:
+            return False
+        return not (require_all_pass and self.failing_uids)
+
+
+_COUNTER_NAMES = tuple(f.name for f in fields(DocumentCoverageStats) if f.name != "prefix")
@@ -3,6 +3,7 @@
 import warnings
 from collections.abc import Iterator
 
+from jamb.core.cycles import Cycle, find_cycles
 from jamb.core.models import (
     ChainRow,
     FullChainMatrix,
@@ -24,7 +25,9 @@ def get_document_paths(
     """Get all document paths from start to leaves.
 
     Discovers all unique paths through the document hierarchy starting
-    from the given prefix and ending at leaf documents.
+    from the given prefix and ending at leaf documents. If the hierarchy
+    has cycles, a path ends before it would revisit a document, and a
+    warning shows each cycle that was cut.
 
     Args:
         graph: The traceability graph containing document relationships.
@@ -50,6 +53,22 @@ def get_document_paths(
     leaf_docs = set(graph.get_leaf_documents())
     paths: list[list[str]] = []
 
+    children_of: dict[str, list[str]] = {}
+
+    def children(prefix: str) -> list[str]:
+        if prefix not in children_of:
+            children_of[prefix] = graph.get_document_children(prefix)
+        return children_of[prefix]
+
+    # A path that reaches a document already on it stops there; each cycle
+    # it ran into is reported once below
+    cycle_of = {
+        prefix: cycle
+        for cycle in find_cycles([start_prefix, *graph.document_parents], children)
+        for prefix in cycle.members
+    }
+    hit_cycles: dict[str, Cycle[str]] = {}
+
     def traverse(current: str, path: list[str], depth: int = 0) -> None:
         """Recursively traverse document hierarchy to find all paths."""
         if depth >= MAX_RECURSION_DEPTH:
@@ -62,18 +81,30 @@ def get_document_paths(
 
         current_path = [*path, current]
 
-        # Get children of this document
-        children = graph.get_document_children(current)
+        # Get children of this document, except those already on the path
+        next_docs = []
+        for child in children(current):
+            if child in current_path:
+                cycle = cycle_of[child]
+                hit_cycles.setdefault(cycle.path[0], cycle)
+            else:
+                next_docs.append(child)
 
-        if not children or current in leaf_docs:
+        if not next_docs or current in leaf_docs:
             # This is a leaf or has no children - complete path
             paths.append(current_path)
         else:
             # Continue traversing
-            for child in children:
+            for child in next_docs:
                 traverse(child, current_path, depth + 1)
 
     traverse(start_prefix, [])
+    for cycle in hit_cycles.values():
+        warnings.warn(
+            f"Cycle in document hierarchy: {' -> '.join([*cycle.path, cycle.path[0]])}. "
+            f"Paths through it stop before revisiting a document.",
+            stacklevel=2,
+        )
     return paths
 
 
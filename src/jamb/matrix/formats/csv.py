@@ -9,12 +9,14 @@ from jamb.core.models import FullChainMatrix, MatrixMetadata, TestRecord
 def render_test_records_csv(
     records: list[TestRecord],
     metadata: MatrixMetadata | None = None,
+    show_duration: bool = False,
 ) -> str:
     """Render test records as CSV.
 
     Args:
         records: List of TestRecord objects to render.
         metadata: Optional matrix metadata for IEC 62304 5.7.5 compliance.
+        show_duration: If True, add a "Duration" column.
 
     Returns:
         A string containing CSV data with metadata rows (if provided),
@@ -58,19 +60,20 @@ def render_test_records_csv(
     writer.writerow([])  # Empty row separator
 
     # Header row
-    writer.writerow(
-        [
-            "Test Case",
-            "Test Name",
-            "Outcome",
-            "Requirements",
-            "Test Actions",
-            "Expected Results",
-            "Actual Results",
-            "Notes",
-            "Timestamp",
-        ]
-    )
+    headers = [
+        "Test Case",
+        "Test Name",
+        "Outcome",
+        "Requirements",
+        "Test Actions",
+        "Expected Results",
+        "Actual Results",
+        "Notes",
+        "Timestamp",
+    ]
+    if show_duration:
+        headers.append("Duration")
+    writer.writerow(headers)
 
     for rec in records:
         requirements_str = ", ".join(rec.requirements) if rec.requirements else ""
@@ -79,19 +82,20 @@ def render_test_records_csv(
         actual_results_str = "; ".join(rec.actual_results) if rec.actual_results else ""
         notes_str = "; ".join(rec.notes) if rec.notes else ""
 
-        writer.writerow(
-            [
-                rec.test_id,
-                rec.test_name,
-                rec.outcome,
-                requirements_str,
-                test_actions_str,
-                expected_results_str,
-                actual_results_str,
-                notes_str,
-                rec.execution_timestamp or "",
-            ]
-        )
+        cells = [
+            rec.test_id,
+            rec.test_name,
+            rec.outcome,
+            requirements_str,
+            test_actions_str,
+            expected_results_str,
+            actual_results_str,
+            notes_str,
+            rec.execution_timestamp or "",
+        ]
+        if show_duration:
+            cells.append(f"{rec.duration:.3f}" if rec.duration is not None else "")
+        writer.writerow(cells)
 
     return output.getvalue()
 
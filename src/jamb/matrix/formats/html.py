@@ -4,6 +4,8 @@ import html as _html
 import warnings
 
 from jamb.core.models import FullChainMatrix, MatrixMetadata, TestRecord
+from jamb.coverage.artifacts import ARTIFACT_REF_PATTERN
+from jamb.matrix.utils import format_duration
 
 # Threshold for warning about large datasets
 LARGE_DATASET_WARNING_THRESHOLD = 5000
@@ -31,15 +33,32 @@ def _escape_html(text: str) -> str:
     return _html.escape(text, quote=True)
 
 
+def _escape_with_artifact_links(text: str) -> str:
+    """Escape text for HTML and turn ``[artifact: <path>]`` references into links.
+
+    Args:
+        text: The plain text to escape.
+
+    Returns:
+        The escaped string with artifact references as ``<a>`` elements.
+    """
+    return ARTIFACT_REF_PATTERN.sub(
+        lambda m: f'<a class="artifact" href="{m.group("path")}">{m.group("path")}</a>',
+        _escape_html(text),
+    )
+
+
 def render_test_records_html(
     records: list[TestRecord],
     metadata: MatrixMetadata | None = None,
+    show_duration: bool = False,
 ) -> str:
     """Render test records as HTML test records matrix.
 
     Args:
         records: List of TestRecord objects to render.
         metadata: Optional matrix metadata for IEC 62304 5.7.5 compliance.
+        show_duration: If True, add a "Duration" column.
 
     Returns:
         A string containing a complete HTML document with embedded CSS,
@@ -63,15 +82,15 @@ def render_test_records_html(
         # Build test actions, expected results, actual results, notes
         test_actions_html = ""
         for action in rec.test_actions:
-            test_actions_html += f'<div class="action">{_escape_html(action)}</div>'
+            test_actions_html += f'<div class="action">{_escape_with_artifact_links(action)}</div>'
 
         expected_results_html = ""
         for result in rec.expected_results:
-            expected_results_html += f'<div class="expected-result">{_escape_html(result)}</div>'
+            expected_results_html += f'<div class="expected-result">{_escape_with_artifact_links(result)}</div>'
 
         actual_results_html = ""
         for result in rec.actual_results:
-            actual_results_html += f'<div class="actual-result">{_escape_html(result)}</div>'
+            actual_results_html += f'<div class="actual-result">{_escape_with_artifact_links(result)}</div>'
 
         notes_html = ""
         for msg in rec.notes:
@@ -80,9 +99,10 @@ def render_test_records_html(
                 msg_class = "message failure"
             elif msg.startswith("[SKIPPED]") or msg.startswith("[XFAIL]"):
                 msg_class = "message skipped"
-            notes_html += f'<div class="{msg_class}">{_escape_html(msg)}</div>'
+            notes_html += f'<div class="{msg_class}">{_escape_with_artifact_links(msg)}</div>'
 
         timestamp = _escape_html(rec.execution_timestamp or "-")
+        duration_cell = f'<td class="duration">{format_duration(rec.duration)}</td>' if show_duration else ""
 
         rows.append(
             f"""
@@ -95,7 +115,7 @@ def render_test_records_html(
                 <td>{expected_results_html or "-"}</td>
                 <td>{actual_results_html or "-"}</td>
                 <td>{notes_html or "-"}</td>
-                <td>{timestamp}</td>
+                <td>{timestamp}</td>{duration_cell}
             </tr>
             """
         )
@@ -108,6 +128,8 @@ def render_test_records_html(
     error = sum(1 for r in records if r.outcome == "error")
     pass_rate = f"{100 * passed / total:.1f}%" if total else "0%"
 
+    duration_header = "\n                <th>Duration</th>" if show_duration else ""
+
     # Build metadata section
     metadata_html = ""
     if metadata:
@@ -206,6 +228,10 @@ def render_test_records_html(
             font-family: monospace;
             font-size: 12px;
         }}
+        .duration {{
+            white-space: nowrap;
+            text-align: right;
+        }}
         .action, .expected-result, .actual-result {{
             font-size: 12px;
             color: #333;
@@ -267,7 +293,7 @@ def render_test_records_html(
                 <th>Expected Results</th>
                 <th>Actual Results</th>
                 <th>Notes</th>
-                <th>Timestamp</th>
+                <th>Timestamp</th>{duration_header}
             </tr>
         </thead>
         <tbody>
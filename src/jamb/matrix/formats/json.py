@@ -9,12 +9,14 @@ from jamb.core.models import FullChainMatrix, MatrixMetadata, TestRecord
 def render_test_records_json(
     records: list[TestRecord],
     metadata: MatrixMetadata | None = None,
+    show_duration: bool = False,
 ) -> str:
     """Render test records as JSON for machine processing.
 
     Args:
         records: List of TestRecord objects to render.
         metadata: Optional matrix metadata for IEC 62304 5.7.5 compliance.
+        show_duration: If True, add a "Duration" column.
 
     Returns:
         A string containing pretty-printed JSON with a ``metadata`` object
@@ -64,20 +66,21 @@ def render_test_records_json(
         }
 
     for rec in records:
-        data["tests"].append(
-            {
-                "test_id": rec.test_id,
-                "test_name": rec.test_name,
-                "test_nodeid": rec.test_nodeid,
-                "outcome": rec.outcome,
-                "requirements": rec.requirements,
-                "test_actions": rec.test_actions,
-                "expected_results": rec.expected_results,
-                "actual_results": rec.actual_results,
-                "notes": rec.notes,
-                "execution_timestamp": rec.execution_timestamp,
-            }
-        )
+        test_data: dict[str, Any] = {
+            "test_id": rec.test_id,
+            "test_name": rec.test_name,
+            "test_nodeid": rec.test_nodeid,
+            "outcome": rec.outcome,
+            "requirements": rec.requirements,
+            "test_actions": rec.test_actions,
+            "expected_results": rec.expected_results,
+            "actual_results": rec.actual_results,
+            "notes": rec.notes,
+            "execution_timestamp": rec.execution_timestamp,
+        }
+        if show_duration:
+            test_data["duration"] = rec.duration
+        data["tests"].append(test_data)
 
     return json.dumps(data, indent=2)
 
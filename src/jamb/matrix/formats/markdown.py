@@ -1,6 +1,8 @@
 """Markdown traceability matrix output."""
 
 from jamb.core.models import FullChainMatrix, MatrixMetadata, TestRecord
+from jamb.coverage.artifacts import ARTIFACT_REF_PATTERN
+from jamb.matrix.utils import format_duration
 
 
 def _escape_markdown(text: str) -> str:
@@ -50,15 +52,37 @@ def _truncate_for_table(text: str, max_len: int = 200) -> str:
     return escaped
 
 
+def _format_entry(text: str) -> str:
+    """Format a log entry for a table cell, keeping artifact links intact.
+
+    ``[artifact: <path>]`` references are removed before truncation and
+    appended as markdown links, so a long excerpt never cuts them off.
+
+    Args:
+        text: The log entry.
+
+    Returns:
+        The escaped, possibly truncated entry followed by its artifact links.
+    """
+    paths = ARTIFACT_REF_PATTERN.findall(text)
+    if not paths:
+        return _truncate_for_table(text)
+    excerpt = _truncate_for_table(ARTIFACT_REF_PATTERN.sub("", text).rstrip())
+    links = " ".join(f"[artifact]({path.replace(' ', '%20')})" for path in paths)
+    return f"{excerpt} {links}" if excerpt else links
+
+
 def render_test_records_markdown(
     records: list[TestRecord],
     metadata: MatrixMetadata | None = None,
+    show_duration: bool = False,
 ) -> str:
     """Render test records as Markdown.
 
     Args:
         records: List of TestRecord objects to render.
         metadata: Optional matrix metadata for IEC 62304 5.7.5 compliance.
+        show_duration: If True, add a "Duration" column.
 
     Returns:
         A string containing a Markdown document with a metadata section,
@@ -128,6 +152,8 @@ def render_test_records_markdown(
         "Notes",
         "Timestamp",
     ]
+    if show_duration:
+        headers.append("Duration")
     lines.append("| " + " | ".join(headers) + " |")
     lines.append("| " + " | ".join(["---"] * len(headers)) + " |")
 
@@ -135,22 +161,23 @@ def render_test_records_markdown(
         test_name = _escape_markdown(rec.test_name)
         outcome = _escape_markdown(rec.outcome)
         requirements_str = _escape_markdown(", ".join(rec.requirements)) or "-"
-        test_actions_str = "; ".join(_truncate_for_table(a) for a in rec.test_actions) if rec.test_actions else "-"
+        test_actions_str = "; ".join(_format_entry(a) for a in rec.test_actions) if rec.test_actions else "-"
         expected_results_str = (
-            "; ".join(_truncate_for_table(r) for r in rec.expected_results) if rec.expected_results else "-"
-        )
-        actual_results_str = (
-            "; ".join(_truncate_for_table(r) for r in rec.actual_results) if rec.actual_results else "-"
+            "; ".join(_format_entry(r) for r in rec.expected_results) if rec.expected_results else "-"
         )
-        notes_str = "; ".join(_truncate_for_table(n) for n in rec.notes) if rec.notes else "-"
+        actual_results_str = "; ".join(_format_entry(r) for r in rec.actual_results) if rec.actual_results else "-"
+        notes_str = "; ".join(_format_entry(n) for n in rec.notes) if rec.notes else "-"
         timestamp = _escape_markdown(rec.execution_timestamp or "-")
 
-        lines.append(
+        row = (
             f"| {rec.test_id} | `{test_name}` "
             f"| {outcome} | {requirements_str} | {test_actions_str} "
             f"| {expected_results_str} | {actual_results_str} "
             f"| {notes_str} | {timestamp} |"
         )
+        if show_duration:
+            row += f" {format_duration(rec.duration)} |"
+        lines.append(row)
 
     return "\n".join(lines)
 
@@ -71,12 +71,14 @@ def _make_item_rich_text(uid: str, header: str | None, text: str) -> CellRichTex
 def render_test_records_xlsx(
     records: list[TestRecord],
     metadata: MatrixMetadata | None = None,
+    show_duration: bool = False,
 ) -> bytes:
     """Render test records as Excel test records matrix.
 
     Args:
         records: List of TestRecord objects to render.
         metadata: Optional matrix metadata for IEC 62304 5.7.5 compliance.
+        show_duration: If True, add a "Duration" column.
 
     Returns:
         Bytes containing an XLSX workbook with a styled header, metadata
@@ -172,6 +174,8 @@ def render_test_records_xlsx(
         ("Notes", 50),
         ("Timestamp", 22),
     ]
+    if show_duration:
+        header_widths.append(("Duration (s)", 14))
     headers = [h for h, _ in header_widths]
     header_row = current_row
     for col, header in enumerate(headers, start=1):
@@ -217,6 +221,8 @@ def render_test_records_xlsx(
         notes_cell = ws.cell(row=row, column=8, value=notes_str)
         notes_cell.alignment = Alignment(wrap_text=True, vertical="top")
         ws.cell(row=row, column=9, value=rec.execution_timestamp or "")
+        if show_duration and rec.duration is not None:
+            ws.cell(row=row, column=10, value=round(rec.duration, 3))
 
         row += 1
 
@@ -2,6 +2,7 @@
 
 import re
 from collections.abc import Callable
+from dataclasses import replace
 from pathlib import Path
 
 from jamb.core.models import (
@@ -13,6 +14,7 @@ from jamb.core.models import (
     TestRecord,
     TraceabilityGraph,
 )
+from jamb.coverage.artifacts import relink_artifact_refs
 from jamb.matrix.utils import group_tests_by_nodeid
 
 # Default TC ID prefix
@@ -106,8 +108,9 @@ def _group_nodeids_by_base(nodeids: list[str]) -> dict[str, list[str]]:
     return groups
 
 
-# Type aliases for formatter functions
-TestRecordsFormatter = Callable[[list[TestRecord], MatrixMetadata | None], str | bytes]
+# Type aliases for formatter functions. Test records formatters also accept
+# a ``show_duration`` keyword argument.
+TestRecordsFormatter = Callable[..., str | bytes]
 FullChainFormatter = Callable[[list[FullChainMatrix], dict[str, str] | None], str | bytes]
 
 
@@ -320,6 +323,7 @@ def build_test_records(
                 actual_results=first.actual_results,
                 notes=first.notes,
                 execution_timestamp=first.execution_timestamp,
+                duration=first.total_duration,
             )
         )
     return records
@@ -330,6 +334,7 @@ def generate_test_records_matrix(
     output_path: str,
     output_format: str = "html",
     metadata: MatrixMetadata | None = None,
+    show_duration: bool = False,
 ) -> None:
     """Generate test records matrix in specified format.
 
@@ -338,12 +343,18 @@ def generate_test_records_matrix(
         output_path: Path to write the output file.
         output_format: Output format: "html", "markdown", "json", "csv", or "xlsx".
         metadata: Optional matrix metadata for IEC 62304 5.7.5 compliance.
+        show_duration: If True, add a "Duration" column with each test's
+            setup, call and teardown time.
     """
     path = Path(output_path)
     path.parent.mkdir(parents=True, exist_ok=True)
 
+    # Artifact references are relative to the test run directory; make them
+    # relative to the matrix so its links resolve wherever it is written.
+    records = [_relink_record(rec, path.parent) for rec in records]
+
     formatter = _get_test_records_formatter(output_format)
-    content = formatter(records, metadata)
+    content = formatter(records, metadata, show_duration=show_duration)
 
     if isinstance(content, bytes):
         path.write_bytes(content)
@@ -351,6 +362,20 @@ def generate_test_records_matrix(
         path.write_text(content, encoding="utf-8")
 
 
+def _relink_record(record: TestRecord, base_dir: Path) -> TestRecord:
+    """Return *record* with artifact references relative to *base_dir*."""
+    texts = (record.test_actions, record.expected_results, record.actual_results, record.notes)
+    if not any("[artifact: " in text for entries in texts for text in entries):
+        return record
+    return replace(
+        record,
+        test_actions=[relink_artifact_refs(t, base_dir) for t in record.test_actions],
+        expected_results=[relink_artifact_refs(t, base_dir) for t in record.expected_results],
+        actual_results=[relink_artifact_refs(t, base_dir) for t in record.actual_results],
+        notes=[relink_artifact_refs(t, base_dir) for t in record.notes],
+    )
+
+
 def generate_full_chain_matrix(
     coverage: dict[str, ItemCoverage],
     graph: TraceabilityGraph,
@@ -34,6 +34,23 @@ def infer_format(path: str) -> str:
     return EXTENSION_TO_FORMAT[ext]
 
 
+def format_duration(seconds: float | None) -> str:
+    """Format a test duration for display.
+
+    Args:
+        seconds: Duration in seconds, or None if not recorded.
+
+    Returns:
+        ``"-"`` for None, milliseconds below one second (``"250ms"``),
+        otherwise seconds with two decimals (``"1.25s"``).
+    """
+    if seconds is None:
+        return "-"
+    if seconds < 1:
+        return f"{seconds * 1000:.0f}ms"
+    return f"{seconds:.2f}s"
+
+
 def group_tests_by_nodeid(
     coverage: dict[str, ItemCoverage],
 ) -> tuple[list[str], dict[str, list[LinkedTest]], int]:
@@ -0,0 +1,106 @@
+"""Write matrices in a detached worker process.
+
+``pytest --jamb --jamb-background-matrices`` hands its matrix jobs to
+``python -m jamb.matrix.worker`` so the test session can exit while large
+(e.g. XLSX) matrices are still being written.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import pickle
+import subprocess
+import sys
+import tempfile
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass
+class MatrixJob:
+    """A deferred call to one of the :mod:`jamb.matrix.generator` functions.
+
+    Attributes:
+        function (str): Name of the generator function, e.g.
+            ``"generate_test_records_matrix"``.
+        args (tuple): Positional arguments for the call.
+        kwargs (dict[str, Any]): Keyword arguments for the call.
+    """
+
+    function: str
+    args: tuple[Any, ...] = ()
+    kwargs: dict[str, Any] = field(default_factory=dict)
+
+    def run(self) -> None:
+        """Call the generator function with the stored arguments."""
+        from jamb.matrix import generator
+
+        getattr(generator, self.function)(*self.args, **self.kwargs)
+
+
+def spawn_matrix_worker(jobs: list[MatrixJob]) -> subprocess.Popen[bytes]:
+    """Start a detached process that runs *jobs*.
+
+    The jobs are pickled to a temporary file that the worker deletes once
+    it has read it. The worker runs in the current directory, so relative
+    output paths resolve as they would in-process, and its errors go to
+    the inherited stderr.
+
+    Args:
+        jobs: The matrix jobs to run, in order.
+
+    Returns:
+        The worker process. It is not waited for.
+
+    Raises:
+        OSError: If the job file cannot be written or the process started.
+    """
+    fd, job_path = tempfile.mkstemp(prefix="jamb-matrix-", suffix=".pickle")
+    with os.fdopen(fd, "wb") as f:
+        pickle.dump(jobs, f)
+    return subprocess.Popen(
+        [sys.executable, "-m", "jamb.matrix.worker", job_path],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the matrix jobs stored in a job file.
+
+    Args:
+        argv: Command-line arguments; the only argument is the job file.
+
+    Returns:
+        0 if every matrix was written, 1 otherwise.
+    """
+    args = sys.argv[1:] if argv is None else argv
+    if len(args) != 1:
+        print("usage: python -m jamb.matrix.worker JOB_FILE", file=sys.stderr)
+        return 1
+
+    job_path = args[0]
+    try:
+        with open(job_path, "rb") as f:
+            jobs: list[MatrixJob] = pickle.load(f)
+    except OSError as e:
+        print(f"jamb: cannot read matrix jobs: {e}", file=sys.stderr)
+        return 1
+    finally:
+        with contextlib.suppress(OSError):
+            os.unlink(job_path)
+
+    status = 0
+    for job in jobs:
+        try:
+            job.run()
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            print(f"jamb: background {job.function} failed: {e}", file=sys.stderr)
+            status = 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,7 +3,8 @@
 import os
 import platform
 import socket
-from collections.abc import Generator
+import time
+from collections.abc import Callable, Generator, Hashable
 from datetime import datetime, timezone
 from typing import Any
 
@@ -15,10 +16,17 @@ from jamb.core.models import (
     LinkedTest,
     MatrixMetadata,
     TestEnvironment,
+    TestResult,
     TraceabilityGraph,
 )
+from jamb.coverage.artifacts import ArtifactStore
+from jamb.coverage.snapshot import CoverageSnapshot
+from jamb.matrix.worker import MatrixJob, spawn_matrix_worker
+from jamb.pytest_plugin.events import EventWriter
 from jamb.pytest_plugin.log import JAMB_LOG_KEY
-from jamb.pytest_plugin.markers import get_requirement_markers, get_tc_id_marker
+from jamb.pytest_plugin.markers import get_requirement_markers, get_tc_id_marker, marker_cache_key
+from jamb.pytest_plugin.selection import expand_requirement_selection, split_option_list
+from jamb.storage.document_dag import DocumentDAG
 
 # Valid test outcomes for type validation
 VALID_OUTCOMES = {"passed", "failed", "skipped", "error"}
@@ -42,10 +50,23 @@ class RequirementCollector:
         graph (TraceabilityGraph | None): The traceability graph
             built from stored documents, or ``None`` if loading
             failed.
+        dag (DocumentDAG | None): The discovered document DAG, or ``None``
+            if discovery failed.
         test_links (list[LinkedTest]): Accumulated test-to-requirement links recorded
             during collection and execution.
         unknown_items (set[str]): UIDs referenced in test markers that do not
             exist in the traceability graph.
+        executed_nodeids (set[str]): Node IDs of tests that produced at least
+            one report (setup, call, or teardown) in this session.
+        artifacts (ArtifactStore): Side store for oversized log entries,
+            full failure reports and ``jamb_log.attach`` attachments.
+        load_duration (float): Seconds spent loading the requirement graph.
+        collection_duration (float | None): Seconds jamb spent processing
+            collected items, or ``None`` before collection finished.
+        collected_count (int): Number of items jamb processed after
+            collection, before its own deselection.
+        events (EventWriter | None): Live event stream for
+            ``--jamb-events``, or ``None`` when disabled.
     """
 
     def __init__(self, config: pytest.Config) -> None:
@@ -60,12 +81,24 @@ class RequirementCollector:
         self.pytest_config = config
         self.jamb_config: JambConfig = load_config()
         self.graph: TraceabilityGraph | None = None
+        self.dag: DocumentDAG | None = None
         self.test_links: list[LinkedTest] = []
         self._links_by_nodeid: dict[str, list[LinkedTest]] = {}
         self.unknown_items: set[str] = set()
+        self.executed_nodeids: set[str] = set()
         self.manual_tc_ids: dict[str, str] = {}  # nodeid -> tc_id
+        self.artifacts = ArtifactStore()
         self.execution_timestamp: str = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        self.collection_duration: float | None = None
+        self.collected_count = 0
+        self._requirement_cache: dict[Hashable, list[str]] = {}
+        self._tc_id_cache: dict[Hashable, str | None] = {}
+        self._snapshot: CoverageSnapshot | None = None
+        self._matrix_jobs: list[MatrixJob] | None = None
+        self.events: EventWriter | None = None
+        start = time.perf_counter()
         self._load_requirements()
+        self.load_duration = time.perf_counter() - start
 
     def _load_requirements(self) -> None:
         """Load requirements from the native storage layer.
@@ -80,8 +113,8 @@ class RequirementCollector:
         try:
             from jamb.storage import build_traceability_graph, discover_documents
 
-            dag = discover_documents()
-            self.graph = build_traceability_graph(dag, exclude_patterns=self.jamb_config.exclude_patterns or None)
+            self.dag = discover_documents()
+            self.graph = build_traceability_graph(self.dag, exclude_patterns=self.jamb_config.exclude_patterns or None)
         except (ValueError, FileNotFoundError, OSError) as e:
             import logging
             import warnings
@@ -98,12 +131,23 @@ class RequirementCollector:
 
         Extracts requirement UIDs from markers on each test item and records
         them as ``LinkedTest`` entries. Yields control for collection to
-        complete first.
+        complete first. Tests not listed in the ``--jamb-select-nodeids`` file,
+        tests outside the ``--jamb-select`` / ``--jamb-select-document`` scope,
+        tests not affected by the changes since ``--jamb-affected-since``, and
+        tests not behind a requirement that failed in the previous run with
+        ``--jamb-rerun-failed-requirements``, are deselected before any links
+        are recorded. With ``--jamb-order=risk`` the remaining tests are then
+        reordered; links keep the collection order. Marker lookups are memoized
+        per test function, so the variants of a parametrized test walk the
+        marker chain once.
 
         Args:
             items: The list of pytest test items collected for the session.
         """
         yield  # Let collection complete
+        start = time.perf_counter()
+        self._snapshot = None
+        self.collected_count = len(items)
 
         # Fail early if graph loading failed
         if self._graph_load_failed:
@@ -111,6 +155,11 @@ class RequirementCollector:
                 "Cannot run with --jamb: requirement graph failed to load. Check earlier warnings for details."
             )
 
+        self._apply_nodeid_selection(items)
+        self._apply_requirement_selection(items)
+        self._apply_change_impact_selection(items)
+        self._apply_failed_requirement_selection(items)
+
         # First pass: collect manual TC IDs and check for duplicates
         # Group items by base nodeid to handle parameterized tests
         base_to_items: dict[str, list[pytest.Item]] = {}
@@ -123,7 +172,7 @@ class RequirementCollector:
 
         for base, base_items in base_to_items.items():
             # Get TC ID from the first item (all params share the same marker)
-            tc_id = get_tc_id_marker(base_items[0])
+            tc_id = self._tc_id_marker(base_items[0])
             if not tc_id:
                 continue
 
@@ -142,9 +191,11 @@ class RequirementCollector:
             for item in base_items:
                 self.manual_tc_ids[item.nodeid] = tc_id
 
-        # Second pass: collect requirement markers
+        # Second pass: collect requirement markers. All links of a test share
+        # one TestResult, so results are recorded once per test.
         for item in items:
-            req_uids = get_requirement_markers(item)
+            req_uids = self._requirement_markers(item)
+            result = TestResult()
             for uid in req_uids:
                 is_unknown = self.graph and not self._graph_load_failed and uid not in self.graph.items
                 if is_unknown:
@@ -153,10 +204,272 @@ class RequirementCollector:
                 link = LinkedTest(
                     test_nodeid=item.nodeid,
                     item_uid=uid,
+                    result=result,
                 )
                 self.test_links.append(link)
                 self._links_by_nodeid.setdefault(item.nodeid, []).append(link)
 
+        self._apply_risk_order(items)
+        self.collection_duration = time.perf_counter() - start
+
+    def _requirement_markers(self, item: pytest.Item) -> list[str]:
+        """Return the requirement UIDs of *item*, memoized per test function.
+
+        Args:
+            item: A pytest test item.
+
+        Returns:
+            List of requirement UIDs, shared between variants. Do not modify.
+        """
+        key = marker_cache_key(item)
+        if key is None:
+            return get_requirement_markers(item)
+        if key not in self._requirement_cache:
+            self._requirement_cache[key] = get_requirement_markers(item)
+        return self._requirement_cache[key]
+
+    def _tc_id_marker(self, item: pytest.Item) -> str | None:
+        """Return the manual TC ID of *item*, memoized per test function.
+
+        Args:
+            item: A pytest test item.
+
+        Returns:
+            The TC ID string if present, None otherwise.
+        """
+        key = marker_cache_key(item)
+        if key is None:
+            return get_tc_id_marker(item)
+        if key not in self._tc_id_cache:
+            self._tc_id_cache[key] = get_tc_id_marker(item)
+        return self._tc_id_cache[key]
+
+    def timing_summary(self) -> str:
+        """Return a one-line summary of jamb's setup and collection overhead.
+
+        Returns:
+            Text such as ``"jamb overhead: loaded requirements in 120ms,
+            processed 2000 collected tests in 35ms"``.
+        """
+        from jamb.matrix.utils import format_duration
+
+        text = f"jamb overhead: loaded requirements in {format_duration(self.load_duration)}"
+        if self.collection_duration is not None:
+            text += f", processed {self.collected_count} collected tests in {format_duration(self.collection_duration)}"
+        return text
+
+    def pytest_collection_finish(self, session: pytest.Session) -> None:
+        """Apply the ``--jamb-fail-uncovered-early`` gate once collection ends.
+
+        When the session goes ahead, a ``collection`` event listing the
+        testable requirements of each test document is sent to the
+        ``--jamb-events`` stream.
+
+        Stops the session before any test runs if the collected markers
+        leave a requirement uncovered or reference an unknown UID. The links
+        recorded during collection are evaluated with the same rules as
+        :meth:`get_coverage`: every active, testable requirement in the test
+        documents needs at least one linked test that is about to run. Test
+        outcomes are not known yet, so ``require_all_pass`` is not applied.
+
+        On failure the collector closes the ``--jamb-events`` stream with a
+        ``session_finish`` event and unregisters itself, so no matrices or
+        ``.jamb`` file are written for the aborted session, and
+        :func:`pytest.exit` ends the run with exit code 1.
+
+        Args:
+            session: The pytest session object.
+        """
+        if getattr(self.pytest_config.option, "jamb_fail_uncovered_early", False):
+            self._check_coverage_before_run()
+        if self.events is not None:
+            documents: dict[str, list[str]] = {}
+            for uid, cov in self.get_coverage().items():
+                if cov.item.type == "requirement" and cov.item.active and cov.item.testable:
+                    documents.setdefault(cov.item.document_prefix, []).append(uid)
+            self.events.emit({"event": "collection", "documents": documents, "tests": len(session.items)})
+
+    def _check_coverage_before_run(self) -> None:
+        """Exit the session if the collected links leave a requirement uncovered."""
+        uncovered = [
+            cov.item
+            for cov in self.get_coverage().values()
+            if not cov.is_covered and cov.item.type == "requirement" and cov.item.active and cov.item.testable
+        ]
+        if not uncovered and not self.unknown_items:
+            return
+
+        lines = ["--jamb-fail-uncovered-early: requirement coverage check failed before running tests"]
+        if uncovered:
+            lines.append("Uncovered test spec items:")
+            lines.extend(f"  - {item.uid}: {item.display_text}" for item in uncovered)
+        if self.unknown_items:
+            lines.append("Unknown items referenced in tests:")
+            lines.extend(f"  - {uid}" for uid in sorted(self.unknown_items))
+
+        if self.events is not None:
+            # pytest_sessionfinish will not run once unregistered
+            events, self.events = self.events, None
+            events.close(
+                {"event": "session_finish", "exitstatus": int(pytest.ExitCode.TESTS_FAILED), "dropped": events.dropped}
+            )
+        self.pytest_config.pluginmanager.unregister(self)
+        pytest.exit("\n".join(lines), returncode=pytest.ExitCode.TESTS_FAILED)
+
+    def _apply_nodeid_selection(self, items: list[pytest.Item]) -> None:
+        """Deselect tests not listed in the ``--jamb-select-nodeids`` file.
+
+        A listed node ID without a parametrize suffix selects every
+        parametrization of that test.
+
+        Args:
+            items: The collected test items, modified in place.
+
+        Raises:
+            pytest.UsageError: If the file cannot be read.
+        """
+        path = getattr(self.pytest_config.option, "jamb_select_nodeids", None)
+        if not path:
+            return
+
+        from jamb.coverage.plan import read_nodeid_file
+
+        try:
+            nodeids = read_nodeid_file(path)
+        except OSError as e:
+            raise pytest.UsageError(f"--jamb-select-nodeids: {e}") from e
+
+        self._deselect_items(items, lambda item: item.nodeid in nodeids or _get_base_nodeid(item.nodeid) in nodeids)
+
+    def _apply_requirement_selection(self, items: list[pytest.Item]) -> None:
+        """Deselect tests that do not verify the selected requirements.
+
+        Reads ``--jamb-select`` (UIDs or globs) and ``--jamb-select-document``
+        (document prefixes), expands the matches to their descendants, and
+        keeps only tests whose requirement markers intersect that set.
+
+        Args:
+            items: The collected test items, modified in place.
+
+        Raises:
+            pytest.UsageError: If a selection matches nothing in the graph.
+        """
+        option = self.pytest_config.option
+        patterns = split_option_list(getattr(option, "jamb_select", None))
+        documents = split_option_list(getattr(option, "jamb_select_document", None))
+        if (not patterns and not documents) or self.graph is None:
+            return
+
+        try:
+            selected_uids = expand_requirement_selection(self.graph, patterns, documents)
+        except ValueError as e:
+            raise pytest.UsageError(f"--jamb-select: {e}") from e
+
+        self._deselect_items(items, lambda item: not selected_uids.isdisjoint(self._requirement_markers(item)))
+
+    def _apply_change_impact_selection(self, items: list[pytest.Item]) -> None:
+        """Deselect tests not affected by changes since ``--jamb-affected-since``.
+
+        A test is kept when its module (or a ``conftest.py`` above it)
+        changed, or when its requirement markers reference a changed item or
+        any descendant of one.
+
+        Args:
+            items: The collected test items, modified in place.
+
+        Raises:
+            pytest.UsageError: If the git comparison fails.
+        """
+        ref = getattr(self.pytest_config.option, "jamb_affected_since", None)
+        if not ref or self.graph is None or self.dag is None:
+            return
+
+        from jamb.storage.changes import get_changes_since
+
+        try:
+            changes = get_changes_since(ref, self.dag)
+        except ValueError as e:
+            raise pytest.UsageError(f"--jamb-affected-since: {e}") from e
+
+        affected_uids = changes.affected_uids(self.graph)
+        self._deselect_items(
+            items,
+            lambda item: (
+                not affected_uids.isdisjoint(self._requirement_markers(item)) or changes.touches_test_file(item.path)
+            ),
+        )
+
+    def _apply_failed_requirement_selection(self, items: list[pytest.Item]) -> None:
+        """Deselect tests not behind a requirement that failed in the last run.
+
+        Reads the previous ``.jamb`` file for ``--jamb-rerun-failed-requirements``
+        and keeps only tests linked to a ``Failed`` or ``Partial`` requirement
+        or to any descendant of one. When every requirement passed, all tests
+        are deselected.
+
+        Args:
+            items: The collected test items, modified in place.
+
+        Raises:
+            pytest.UsageError: If the previous coverage file cannot be loaded.
+        """
+        if not getattr(self.pytest_config.option, "jamb_rerun_failed_requirements", False) or self.graph is None:
+            return
+
+        from jamb.coverage.serializer import load_coverage
+        from jamb.pytest_plugin.selection import failed_requirement_selection
+
+        try:
+            previous = load_coverage()[0]
+        except (FileNotFoundError, ValueError) as e:
+            raise pytest.UsageError(f"--jamb-rerun-failed-requirements: {e}") from e
+
+        selected_uids = failed_requirement_selection(self.graph, previous)
+        self._deselect_items(items, lambda item: not selected_uids.isdisjoint(self._requirement_markers(item)))
+
+    def _apply_risk_order(self, items: list[pytest.Item]) -> None:
+        """Run the tests most likely to fail first for ``--jamb-order=risk``.
+
+        Tests linked to requirements that failed in the previous ``.jamb``
+        file come first, then tests of suspect requirements, then tests by
+        descending ``safety_class``. A missing or unreadable previous file
+        only disables the first criterion.
+
+        Args:
+            items: The collected test items, reordered in place.
+        """
+        if getattr(self.pytest_config.option, "jamb_order", None) != "risk" or self.graph is None:
+            return
+
+        from jamb.coverage.serializer import load_coverage
+        from jamb.pytest_plugin.ordering import RiskRanker, failed_requirement_uids, order_by_risk
+
+        try:
+            previous = load_coverage()[0]
+        except (FileNotFoundError, ValueError):
+            previous = {}
+
+        order_by_risk(items, RiskRanker(self.graph, failed_requirement_uids(previous)), self._requirement_markers)
+
+    def _deselect_items(self, items: list[pytest.Item], keep: Callable[[pytest.Item], bool]) -> None:
+        """Remove items failing *keep* and report them as deselected.
+
+        Deselected items are passed to the ``pytest_deselected`` hook so they
+        appear in pytest's standard "N deselected" summary.
+
+        Args:
+            items: The collected test items, modified in place.
+            keep: Predicate returning True for items that should run.
+        """
+        selected: list[pytest.Item] = []
+        deselected: list[pytest.Item] = []
+        for item in items:
+            (selected if keep(item) else deselected).append(item)
+
+        if deselected:
+            self.pytest_config.hook.pytest_deselected(items=deselected)
+            items[:] = selected
+
     @pytest.hookimpl(hookwrapper=True)
     def pytest_runtest_makereport(
         self,
@@ -166,8 +479,9 @@ class RequirementCollector:
         """Record test outcomes, notes, test actions, and expected results.
 
         Captures the test outcome and data from the ``jamb_log`` fixture,
-        including failure messages and skip reasons, and updates all
-        ``LinkedTest`` entries for the test.
+        including failure messages, skip reasons and per-phase durations,
+        and stores them in the ``TestResult`` shared by the test's
+        ``LinkedTest`` entries.
 
         Args:
             item: The pytest test item that was executed.
@@ -176,45 +490,51 @@ class RequirementCollector:
         _ = call  # Required by pytest hook signature
         outcome = yield
         report = outcome.get_result()
+        self.executed_nodeids.add(item.nodeid)
+        self._snapshot = None
 
         links_for_node = self._links_by_nodeid.get(item.nodeid)
         if links_for_node is None:
             links_for_node = [lk for lk in self.test_links if lk.test_nodeid == item.nodeid]
+        # Links recorded during collection share one result; links added by
+        # other means may not, so update each distinct result once.
+        results = list({id(lk.result): lk.result for lk in links_for_node}.values())
 
         if report.when == "setup":
+            for result in results:
+                result.setup_duration = report.duration
             if report.failed:
-                for link in links_for_node:
-                    link.test_outcome = "error"
-                    link.notes = [f"[SETUP FAILURE] {report.longreprtext or ''}"]
+                for result in results:
+                    result.test_outcome = "error"
+                    result.notes = [self.artifacts.spill(f"[SETUP FAILURE] {report.longreprtext or ''}")]
             elif report.skipped:
                 reason = ""
                 if hasattr(report, "wasxfail") and report.wasxfail:
                     reason = report.wasxfail
                 elif report.longreprtext:
                     reason = report.longreprtext
-                for link in links_for_node:
-                    link.test_outcome = "skipped"
-                    link.notes = [f"[SKIPPED] {reason}"]
+                for result in results:
+                    result.test_outcome = "skipped"
+                    result.notes = [f"[SKIPPED] {reason}"]
         elif report.when == "call":
             notes: list[str] = []
             test_actions: list[str] = []
             expected_results: list[str] = []
             actual_results: list[str] = []
 
-            # Capture custom data from jamb_log fixture
+            # Capture custom data from jamb_log fixture; oversized entries
+            # are kept in full in the artifact store
             if JAMB_LOG_KEY in item.stash:
-                jamb_log = item.stash[JAMB_LOG_KEY]
-                notes.extend(jamb_log.notes)
-                test_actions.extend(jamb_log.test_actions)
-                expected_results.extend(jamb_log.expected_results)
-                actual_results.extend(jamb_log.actual_results)
-
-            # Capture failure message/traceback
+                logged = item.stash[JAMB_LOG_KEY].entries()
+                spill = self.artifacts.spill
+                notes.extend(spill(entry) for entry in logged.notes)
+                test_actions.extend(spill(entry) for entry in logged.test_actions)
+                expected_results.extend(spill(entry) for entry in logged.expected_results)
+                actual_results.extend(spill(entry) for entry in logged.actual_results)
+
+            # Capture failure message/traceback (full text goes to the artifact store)
             if report.failed and report.longreprtext:
-                failure_msg = report.longreprtext
-                if len(failure_msg) > 500:
-                    failure_msg = failure_msg[:500] + "\n... (truncated)"
-                notes.append(f"[FAILURE] {failure_msg}")
+                notes.append(f"[FAILURE] {self.artifacts.spill(report.longreprtext)}")
 
             # Capture skip reason
             if report.skipped:
@@ -237,19 +557,102 @@ class RequirementCollector:
                 )
                 outcome = "error"
 
-            # Update test outcomes and data for all links to this test
-            for link in links_for_node:
-                link.test_outcome = outcome
-                link.notes = list(notes)
-                link.test_actions = list(test_actions)
-                link.expected_results = list(expected_results)
-                link.actual_results = list(actual_results)
-                link.execution_timestamp = test_timestamp
-        elif report.when == "teardown" and report.failed:
-            for link in links_for_node:
-                if link.test_outcome not in ("failed", "error"):
-                    link.test_outcome = "error"
-                    link.notes.append(f"[TEARDOWN FAILURE] {report.longreprtext or ''}")
+            # Update the shared result(s) of this test
+            for result in results:
+                result.test_outcome = outcome
+                result.notes = list(notes)
+                result.test_actions = list(test_actions)
+                result.expected_results = list(expected_results)
+                result.actual_results = list(actual_results)
+                result.execution_timestamp = test_timestamp
+                result.duration = report.duration
+        elif report.when == "teardown":
+            for result in results:
+                result.teardown_duration = report.duration
+                if report.failed and result.test_outcome not in ("failed", "error"):
+                    result.test_outcome = "error"
+                    result.notes.append(self.artifacts.spill(f"[TEARDOWN FAILURE] {report.longreprtext or ''}"))
+
+        if self.events is not None:
+            self.events.emit(
+                {
+                    "event": "report",
+                    "nodeid": item.nodeid,
+                    "uids": [lk.item_uid for lk in links_for_node],
+                    "when": report.when,
+                    "outcome": (results[0].test_outcome if results else None) or report.outcome,
+                    "duration": report.duration,
+                }
+            )
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_sessionfinish(self, session: pytest.Session, exitstatus: int) -> None:
+        """Close the ``--jamb-events`` stream with a ``session_finish`` event.
+
+        Args:
+            session: The pytest session object.
+            exitstatus: The exit status of the test run.
+        """
+        if self.events is None:
+            return
+        _ = exitstatus  # session.exitstatus includes jamb's coverage check
+        events, self.events = self.events, None
+        events.close({"event": "session_finish", "exitstatus": int(session.exitstatus), "dropped": events.dropped})
+        if events.error or events.dropped:
+            import warnings
+
+            problem = events.error or f"{events.dropped} events dropped because the consumer fell behind"
+            warnings.warn(f"--jamb-events: {problem}", stacklevel=2)
+
+    def merge_previous_coverage(self, input_path: str = ".jamb") -> None:
+        """Carry over results from a previous coverage file.
+
+        Used by ``--jamb-update``: links for tests executed in this session
+        replace the previous ones for the same nodeid, while links for every
+        other test in the previous file are kept unchanged. Manual TC IDs of
+        carried-over tests are kept as well. A missing or unreadable previous
+        file produces a warning and leaves this session's data untouched.
+
+        Args:
+            input_path: Path to the previous coverage file (default: .jamb).
+        """
+        import warnings
+
+        from jamb.coverage.serializer import load_coverage
+
+        try:
+            previous, _, _, previous_tc_ids = load_coverage(input_path)
+        except (FileNotFoundError, ValueError) as e:
+            warnings.warn(
+                f"--jamb-update: could not load previous coverage ({e}); saving this session's results only",
+                stacklevel=2,
+            )
+            return
+
+        carried = [
+            link
+            for cov in previous.values()
+            for link in cov.linked_tests
+            if link.test_nodeid not in self.executed_nodeids
+        ]
+        carried_nodeids = {link.test_nodeid for link in carried}
+
+        # Collected-but-not-run tests keep their previous results when present
+        self.test_links = [
+            link
+            for link in self.test_links
+            if link.test_nodeid in self.executed_nodeids or link.test_nodeid not in carried_nodeids
+        ]
+        self.test_links.extend(carried)
+
+        self._links_by_nodeid = {}
+        for link in self.test_links:
+            self._links_by_nodeid.setdefault(link.test_nodeid, []).append(link)
+        self._snapshot = None
+
+        for nodeid, tc_id in previous_tc_ids.items():
+            if nodeid in carried_nodeids:
+                self.manual_tc_ids.setdefault(nodeid, tc_id)
 
     def get_coverage(self) -> dict[str, ItemCoverage]:
         """Build coverage report for all items in test documents.
@@ -281,6 +684,21 @@ class RequirementCollector:
 
         return coverage
 
+    def coverage_snapshot(self) -> CoverageSnapshot:
+        """Return the coverage snapshot shared by the end-of-session consumers.
+
+        The snapshot is built on first use and reused until another test
+        report arrives or previous coverage is merged in, so the matrices,
+        the ``.jamb`` file, the coverage check and the terminal summary
+        group the links and scan the documents once.
+
+        Returns:
+            The current :class:`~jamb.coverage.snapshot.CoverageSnapshot`.
+        """
+        if self._snapshot is None:
+            self._snapshot = CoverageSnapshot.from_coverage(self.get_coverage(), self._build_links_by_uid())
+        return self._snapshot
+
     def _get_test_documents(self) -> list[str]:
         """Get list of test document prefixes to check for coverage.
 
@@ -316,15 +734,7 @@ class RequirementCollector:
             True if every active requirement item meets the coverage
             criteria, False otherwise.
         """
-        coverage = self.get_coverage()
-        require_all_pass = self.jamb_config.require_all_pass
-        for cov in coverage.values():
-            if cov.item.type == "requirement" and cov.item.active and cov.item.testable:
-                if not cov.is_covered:
-                    return False
-                if require_all_pass and not cov.all_tests_passed:
-                    return False
-        return True
+        return self.coverage_snapshot().all_covered(self.jamb_config.require_all_pass)
 
     def _build_test_environment(self) -> TestEnvironment:
         """Build test environment information using stdlib modules.
@@ -419,6 +829,39 @@ class RequirementCollector:
             links_by_uid.setdefault(link.item_uid, []).append(link)
         return links_by_uid
 
+    def defer_matrices(self) -> None:
+        """Queue matrices for a background worker instead of writing them.
+
+        Subsequent :meth:`generate_test_records_matrix` and
+        :meth:`generate_trace_matrix` calls prepare their data and queue it;
+        :meth:`start_matrix_worker` hands the queue to a detached process.
+        """
+        if self._matrix_jobs is None:
+            self._matrix_jobs = []
+
+    def start_matrix_worker(self) -> None:
+        """Start a background process writing the queued matrices.
+
+        Does nothing when no matrices were queued.
+        """
+        jobs, self._matrix_jobs = self._matrix_jobs, None
+        if jobs:
+            spawn_matrix_worker(jobs)
+
+    def _write_matrix(self, function: str, *args: Any, **kwargs: Any) -> None:
+        """Call a matrix generator function now or queue it for the worker.
+
+        Args:
+            function: Name of the :mod:`jamb.matrix.generator` function.
+            *args: Positional arguments for the call.
+            **kwargs: Keyword arguments for the call.
+        """
+        job = MatrixJob(function, args, kwargs)
+        if self._matrix_jobs is None:
+            job.run()
+        else:
+            self._matrix_jobs.append(job)
+
     def generate_test_records_matrix(
         self,
         path: str,
@@ -434,20 +877,19 @@ class RequirementCollector:
             tester_id: Identification of the tester or CI system.
             software_version: Software version override (takes precedence over config).
         """
-        from jamb.matrix.generator import (
-            build_test_records,
-            generate_test_records_matrix,
-        )
+        from jamb.matrix.generator import build_test_records
 
-        coverage = self.get_coverage()
+        coverage = self.coverage_snapshot().coverage
         records = build_test_records(coverage, self.manual_tc_ids, self.jamb_config.tc_id_prefix)
         metadata = self._build_matrix_metadata(tester_id, software_version)
 
-        generate_test_records_matrix(
+        self._write_matrix(
+            "generate_test_records_matrix",
             records,
             path,
             output_format,
             metadata=metadata,
+            show_duration=self.jamb_config.test_matrix_durations,
         )
 
     def generate_trace_matrix(
@@ -466,9 +908,10 @@ class RequirementCollector:
                 If not provided, auto-detects the root document.
             include_ancestors: Whether to include "Traces To" column.
         """
-        from jamb.matrix.generator import build_test_id_mapping, generate_full_chain_matrix
+        from jamb.matrix.generator import build_test_id_mapping
 
-        coverage = self.get_coverage()
+        snapshot = self.coverage_snapshot()
+        coverage = snapshot.coverage
 
         if not self.graph:
             raise ValueError("No traceability graph available")
@@ -488,7 +931,8 @@ class RequirementCollector:
         # Build TC mapping with manual IDs and configured prefix
         tc_mapping = build_test_id_mapping(coverage, self.manual_tc_ids, self.jamb_config.tc_id_prefix)
 
-        generate_full_chain_matrix(
+        self._write_matrix(
+            "generate_full_chain_matrix",
             coverage,
             self.graph,
             path,
@@ -497,10 +941,30 @@ class RequirementCollector:
             include_ancestors=include_ancestors,
             tc_mapping=tc_mapping,
             trace_to_ignore=trace_to_ignore,
-            all_test_links=self._build_links_by_uid(),
+            all_test_links=snapshot.links_by_uid,
             column_configs=self.jamb_config.matrix_columns or None,
         )
 
+    def record_history(self, coverage_path: str = ".jamb") -> None:
+        """Append a saved coverage file to the run history database.
+
+        Failures are reported as warnings so they never fail the session.
+
+        Args:
+            coverage_path: Path of the coverage file written by
+                :meth:`save_coverage_file`.
+        """
+        import sqlite3
+        import warnings
+
+        from jamb.coverage.history import HistoryStore
+
+        try:
+            with HistoryStore() as store:
+                store.ingest(coverage_path)
+        except (OSError, ValueError, sqlite3.Error) as e:
+            warnings.warn(f"--jamb-history: could not record run history ({e})", stacklevel=2)
+
     def save_coverage_file(
         self,
         output_path: str = ".jamb",
@@ -522,7 +986,7 @@ class RequirementCollector:
         if self.graph is None:
             return
 
-        coverage = self.get_coverage()
+        coverage = self.coverage_snapshot().coverage
         metadata = self._build_matrix_metadata(tester_id, software_version)
 
         save_coverage(
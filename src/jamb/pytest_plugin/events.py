@@ -0,0 +1,364 @@
+"""Live stream of test outcome events for ``jamb watch-run``.
+
+``pytest --jamb --jamb-events=TARGET`` writes one JSON object per line:
+
+* ``{"event": "collection", "documents": {...}, "tests": N}`` once after
+  collection, listing the testable requirement UIDs of each test document;
+* ``{"event": "report", "nodeid": ..., "uids": [...], "when": ...,
+  "outcome": ..., "duration": ...}`` for every setup, call and teardown
+  report, where ``outcome`` is the test's outcome so far;
+* ``{"event": "session_finish", "exitstatus": N, "dropped": N}`` at the end.
+
+Events are handed to a background thread through a bounded queue, so a
+slow or missing consumer never blocks the test loop; events that do not
+fit in the queue are dropped and counted. Only the final
+``session_finish`` event waits for room in the queue, since consumers
+stop reading when it arrives.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import queue
+import socket
+import threading
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from typing import Any, NamedTuple, TextIO
+
+# Events buffered between the test loop and the writer thread
+DEFAULT_QUEUE_SIZE = 10_000
+
+EVENT_TARGET_KINDS = ("unix", "file")
+
+
+class EventTarget(NamedTuple):
+    """Destination of the event stream.
+
+    Attributes:
+        kind (str): ``"unix"`` for a Unix domain socket, ``"file"`` for a
+            JSON Lines file.
+        path (str): Socket or file path.
+    """
+
+    kind: str
+    path: str
+
+
+def parse_event_target(value: str) -> EventTarget:
+    """Parse ``unix:/path.sock`` or ``file:events.jsonl``.
+
+    Args:
+        value: Target text.
+
+    Returns:
+        The parsed :class:`EventTarget`.
+
+    Raises:
+        ValueError: If the scheme is unknown, the path is empty, or Unix
+            sockets are not available on this platform.
+    """
+    kind, sep, path = value.partition(":")
+    if not sep or kind not in EVENT_TARGET_KINDS or not path:
+        raise ValueError(f"Invalid event target '{value}' (expected unix:PATH or file:PATH)")
+    if kind == "unix" and not hasattr(socket, "AF_UNIX"):
+        raise ValueError("Unix domain sockets are not supported on this platform")
+    return EventTarget(kind, path)
+
+
+class EventWriter:
+    """Write events to an :class:`EventTarget` from a background thread.
+
+    Attributes:
+        target (EventTarget): Where events are written.
+        dropped (int): Events discarded because the queue was full.
+        error (str | None): Why the target stopped accepting events, if it
+            did. Later events are discarded.
+    """
+
+    def __init__(self, target: EventTarget, maxsize: int = DEFAULT_QUEUE_SIZE) -> None:
+        """Start the writer thread.
+
+        The target is opened by the thread, so a slow socket connect does
+        not delay the session.
+
+        Args:
+            target: Where to write events.
+            maxsize: Maximum number of events waiting to be written.
+        """
+        self.target = target
+        self.dropped = 0
+        self.error: str | None = None
+        self._queue: queue.Queue[dict[str, Any] | None] = queue.Queue(maxsize)
+        self._thread = threading.Thread(target=self._run, name="jamb-events", daemon=True)
+        self._thread.start()
+
+    def emit(self, event: dict[str, Any]) -> None:
+        """Queue *event* without blocking; drop it if the queue is full.
+
+        Args:
+            event: JSON-serializable event.
+        """
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            self.dropped += 1
+
+    def close(self, final: dict[str, Any] | None = None, timeout: float = 5.0) -> None:
+        """Flush queued events and stop the writer thread.
+
+        Args:
+            final: Event to write last, e.g. ``session_finish``. Unlike
+                :meth:`emit`, this waits for room in the queue; it is only
+                dropped if the queue stays full for *timeout* seconds.
+            timeout: Seconds to wait for the queue to drain.
+        """
+        deadline = time.monotonic() + timeout
+        if final is not None:
+            try:
+                self._queue.put(final, timeout=timeout)
+            except queue.Full:
+                self.dropped += 1
+        with contextlib.suppress(queue.Full):
+            self._queue.put(None, timeout=max(0.0, deadline - time.monotonic()))
+        self._thread.join(max(0.0, deadline - time.monotonic()))
+
+    def _open(self) -> tuple[TextIO, socket.socket | None]:
+        if self.target.kind == "unix":
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                sock.connect(self.target.path)
+            except OSError:
+                sock.close()
+                raise
+            return sock.makefile("w", encoding="utf-8"), sock
+        return open(self.target.path, "w", encoding="utf-8"), None
+
+    def _run(self) -> None:
+        stream: TextIO | None = None
+        sock: socket.socket | None = None
+        try:
+            stream, sock = self._open()
+        except OSError as e:
+            self.error = f"cannot open {self.target.kind}:{self.target.path}: {e}"
+
+        while (event := self._queue.get()) is not None:
+            if stream is None:
+                continue
+            try:
+                stream.write(json.dumps(event) + "\n")
+                if self._queue.empty():
+                    stream.flush()
+            except OSError as e:
+                self.error = f"writing to {self.target.kind}:{self.target.path} failed: {e}"
+                with contextlib.suppress(OSError):
+                    stream.close()
+                stream = None
+
+        if stream is not None:
+            with contextlib.suppress(OSError):
+                stream.close()
+        if sock is not None:
+            sock.close()
+
+
+def read_events(target: EventTarget, follow: bool = True, poll_interval: float = 0.2) -> Iterator[dict[str, Any]]:
+    """Yield events from *target* until a ``session_finish`` event.
+
+    For ``file:`` targets the file is tailed while *follow* is set, waiting
+    for it to appear if necessary; otherwise reading stops at its end. A
+    file left over from a finished session (one that already holds a
+    ``session_finish`` event) is emptied before it is tailed, so the
+    events of the next session are read instead. For
+    ``unix:`` targets a socket is created at the path and each connecting
+    pytest session is read in turn.
+
+    Args:
+        target: The event source.
+        follow: Keep waiting for new events (``file:`` targets only).
+        poll_interval: Seconds between polls of a file target.
+
+    Yields:
+        Decoded events. Lines that are not valid JSON objects are skipped.
+
+    Raises:
+        OSError: If the file cannot be read or the socket cannot be bound.
+    """
+    lines = _follow_file(target.path, follow, poll_interval) if target.kind == "file" else _serve_socket(target.path)
+    for line in lines:
+        try:
+            event = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if not isinstance(event, dict):
+            continue
+        yield event
+        if event.get("event") == "session_finish":
+            return
+
+
+def _follow_file(path: str, follow: bool, poll_interval: float) -> Iterator[str]:
+    if follow and _is_finished_stream(path):
+        # Stale events of an earlier run; pytest truncates the file anyway
+        with open(path, "w", encoding="utf-8"):
+            pass
+    while follow and not os.path.exists(path):
+        time.sleep(poll_interval)
+    with open(path, encoding="utf-8") as f:
+        pending = ""
+        while True:
+            chunk = f.readline()
+            if chunk:
+                pending += chunk
+                if pending.endswith("\n"):
+                    yield pending
+                    pending = ""
+            elif follow:
+                time.sleep(poll_interval)
+            else:
+                if pending:
+                    yield pending
+                return
+
+
+def _is_finished_stream(path: str) -> bool:
+    """Return whether the event file at *path* holds a ``session_finish`` event."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if "session_finish" not in line:
+                    continue
+                with contextlib.suppress(json.JSONDecodeError):
+                    event = json.loads(line)
+                    if isinstance(event, dict) and event.get("event") == "session_finish":
+                        return True
+    except (OSError, UnicodeDecodeError):
+        pass
+    return False
+
+
+def _serve_socket(path: str) -> Iterator[str]:
+    with contextlib.suppress(FileNotFoundError):
+        os.unlink(path)
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        server.bind(path)
+        server.listen(1)
+        while True:
+            conn, _ = server.accept()
+            with conn, conn.makefile("r", encoding="utf-8") as stream:
+                yield from stream
+    finally:
+        server.close()
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(path)
+
+
+@dataclass
+class DocumentProgress:
+    """Live coverage of one test document.
+
+    Attributes:
+        prefix (str): Document prefix.
+        testable (int): Number of testable requirements.
+        covered (int): Testable requirements with at least one finished test.
+        passing (int): Covered requirements whose finished tests all passed.
+        failing (int): Covered requirements with a failed or errored test.
+    """
+
+    prefix: str
+    testable: int = 0
+    covered: int = 0
+    passing: int = 0
+    failing: int = 0
+
+
+@dataclass
+class RunProgress:
+    """Aggregate of an event stream, as shown by ``jamb watch-run``.
+
+    A test counts once its teardown report arrives. Its outcome follows the
+    collector's rules: a setup failure is an error, the call outcome wins
+    otherwise, and a teardown failure turns a passed or skipped test into
+    an error.
+
+    Attributes:
+        documents (dict[str, list[str]]): Testable UIDs per test document,
+            from the ``collection`` event.
+        total_tests (int): Number of collected tests, or 0 if unknown.
+        outcomes (dict[str, str]): Final outcome per finished test node ID.
+        uids_by_nodeid (dict[str, list[str]]): Linked UIDs per node ID.
+        finished (bool): Whether the ``session_finish`` event arrived.
+        exitstatus (int | None): The session exit status, once finished.
+        dropped (int): Events the writer reported as dropped.
+    """
+
+    documents: dict[str, list[str]] = field(default_factory=dict)
+    total_tests: int = 0
+    outcomes: dict[str, str] = field(default_factory=dict)
+    uids_by_nodeid: dict[str, list[str]] = field(default_factory=dict)
+    finished: bool = False
+    exitstatus: int | None = None
+    dropped: int = 0
+    _running: dict[str, str] = field(default_factory=dict, repr=False)
+
+    def update(self, event: dict[str, Any]) -> None:
+        """Apply one event.
+
+        Args:
+            event: A decoded event.
+        """
+        kind = event.get("event")
+        if kind == "collection":
+            self.documents = {prefix: list(uids) for prefix, uids in event.get("documents", {}).items()}
+            self.total_tests = int(event.get("tests", 0))
+        elif kind == "report":
+            nodeid = str(event.get("nodeid", ""))
+            self.uids_by_nodeid[nodeid] = list(event.get("uids", []))
+            when = event.get("when")
+            outcome = str(event.get("outcome"))
+            if when == "setup":
+                self._running[nodeid] = "error" if outcome == "failed" else outcome
+            elif when == "call":
+                self._running[nodeid] = outcome
+            elif when == "teardown":
+                final = self._running.pop(nodeid, outcome)
+                if outcome in ("failed", "error") and final not in ("failed", "error"):
+                    final = "error"
+                self.outcomes[nodeid] = final
+        elif kind == "session_finish":
+            self.finished = True
+            self.exitstatus = event.get("exitstatus")
+            self.dropped = int(event.get("dropped", 0))
+
+    def outcome_counts(self) -> dict[str, int]:
+        """Return the number of finished tests per outcome."""
+        counts: dict[str, int] = {}
+        for outcome in self.outcomes.values():
+            counts[outcome] = counts.get(outcome, 0) + 1
+        return counts
+
+    def document_progress(self) -> list[DocumentProgress]:
+        """Return live coverage per test document, in collection order."""
+        outcomes_by_uid: dict[str, list[str]] = {}
+        for nodeid, outcome in self.outcomes.items():
+            for uid in self.uids_by_nodeid.get(nodeid, ()):
+                outcomes_by_uid.setdefault(uid, []).append(outcome)
+
+        progress = []
+        for prefix, uids in self.documents.items():
+            doc = DocumentProgress(prefix=prefix, testable=len(uids))
+            for uid in uids:
+                outcomes = outcomes_by_uid.get(uid)
+                if not outcomes:
+                    continue
+                doc.covered += 1
+                if all(o == "passed" for o in outcomes):
+                    doc.passing += 1
+                elif any(o in ("failed", "error") for o in outcomes):
+                    doc.failing += 1
+            progress.append(doc)
+        return progress
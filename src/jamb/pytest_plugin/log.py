@@ -1,11 +1,29 @@
 """Logging utilities for jamb test messages."""
 
+from __future__ import annotations
+
+import os
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, NamedTuple
+
 import pytest
 
+if TYPE_CHECKING:
+    from jamb.coverage.artifacts import ArtifactStore
+
 # Stash key for storing JambLog instances per test
 JAMB_LOG_KEY = pytest.StashKey["JambLog"]()
 
 
+class LogEntries(NamedTuple):
+    """Read-only view of everything logged through a :class:`JambLog`."""
+
+    notes: Sequence[str]
+    test_actions: Sequence[str]
+    expected_results: Sequence[str]
+    actual_results: Sequence[str]
+
+
 class JambLog:
     """
     Collector for custom test messages to include in traceability matrix.
@@ -19,10 +37,18 @@ class JambLog:
             jamb_log.expected_result("Login succeeds")
             result = do_something()
             jamb_log.actual_result(f"Got: {result}")
+            jamb_log.attach("screenshots/login.png")
             assert something
     """
 
-    def __init__(self) -> None:
+    def __init__(self, artifact_store: ArtifactStore | None = None) -> None:
+        """Create an empty log.
+
+        Args:
+            artifact_store: Store for :meth:`attach`. ``None`` (the default
+                when running without ``--jamb``) makes attachments no-ops.
+        """
+        self._artifact_store = artifact_store
         self._notes: list[str] = []
         self._test_actions: list[str] = []
         self._expected_results: list[str] = []
@@ -68,6 +94,39 @@ class JambLog:
         """
         self._actual_results.append(str(result))
 
+    def attach(self, data: bytes | str | os.PathLike[str], name: str | None = None) -> str | None:
+        """
+        Attach a file or raw bytes as evidence for this test.
+
+        The content is copied into the ``.jamb-artifacts/`` store right away
+        (identical content is stored once) and an ``[ATTACHMENT]`` note
+        linking to it is added to the matrix output.
+
+        Args:
+            data: Raw bytes, or the path of a file to copy.
+            name: Label shown in the note. Defaults to the file name, or
+                ``"attachment"`` for raw bytes.
+
+        Returns:
+            The artifact path, or ``None`` when running without ``--jamb``.
+
+        Raises:
+            OSError: If the file cannot be read or the artifact written.
+        """
+        if self._artifact_store is None:
+            return None
+
+        from jamb.coverage.artifacts import format_artifact_ref
+
+        if isinstance(data, bytes):
+            path = self._artifact_store.put(data)
+            label = name or "attachment"
+        else:
+            path = self._artifact_store.put_file(data)
+            label = name or os.path.basename(os.fspath(data))
+        self._notes.append(f"[ATTACHMENT] {label} {format_artifact_ref(path)}")
+        return path
+
     @property
     def notes(self) -> list[str]:
         """Return all logged notes."""
@@ -87,3 +146,11 @@ class JambLog:
     def actual_results(self) -> list[str]:
         """Return all logged actual results."""
         return self._actual_results.copy()
+
+    def entries(self) -> LogEntries:
+        """Return all logged entries without copying them.
+
+        Used by the plugin when it records a test's results; the returned
+        sequences must not be modified.
+        """
+        return LogEntries(self._notes, self._test_actions, self._expected_results, self._actual_results)
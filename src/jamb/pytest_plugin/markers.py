@@ -1,7 +1,11 @@
 """Marker utilities for extracting requirement links from tests."""
 
+from collections.abc import Hashable
+
 import pytest
 
+_CACHED_MARKERS = ("requirement", "tc_id")
+
 
 def get_tc_id_marker(item: pytest.Item) -> str | None:
     """Extract manual test case ID from a test item's marker.
@@ -72,3 +76,29 @@ def get_requirement_markers(item: pytest.Item) -> list[str]:
                 uids.append(uid)
 
     return uids
+
+
+def marker_cache_key(item: pytest.Item) -> Hashable | None:
+    """Return a key shared by variants of one test function with equal markers.
+
+    ``iter_markers`` walks the module/class/function chain of every item,
+    which adds up when a test function is parametrized into thousands of
+    variants. Variants of one function share their parent's markers, so
+    marker lookups can be cached per parent and function name. Markers
+    attached to a single variant (``pytest.param(..., marks=...)`` or
+    ``add_marker``) are part of the key, so such variants are resolved
+    separately.
+
+    Args:
+        item: A pytest test item.
+
+    Returns:
+        A hashable key, or ``None`` for items that are not Python test
+        functions and should not be cached.
+    """
+    if not isinstance(item, pytest.Function) or item.parent is None:
+        return None
+    # Mark objects from the function decorators are shared by all variants;
+    # per-variant marks have their own identity and give a separate key.
+    own = tuple(id(mark) for mark in item.own_markers if mark.name in _CACHED_MARKERS)
+    return (id(item.parent), item.originalname, own)
@@ -0,0 +1,150 @@
+"""Requirement-aware test ordering for the jamb pytest plugin."""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Callable, Iterable
+from typing import Any
+
+import pytest
+
+from jamb.core.models import ItemCoverage, TraceabilityGraph
+from jamb.matrix.column_resolvers import resolve_review_status
+
+#: Values accepted by ``--jamb-order``.
+ORDER_CHOICES = ("risk",)
+
+#: Custom item attribute holding the IEC 62304 software safety class.
+SAFETY_CLASS_ATTRIBUTE = "safety_class"
+
+_SAFETY_CLASS_PATTERN = re.compile(r"^(?:class\s*)?([abc])$", re.IGNORECASE)
+
+
+def safety_class_rank(value: Any) -> int:
+    """Rank a ``safety_class`` attribute value; higher is riskier.
+
+    IEC 62304 classes ``A``, ``B`` and ``C`` (also written ``Class C``)
+    rank 1, 2 and 3. Integers are used as-is, so projects with their own
+    numeric scale can rank beyond class C.
+
+    Args:
+        value: The attribute value, or ``None`` when unset.
+
+    Returns:
+        The rank, or 0 if the value is unset or not recognised.
+    """
+    if isinstance(value, bool):
+        return 0
+    if isinstance(value, int):
+        return value
+    match = _SAFETY_CLASS_PATTERN.match(str(value).strip()) if value is not None else None
+    if not match:
+        return 0
+    return "abc".index(match.group(1).lower()) + 1
+
+
+def failed_requirement_uids(coverage: dict[str, ItemCoverage]) -> set[str]:
+    """Return the UIDs with at least one failed or errored linked test.
+
+    Args:
+        coverage: Coverage loaded from a previous ``.jamb`` file.
+
+    Returns:
+        Set of UIDs whose linked tests did not all pass or skip.
+    """
+    return {
+        uid
+        for uid, cov in coverage.items()
+        if any(link.test_outcome in ("failed", "error") for link in cov.linked_tests)
+    }
+
+
+class RiskRanker:
+    """Rank requirements by how likely their tests are to fail.
+
+    A requirement ranks by three criteria, in order of importance:
+
+    1. it failed in the previous run;
+    2. it is suspect, i.e. its content changed since it was last reviewed;
+    3. its ``safety_class`` attribute, or the highest class among its
+       ancestors when that is higher.
+
+    Attributes:
+        graph (TraceabilityGraph): The traceability graph.
+        failed_uids (set[str]): Requirements that failed in the previous run.
+    """
+
+    def __init__(self, graph: TraceabilityGraph, failed_uids: Iterable[str] = ()) -> None:
+        """Create a ranker.
+
+        Args:
+            graph: The traceability graph.
+            failed_uids: Requirements that failed in the previous run.
+        """
+        self.graph = graph
+        self.failed_uids = set(failed_uids)
+        self._ranks: dict[str, tuple[int, int, int]] = {}
+
+    def rank(self, uid: str) -> tuple[int, int, int]:
+        """Return the ``(failed, suspect, safety class)`` rank of *uid*.
+
+        Args:
+            uid: Requirement UID.
+
+        Returns:
+            A tuple that compares greater for riskier requirements. Unknown
+            UIDs only rank by previous failure.
+        """
+        if uid not in self._ranks:
+            failed = int(uid in self.failed_uids)
+            item = self.graph.items.get(uid)
+            if item is None:
+                self._ranks[uid] = (failed, 0, 0)
+            else:
+                suspect = int(resolve_review_status(item) == "Suspect")
+                safety = max(
+                    (
+                        safety_class_rank(i.custom_attributes.get(SAFETY_CLASS_ATTRIBUTE))
+                        for i in (item, *self.graph.get_ancestors(uid))
+                    ),
+                    default=0,
+                )
+                self._ranks[uid] = (failed, suspect, safety)
+        return self._ranks[uid]
+
+    def test_rank(self, uids: Iterable[str]) -> tuple[int, int, int]:
+        """Return the rank of a test linked to *uids*.
+
+        Each criterion is taken from the riskiest linked requirement on its
+        own, so a test verifying a failed class A requirement and an
+        unchanged class C requirement ranks as failed and class C.
+
+        Args:
+            uids: Requirement UIDs the test is linked to.
+
+        Returns:
+            The combined rank, ``(0, 0, 0)`` for unlinked tests.
+        """
+        failed = suspect = safety = 0
+        for uid in uids:
+            f, s, c = self.rank(uid)
+            failed, suspect, safety = max(failed, f), max(suspect, s), max(safety, c)
+        return failed, suspect, safety
+
+
+def order_by_risk(
+    items: list[pytest.Item],
+    ranker: RiskRanker,
+    uids_of: Callable[[pytest.Item], Iterable[str]],
+) -> None:
+    """Move the tests of the riskiest requirements to the front.
+
+    The sort is stable, so tests of equal rank (including all unlinked
+    tests) keep their collection order.
+
+    Args:
+        items: The collected test items, reordered in place.
+        ranker: Ranks the requirements.
+        uids_of: Returns the requirement UIDs a test is linked to.
+    """
+    items.sort(key=lambda item: ranker.test_rank(uids_of(item)), reverse=True)
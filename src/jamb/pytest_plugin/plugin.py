@@ -9,7 +9,9 @@ if TYPE_CHECKING:
 
 from jamb.matrix.utils import infer_format
 from jamb.pytest_plugin.collector import RequirementCollector
+from jamb.pytest_plugin.events import EventWriter, parse_event_target
 from jamb.pytest_plugin.log import JAMB_LOG_KEY, JambLog
+from jamb.pytest_plugin.ordering import ORDER_CHOICES
 
 
 @pytest.fixture
@@ -24,7 +26,8 @@ def jamb_log(request: pytest.FixtureRequest) -> JambLog:
             jamb_log.note("Verified input validation with boundary values")
             assert validate_input(-1) is False
     """
-    log = JambLog()
+    collector = request.config.pluginmanager.get_plugin("jamb_collector")
+    log = JambLog(collector.artifacts if collector else None)
     request.node.stash[JAMB_LOG_KEY] = log
     return log
 
@@ -33,7 +36,9 @@ def pytest_addoption(parser: pytest.Parser) -> None:
     """Register jamb command-line options with pytest.
 
     Registers the following options: ``--jamb``, ``--jamb-fail-uncovered``,
-    ``--jamb-test-matrix``, ``--jamb-trace-matrix``, and ``--jamb-documents``.
+    ``--jamb-fail-uncovered-early``, ``--jamb-update``, ``--jamb-test-matrix``, ``--jamb-trace-matrix``,
+    ``--jamb-background-matrices``, ``--jamb-events``, ``--jamb-history``,
+    ``--jamb-rerun-failed-requirements``, ``--jamb-order``, and ``--jamb-documents``.
 
     Args:
         parser: The pytest argument parser to add options to.
@@ -52,6 +57,25 @@ def pytest_addoption(parser: pytest.Parser) -> None:
         default=False,
         help="Fail if any test spec items lack pytest test coverage",
     )
+    group.addoption(
+        "--jamb-fail-uncovered-early",
+        action="store_true",
+        default=False,
+        help=(
+            "Check requirement markers right after collection and stop before any test "
+            "runs if a test spec item has no linked test or a marker references an unknown UID"
+        ),
+    )
+    group.addoption(
+        "--jamb-update",
+        action="store_true",
+        default=False,
+        help=(
+            "Update the existing .jamb file instead of replacing it: results for "
+            "tests run in this session replace their previous entries, all other "
+            "tests keep their previous results"
+        ),
+    )
     group.addoption(
         "--jamb-test-matrix",
         metavar="PATH",
@@ -62,11 +86,76 @@ def pytest_addoption(parser: pytest.Parser) -> None:
         metavar="PATH",
         help=("Generate traceability matrix at PATH (format inferred from extension: .html, .json, .csv, .md, .xlsx)"),
     )
+    group.addoption(
+        "--jamb-background-matrices",
+        action="store_true",
+        default=False,
+        help="Write the test records and trace matrices in a background process so pytest can exit immediately",
+    )
+    group.addoption(
+        "--jamb-events",
+        metavar="TARGET",
+        help=(
+            "Stream one JSON event per test report to unix:PATH (a socket opened by "
+            "'jamb watch-run') or file:PATH (JSON Lines)"
+        ),
+    )
+    group.addoption(
+        "--jamb-history",
+        action="store_true",
+        default=False,
+        help="Append this run's .jamb file to the history database in .jamb-history/ (see 'jamb history')",
+    )
     group.addoption(
         "--jamb-documents",
         metavar="PREFIXES",
         help="Comma-separated list of test document prefixes to check",
     )
+    group.addoption(
+        "--jamb-select",
+        metavar="UIDS",
+        help=(
+            "Only run tests linked to these requirement UIDs or globs (comma-separated, "
+            "e.g. SYS012,SRS01*) or to any of their descendants"
+        ),
+    )
+    group.addoption(
+        "--jamb-select-document",
+        metavar="PREFIXES",
+        help="Only run tests linked to items in these documents (comma-separated) or their descendants",
+    )
+    group.addoption(
+        "--jamb-affected-since",
+        metavar="REF",
+        help=(
+            "Only run tests affected by changes since git REF: tests in changed files, "
+            "and tests linked to changed requirement items or their descendants"
+        ),
+    )
+    group.addoption(
+        "--jamb-select-nodeids",
+        metavar="FILE",
+        help="Only run tests whose node IDs are listed in FILE, one per line (e.g. written by 'jamb plan')",
+    )
+    group.addoption(
+        "--jamb-rerun-failed-requirements",
+        action="store_true",
+        default=False,
+        help=(
+            "Only run tests linked to requirements that failed or partially passed in the "
+            "previous .jamb file, or to any of their descendants"
+        ),
+    )
+    group.addoption(
+        "--jamb-order",
+        choices=ORDER_CHOICES,
+        default=None,
+        help=(
+            "Reorder the selected tests without changing what runs. 'risk' runs tests of "
+            "requirements that failed in the previous .jamb file first, then tests of suspect "
+            "requirements, then tests by descending safety_class"
+        ),
+    )
     group.addoption(
         "--jamb-tester-id",
         default="Unknown",
@@ -101,7 +190,10 @@ def pytest_configure(config: pytest.Config) -> None:
     Raises a usage error when ``--jamb`` is combined with pytest-xdist, since
     coverage state is accumulated per-process and is not aggregated across
     workers; a distributed run would silently produce an incomplete or empty
-    traceability matrix.
+    traceability matrix. Also raises a usage error when test selection
+    (``--jamb-select``, ``--jamb-affected-since``, ``--jamb-select-nodeids``,
+    ``--jamb-rerun-failed-requirements``) is requested without ``--jamb``, or
+    when the ``--jamb-events`` target is malformed.
 
     Args:
         config: The pytest configuration object.
@@ -120,6 +212,19 @@ def pytest_configure(config: pytest.Config) -> None:
             "Re-run without '-n'/'--dist' (or with '-n0') when using --jamb."
         )
 
+    selecting = (
+        getattr(config.option, "jamb_select", None)
+        or getattr(config.option, "jamb_select_document", None)
+        or getattr(config.option, "jamb_affected_since", None)
+        or getattr(config.option, "jamb_select_nodeids", None)
+        or getattr(config.option, "jamb_rerun_failed_requirements", None)
+    )
+    if selecting and not config.option.jamb:
+        raise pytest.UsageError(
+            "--jamb-select, --jamb-select-document, --jamb-affected-since, --jamb-select-nodeids "
+            "and --jamb-rerun-failed-requirements require --jamb."
+        )
+
     # Register the requirement marker
     config.addinivalue_line(
         "markers",
@@ -135,8 +240,18 @@ def pytest_configure(config: pytest.Config) -> None:
     )
 
     if config.option.jamb:
+        # Validate the event target before loading requirements
+        event_target = None
+        if events := getattr(config.option, "jamb_events", None):
+            try:
+                event_target = parse_event_target(events)
+            except ValueError as e:
+                raise pytest.UsageError(f"--jamb-events: {e}") from e
+
         # Initialize the collector
         collector = RequirementCollector(config)
+        if event_target is not None:
+            collector.events = EventWriter(event_target)
         config.pluginmanager.register(collector, "jamb_collector")
 
 
@@ -150,6 +265,13 @@ def pytest_sessionfinish(session: pytest.Session, exitstatus: int) -> None:
     ``fail_uncovered`` in the config is enabled and any test spec items lack
     coverage.
 
+    With ``--jamb-update``, results from the previous ``.jamb`` file are
+    merged in first, so matrices and the coverage check see the full suite
+    even when only a subset of tests was rerun. With
+    ``--jamb-background-matrices``, the matrices are handed to a detached
+    worker process after their data is prepared. With ``--jamb-history``,
+    the saved ``.jamb`` file is appended to the run history.
+
     For all options, CLI flags take precedence over ``[tool.jamb]`` config
     values, which take precedence over hardcoded defaults.
 
@@ -168,6 +290,14 @@ def pytest_sessionfinish(session: pytest.Session, exitstatus: int) -> None:
     tester_id = session.config.option.jamb_tester_id
     software_version = session.config.option.jamb_software_version
 
+    # Patch results into the previous coverage file when updating
+    if session.config.option.jamb_update:
+        collector.merge_previous_coverage()
+
+    background = session.config.option.jamb_background_matrices
+    if background:
+        collector.defer_matrices()
+
     # Generate test records matrix if requested
     test_matrix_path = session.config.option.jamb_test_matrix or collector.jamb_config.test_matrix_output
     if test_matrix_path:
@@ -195,11 +325,16 @@ def pytest_sessionfinish(session: pytest.Session, exitstatus: int) -> None:
             include_ancestors=include_ancestors,
         )
 
+    if background:
+        collector.start_matrix_worker()
+
     # Always save .jamb file for later matrix generation
     collector.save_coverage_file(
         tester_id=tester_id,
         software_version=software_version,
     )
+    if session.config.option.jamb_history:
+        collector.record_history()
 
     # Check coverage and potentially modify exit status
     fail_uncovered = session.config.option.jamb_fail_uncovered or collector.jamb_config.fail_uncovered
@@ -233,8 +368,9 @@ def pytest_terminal_summary(
 ) -> None:
     """Add coverage summary to terminal output.
 
-    Prints total test spec items, coverage percentage, uncovered items,
-    and unknown item references to the terminal.
+    Prints jamb's setup and collection overhead, total test spec items,
+    coverage percentage, uncovered items, and unknown item references to
+    the terminal.
 
     Args:
         terminalreporter: The pytest terminal reporter instance.
@@ -248,55 +384,41 @@ def pytest_terminal_summary(
     if not collector:
         return
 
-    coverage = collector.get_coverage()
+    snapshot = collector.coverage_snapshot()
+    coverage = snapshot.coverage
     if not coverage:
         return
 
     terminalreporter.write_sep("=", "Requirements Coverage Summary")
+    terminalreporter.write_line(collector.timing_summary())
 
-    # Count statistics - separate testable from non-testable
-    testable_items = [
-        c for c in coverage.values() if c.item.type == "requirement" and c.item.active and c.item.testable
-    ]
-    non_testable = [c for c in coverage.values() if c not in testable_items]
-
-    total_testable = len(testable_items)
-    covered = sum(1 for c in testable_items if c.is_covered)
-    passed = sum(1 for c in testable_items if c.all_tests_passed)
-
-    terminalreporter.write_line(f"Total testable items: {total_testable}")
-    if total_testable > 0:
-        terminalreporter.write_line(f"Covered by pytest tests: {covered} ({100 * covered / total_testable:.1f}%)")
-        terminalreporter.write_line(f"All tests passing: {passed}")
+    totals = snapshot.totals
+    terminalreporter.write_line(f"Total testable items: {totals.testable}")
+    if totals.testable > 0:
+        terminalreporter.write_line(
+            f"Covered by pytest tests: {totals.covered} ({100 * totals.covered / totals.testable:.1f}%)"
+        )
+        terminalreporter.write_line(f"All tests passing: {totals.passed}")
 
     # Report non-testable breakdown if any exist
-    if non_testable:
-        heading_count = sum(1 for c in non_testable if c.item.type == "heading")
-        info_count = sum(1 for c in non_testable if c.item.type == "info")
-        inactive_count = sum(1 for c in non_testable if not c.item.active)
-        untestable_count = sum(1 for c in non_testable if c.item.type == "requirement" and not c.item.testable)
+    if totals.excluded:
         parts = []
-        if heading_count:
-            parts.append(f"heading: {heading_count}")
-        if info_count:
-            parts.append(f"info: {info_count}")
-        if inactive_count:
-            parts.append(f"inactive: {inactive_count}")
-        if untestable_count:
-            parts.append(f"non-testable: {untestable_count}")
+        if totals.heading:
+            parts.append(f"heading: {totals.heading}")
+        if totals.info:
+            parts.append(f"info: {totals.info}")
+        if totals.inactive:
+            parts.append(f"inactive: {totals.inactive}")
+        if totals.untestable:
+            parts.append(f"non-testable: {totals.untestable}")
         if parts:
-            terminalreporter.write_line(f"Non-testable items: {len(non_testable)} ({', '.join(parts)})")
+            terminalreporter.write_line(f"Non-testable items: {totals.excluded} ({', '.join(parts)})")
 
     # Report uncovered items - only testable items
-    uncovered = [
-        uid
-        for uid, c in coverage.items()
-        if not c.is_covered and c.item.type == "requirement" and c.item.active and c.item.testable
-    ]
-    if uncovered:
+    if snapshot.uncovered_uids:
         terminalreporter.write_line("")
         terminalreporter.write_line("Uncovered test spec items:", red=True, bold=True)
-        for uid in uncovered:
+        for uid in snapshot.uncovered_uids:
             item = coverage[uid].item
             terminalreporter.write_line(f"  - {uid}: {item.display_text}", red=True)
 
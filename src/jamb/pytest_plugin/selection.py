@@ -0,0 +1,98 @@
+"""Requirement-scoped test selection for the jamb pytest plugin."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from fnmatch import fnmatchcase
+
+from jamb.core.models import ItemCoverage, TraceabilityGraph
+
+# Requirement statuses that --jamb-rerun-failed-requirements re-verifies
+RERUN_STATUSES = ("Failed", "Partial")
+
+
+def split_option_list(value: str | None) -> list[str]:
+    """Split a comma-separated command-line value into stripped entries.
+
+    Args:
+        value: Raw option value (e.g. ``"SYS012, SRS0*"``), or ``None``.
+
+    Returns:
+        Non-empty entries in the order given.
+    """
+    if not value:
+        return []
+    return [part.strip() for part in value.split(",") if part.strip()]
+
+
+def expand_requirement_selection(
+    graph: TraceabilityGraph,
+    patterns: Iterable[str] = (),
+    documents: Iterable[str] = (),
+) -> set[str]:
+    """Resolve a requirement selection to UIDs, including descendants.
+
+    Each pattern is either an exact UID or a glob (``*``, ``?``, ``[...]``)
+    matched case-sensitively against every UID in the graph. Each document
+    prefix selects all items of that document. Every matched item is then
+    expanded to its descendants (see
+    :meth:`TraceabilityGraph.get_descendant_uids`), so selecting a system
+    requirement also selects the software requirements beneath it.
+
+    Args:
+        graph: The traceability graph to resolve against.
+        patterns: UIDs or UID globs.
+        documents: Document prefixes.
+
+    Returns:
+        Set of selected UIDs (matched items and all their descendants).
+
+    Raises:
+        ValueError: If a pattern matches no item or a document prefix is
+            not part of the graph.
+    """
+    roots: set[str] = set()
+
+    for pattern in patterns:
+        if pattern in graph.items:
+            roots.add(pattern)
+            continue
+        matched = [uid for uid in graph.items if fnmatchcase(uid, pattern)]
+        if not matched:
+            raise ValueError(f"Requirement selection '{pattern}' matched no items")
+        roots.update(matched)
+
+    for prefix in documents:
+        if prefix not in graph.document_parents:
+            raise ValueError(f"Unknown document '{prefix}' in requirement selection")
+        roots.update(item.uid for item in graph.get_items_by_document(prefix))
+
+    return graph.get_descendant_uids(roots)
+
+
+def failed_requirement_selection(graph: TraceabilityGraph, coverage: dict[str, ItemCoverage]) -> set[str]:
+    """Resolve the requirements to re-verify after a run with failures.
+
+    Each item's status is computed from its own linked tests with the
+    rules of the trace matrix (see
+    :func:`jamb.matrix.chain_builder._calculate_status_from_tests`). Items
+    that are ``Failed`` or ``Partial`` are then expanded to their
+    descendants, so every test behind a failed requirement runs again,
+    not just the tests that failed.
+
+    Args:
+        graph: The current traceability graph, used to find descendants.
+        coverage: Coverage loaded from the previous ``.jamb`` file.
+
+    Returns:
+        Set of the failed or partial UIDs and all their descendants. Empty
+        when every requirement passed.
+    """
+    from jamb.matrix.chain_builder import _calculate_status_from_tests
+
+    roots = {
+        uid
+        for uid, cov in coverage.items()
+        if cov.linked_tests and _calculate_status_from_tests(cov.linked_tests, cov.item) in RERUN_STATUSES
+    }
+    return graph.get_descendant_uids(roots)
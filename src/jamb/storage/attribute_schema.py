@@ -0,0 +1,129 @@
+"""Schemas for the custom attributes of a document's items.
+
+A document's ``.jamb.yml`` may describe the custom attributes of its items
+in a top-level ``attributes`` section::
+
+    settings:
+      prefix: SRS
+      parents: [SYS]
+    attributes:
+      safety_class:
+        type: str
+        enum: [A, B, C]
+        required: true
+      owner:
+        pattern: "^[a-z]+$"
+
+Each attribute accepts:
+
+* ``type`` -- one of :data:`ATTRIBUTE_TYPES`;
+* ``enum`` -- the list of allowed values;
+* ``required`` -- whether every item must set the attribute;
+* ``pattern`` -- a regular expression that string values must match
+  (anywhere, as with :func:`re.search`; anchor it with ``^`` and ``$``).
+
+:func:`compile_attribute_schema` turns a schema into one check per
+attribute. The schema is parsed and its patterns compiled once, so
+checking an item only calls a few closures on its attribute dict.
+"""
+
+from __future__ import annotations
+
+import datetime
+import re
+from collections.abc import Callable
+from typing import Any
+
+#: Attribute types and the Python types their values may have.
+ATTRIBUTE_TYPES: dict[str, tuple[type, ...]] = {
+    "str": (str,),
+    "int": (int,),
+    "float": (int, float),
+    "bool": (bool,),
+    "list": (list,),
+    "date": (datetime.date,),
+}
+
+_SPEC_KEYS = ("type", "enum", "required", "pattern")
+
+#: Returns a message describing why an item's attributes break the
+#: schema of one attribute, or ``None`` if they do not.
+AttributeCheck = Callable[[dict[str, Any]], str | None]
+
+
+def compile_attribute_schema(schema: dict[str, Any]) -> list[AttributeCheck]:
+    """Compile the ``attributes`` section of a document config.
+
+    Args:
+        schema: Mapping of attribute name to its specification.
+
+    Returns:
+        One check per attribute, in schema order. Each takes an item's
+        :attr:`~jamb.core.models.Item.custom_attributes`.
+
+    Raises:
+        ValueError: If the schema is malformed, e.g. has an unknown type
+            or an invalid regular expression.
+    """
+    if not isinstance(schema, dict):
+        raise ValueError(f"expected a mapping of attribute names, got {type(schema).__name__}")
+    return [_compile_attribute(str(name), spec) for name, spec in schema.items()]
+
+
+def _compile_attribute(name: str, spec: Any) -> AttributeCheck:
+    """Compile the specification of attribute *name* into a check."""
+    if spec is None:
+        spec = {}
+    if not isinstance(spec, dict):
+        raise ValueError(f"attribute '{name}': expected a mapping, got {type(spec).__name__}")
+    unknown = [key for key in spec if key not in _SPEC_KEYS]
+    if unknown:
+        raise ValueError(
+            f"attribute '{name}': unknown keys {', '.join(map(str, unknown))} (expected: {', '.join(_SPEC_KEYS)})"
+        )
+
+    required = spec.get("required", False)
+    if not isinstance(required, bool):
+        raise ValueError(f"attribute '{name}': 'required' must be true or false")
+
+    type_name = spec.get("type")
+    types: tuple[type, ...] | None = None
+    if type_name is not None:
+        if not isinstance(type_name, str) or type_name not in ATTRIBUTE_TYPES:
+            raise ValueError(
+                f"attribute '{name}': unknown type '{type_name}' (expected one of: {', '.join(ATTRIBUTE_TYPES)})"
+            )
+        types = ATTRIBUTE_TYPES[type_name]
+    # bool is a subclass of int, but true is not a number here
+    reject_bool = types is not None and bool not in types
+    # datetime is a subclass of date, but a timestamp is not a date
+    reject_datetime = type_name == "date"
+
+    enum = spec.get("enum")
+    if enum is not None and not isinstance(enum, list):
+        raise ValueError(f"attribute '{name}': 'enum' must be a list")
+
+    pattern = None
+    if spec.get("pattern") is not None:
+        try:
+            pattern = re.compile(str(spec["pattern"]))
+        except re.error as e:
+            raise ValueError(f"attribute '{name}': invalid pattern: {e}") from e
+
+    def check(attributes: dict[str, Any]) -> str | None:
+        value = attributes.get(name)
+        if value is None:
+            return f"missing required attribute '{name}'" if required else None
+        if types is not None and (
+            not isinstance(value, types)
+            or (reject_bool and isinstance(value, bool))
+            or (reject_datetime and isinstance(value, datetime.datetime))
+        ):
+            return f"attribute '{name}' must be of type {type_name}, got {type(value).__name__}: {value!r}"
+        if enum is not None and value not in enum:
+            return f"attribute '{name}' must be one of {', '.join(map(str, enum))}, got {value!r}"
+        if pattern is not None and (not isinstance(value, str) or not pattern.search(value)):
+            return f"attribute '{name}' does not match pattern '{pattern.pattern}': {value!r}"
+        return None
+
+    return check
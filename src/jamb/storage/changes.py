@@ -0,0 +1,266 @@
+"""Detect changed requirement items and test files.
+
+Changes are found either from git history (:func:`get_changes_since`,
+:func:`get_staged_changes`) or from the suspect links of the tree itself
+(:func:`suspect_impact`).
+"""
+
+from __future__ import annotations
+
+import re
+import subprocess
+from collections import deque
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from jamb.core.models import TraceabilityGraph
+from jamb.storage.document_dag import DocumentDAG
+from jamb.storage.items import compute_content_hash
+
+
+@dataclass
+class ChangeSet:
+    """Requirement and test files changed relative to a git ref.
+
+    Attributes:
+        item_uids (set[str]): UIDs whose item YAML file was added, modified,
+            or deleted.
+        documents (set[str]): Prefixes of documents whose ``.jamb.yml``
+            config changed; every item in them is treated as changed.
+        python_files (set[Path]): Resolved paths of changed ``.py`` files.
+    """
+
+    item_uids: set[str] = field(default_factory=set)
+    documents: set[str] = field(default_factory=set)
+    python_files: set[Path] = field(default_factory=set)
+
+    def affected_uids(self, graph: TraceabilityGraph) -> set[str]:
+        """Return changed UIDs plus all of their descendants in *graph*.
+
+        Args:
+            graph: The current traceability graph.
+
+        Returns:
+            Set of UIDs whose verification may be affected by the change.
+        """
+        roots = set(self.item_uids)
+        for prefix in self.documents:
+            roots.update(item.uid for item in graph.get_items_by_document(prefix))
+        return graph.get_descendant_uids(roots)
+
+    def touches_test_file(self, path: Path) -> bool:
+        """Return True if *path* or a ``conftest.py`` governing it changed.
+
+        Args:
+            path: Path of a test module.
+
+        Returns:
+            True if the module itself changed, or a ``conftest.py`` in its
+            directory or any parent directory changed.
+        """
+        path = path.resolve()
+        if path in self.python_files:
+            return True
+        conftest_dirs = {changed.parent for changed in self.python_files if changed.name == "conftest.py"}
+        return any(parent in conftest_dirs for parent in path.parents)
+
+
+def git_changed_files(ref: str, root: Path | None = None) -> list[Path]:
+    """List files that differ from *ref*, including uncommitted work.
+
+    Combines ``git diff --name-only <ref>`` (committed, staged, and unstaged
+    changes, including deletions) with untracked files that are not ignored.
+
+    Args:
+        ref: Any git revision (branch, tag, commit, ``HEAD~3``, ...).
+        root: Directory inside the repository. Defaults to the current
+            working directory.
+
+    Returns:
+        Resolved paths of the changed files, in git's order.
+
+    Raises:
+        ValueError: If git is unavailable, *root* is not in a repository,
+            or *ref* cannot be resolved.
+    """
+    cwd = root or Path.cwd()
+    toplevel = Path(_run_git(["rev-parse", "--show-toplevel"], cwd).strip())
+    names = _run_git(["diff", "--name-only", ref, "--"], toplevel).splitlines()
+    names += _run_git(["ls-files", "--others", "--exclude-standard"], toplevel).splitlines()
+    return [(toplevel / name).resolve() for name in dict.fromkeys(names) if name]
+
+
+def git_staged_files(root: Path | None = None) -> list[Path]:
+    """List files staged for the next commit.
+
+    Uses ``git diff --cached --name-only``, so staged deletions are
+    included.
+
+    Args:
+        root: Directory inside the repository. Defaults to the current
+            working directory.
+
+    Returns:
+        Resolved paths of the staged files, in git's order.
+
+    Raises:
+        ValueError: If git is unavailable or *root* is not in a repository.
+    """
+    cwd = root or Path.cwd()
+    toplevel = Path(_run_git(["rev-parse", "--show-toplevel"], cwd).strip())
+    names = _run_git(["diff", "--cached", "--name-only", "--"], toplevel).splitlines()
+    return [(toplevel / name).resolve() for name in names if name]
+
+
+def _run_git(args: list[str], cwd: Path) -> str:
+    """Run a git command and return stdout, raising ValueError on failure."""
+    try:
+        result = subprocess.run(["git", *args], cwd=str(cwd), capture_output=True, text=True)
+    except OSError as e:
+        raise ValueError(f"Could not run git: {e}") from e
+    if result.returncode != 0:
+        raise ValueError(f"git {' '.join(args)} failed: {result.stderr.strip()}")
+    return result.stdout
+
+
+def classify_changes(changed_files: Iterable[Path], dag: DocumentDAG) -> ChangeSet:
+    """Map changed file paths to item UIDs, documents, and Python files.
+
+    Args:
+        changed_files: Resolved paths of changed files.
+        dag: The discovered document DAG.
+
+    Returns:
+        A :class:`ChangeSet` describing the change.
+    """
+    doc_dirs: dict[Path, tuple[str, re.Pattern[str]]] = {}
+    for prefix, doc_path in dag.document_paths.items():
+        sep = dag.documents[prefix].sep
+        pattern = re.compile(rf"^{re.escape(prefix)}{re.escape(sep)}\d+\.yml$", re.IGNORECASE)
+        doc_dirs[doc_path.resolve()] = (prefix, pattern)
+
+    changes = ChangeSet()
+    for path in changed_files:
+        if path.suffix == ".py":
+            changes.python_files.add(path)
+            continue
+        doc = doc_dirs.get(path.parent)
+        if doc is None:
+            continue
+        prefix, pattern = doc
+        if path.name == ".jamb.yml":
+            changes.documents.add(prefix)
+        elif pattern.match(path.name):
+            changes.item_uids.add(path.stem.strip())
+    return changes
+
+
+def get_changes_since(ref: str, dag: DocumentDAG, root: Path | None = None) -> ChangeSet:
+    """Classify everything that changed in the working tree since *ref*.
+
+    Args:
+        ref: Git revision to compare against.
+        dag: The discovered document DAG.
+        root: Directory inside the repository (default: current directory).
+
+    Returns:
+        A :class:`ChangeSet` for the change.
+
+    Raises:
+        ValueError: If the git comparison fails.
+    """
+    return classify_changes(git_changed_files(ref, root), dag)
+
+
+def get_staged_changes(dag: DocumentDAG, root: Path | None = None) -> ChangeSet:
+    """Classify the files staged for the next commit.
+
+    Args:
+        dag: The discovered document DAG.
+        root: Directory inside the repository (default: current directory).
+
+    Returns:
+        A :class:`ChangeSet` for the staged files.
+
+    Raises:
+        ValueError: If git fails.
+    """
+    return classify_changes(git_staged_files(root), dag)
+
+
+@dataclass
+class ImpactedItem:
+    """An item in the downstream impact of changed items.
+
+    Attributes:
+        uid (str): Item UID.
+        depth (int): Number of links between the item and the nearest
+            changed item; 0 for the changed items themselves.
+        suspect_links (list[str]): UIDs of linked items whose content no
+            longer matches the stored link hash.
+        via (str | None): The parent through which the item was first
+            reached, or ``None`` for changed items.
+    """
+
+    uid: str
+    depth: int
+    suspect_links: list[str] = field(default_factory=list)
+    via: str | None = None
+
+
+def suspect_impact(graph: TraceabilityGraph) -> list[ImpactedItem]:
+    """Return every item downstream of an item that changed since its links were verified.
+
+    An item has changed when an item linking to it stores a link hash that
+    no longer matches its content (a suspect link). Starting from all
+    changed items at once, a breadth-first walk over the child links gives
+    each active descendant its distance to the nearest changed item. Each
+    item's content hash is computed at most once and each link is followed
+    at most once, so the analysis is linear in the size of the graph.
+
+    Args:
+        graph: The traceability graph, with link hashes loaded (see
+            :attr:`Item.link_hashes`).
+
+    Returns:
+        The changed and affected items, ordered by depth, then by the
+        order in which they were reached.
+    """
+    items = graph.items
+    hashes: dict[str, str] = {}
+
+    def content_hash(uid: str) -> str:
+        if uid not in hashes:
+            item = items[uid]
+            hashes[uid] = compute_content_hash(
+                {"text": item.text, "header": item.header, "links": item.links, "type": item.type}
+            )
+        return hashes[uid]
+
+    suspect_links: dict[str, list[str]] = {}
+    changed: dict[str, None] = {}
+    for uid, item in items.items():
+        if not item.active or not item.link_hashes:
+            continue
+        for link, stored_hash in item.link_hashes.items():
+            target = items.get(link)
+            if target is None or not target.active or link not in item.links:
+                continue
+            if stored_hash != content_hash(link):
+                suspect_links.setdefault(uid, []).append(link)
+                changed[link] = None
+
+    impacted = {uid: ImpactedItem(uid, 0, suspect_links.get(uid, [])) for uid in changed}
+    to_visit = deque(changed)
+    while to_visit:
+        uid = to_visit.popleft()
+        depth = impacted[uid].depth + 1
+        for child_uid in graph.item_children.get(uid, []):
+            child = items.get(child_uid)
+            if child is None or not child.active or child_uid in impacted:
+                continue
+            impacted[child_uid] = ImpactedItem(child_uid, depth, suspect_links.get(child_uid, []), uid)
+            to_visit.append(child_uid)
+
+    return list(impacted.values())
@@ -19,12 +19,16 @@ class DocumentConfig:
             (e.g. ``3`` produces ``REQ001``).
         sep (str): Separator between the prefix and numeric part of a UID
             (e.g. ``"-"`` produces ``REQ-001``).
+        attributes (dict[str, Any]): Schema of the items' custom attributes,
+            checked by ``jamb validate`` (see
+            :mod:`jamb.storage.attribute_schema`). Empty if not declared.
     """
 
     prefix: str
     parents: list[str] = field(default_factory=list)
     digits: int = 3
     sep: str = ""
+    attributes: dict[str, Any] = field(default_factory=dict)
 
 
 def load_document_config(path: Path) -> DocumentConfig:
@@ -37,7 +41,8 @@ def load_document_config(path: Path) -> DocumentConfig:
         DocumentConfig parsed from the file.
 
     Raises:
-        ValueError: If the config file is missing required fields.
+        ValueError: If the config file is missing required fields, or its
+            ``attributes`` section is not a mapping.
     """
     with open(path, encoding="utf-8") as f:
         data = yaml.safe_load(f)
@@ -58,11 +63,16 @@ def load_document_config(path: Path) -> DocumentConfig:
         elif raw is not None:
             parents = [str(raw)]
 
+    attributes = data.get("attributes") or {}
+    if not isinstance(attributes, dict):
+        raise ValueError(f"Config file 'attributes' must be a mapping: {path}")
+
     return DocumentConfig(
         prefix=prefix,
         parents=parents,
         digits=settings.get("digits", 3),
         sep=settings.get("sep", ""),
+        attributes=attributes,
     )
 
 
@@ -81,7 +91,9 @@ def save_document_config(config: DocumentConfig, directory: Path) -> None:
     if config.parents:
         settings["parents"] = config.parents
 
-    data = {"settings": settings}
+    data: dict[str, Any] = {"settings": settings}
+    if config.attributes:
+        data["attributes"] = config.attributes
 
     directory.mkdir(parents=True, exist_ok=True)
     config_path = directory / ".jamb.yml"
@@ -1,9 +1,9 @@
 """DAG-based document hierarchy for jamb."""
 
-from collections import deque
 from dataclasses import dataclass, field
 from pathlib import Path
 
+from jamb.core.cycles import find_cycles, topological_order
 from jamb.storage.document_config import DocumentConfig
 
 
@@ -75,82 +75,40 @@ class DocumentDAG:
     def topological_sort(self) -> list[str]:
         """Return prefixes in topological order (parents before children).
 
-        Uses Kahn's algorithm. If there are cycles, remaining nodes
-        are appended at the end.
+        Uses Kahn's algorithm over the strongly connected components of the
+        hierarchy (see :func:`jamb.core.cycles.topological_order`). Documents
+        in a cycle cannot be ordered among themselves; they are kept
+        together, after the documents above the cycle.
 
         Raises:
             ValueError: If any document references unknown parent documents.
         """
-        # Build in-degree map
-        in_degree: dict[str, int] = {p: 0 for p in self.documents}
-        children_map: dict[str, list[str]] = {p: [] for p in self.documents}
-        missing_parents: list[str] = []
-
-        for prefix, config in self.documents.items():
-            for parent in config.parents:
-                if parent in self.documents:
-                    in_degree[prefix] += 1
-                    children_map[parent].append(prefix)
-                else:
-                    missing_parents.append(f"{prefix} references unknown parent {parent}")
-
+        missing_parents = [
+            f"{prefix} references unknown parent {parent}"
+            for prefix, config in self.documents.items()
+            for parent in config.parents
+            if parent not in self.documents
+        ]
         if missing_parents:
             raise ValueError(f"Document DAG has missing parents: {', '.join(missing_parents)}")
 
-        # Start with nodes that have no parents
-        queue: deque[str] = deque()
-        for prefix, degree in in_degree.items():
-            if degree == 0:
-                queue.append(prefix)
-
-        result: list[str] = []
-        while queue:
-            node = queue.popleft()
-            result.append(node)
-            for child in children_map[node]:
-                in_degree[child] -= 1
-                if in_degree[child] == 0:
-                    queue.append(child)
-
-        # Append any remaining (cycle participants)
-        for prefix in self.documents:
-            if prefix not in result:
-                result.append(prefix)
-
-        return result
+        children_map: dict[str, list[str]] = {p: [] for p in self.documents}
+        for prefix, config in self.documents.items():
+            for parent in config.parents:
+                children_map[parent].append(prefix)
+        return topological_order(self.documents, children_map.__getitem__)
 
     def validate_acyclic(self) -> list[str]:
         """Check for cycles in the DAG.
 
+        Every cycle is reported, with its documents and a representative
+        chain of parent references.
+
         Returns:
-            List of error messages. Empty if no cycles.
+            List of error messages, one per cycle. Empty if no cycles.
         """
-        # Build in-degree map and children adjacency (single Kahn's pass)
-        in_degree: dict[str, int] = {p: 0 for p in self.documents}
-        children_map: dict[str, list[str]] = {p: [] for p in self.documents}
-
-        for prefix, config in self.documents.items():
-            for parent in config.parents:
-                if parent in self.documents:
-                    in_degree[prefix] += 1
-                    children_map[parent].append(prefix)
-
-        queue: deque[str] = deque()
-        for prefix, degree in in_degree.items():
-            if degree == 0:
-                queue.append(prefix)
-
-        visited: set[str] = set()
-        while queue:
-            node = queue.popleft()
-            visited.add(node)
-            for child in children_map[node]:
-                in_degree[child] -= 1
-                if in_degree[child] == 0:
-                    queue.append(child)
-
-        errors: list[str] = []
-        cycle_nodes = set(self.documents.keys()) - visited
-        if cycle_nodes:
-            errors.append(f"Cycle detected among documents: {', '.join(sorted(cycle_nodes))}")
-        return errors
+        return [
+            f"Cycle detected among documents: {', '.join(sorted(cycle.members))} "
+            f"(parents: {' -> '.join([*cycle.path, cycle.path[0]])})"
+            for cycle in find_cycles(self.documents, self.get_parents)
+        ]
@@ -1,10 +1,18 @@
 """Build TraceabilityGraph from native storage layer."""
 
 import fnmatch
+import re
+from collections.abc import Iterable
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 from jamb.core.models import Item, TraceabilityGraph
 from jamb.storage.document_dag import DocumentDAG
-from jamb.storage.items import read_document_items
+from jamb.storage.items import find_item_files, read_document_items, read_item
+from jamb.storage.parallel import run_in_pool, shard_by_document
+
+if TYPE_CHECKING:
+    from jamb.storage.validation_cache import ValidationCache
 
 
 def build_traceability_graph(
@@ -12,6 +20,8 @@ def build_traceability_graph(
     document_prefixes: list[str] | None = None,
     include_inactive: bool = False,
     exclude_patterns: list[str] | None = None,
+    cache: "ValidationCache | None" = None,
+    jobs: int = 1,
 ) -> TraceabilityGraph:
     """Build a TraceabilityGraph from the native storage layer.
 
@@ -22,10 +32,21 @@ def build_traceability_graph(
         include_inactive: Whether to include inactive items.
         exclude_patterns: Optional glob patterns to exclude documents
             (by prefix) and items (by UID) from the graph.
+        cache: Reuse parsed items of unchanged files from this cache.
+        jobs: Number of processes parsing item files. With more than one,
+            each document's files are split into contiguous shards that
+            are parsed in a process pool; the graph is the same as with
+            one.
 
     Returns:
         TraceabilityGraph populated with items and document relationships.
+
+    Raises:
+        ValueError: If *jobs* is greater than one and a *cache* is given.
     """
+    if jobs > 1 and cache is not None:
+        raise ValueError("A validation cache cannot be used with more than one job")
+
     graph = TraceabilityGraph()
 
     prefixes_to_load = document_prefixes if document_prefixes is not None else list(dag.documents.keys())
@@ -34,6 +55,8 @@ def build_traceability_graph(
     if exclude_patterns:
         prefixes_to_load = [p for p in prefixes_to_load if not any(fnmatch.fnmatch(p, pat) for pat in exclude_patterns)]
 
+    raw_by_prefix = _read_documents_in_pool(dag, prefixes_to_load, include_inactive, jobs) if jobs > 1 else None
+
     for prefix in prefixes_to_load:
         if prefix not in dag.documents:
             continue
@@ -48,26 +71,177 @@ def build_traceability_graph(
             continue
 
         # Read items from disk
-        raw_items = read_document_items(doc_path, prefix, include_inactive, sep=config.sep)
+        if raw_by_prefix is not None:
+            raw_items = raw_by_prefix[prefix]
+        else:
+            raw_items = read_document_items(doc_path, prefix, include_inactive, sep=config.sep, cache=cache)
 
         for raw in raw_items:
-            item = Item(
-                uid=raw["uid"],
-                text=raw["text"],
-                document_prefix=raw["document_prefix"],
-                active=raw["active"],
-                type=raw["type"],
-                header=raw["header"] or None,
-                level=raw.get("level"),
-                links=raw["links"],
-                reviewed=raw["reviewed"],
-                derived=raw["derived"],
-                testable=raw.get("testable", True),
-                custom_attributes=raw.get("custom_attributes", {}),
-            )
+            item = _item_from_raw(raw)
             # Filter out excluded items by UID
             if exclude_patterns and any(fnmatch.fnmatch(item.uid, pat) for pat in exclude_patterns):
                 continue
             graph.add_item(item)
 
     return graph
+
+
+def index_item_files(dag: DocumentDAG) -> dict[str, tuple[str, Path]]:
+    """Map the UID of every item file to its document and path.
+
+    Only the document directories are listed; no item file is read.
+
+    Args:
+        dag: The document DAG with discovered documents.
+
+    Returns:
+        ``{uid: (prefix, path)}`` for every item file, whether the item is
+        active or not.
+
+    Raises:
+        ValueError: If a prefix pattern is invalid.
+    """
+    index: dict[str, tuple[str, Path]] = {}
+    for prefix, config in dag.documents.items():
+        doc_path = dag.document_paths.get(prefix)
+        if doc_path is None or not doc_path.is_dir():
+            continue
+        for path in find_item_files(doc_path, prefix, config.sep):
+            index.setdefault(path.stem.strip(), (prefix, path))
+    return index
+
+
+def build_link_closure_graph(
+    dag: DocumentDAG,
+    uids: Iterable[str],
+    index: dict[str, tuple[str, Path]] | None = None,
+) -> tuple[TraceabilityGraph, list[str]]:
+    """Load a few items with their direct parents and children.
+
+    The items and their children are the items to check. Children are the
+    items of child documents that link to one of *uids*; their files are
+    searched for the UIDs as text before being parsed, so only files that
+    mention them are read. Every item the items to check link to is loaded
+    too, so that per-item checks see their link targets. *uids* without
+    an item file (e.g. deleted items) still have their children loaded.
+
+    Args:
+        dag: The document DAG with discovered documents.
+        uids: UIDs of the items to load.
+        index: UID to file index from :func:`index_item_files`; built if
+            not given.
+
+    Returns:
+        The graph, including inactive items, and the UIDs of the items to
+        check, in document order.
+
+    Raises:
+        ValueError: If a prefix pattern is invalid.
+    """
+    if index is None:
+        index = index_item_files(dag)
+    uids = set(uids)
+    graph = TraceabilityGraph()
+    for prefix, config in dag.documents.items():
+        graph.set_document_parents(prefix, config.parents)
+
+    def load(uid: str) -> None:
+        if uid not in graph.items and uid in index:
+            prefix, path = index[uid]
+            graph.add_item(_item_from_raw(read_item(path, prefix)))
+
+    # Documents whose items may link to the given ones
+    prefixes = {_document_of(uid, dag, index) for uid in uids}
+    child_docs = {child for prefix in prefixes if prefix in dag.documents for child in dag.get_children(prefix)}
+    mentions = re.compile("|".join(rf"(?<![\w-]){re.escape(uid)}(?![\w-])" for uid in sorted(uids))) if uids else None
+
+    to_check: set[str] = set()
+    for uid in uids:
+        load(uid)
+        if uid in graph.items:
+            to_check.add(uid)
+    if mentions is not None:
+        for uid, (prefix, path) in index.items():
+            if prefix not in child_docs or uid in graph.items:
+                continue
+            try:
+                text = path.read_text(encoding="utf-8")
+            except (OSError, UnicodeDecodeError):
+                continue
+            if not mentions.search(text):
+                continue
+            raw = read_item(path, prefix)
+            if uids.intersection(raw["links"]) or uids.intersection(raw.get("link_hashes", {})):
+                graph.add_item(_item_from_raw(raw))
+                to_check.add(uid)
+
+    for uid in list(to_check):
+        item = graph.items[uid]
+        for link in (*item.links, *(item.link_hashes or {})):
+            load(link)
+
+    order = {prefix: i for i, prefix in enumerate(dag.documents)}
+    checked = sorted(to_check, key=lambda uid: (order.get(graph.items[uid].document_prefix, len(order)), uid))
+    return graph, checked
+
+
+def _document_of(uid: str, dag: DocumentDAG, index: dict[str, tuple[str, Path]]) -> str | None:
+    """Return the document of *uid*, from its file or, if it has none, its name."""
+    if uid in index:
+        return index[uid][0]
+    for prefix, config in dag.documents.items():
+        if re.fullmatch(rf"{re.escape(prefix)}{re.escape(config.sep)}\d+", uid, re.IGNORECASE):
+            return prefix
+    return None
+
+
+def _item_from_raw(raw: dict[str, Any]) -> Item:
+    """Create an :class:`Item` from an item dict returned by :func:`read_item`."""
+    return Item(
+        uid=raw["uid"],
+        text=raw["text"],
+        document_prefix=raw["document_prefix"],
+        active=raw["active"],
+        type=raw["type"],
+        header=raw["header"] or None,
+        level=raw.get("level"),
+        links=raw["links"],
+        reviewed=raw["reviewed"],
+        derived=raw["derived"],
+        testable=raw.get("testable", True),
+        custom_attributes=raw.get("custom_attributes", {}),
+        link_hashes=raw.get("link_hashes", {}),
+    )
+
+
+def _read_documents_in_pool(
+    dag: DocumentDAG, prefixes: list[str], include_inactive: bool, jobs: int
+) -> dict[str, list[dict[str, Any]]]:
+    """Parse the item files of *prefixes* in a pool of *jobs* processes.
+
+    Returns:
+        The item dicts of each document with a directory, as
+        :func:`read_document_items` would return them.
+    """
+    files = [
+        (prefix, find_item_files(dag.document_paths[prefix], prefix, dag.documents[prefix].sep))
+        for prefix in prefixes
+        if prefix in dag.documents and dag.document_paths.get(prefix) is not None
+    ]
+    shards = shard_by_document(files, jobs)
+    results = run_in_pool(_read_item_files, [(prefix, paths, include_inactive) for prefix, paths in shards], jobs)
+
+    raw_by_prefix: dict[str, list[dict[str, Any]]] = {prefix: [] for prefix, _ in files}
+    for (prefix, _), raw_items in zip(shards, results, strict=True):
+        raw_by_prefix[prefix].extend(raw_items)
+    return raw_by_prefix
+
+
+def _read_item_files(task: tuple[str, list[Path], bool]) -> list[dict[str, Any]]:
+    prefix, paths, include_inactive = task
+    items = []
+    for path in paths:
+        item = read_item(path, prefix)
+        if include_inactive or item["active"]:
+            items.append(item)
+    return items
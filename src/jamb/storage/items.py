@@ -8,10 +8,13 @@ import tempfile
 import unicodedata
 import warnings
 from pathlib import Path
-from typing import IO, Any
+from typing import IO, TYPE_CHECKING, Any
 
 import yaml
 
+if TYPE_CHECKING:
+    from jamb.storage.validation_cache import ValidationCache
+
 
 class _BlockScalarDumper(yaml.SafeDumper):
     """YAML dumper that uses literal block scalar style for multiline strings."""
@@ -238,7 +241,11 @@ def write_item(item_data: dict[str, Any], path: Path, extra_fields: dict[str, An
 
 
 def read_document_items(
-    doc_path: Path, prefix: str, include_inactive: bool = False, sep: str = ""
+    doc_path: Path,
+    prefix: str,
+    include_inactive: bool = False,
+    sep: str = "",
+    cache: "ValidationCache | None" = None,
 ) -> list[dict[str, Any]]:
     """Read all item YAML files from a document directory.
 
@@ -247,6 +254,7 @@ def read_document_items(
         prefix: The document prefix.
         include_inactive: Whether to include inactive items.
         sep: Separator between prefix and number.
+        cache: Reuse parsed items of unchanged files from this cache.
 
     Returns:
         List of item dicts, sorted by UID.
@@ -255,18 +263,35 @@ def read_document_items(
         ValueError: If the prefix pattern is invalid.
     """
     items = []
+    for path in find_item_files(doc_path, prefix, sep):
+        item = read_item(path, prefix) if cache is None else cache.read_item(path, prefix)
+        if include_inactive or item["active"]:
+            items.append(item)
+
+    return items
+
+
+def find_item_files(doc_path: Path, prefix: str, sep: str = "") -> list[Path]:
+    """List the item YAML files of a document directory.
+
+    Args:
+        doc_path: Path to the document directory.
+        prefix: The document prefix.
+        sep: Separator between prefix and number.
+
+    Returns:
+        Paths of the files named like ``<prefix><sep><number>.yml``,
+        sorted by name.
+
+    Raises:
+        ValueError: If the prefix pattern is invalid.
+    """
     try:
         pattern = re.compile(rf"^{re.escape(prefix)}{re.escape(sep)}\d+\.yml$", re.IGNORECASE)
     except re.error as e:
         raise ValueError(f"Invalid prefix pattern '{prefix}': {e}") from e
 
-    for path in sorted(doc_path.iterdir()):
-        if path.is_file() and pattern.match(path.name):
-            item = read_item(path, prefix)
-            if include_inactive or item["active"]:
-                items.append(item)
-
-    return items
+    return [path for path in sorted(doc_path.iterdir()) if path.is_file() and pattern.match(path.name)]
 
 
 def next_uid(prefix: str, digits: int, existing_uids: list[str], sep: str = "") -> str:
@@ -0,0 +1,89 @@
+"""Process pool helpers for ``jamb validate --jobs``.
+
+Tasks run in worker processes, but their results and the warnings they
+raise come back in task order, so a parallel run reports exactly what a
+serial run would.
+"""
+
+from __future__ import annotations
+
+import functools
+import math
+import warnings
+from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Warning message, category, filename and line number
+_CapturedWarning = tuple[str, type[Warning], str, int]
+
+
+def run_in_pool(
+    func: Callable[[T], R],
+    tasks: Sequence[T],
+    jobs: int,
+    initializer: Callable[..., None] | None = None,
+    initargs: tuple[Any, ...] = (),
+) -> list[R]:
+    """Call *func* on every task in a pool of *jobs* processes.
+
+    Warnings raised by a task are recorded in the worker and raised again
+    in this process, after those of the tasks before it.
+
+    Args:
+        func: Module-level function to call on each task.
+        tasks: Picklable task arguments.
+        jobs: Number of worker processes.
+        initializer: Called once in each worker before its first task,
+            e.g. to install read-only state shared by all tasks.
+        initargs: Arguments for *initializer*.
+
+    Returns:
+        The results, in task order.
+
+    Raises:
+        Exception: The first exception raised by a task, in task order,
+            after the warnings of the tasks before it.
+    """
+    results = []
+    with ProcessPoolExecutor(max_workers=jobs, initializer=initializer, initargs=initargs) as pool:
+        for result, captured in pool.map(functools.partial(_call_capturing_warnings, func), tasks):
+            for message, category, filename, lineno in captured:
+                warnings.warn_explicit(message, category, filename, lineno)
+            results.append(result)
+    return results
+
+
+def shard_by_document(documents: Sequence[tuple[str, Sequence[T]]], jobs: int) -> list[tuple[str, list[T]]]:
+    """Split the entries of each document into contiguous shards.
+
+    Shards never span documents. Documents larger than the target shard
+    size (a quarter of an even split across *jobs*, so that a pool stays
+    busy when documents differ in size) are split further. Concatenating
+    the shards in order gives back the input entries in order.
+
+    Args:
+        documents: ``(prefix, entries)`` pairs, e.g. item files or UIDs.
+        jobs: Number of worker processes the shards are for.
+
+    Returns:
+        ``(prefix, entries)`` shards, in input order. Documents without
+        entries have no shard.
+    """
+    total = sum(len(entries) for _, entries in documents)
+    size = max(1, math.ceil(total / (jobs * 4)))
+    return [
+        (prefix, list(entries[start : start + size]))
+        for prefix, entries in documents
+        for start in range(0, len(entries), size)
+    ]
+
+
+def _call_capturing_warnings(func: Callable[[T], R], task: T) -> tuple[R, list[_CapturedWarning]]:
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        result = func(task)
+    return result, [(str(w.message), w.category, w.filename, w.lineno) for w in caught]
@@ -0,0 +1,477 @@
+"""Index of the requirement and tc_id markers in test files.
+
+Every command that reads test markers (``jamb check``, ``jamb reorder``,
+``jamb item add``, ``jamb item remove`` and ``jamb lock-tc``) goes through
+a :class:`ReferenceIndex`, which parses each test file once and records:
+
+* the UID string arguments of its requirement markers, with their
+  positions and enclosing function;
+* its function definitions, with decorator-inclusive line spans and the
+  value of their tc_id marker.
+
+The index can be kept in ``.jamb-cache/test-references.json``. A file is
+parsed again only when its modification time or size changed and the
+hash of its content no longer matches, so repeated commands on a large
+test suite only parse the test files edited in between.
+"""
+
+from __future__ import annotations
+
+import ast
+import bisect
+import hashlib
+import json
+import os
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from jamb.storage.validation_cache import CACHE_DIR
+
+TEST_INDEX_CACHE = "test-references.json"
+
+# Bump when the indexed data changes meaning
+INDEX_VERSION = 1
+
+#: A requirement UID in a test file: (line, column, end column, uid,
+#: enclosing function). The line is 1-based, the columns are 0-based
+#: offsets of the quoted string.
+UidPosition = tuple[int, int, int, str, str | None]
+
+
+@dataclass
+class FunctionSpan:
+    """A function or method definition in a test file.
+
+    Attributes:
+        name: The function name.
+        start: 1-based first line, including decorators.
+        end: 1-based last line.
+        indent: Column of the first decorator's ``@``, or of ``def``.
+        tc_id: The argument of its tc_id marker: ``""`` if the marker has
+            no string argument, ``None`` if there is no marker.
+    """
+
+    name: str
+    start: int
+    end: int
+    indent: int
+    tc_id: str | None = None
+
+
+@dataclass
+class IndexedFile:
+    """The markers found in one test file.
+
+    Attributes:
+        path: The test file.
+        references: Positions of the UIDs in its requirement markers.
+        functions: Its function definitions, in ``ast.walk`` order.
+        error: Why the file could not be indexed (e.g. ``"syntax error:
+            ..."``), or ``None``. Files with an error have no references
+            or functions.
+    """
+
+    path: Path
+    references: list[UidPosition] = field(default_factory=list)
+    functions: list[FunctionSpan] = field(default_factory=list)
+    error: str | None = None
+
+
+def _is_requirement_marker(node: ast.Call) -> bool:
+    """Check if an AST Call node is a requirement marker.
+
+    Handles multiple import styles:
+    - pytest.mark.requirement(...)
+    - mark.requirement(...)
+    - requirement(...)
+
+    Args:
+        node: An ``ast.Call`` node to inspect.
+
+    Returns:
+        ``True`` if the node represents a requirement marker call,
+        ``False`` otherwise.
+    """
+    func = node.func
+
+    # @pytest.mark.requirement(...)
+    if isinstance(func, ast.Attribute) and func.attr == "requirement":
+        if (
+            isinstance(func.value, ast.Attribute)
+            and func.value.attr == "mark"
+            and isinstance(func.value.value, ast.Name)
+            and func.value.value.id == "pytest"
+        ):
+            return True
+        # @mark.requirement(...)
+        if isinstance(func.value, ast.Name) and func.value.id == "mark":
+            return True
+
+    # @requirement(...)
+    return bool(isinstance(func, ast.Name) and func.id == "requirement")
+
+
+def _is_tc_id_marker(node: ast.Call) -> bool:
+    """Check if an AST Call node is a tc_id marker.
+
+    Handles multiple import styles:
+    - pytest.mark.tc_id(...)
+    - mark.tc_id(...)
+
+    Args:
+        node: An ``ast.Call`` node to inspect.
+
+    Returns:
+        ``True`` if the node represents a tc_id marker call.
+    """
+    func = node.func
+
+    # @pytest.mark.tc_id(...)
+    if isinstance(func, ast.Attribute) and func.attr == "tc_id":
+        if (
+            isinstance(func.value, ast.Attribute)
+            and func.value.attr == "mark"
+            and isinstance(func.value.value, ast.Name)
+            and func.value.value.id == "pytest"
+        ):
+            return True
+        # @mark.tc_id(...)
+        if isinstance(func.value, ast.Name) and func.value.id == "mark":
+            return True
+
+    return False
+
+
+def _function_span(node: ast.FunctionDef | ast.AsyncFunctionDef) -> FunctionSpan:
+    """Return the decorator-inclusive span of a function definition."""
+    if node.decorator_list:
+        # Decorators are applied before the function definition
+        start = min(d.lineno for d in node.decorator_list)
+        # col_offset points to the expression after @
+        indent = max(0, node.decorator_list[0].col_offset - 1)
+    else:
+        start = node.lineno
+        indent = node.col_offset
+    tc_id: str | None = None
+    for decorator in node.decorator_list:
+        if isinstance(decorator, ast.Call) and _is_tc_id_marker(decorator):
+            tc_id = next(
+                (arg.value for arg in decorator.args if isinstance(arg, ast.Constant) and isinstance(arg.value, str)),
+                "",
+            )
+            break
+    return FunctionSpan(node.name, start, node.end_lineno or node.lineno, indent, tc_id)
+
+
+class _FunctionLookup:
+    """Find the innermost function enclosing a line by binary search.
+
+    Function spans are either nested or disjoint, so the lines of a file
+    split into consecutive segments that each belong to one innermost
+    function (or to none). The segments are built in one sweep over the
+    spans sorted by start line.
+    """
+
+    def __init__(self, spans: list[FunctionSpan]) -> None:
+        # Segment i covers lines starts[i] up to starts[i + 1] - 1
+        self._starts: list[int] = []
+        self._names: list[str | None] = []
+        stack: list[FunctionSpan] = []
+        for span in sorted(spans, key=lambda s: (s.start, -s.end)):
+            while stack and stack[-1].end < span.start:
+                self._close(stack)
+            stack.append(span)
+            self._open(span.start, span.name)
+        while stack:
+            self._close(stack)
+
+    def _open(self, line: int, name: str | None) -> None:
+        if self._starts and self._starts[-1] == line:
+            self._names[-1] = name
+        else:
+            self._starts.append(line)
+            self._names.append(name)
+
+    def _close(self, stack: list[FunctionSpan]) -> None:
+        # The lines after a function belong to the function around it
+        closed = stack.pop()
+        self._open(closed.end + 1, stack[-1].name if stack else None)
+
+    def find(self, line: int) -> str | None:
+        """Return the name of the innermost function whose span contains *line*."""
+        i = bisect.bisect_right(self._starts, line) - 1
+        return self._names[i] if i >= 0 else None
+
+
+def _index_tree(tree: ast.AST) -> tuple[list[UidPosition], list[FunctionSpan]]:
+    """Collect the requirement marker UIDs and function spans of *tree*.
+
+    The tree is walked once; each UID is then assigned to its enclosing
+    function with a :class:`_FunctionLookup`, so indexing takes
+    O(n log n) time in the size of the file.
+
+    Args:
+        tree: The parsed AST of the source file.
+
+    Returns:
+        The UID positions, in ``ast.walk`` order of their markers, and
+        the function spans, in ``ast.walk`` order.
+    """
+    uids: list[tuple[ast.Constant, str]] = []
+    spans: list[FunctionSpan] = []
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef):
+            spans.append(_function_span(node))
+        elif isinstance(node, ast.Call) and _is_requirement_marker(node):
+            # Positional, then keyword arguments
+            for value in (*node.args, *(kw.value for kw in node.keywords)):
+                if isinstance(value, ast.Constant) and isinstance(value.value, str):
+                    uids.append((value, value.value))
+
+    lookup = _FunctionLookup(spans)
+    refs: list[UidPosition] = [
+        (
+            value.lineno,
+            value.col_offset,
+            value.end_col_offset or (value.col_offset + len(repr(uid))),
+            uid,
+            lookup.find(value.lineno),
+        )
+        for value, uid in uids
+    ]
+    return refs, spans
+
+
+def _find_enclosing_function(tree: ast.AST, target_line: int) -> str | None:
+    """Find the name of the function/method enclosing a given line.
+
+    Args:
+        tree: The parsed AST of the source file.
+        target_line: The 1-based line number to search for.
+
+    Returns:
+        The name of the innermost enclosing function, or None if not found.
+    """
+    _, spans = _index_tree(tree)
+    return _FunctionLookup(spans).find(target_line)
+
+
+def _find_uid_positions_in_source(source: str) -> list[UidPosition]:
+    """Parse source and return positions of all UIDs in requirement markers.
+
+    Args:
+        source: Python source code to parse.
+
+    Returns:
+        List of tuples (line, column, end_column, uid, test_name).
+        Line is 1-based, columns are 0-based.
+    """
+    refs, _ = _index_tree(ast.parse(source))
+    return refs
+
+
+def index_source(source: str, path: Path) -> IndexedFile:
+    """Index the markers in the Python source of a test file.
+
+    Args:
+        source: Python source code.
+        path: The file the source was read from.
+
+    Returns:
+        The indexed file.
+
+    Raises:
+        SyntaxError: If the source cannot be parsed.
+    """
+    refs, spans = _index_tree(ast.parse(source))
+    return IndexedFile(path, refs, spans)
+
+
+def _get_test_files(test_dir: Path) -> list[Path]:
+    """Get all test files in a directory.
+
+    Args:
+        test_dir: Directory to search for test files.
+
+    Returns:
+        List of paths to test files (test_*.py and *_test.py).
+    """
+    test_files: list[Path] = []
+    for pattern in ("test_*.py", "*_test.py"):
+        test_files.extend(test_dir.rglob(pattern))
+    return test_files
+
+
+class ReferenceIndex:
+    """Parsed markers of test files, optionally cached on disk.
+
+    Each file is indexed at most once per run; call :meth:`discard` after
+    modifying a file so it is indexed again.
+
+    Attributes:
+        path (Path | None): The cache file, or ``None`` for an index kept
+            in memory only.
+        files_parsed (int): Test files parsed during this run.
+        files_reused (int): Test files served from the cache.
+    """
+
+    def __init__(self, path: str | os.PathLike[str] | None = None) -> None:
+        """Create an empty index.
+
+        Args:
+            path: Cache file the index is saved to, or ``None`` to keep it
+                in memory only.
+        """
+        self.path = Path(path) if path is not None else None
+        self.files_parsed = 0
+        self.files_reused = 0
+        self._cached: dict[str, list[Any]] = {}
+        self._seen: dict[str, list[Any]] = {}
+        self._files: dict[str, IndexedFile] = {}
+
+    @classmethod
+    def load(cls, path: str | os.PathLike[str] = Path(CACHE_DIR) / TEST_INDEX_CACHE) -> ReferenceIndex:
+        """Load the index from its cache file.
+
+        A missing, unreadable or outdated cache file gives an empty index.
+
+        Args:
+            path: Cache file (default: ``.jamb-cache/test-references.json``).
+
+        Returns:
+            The index.
+        """
+        index = cls(path)
+        try:
+            data = json.loads(Path(path).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return index
+        if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+            return index
+        files = data.get("files")
+        if isinstance(files, dict):
+            index._cached = files
+        return index
+
+    def save(self) -> None:
+        """Write the entries of the files indexed during this run to the cache file.
+
+        Entries of deleted files are dropped. Does nothing for an index
+        kept in memory only.
+
+        Raises:
+            OSError: If the cache file cannot be written.
+        """
+        if self.path is None:
+            return
+        data = {"version": INDEX_VERSION, "files": self._seen}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=self.path.parent, prefix=".tmp_", suffix=".json")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(temp_path, self.path)
+        except BaseException:
+            Path(temp_path).unlink(missing_ok=True)
+            raise
+
+    def get(self, path: Path) -> IndexedFile:
+        """Return the markers of test file *path*.
+
+        The cached entry is reused while the file's modification time and
+        size, or else the hash of its content, are unchanged. Files that
+        cannot be read are not cached.
+
+        Args:
+            path: The test file.
+
+        Returns:
+            The indexed file. Do not modify it.
+        """
+        key = str(path)
+        indexed = self._files.get(key)
+        if indexed is not None:
+            return indexed
+
+        try:
+            stat = path.stat()
+            entry = self._cached.get(key)
+            if entry is not None and entry[:2] == [stat.st_mtime_ns, stat.st_size]:
+                indexed = self._reuse(path, entry)
+                if indexed is not None:
+                    return indexed
+            content = path.read_bytes()
+        except OSError as e:
+            indexed = self._files[key] = IndexedFile(path, error=f"read error: {e}")
+            return indexed
+
+        digest = hashlib.sha256(content).hexdigest()
+        if entry is not None and entry[2:3] == [digest]:
+            indexed = self._reuse(path, [stat.st_mtime_ns, stat.st_size, digest, entry[3]])
+            if indexed is not None:
+                return indexed
+
+        try:
+            indexed = index_source(content.decode("utf-8"), path)
+        except UnicodeDecodeError as e:
+            indexed = IndexedFile(path, error=f"encoding error: {e}")
+        except SyntaxError as e:
+            indexed = IndexedFile(path, error=f"syntax error: {e}")
+        self.files_parsed += 1
+        self._files[key] = indexed
+        self._seen[key] = [stat.st_mtime_ns, stat.st_size, digest, _dump_entry(indexed)]
+        return indexed
+
+    def scan(self, test_dir: Path) -> list[IndexedFile]:
+        """Index every test file (``test_*.py`` and ``*_test.py``) under *test_dir*.
+
+        Args:
+            test_dir: Directory to search for test files.
+
+        Returns:
+            The indexed files, including those with an error.
+        """
+        return [self.get(test_file) for test_file in _get_test_files(test_dir)]
+
+    def discard(self, path: Path) -> None:
+        """Forget the entry of *path*, e.g. after modifying the file.
+
+        Args:
+            path: The test file.
+        """
+        key = str(path)
+        self._files.pop(key, None)
+        self._cached.pop(key, None)
+        self._seen.pop(key, None)
+
+    def _reuse(self, path: Path, entry: list[Any]) -> IndexedFile | None:
+        key = str(path)
+        try:
+            indexed = _load_entry(path, entry[3])
+        except (IndexError, KeyError, TypeError, ValueError):
+            # Malformed entry
+            return None
+        self._files[key] = indexed
+        self._seen[key] = entry
+        self.files_reused += 1
+        return indexed
+
+
+def _dump_entry(indexed: IndexedFile) -> dict[str, Any]:
+    return {
+        "references": indexed.references,
+        "functions": [[f.name, f.start, f.end, f.indent, f.tc_id] for f in indexed.functions],
+        "error": indexed.error,
+    }
+
+
+def _load_entry(path: Path, data: dict[str, Any]) -> IndexedFile:
+    return IndexedFile(
+        path,
+        [tuple(ref) for ref in data["references"]],
+        [FunctionSpan(*f) for f in data["functions"]],
+        data["error"],
+    )
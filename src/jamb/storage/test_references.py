@@ -2,6 +2,11 @@
 
 Provides functions to find, update, and remove @pytest.mark.requirement()
 references in test files.
+
+Test files are located and parsed through a
+:class:`~jamb.storage.test_index.ReferenceIndex`. Pass the same index to
+several calls to parse each file only once; without one, a fresh
+in-memory index is used.
 """
 
 from __future__ import annotations
@@ -10,6 +15,8 @@ import ast
 from dataclasses import dataclass
 from pathlib import Path
 
+from jamb.storage.test_index import ReferenceIndex, _is_requirement_marker
+
 
 @dataclass
 class RequirementReference:
@@ -32,157 +39,39 @@ class RequirementReference:
     test_name: str | None = None
 
 
-def _is_requirement_marker(node: ast.Call) -> bool:
-    """Check if an AST Call node is a requirement marker.
-
-    Handles multiple import styles:
-    - pytest.mark.requirement(...)
-    - mark.requirement(...)
-    - requirement(...)
-
-    Args:
-        node: An ``ast.Call`` node to inspect.
-
-    Returns:
-        ``True`` if the node represents a requirement marker call,
-        ``False`` otherwise.
-    """
-    func = node.func
-
-    # @pytest.mark.requirement(...)
-    if isinstance(func, ast.Attribute) and func.attr == "requirement":
-        if (
-            isinstance(func.value, ast.Attribute)
-            and func.value.attr == "mark"
-            and isinstance(func.value.value, ast.Name)
-            and func.value.value.id == "pytest"
-        ):
-            return True
-        # @mark.requirement(...)
-        if isinstance(func.value, ast.Name) and func.value.id == "mark":
-            return True
-
-    # @requirement(...)
-    return bool(isinstance(func, ast.Name) and func.id == "requirement")
-
-
-def _find_enclosing_function(tree: ast.AST, target_line: int) -> str | None:
-    """Find the name of the function/method enclosing a given line.
-
-    Args:
-        tree: The parsed AST of the source file.
-        target_line: The 1-based line number to search for.
-
-    Returns:
-        The name of the enclosing function, or None if not found.
-    """
-    enclosing: str | None = None
-    for node in ast.walk(tree):
-        if isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef):
-            # Check if the target line is within this function's decorator range
-            # Decorators are applied before the function definition
-            start_line = node.lineno
-            if node.decorator_list:
-                start_line = min(d.lineno for d in node.decorator_list)
-            end_line = getattr(node, "end_lineno", node.lineno)
-            if start_line <= target_line <= end_line:
-                enclosing = node.name
-    return enclosing
-
-
-def _find_uid_positions_in_source(source: str) -> list[tuple[int, int, int, str, str | None]]:
-    """Parse source and return positions of all UIDs in requirement markers.
-
-    Args:
-        source: Python source code to parse.
-
-    Returns:
-        List of tuples (line, column, end_column, uid, test_name).
-        Line is 1-based, columns are 0-based.
-    """
-    tree = ast.parse(source)
-    refs: list[tuple[int, int, int, str, str | None]] = []
-
-    for node in ast.walk(tree):
-        if isinstance(node, ast.Call) and _is_requirement_marker(node):
-            for arg in node.args:
-                if isinstance(arg, ast.Constant) and isinstance(arg.value, str):
-                    test_name = _find_enclosing_function(tree, arg.lineno)
-                    refs.append(
-                        (
-                            arg.lineno,
-                            arg.col_offset,
-                            arg.end_col_offset or (arg.col_offset + len(repr(arg.value))),
-                            arg.value,
-                            test_name,
-                        )
-                    )
-            # Also check keyword arguments
-            for kw in node.keywords:
-                if isinstance(kw.value, ast.Constant) and isinstance(kw.value.value, str):
-                    test_name = _find_enclosing_function(tree, kw.value.lineno)
-                    refs.append(
-                        (
-                            kw.value.lineno,
-                            kw.value.col_offset,
-                            kw.value.end_col_offset or (kw.value.col_offset + len(repr(kw.value.value))),
-                            kw.value.value,
-                            test_name,
-                        )
-                    )
-    return refs
-
-
-def _get_test_files(test_dir: Path) -> list[Path]:
-    """Get all test files in a directory.
-
-    Args:
-        test_dir: Directory to search for test files.
-
-    Returns:
-        List of paths to test files (test_*.py and *_test.py).
-    """
-    test_files: list[Path] = []
-    for pattern in ("test_*.py", "*_test.py"):
-        test_files.extend(test_dir.rglob(pattern))
-    return test_files
-
-
 def find_test_references(
     test_dir: Path,
     uid: str | None = None,
+    index: ReferenceIndex | None = None,
 ) -> list[RequirementReference]:
     """Find all @pytest.mark.requirement references in test files.
 
     Args:
         test_dir: Directory to search for test files.
         uid: Optional UID to filter by. If None, returns all references.
+        index: Index to read the test files through.
 
     Returns:
         List of RequirementReference objects for found references.
     """
+    if index is None:
+        index = ReferenceIndex()
     refs: list[RequirementReference] = []
 
-    for test_file in _get_test_files(test_dir):
-        try:
-            source = test_file.read_text()
-            positions = _find_uid_positions_in_source(source)
-
-            for line, col, end_col, found_uid, test_name in positions:
-                if uid is None or found_uid == uid:
-                    refs.append(
-                        RequirementReference(
-                            file=test_file,
-                            line=line,
-                            column=col,
-                            end_column=end_col,
-                            uid=found_uid,
-                            test_name=test_name,
-                        )
+    # Files that can't be parsed have no references
+    for indexed in index.scan(test_dir):
+        for line, col, end_col, found_uid, test_name in indexed.references:
+            if uid is None or found_uid == uid:
+                refs.append(
+                    RequirementReference(
+                        file=indexed.path,
+                        line=line,
+                        column=col,
+                        end_column=end_col,
+                        uid=found_uid,
+                        test_name=test_name,
                     )
-        except (SyntaxError, OSError, UnicodeDecodeError):
-            # Skip files that can't be parsed
-            continue
+                )
 
     return refs
 
@@ -190,30 +79,35 @@ def find_test_references(
 def update_test_references(
     rename_map: dict[str, str],
     test_dir: Path,
+    index: ReferenceIndex | None = None,
 ) -> dict[Path, list[str]]:
     """Update UIDs in @pytest.mark.requirement decorators.
 
     Args:
         rename_map: Mapping of old UIDs to new UIDs.
         test_dir: Directory containing test files.
+        index: Index to read the test files through. Modified files are
+            discarded from it.
 
     Returns:
         Dict mapping file paths to lists of change descriptions (e.g., "SRS003->SRS002").
     """
+    if index is None:
+        index = ReferenceIndex()
     changes: dict[Path, list[str]] = {}
 
-    for test_file in _get_test_files(test_dir):
-        try:
-            source = test_file.read_text()
-            positions = _find_uid_positions_in_source(source)
+    for indexed in index.scan(test_dir):
+        # Filter to positions that need updating
+        refs_to_update = [
+            (line, col, end_col, uid) for line, col, end_col, uid, _ in indexed.references if uid in rename_map
+        ]
 
-            # Filter to positions that need updating
-            refs_to_update = [
-                (line, col, end_col, uid) for line, col, end_col, uid, _ in positions if uid in rename_map
-            ]
+        if not refs_to_update:
+            continue
 
-            if not refs_to_update:
-                continue
+        test_file = indexed.path
+        try:
+            source = test_file.read_text()
 
             # Sort by position (reverse) to replace from end to start
             refs_to_update.sort(key=lambda r: (r[0], r[1]), reverse=True)
@@ -236,9 +130,11 @@ def update_test_references(
             test_file.write_text("".join(lines))
             changes[test_file] = file_changes
 
-        except (SyntaxError, OSError, UnicodeDecodeError):
-            # Skip files that can't be parsed
+        except (OSError, UnicodeDecodeError):
+            # Skip files that can't be read or written
             continue
+        finally:
+            index.discard(test_file)
 
     return changes
 
@@ -247,6 +143,7 @@ def remove_test_reference(
     uid: str,
     test_dir: Path,
     remove_empty: bool = True,
+    index: ReferenceIndex | None = None,
 ) -> dict[Path, list[str]]:
     """Remove a UID from @pytest.mark.requirement decorators.
 
@@ -257,13 +154,21 @@ def remove_test_reference(
         uid: The UID to remove from decorators.
         test_dir: Directory containing test files.
         remove_empty: If True, remove entire decorator line when no UIDs remain.
+        index: Index to find the files referencing *uid* through. Modified
+            files are discarded from it.
 
     Returns:
         Dict mapping file paths to lists of change descriptions.
     """
+    if index is None:
+        index = ReferenceIndex()
     changes: dict[Path, list[str]] = {}
 
-    for test_file in _get_test_files(test_dir):
+    for indexed in index.scan(test_dir):
+        # Only files referencing the UID are parsed again, for editing
+        if not any(ref[3] == uid for ref in indexed.references):
+            continue
+        test_file = indexed.path
         try:
             source = test_file.read_text()
             tree = ast.parse(source)
@@ -350,6 +255,8 @@ def remove_test_reference(
         except (SyntaxError, OSError, UnicodeDecodeError):
             # Skip files that can't be parsed
             continue
+        finally:
+            index.discard(test_file)
 
     return changes
 
@@ -357,17 +264,19 @@ def remove_test_reference(
 def find_orphaned_references(
     test_dir: Path,
     valid_uids: set[str],
+    index: ReferenceIndex | None = None,
 ) -> list[RequirementReference]:
     """Find test references to UIDs that don't exist in requirements.
 
     Args:
         test_dir: Directory containing test files.
         valid_uids: Set of UIDs that currently exist in requirements.
+        index: Index to read the test files through.
 
     Returns:
         List of RequirementReference objects for references to non-existent UIDs.
     """
-    all_refs = find_test_references(test_dir)
+    all_refs = find_test_references(test_dir, index=index)
     return [ref for ref in all_refs if ref.uid not in valid_uids]
 
 
@@ -375,6 +284,7 @@ def detect_reference_collisions(
     rename_map: dict[str, str],
     test_dir: Path,
     valid_uids: set[str],
+    index: ReferenceIndex | None = None,
 ) -> list[tuple[str, RequirementReference]]:
     """Detect when renaming would create duplicate test references.
 
@@ -386,62 +296,17 @@ def detect_reference_collisions(
         rename_map: Mapping of old UIDs to new UIDs from reorder operation.
         test_dir: Directory containing test files.
         valid_uids: Set of UIDs that currently exist in requirements.
+        index: Index to read the test files through.
 
     Returns:
         List of (target_uid, orphan_ref) tuples where an orphaned reference
         already uses a UID that would become the target of a rename.
     """
     target_uids = set(rename_map.values())
-    orphans = find_orphaned_references(test_dir, valid_uids)
+    orphans = find_orphaned_references(test_dir, valid_uids, index)
     return [(ref.uid, ref) for ref in orphans if ref.uid in target_uids]
 
 
-def _is_tc_id_marker(node: ast.Call) -> bool:
-    """Check if an AST Call node is a tc_id marker.
-
-    Handles multiple import styles:
-    - pytest.mark.tc_id(...)
-    - mark.tc_id(...)
-
-    Args:
-        node: An ``ast.Call`` node to inspect.
-
-    Returns:
-        ``True`` if the node represents a tc_id marker call.
-    """
-    func = node.func
-
-    # @pytest.mark.tc_id(...)
-    if isinstance(func, ast.Attribute) and func.attr == "tc_id":
-        if (
-            isinstance(func.value, ast.Attribute)
-            and func.value.attr == "mark"
-            and isinstance(func.value.value, ast.Name)
-            and func.value.value.id == "pytest"
-        ):
-            return True
-        # @mark.tc_id(...)
-        if isinstance(func.value, ast.Name) and func.value.id == "mark":
-            return True
-
-    return False
-
-
-def _has_tc_id_marker(func_node: ast.FunctionDef | ast.AsyncFunctionDef) -> bool:
-    """Check if a function has a tc_id marker decorator.
-
-    Args:
-        func_node: A function definition AST node.
-
-    Returns:
-        True if the function has a tc_id marker.
-    """
-    for decorator in func_node.decorator_list:
-        if isinstance(decorator, ast.Call) and _is_tc_id_marker(decorator):
-            return True
-    return False
-
-
 def _nodeid_to_file_and_func(nodeid: str) -> tuple[str, str]:
     """Extract file path and function name from pytest nodeid.
 
@@ -463,6 +328,7 @@ def insert_tc_id_markers(
     tc_mapping: dict[str, str],
     test_dir: Path,
     dry_run: bool = False,
+    index: ReferenceIndex | None = None,
 ) -> dict[Path, list[str]]:
     """Insert @pytest.mark.tc_id() decorators into test files.
 
@@ -474,10 +340,14 @@ def insert_tc_id_markers(
         tc_mapping: Dict mapping test nodeid to TC ID.
         test_dir: Root directory containing test files.
         dry_run: If True, don't actually modify files, just report changes.
+        index: Index to read the test files through. Modified files are
+            discarded from it.
 
     Returns:
         Dict mapping file paths to lists of change descriptions.
     """
+    if index is None:
+        index = ReferenceIndex()
     changes: dict[Path, list[str]] = {}
 
     # Group by base nodeid (strip parameter suffix) to avoid duplicate insertions
@@ -510,35 +380,17 @@ def insert_tc_id_markers(
         if not resolved_path.exists():
             continue
 
-        try:
-            source = resolved_path.read_text()
-            tree = ast.parse(source)
-        except (SyntaxError, OSError, UnicodeDecodeError):
+        indexed = index.get(resolved_path)
+        if indexed.error is not None:
             continue
 
-        # Find test functions that need tc_id markers
-        insertions: list[tuple[int, str, str]] = []  # (line, indent, tc_id)
-
-        for node in ast.walk(tree):
-            if (
-                isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef)
-                and node.name in func_tc_ids
-                and not _has_tc_id_marker(node)
-            ):
-                # Find insertion point (before first decorator or function def)
-                if node.decorator_list:
-                    insert_line = min(d.lineno for d in node.decorator_list)
-                    # Get indentation from first decorator
-                    # col_offset points to the expression after @, so subtract 1
-                    first_dec = node.decorator_list[0]
-                    indent_col = max(0, first_dec.col_offset - 1)
-                else:
-                    insert_line = node.lineno
-                    indent_col = node.col_offset
-
-                tc_id = func_tc_ids[node.name]
-                indent = " " * indent_col
-                insertions.append((insert_line, indent, tc_id))
+        # Find test functions that need tc_id markers, inserted before
+        # their first decorator or def
+        insertions: list[tuple[int, str, str]] = [  # (line, indent, tc_id)
+            (func.start, " " * func.indent, func_tc_ids[func.name])
+            for func in indexed.functions
+            if func.name in func_tc_ids and func.tc_id is None
+        ]
 
         if not insertions:
             continue
@@ -552,6 +404,10 @@ def insert_tc_id_markers(
             continue
 
         # Apply insertions
+        try:
+            source = resolved_path.read_text()
+        except (OSError, UnicodeDecodeError):
+            continue
         lines = source.splitlines(keepends=True)
         applied_changes: list[str] = []
 
@@ -564,6 +420,7 @@ def insert_tc_id_markers(
 
         # Write back
         resolved_path.write_text("".join(lines))
+        index.discard(resolved_path)
         changes[resolved_path] = applied_changes
 
     return changes
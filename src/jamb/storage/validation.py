@@ -1,13 +1,43 @@
-"""Validation module for jamb's native storage layer."""
-
+"""Validation module for jamb's native storage layer.
+
+:func:`validate` runs every enabled check in a single pass over the
+items. Each check is a :class:`_Rule` with optional per-item and per-link
+callbacks and a ``finish`` step for whole-graph checks (document cycles,
+empty documents, children and item link cycles), which only use what the
+pass recorded. Every rule keeps its own issue list, and the lists are
+concatenated in a fixed order, so the output is the same as running the
+checks one after another.
+
+:func:`iter_validate` runs the same pass but yields each issue as soon as
+it is found: the issues of each item as the pass reaches it, then those
+of the whole-graph checks. Stopping the iteration early skips the rest
+of the pass.
+
+With a :class:`~jamb.storage.validation_cache.ValidationCache`, the
+per-item issues of the rules marked ``cacheable`` are reused for items
+whose fingerprint (content, stored link hashes and the state of their
+link targets) is unchanged since the cached run.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
 import logging
-from dataclasses import dataclass
-from typing import Literal
-
-from jamb.core.models import TraceabilityGraph
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Literal, cast
+
+from jamb.core.cycles import find_cycles
+from jamb.core.models import Item, TraceabilityGraph
+from jamb.storage.attribute_schema import AttributeCheck, compile_attribute_schema
 from jamb.storage.document_dag import DocumentDAG
 from jamb.storage.items import compute_content_hash, read_item
 
+if TYPE_CHECKING:
+    from jamb.storage.validation_cache import ValidationCache
+
 logger = logging.getLogger("jamb")
 
 
@@ -22,12 +52,16 @@ class ValidationIssue:
         prefix (str | None): Document prefix involved, or ``None`` when not
             applicable.
         message (str): Human-readable description of the issue.
+        rule (str | None): Name of the check that reported the issue, e.g.
+            ``"links"`` or ``"suspect"``, or ``None`` if not reported by
+            :func:`validate`.
     """
 
     level: Literal["error", "warning", "info"]
     uid: str | None
     prefix: str | None
     message: str
+    rule: str | None = None
 
     def __str__(self) -> str:
         """Return a human-readable representation of the validation issue."""
@@ -55,7 +89,11 @@ def validate(
     check_self_links: bool = True,
     check_item_cycles: bool = True,
     check_unlinked: bool = True,
+    check_attributes: bool = True,
     skip_prefixes: list[str] | None = None,
+    cache: ValidationCache | None = None,
+    jobs: int = 1,
+    uids: Iterable[str] | None = None,
 ) -> list[ValidationIssue]:
     """Run validation checks on the document tree.
 
@@ -71,216 +109,570 @@ def validate(
         check_self_links: Check for items linking to themselves.
         check_item_cycles: Check for cycles in item-to-item links.
         check_unlinked: Check for unlinked normative items in child documents.
+        check_attributes: Check custom attributes against the ``attributes``
+            schema of each document's ``.jamb.yml``.
         skip_prefixes: Document prefixes to skip during validation.
+        cache: Reuse and record per-item issues in this cache. Only items
+            loaded with their link hashes (see :attr:`Item.link_hashes`)
+            are cached.
+        jobs: Number of processes running the per-item checks. With more
+            than one, the items are split into shards by document and
+            checked in a process pool; the issues are the same, in the
+            same order, as with one.
+        uids: Only check these items, and only with the per-item checks
+            (links, suspect links, review status, empty text, unlinked
+            items, custom attributes and heading levels); the checks that
+            need the whole tree are skipped. *graph* must hold every item
+            they link to, e.g. as loaded by
+            :func:`~jamb.storage.graph_builder.build_link_closure_graph`.
+
+    Returns:
+        List of ValidationIssue objects, grouped by check in the order of
+        the arguments above, after document cycle errors and before
+        heading level warnings.
+
+    Raises:
+        ValueError: If a *cache* is given together with more than one job
+            or with *uids*.
+    """
+    ctx, rules, item_issues = _prepare(
+        dag,
+        graph,
+        {
+            "check_links": check_links,
+            "check_suspect": check_suspect,
+            "check_review": check_review,
+            "check_children": check_children,
+            "check_empty_docs": check_empty_docs,
+            "check_empty_text": check_empty_text,
+            "check_self_links": check_self_links,
+            "check_item_cycles": check_item_cycles,
+            "check_unlinked": check_unlinked,
+            "check_attributes": check_attributes,
+        },
+        skip_prefixes,
+        cache,
+        jobs,
+        uids,
+    )
+    deque(_iter_rules(ctx, rules, item_issues), maxlen=0)
+    return [issue for rule in rules for issue in rule.issues]
+
+
+def iter_validate(
+    dag: DocumentDAG,
+    graph: TraceabilityGraph,
+    *,
+    check_links: bool = True,
+    check_suspect: bool = True,
+    check_review: bool = True,
+    check_children: bool = True,
+    check_empty_docs: bool = True,
+    check_empty_text: bool = True,
+    check_self_links: bool = True,
+    check_item_cycles: bool = True,
+    check_unlinked: bool = True,
+    check_attributes: bool = True,
+    skip_prefixes: list[str] | None = None,
+    cache: ValidationCache | None = None,
+    jobs: int = 1,
+    uids: Iterable[str] | None = None,
+) -> Iterator[ValidationIssue]:
+    """Run validation checks, yielding issues as they are found.
+
+    Takes the same arguments as :func:`validate` and reports the same
+    issues, but in the order they are found: for each item in graph order
+    the issues of every check on that item, then the issues of the
+    whole-graph checks (document cycles, child links, empty documents and
+    item link cycles). Stop iterating to skip the remaining checks.
 
     Returns:
-        List of ValidationIssue objects.
+        An iterator over the issues.
+
+    Raises:
+        ValueError: If a *cache* is given together with more than one job
+            or with *uids*.
     """
-    issues: list[ValidationIssue] = []
+    ctx, rules, item_issues = _prepare(
+        dag,
+        graph,
+        {
+            "check_links": check_links,
+            "check_suspect": check_suspect,
+            "check_review": check_review,
+            "check_children": check_children,
+            "check_empty_docs": check_empty_docs,
+            "check_empty_text": check_empty_text,
+            "check_self_links": check_self_links,
+            "check_item_cycles": check_item_cycles,
+            "check_unlinked": check_unlinked,
+            "check_attributes": check_attributes,
+        },
+        skip_prefixes,
+        cache,
+        jobs,
+        uids,
+    )
+    return _iter_rules(ctx, rules, item_issues)
+
+
+def _prepare(
+    dag: DocumentDAG,
+    graph: TraceabilityGraph,
+    options: dict[str, bool],
+    skip_prefixes: list[str] | None,
+    cache: ValidationCache | None,
+    jobs: int,
+    uids: Iterable[str] | None = None,
+) -> tuple[_ValidationContext, list[_Rule], dict[str, list[list[str]]] | None]:
+    """Set up a validation run.
+
+    Returns:
+        The context, the enabled rules in reporting order, and the per-item
+        issues computed in a process pool when *jobs* is greater than one.
+    """
+    rules = _build_rules(**options)
     skip = set(skip_prefixes or [])
+    ctx = _ValidationContext(dag, graph, skip, cache=cache)
+    if uids is not None:
+        if cache is not None:
+            raise ValueError("A validation cache cannot be used when checking only some items")
+        rules = [rule for rule in rules if rule.cacheable]
+        ctx.only = list(uids)
+
+    if jobs > 1:
+        if cache is not None:
+            raise ValueError("A validation cache cannot be used with more than one job")
+        return ctx, rules, _run_item_rules_in_pool(ctx, options, jobs)
+
+    if cache is not None:
+        cache.use_settings(
+            {
+                "documents": {prefix: config.parents for prefix, config in sorted(dag.documents.items())},
+                "attributes": {prefix: config.attributes for prefix, config in sorted(dag.documents.items())},
+                "rules": [rule.name for rule in rules],
+                "check_self_links": options["check_self_links"],
+                "skip": sorted(skip),
+            }
+        )
+    return ctx, rules, None
 
-    # 1. DAG acyclicity
-    cycle_errors = dag.validate_acyclic()
-    for error in cycle_errors:
-        issues.append(ValidationIssue("error", None, None, error))
 
-    # 2. Link validity and conformance
+def _build_rules(
+    *,
+    check_links: bool,
+    check_suspect: bool,
+    check_review: bool,
+    check_children: bool,
+    check_empty_docs: bool,
+    check_empty_text: bool,
+    check_self_links: bool,
+    check_item_cycles: bool,
+    check_unlinked: bool,
+    check_attributes: bool,
+) -> list[_Rule]:
+    """Return the enabled rules, in reporting order."""
+    rules: list[_Rule] = [_DocumentCycleRule()]
     if check_links:
-        issues.extend(_check_links(dag, graph, skip, check_self_links))
-
-    # 3. Suspect link detection
+        rules.append(_LinkRule(check_self_links))
     if check_suspect:
-        issues.extend(_check_suspect_links(dag, graph, skip))
-
-    # 4. Review status
+        rules.append(_SuspectLinkRule())
     if check_review:
-        issues.extend(_check_review_status(graph, skip))
-
-    # 5. Child link check
+        rules.append(_ReviewStatusRule())
     if check_children:
-        issues.extend(_check_children(dag, graph, skip))
-
-    # 6. Empty documents
+        rules.append(_ChildrenRule())
     if check_empty_docs:
-        issues.extend(_check_empty_documents(dag, graph, skip))
-
-    # 7. Empty text
+        rules.append(_EmptyDocumentRule())
     if check_empty_text:
-        issues.extend(_check_empty_text(graph, skip))
-
-    # 8. Item link cycles
+        rules.append(_EmptyTextRule())
     if check_item_cycles:
-        issues.extend(_check_item_link_cycles(graph, skip))
-
-    # 9. Unlinked normative items in child docs
+        rules.append(_ItemLinkCycleRule())
     if check_unlinked:
-        issues.extend(_check_unlinked_items(dag, graph, skip))
+        rules.append(_UnlinkedItemRule())
+    if check_attributes:
+        rules.append(_AttributeSchemaRule())
+    rules.append(_HeadingLevelRule())
+    return rules
+
 
-    # 10. Heading level field validity
-    issues.extend(_check_heading_level(graph, skip))
+@dataclass
+class _ValidationContext:
+    """State shared by the rules of one validation run.
 
-    return issues
+    Attributes:
+        dag (DocumentDAG): The document DAG.
+        graph (TraceabilityGraph): The traceability graph.
+        skip (set[str]): Document prefixes excluded from validation.
+        prefixes_with_items (set[str]): Prefixes of every item, including
+            inactive and skipped ones.
+        linked_to (set[str]): UIDs linked to by any active item, including
+            items of skipped documents.
+        cache (ValidationCache | None): Per-item issue cache, if any.
+        only (list[str] | None): UIDs of the only items to visit, in
+            order, or ``None`` to visit every item of the graph.
+    """
 
+    dag: DocumentDAG
+    graph: TraceabilityGraph
+    skip: set[str]
+    cache: ValidationCache | None = None
+    only: list[str] | None = None
+    prefixes_with_items: set[str] = field(default_factory=set)
+    linked_to: set[str] = field(default_factory=set)
+    _parents: dict[str, list[str]] = field(default_factory=dict)
+    _hashes: dict[str, str] = field(default_factory=dict)
+
+    def parents(self, prefix: str) -> list[str]:
+        """Return the parent documents of *prefix*, or ``[]`` if unknown."""
+        parents = self._parents.get(prefix)
+        if parents is None:
+            parents = self.dag.get_parents(prefix) if prefix in self.dag.documents else []
+            self._parents[prefix] = parents
+        return parents
+
+    def content_hash(self, uid: str) -> str:
+        """Return the current content hash of item *uid*, computed once per run."""
+        content_hash = self._hashes.get(uid)
+        if content_hash is None:
+            item = self.graph.items[uid]
+            content_hash = compute_content_hash(
+                {"text": item.text, "header": item.header, "links": item.links, "type": item.type}
+            )
+            self._hashes[uid] = content_hash
+        return content_hash
+
+    def item_key(self, uid: str, item: Item) -> str | None:
+        """Return the cache fingerprint of *item*, or ``None`` if it cannot be cached.
+
+        The fingerprint covers everything the cacheable rules read: the
+        item's own fields and custom attributes, its stored link hashes,
+        and the content, type, state and document of every item it links
+        to.
+        """
+        if item.link_hashes is None:
+            return None
+        items = self.graph.items
+        targets = []
+        for link in dict.fromkeys([*item.links, *item.link_hashes]):
+            target = items.get(link)
+            targets.append(
+                None
+                if target is None
+                else [target.active, target.type, target.document_prefix, target.text, target.header, target.links]
+            )
+        data = [
+            uid,
+            item.document_prefix,
+            item.type,
+            item.derived,
+            item.level,
+            item.text,
+            item.header,
+            item.links,
+            item.reviewed,
+            item.link_hashes,
+            item.custom_attributes,
+            targets,
+        ]
+        return hashlib.sha256(json.dumps(data, default=str).encode("utf-8")).hexdigest()
+
+
+class _Rule:
+    """A validation check run by :func:`_iter_rules`.
+
+    Subclasses override any of the hooks. :meth:`check_item` and
+    :meth:`check_link` are only called for active items outside the
+    skipped documents; links are visited after every rule has seen their
+    item. Issues are appended to :attr:`issues` in the order they should
+    be reported.
+
+    A rule is ``cacheable`` when its item and link hooks only read the item,
+    its stored link hashes and its link targets, and only report issues
+    for that item. Their issues are then reused from a
+    :class:`~jamb.storage.validation_cache.ValidationCache` for unchanged
+    items, and computed in worker processes when validating with several
+    jobs.
 
-def _check_heading_level(graph: TraceabilityGraph, skip: set[str]) -> list[ValidationIssue]:
-    """Check that the 'level' field is only used on heading items and is >= 1.
+    Attributes:
+        name (str): Identifies the rule's issues in the cache.
+        cacheable (bool): Whether per-item issues may be cached.
+        issues (list[ValidationIssue]): Issues found by this rule.
+    """
 
-    Args:
-        graph: The traceability graph containing all items.
-        skip: Set of document prefixes to exclude from validation.
+    name = ""
+    cacheable = False
 
-    Returns:
-        A list of ``ValidationIssue`` objects with level ``warning`` for
-        each item with an invalid or misplaced ``level`` field.
+    def __init__(self) -> None:
+        """Start with no issues."""
+        self.issues: list[ValidationIssue] = []
+
+    def check_item(self, ctx: _ValidationContext, uid: str, item: Item) -> None:
+        """Check one item."""
+
+    def check_link(self, ctx: _ValidationContext, uid: str, item: Item, link: str) -> None:
+        """Check one link of *item*."""
+
+    def finish(self, ctx: _ValidationContext) -> None:
+        """Run whole-graph checks once every item has been visited."""
+
+
+def _overrides(rule: _Rule, hook: str) -> bool:
+    return getattr(type(rule), hook) is not getattr(_Rule, hook)
+
+
+def _iter_rules(
+    ctx: _ValidationContext,
+    rules: list[_Rule],
+    item_issues: dict[str, list[list[str]]] | None = None,
+) -> Iterator[ValidationIssue]:
+    """Visit every item once, dispatching to *rules*, then finish them.
+
+    Every issue is also kept in its rule's :attr:`_Rule.issues`, so once
+    the iteration is done the rules hold the complete, grouped result.
+
+    Args:
+        ctx: The validation context.
+        rules: The rules to run, in reporting order.
+        item_issues: Issues of the cacheable rules for every checked item,
+            as ``[rule, level, message]`` entries, computed elsewhere
+            (see :func:`_run_item_rules_in_pool`). Those rules' hooks are
+            then not called.
+
+    Yields:
+        Each issue once its item has been checked, or once its rule has
+        finished for whole-graph checks.
     """
-    issues = []
-    for uid, item in graph.items.items():
-        if item.document_prefix in skip or not item.active:
+    item_checks = [rule.check_item for rule in rules if _overrides(rule, "check_item")]
+    link_checks = [rule.check_link for rule in rules if _overrides(rule, "check_link")]
+    cache = ctx.cache
+    cacheable = [rule for rule in rules if rule.cacheable]
+    cacheable_by_name = {rule.name: rule for rule in cacheable}
+    uncached_item_checks = [rule.check_item for rule in rules if not rule.cacheable and _overrides(rule, "check_item")]
+    uncached_link_checks = [rule.check_link for rule in rules if not rule.cacheable and _overrides(rule, "check_link")]
+    skip = ctx.skip
+
+    # Rules that may report issues while visiting items, and how many of
+    # their issues have been yielded
+    item_rules = [
+        rule for rule in rules if rule.cacheable or _overrides(rule, "check_item") or _overrides(rule, "check_link")
+    ]
+    yielded = [0] * len(item_rules)
+
+    items = ctx.graph.items
+    visited = items.items() if ctx.only is None else [(uid, items[uid]) for uid in ctx.only if uid in items]
+    for uid, item in visited:
+        ctx.prefixes_with_items.add(item.document_prefix)
+        if not item.active:
             continue
-        if item.level is None:
+        ctx.linked_to.update(item.links)
+        if item.document_prefix in skip:
             continue
-        if item.type != "heading":
-            issues.append(
-                ValidationIssue(
-                    "warning",
-                    uid,
-                    item.document_prefix,
-                    "'level' field is only meaningful on heading items",
-                )
-            )
-        elif item.level < 1:
-            issues.append(
-                ValidationIssue(
-                    "warning",
-                    uid,
-                    item.document_prefix,
-                    f"'level' must be >= 1, got {item.level}",
+
+        key = None
+        entries: list[list[str]] | None
+        if item_issues is not None:
+            entries = item_issues[uid]
+        elif cache is not None and (key := ctx.item_key(uid, item)) is not None:
+            entries = cache.lookup_issues(uid, key)
+        else:
+            entries = None
+
+        if entries is not None:
+            for name, level, message in entries:
+                cacheable_by_name[name].issues.append(
+                    ValidationIssue(
+                        cast(Literal["error", "warning", "info"], level), uid, item.document_prefix, message
+                    )
                 )
-            )
-    return issues
+            _check_item(ctx, uid, item, uncached_item_checks, uncached_link_checks)
+        elif cache is None or key is None:
+            _check_item(ctx, uid, item, item_checks, link_checks)
+        else:
+            cache.store_issues(uid, key, _check_item_recording(ctx, uid, item, cacheable, item_checks, link_checks))
+
+        for i, rule in enumerate(item_rules):
+            if len(rule.issues) > yielded[i]:
+                for issue in rule.issues[yielded[i] :]:
+                    issue.rule = rule.name
+                    yield issue
+                yielded[i] = len(rule.issues)
+
+    for rule in rules:
+        start = len(rule.issues)
+        rule.finish(ctx)
+        for issue in rule.issues[start:]:
+            issue.rule = rule.name
+            yield issue
+
+
+def _check_item_recording(
+    ctx: _ValidationContext,
+    uid: str,
+    item: Item,
+    recorded: list[_Rule],
+    item_checks: Sequence[Callable[[_ValidationContext, str, Item], None]],
+    link_checks: Sequence[Callable[[_ValidationContext, str, Item, str], None]],
+) -> list[list[str]]:
+    """Check *item* like :func:`_check_item`.
+
+    Returns:
+        The new issues of the *recorded* rules, as ``[rule, level,
+        message]`` entries.
+    """
+    marks = [len(rule.issues) for rule in recorded]
+    _check_item(ctx, uid, item, item_checks, link_checks)
+    return [
+        [rule.name, issue.level, issue.message]
+        for rule, mark in zip(recorded, marks, strict=True)
+        for issue in rule.issues[mark:]
+    ]
+
+
+def _check_item(
+    ctx: _ValidationContext,
+    uid: str,
+    item: Item,
+    item_checks: Sequence[Callable[[_ValidationContext, str, Item], None]],
+    link_checks: Sequence[Callable[[_ValidationContext, str, Item, str], None]],
+) -> None:
+    """Run the item hooks on *item*, then the link hooks on each of its links."""
+    for check_item in item_checks:
+        check_item(ctx, uid, item)
+    if link_checks:
+        for link in item.links:
+            for check_link in link_checks:
+                check_link(ctx, uid, item, link)
 
 
-def _check_links(
-    dag: DocumentDAG,
-    graph: TraceabilityGraph,
-    skip: set[str],
-    check_self_links: bool = True,
-) -> list[ValidationIssue]:
+# Validation state of a worker process, set by _init_item_rule_worker
+_worker_state: tuple[_ValidationContext, dict[str, bool]] | None = None
+
+
+def _run_item_rules_in_pool(ctx: _ValidationContext, options: dict[str, bool], jobs: int) -> dict[str, list[list[str]]]:
+    """Run the cacheable (per-item) rules in a pool of *jobs* processes.
+
+    The items to check are split into shards by document. Every worker
+    gets a read-only copy of the DAG and of the graph, which the rules use
+    to look up link targets in other documents.
+
+    Returns:
+        The issues of every checked item, as ``[rule, level, message]``
+        entries.
+    """
+    from jamb.storage.parallel import run_in_pool, shard_by_document
+
+    only = None if ctx.only is None else set(ctx.only)
+    uids_by_prefix: dict[str, list[str]] = {}
+    for uid, item in ctx.graph.items.items():
+        if item.active and item.document_prefix not in ctx.skip and (only is None or uid in only):
+            uids_by_prefix.setdefault(item.document_prefix, []).append(uid)
+
+    results = run_in_pool(
+        _check_item_shard,
+        [uids for _, uids in shard_by_document(list(uids_by_prefix.items()), jobs)],
+        jobs,
+        initializer=_init_item_rule_worker,
+        initargs=(ctx.dag, ctx.graph, ctx.skip, options),
+    )
+    return {uid: entries for shard in results for uid, entries in shard}
+
+
+def _init_item_rule_worker(
+    dag: DocumentDAG, graph: TraceabilityGraph, skip: set[str], options: dict[str, bool]
+) -> None:
+    global _worker_state
+    _worker_state = (_ValidationContext(dag, graph, skip), options)
+
+
+def _check_item_shard(uids: list[str]) -> list[tuple[str, list[list[str]]]]:
+    assert _worker_state is not None
+    ctx, options = _worker_state
+    rules = [rule for rule in _build_rules(**options) if rule.cacheable]
+    item_checks = [rule.check_item for rule in rules if _overrides(rule, "check_item")]
+    link_checks = [rule.check_link for rule in rules if _overrides(rule, "check_link")]
+    items = ctx.graph.items
+    return [(uid, _check_item_recording(ctx, uid, items[uid], rules, item_checks, link_checks)) for uid in uids]
+
+
+class _DocumentCycleRule(_Rule):
+    """Report cycles in the document DAG as errors."""
+
+    name = "document_cycles"
+
+    def finish(self, ctx: _ValidationContext) -> None:
+        """Check the DAG for cycles."""
+        self.issues.extend(ValidationIssue("error", None, None, error) for error in ctx.dag.validate_acyclic())
+
+
+class _LinkRule(_Rule):
     """Check link validity and conformance.
 
-    Validates every link on every active, non-skipped item in the
-    traceability graph.  The following conditions are flagged:
+    The following conditions are flagged:
 
-    * Self-links (item links to its own UID).
-    * Links to non-existent items.
-    * Links to inactive items.
     * Links from non-normative items (items that have links but are not
       of type ``requirement``).
+    * Self-links (item links to its own UID), when enabled.
+    * Links to non-existent items.
+    * Links to inactive items.
     * Links to non-normative target items.
     * Links that violate parent-document conformance (the target item
       belongs to a document that is not a parent of the source item's
       document in the DAG).
 
-    Args:
-        dag: The document DAG used to determine parent-child document
-            relationships.
-        graph: The traceability graph containing all items and their
-            links.
-        skip: Set of document prefixes to exclude from validation.
-        check_self_links: Whether to flag items that link to themselves.
-
-    Returns:
-        A list of ``ValidationIssue`` objects, one per detected problem.
-        Self-links, links to inactive items, and links to non-existent
-        items are reported as errors or warnings depending on severity.
+    Self-links, links to non-existent items, and links to inactive items
+    are not checked further.
     """
-    issues = []
 
-    for uid, item in graph.items.items():
-        if item.document_prefix in skip:
-            continue
-        if not item.active:
-            continue
+    name = "links"
+    cacheable = True
+
+    def __init__(self, check_self_links: bool = True) -> None:
+        """Create the rule.
 
-        parents = dag.get_parents(item.document_prefix) if item.document_prefix in dag.documents else []
+        Args:
+            check_self_links: Whether to flag items that link to themselves.
+        """
+        super().__init__()
+        self.check_self_links = check_self_links
 
-        # Check non-normative item has links
+    def check_item(self, ctx: _ValidationContext, uid: str, item: Item) -> None:
+        """Flag non-normative items that have links."""
         if item.type != "requirement" and item.links:
-            issues.append(
+            self.issues.append(ValidationIssue("warning", uid, item.document_prefix, "non-normative item has links"))
+
+    def check_link(self, ctx: _ValidationContext, uid: str, item: Item, link: str) -> None:
+        """Check that *link* points to an active, normative item in a parent document."""
+        prefix = item.document_prefix
+        if self.check_self_links and link == uid:
+            self.issues.append(ValidationIssue("warning", uid, prefix, "links to itself"))
+            return
+
+        target = ctx.graph.items.get(link)
+        if target is None:
+            self.issues.append(ValidationIssue("error", uid, prefix, f"links to non-existent item: {link}"))
+            return
+        if not target.active:
+            self.issues.append(ValidationIssue("error", uid, prefix, f"links to inactive item: {link}"))
+            return
+
+        if target.type != "requirement":
+            self.issues.append(ValidationIssue("warning", uid, prefix, f"links to non-normative item: {link}"))
+
+        parents = ctx.parents(prefix)
+        if parents and target.document_prefix not in parents:
+            self.issues.append(
                 ValidationIssue(
                     "warning",
                     uid,
-                    item.document_prefix,
-                    "non-normative item has links",
+                    prefix,
+                    f"links to {link} in document {target.document_prefix}, "
+                    f"which is not a parent document "
+                    f"(expected: {', '.join(parents)})",
                 )
             )
 
-        for link in item.links:
-            # Check self-link
-            if check_self_links and link == uid:
-                issues.append(
-                    ValidationIssue(
-                        "warning",
-                        uid,
-                        item.document_prefix,
-                        "links to itself",
-                    )
-                )
-                continue
-
-            # Check link target exists
-            if link not in graph.items:
-                issues.append(
-                    ValidationIssue(
-                        "error",
-                        uid,
-                        item.document_prefix,
-                        f"links to non-existent item: {link}",
-                    )
-                )
-                continue
-
-            # Check link to inactive item
-            target = graph.items[link]
-            if not target.active:
-                issues.append(
-                    ValidationIssue(
-                        "error",
-                        uid,
-                        item.document_prefix,
-                        f"links to inactive item: {link}",
-                    )
-                )
-                continue
-
-            # Check link to non-normative item
-            if target.type != "requirement":
-                issues.append(
-                    ValidationIssue(
-                        "warning",
-                        uid,
-                        item.document_prefix,
-                        f"links to non-normative item: {link}",
-                    )
-                )
-
-            # Check link conformance (links to parent document)
-            if parents and target.document_prefix not in parents:
-                issues.append(
-                    ValidationIssue(
-                        "warning",
-                        uid,
-                        item.document_prefix,
-                        f"links to {link} in document {target.document_prefix}, "
-                        f"which is not a parent document "
-                        f"(expected: {', '.join(parents)})",
-                    )
-                )
-
-    return issues
 
-
-def _check_suspect_links(dag: DocumentDAG, graph: TraceabilityGraph, skip: set[str]) -> list[ValidationIssue]:
+class _SuspectLinkRule(_Rule):
     """Check for suspect links by comparing stored hashes to current content.
 
     A link is considered *suspect* when the content hash stored at the
@@ -289,63 +681,38 @@ def _check_suspect_links(dag: DocumentDAG, graph: TraceabilityGraph, skip: set[s
     modified since the link was last verified.  Links that have no
     stored hash at all are also flagged, since they cannot be verified.
 
-    For each active, non-skipped item the function reads the raw YAML
-    file to obtain ``link_hashes``, recomputes the content hash of every
-    linked target, and compares the two values.
-
-    Args:
-        dag: The document DAG, used to resolve file paths for raw item
-            data.
-        graph: The traceability graph containing all items and their
-            links.
-        skip: Set of document prefixes to exclude from validation.
-
-    Returns:
-        A list of ``ValidationIssue`` objects with level ``warning`` for
-        each suspect link (hash mismatch) and each link missing a stored
-        hash.
+    The stored hashes come from :attr:`Item.link_hashes` for items loaded
+    by :func:`~jamb.storage.graph_builder.build_traceability_graph`; the
+    raw YAML file is only read for items built elsewhere. Target hashes
+    are computed once per run and shared with the review status check.
     """
-    issues = []
 
-    for uid, item in graph.items.items():
-        if item.document_prefix in skip:
-            continue
-        if not item.active:
-            continue
+    name = "suspect"
+    cacheable = True
 
-        # Read raw item to get link hashes
-        doc_path = dag.document_paths.get(item.document_prefix)
-        if doc_path is None:
-            logger.warning("Document path not found for prefix: %s", item.document_prefix)
-            continue
+    def check_item(self, ctx: _ValidationContext, uid: str, item: Item) -> None:
+        """Compare the stored link hashes of *item* with its targets."""
+        link_hashes = item.link_hashes
+        if link_hashes is None:
+            doc_path = ctx.dag.document_paths.get(item.document_prefix)
+            if doc_path is None:
+                logger.warning("Document path not found for prefix: %s", item.document_prefix)
+                return
 
-        item_path = doc_path / f"{uid}.yml"
-        if not item_path.exists():
-            logger.warning("Item file not found: %s", item_path)
-            continue
+            item_path = doc_path / f"{uid}.yml"
+            if not item_path.exists():
+                logger.warning("Item file not found: %s", item_path)
+                return
 
-        raw_item = read_item(item_path, item.document_prefix)
-        link_hashes = raw_item.get("link_hashes", {})
+            link_hashes = read_item(item_path, item.document_prefix).get("link_hashes", {})
+        items = ctx.graph.items
 
         for link_uid, stored_hash in link_hashes.items():
-            if link_uid not in graph.items:
+            target = items.get(link_uid)
+            if target is None or not target.active:
                 continue
-
-            if not graph.items[link_uid].active:
-                continue
-
-            # Compute current hash of linked item
-            target = graph.items[link_uid]
-            target_data = {
-                "text": target.text,
-                "header": target.header,
-                "links": target.links,
-                "type": target.type,
-            }
-            current_hash = compute_content_hash(target_data)
-
-            if stored_hash != current_hash:
-                issues.append(
+            if stored_hash != ctx.content_hash(link_uid):
+                self.issues.append(
                     ValidationIssue(
                         "warning",
                         uid,
@@ -354,15 +721,13 @@ def _check_suspect_links(dag: DocumentDAG, graph: TraceabilityGraph, skip: set[s
                     )
                 )
 
-        # Check for links with no stored hash
         for link_uid in item.links:
             if link_uid in link_hashes:
                 continue  # already checked above
-            if link_uid not in graph.items:
-                continue  # broken link, caught by _check_links
-            if not graph.items[link_uid].active:
-                continue
-            issues.append(
+            target = items.get(link_uid)
+            if target is None or not target.active:
+                continue  # broken link, caught by _LinkRule
+            self.issues.append(
                 ValidationIssue(
                     "warning",
                     uid,
@@ -371,40 +736,26 @@ def _check_suspect_links(dag: DocumentDAG, graph: TraceabilityGraph, skip: set[s
                 )
             )
 
-    return issues
-
 
-def _check_review_status(graph: TraceabilityGraph, skip: set[str]) -> list[ValidationIssue]:
-    """Check that items have been reviewed and review hash matches current content.
+class _ReviewStatusRule(_Rule):
+    """Check that normative items have been reviewed since their last change.
 
-    Ensures every active normative (``requirement``) item has been
-    reviewed.  Two conditions are flagged:
+    Two conditions are flagged:
 
     * The item has never been reviewed (``reviewed`` field is falsy).
     * The item has been modified since its last review, detected by
-      comparing the stored review hash against a freshly computed
-      content hash.
-
-    Args:
-        graph: The traceability graph containing all items.
-        skip: Set of document prefixes to exclude from validation.
-
-    Returns:
-        A list of ``ValidationIssue`` objects with level ``warning`` for
-        each unreviewed or stale-reviewed item.
+      comparing the stored review hash against the current content hash.
     """
-    issues = []
 
-    for uid, item in graph.items.items():
-        if item.document_prefix in skip:
-            continue
-        if not item.active:
-            continue
-        if item.type != "requirement":
-            continue
+    name = "review"
+    cacheable = True
 
+    def check_item(self, ctx: _ValidationContext, uid: str, item: Item) -> None:
+        """Check the review hash of *item*."""
+        if item.type != "requirement":
+            return
         if not item.reviewed:
-            issues.append(
+            self.issues.append(
                 ValidationIssue(
                     "warning",
                     uid,
@@ -412,284 +763,225 @@ def _check_review_status(graph: TraceabilityGraph, skip: set[str]) -> list[Valid
                     "has not been reviewed (run 'jamb review mark' to mark as reviewed)",
                 )
             )
-        else:
-            item_data = {
-                "text": item.text,
-                "header": item.header,
-                "links": item.links,
-                "type": item.type,
-            }
-            current_hash = compute_content_hash(item_data)
-            if item.reviewed != current_hash:
-                issues.append(
-                    ValidationIssue(
-                        "warning",
-                        uid,
-                        item.document_prefix,
-                        "has been modified since last review (run 'jamb review mark' to re-approve)",
-                    )
+        elif item.reviewed != ctx.content_hash(uid):
+            self.issues.append(
+                ValidationIssue(
+                    "warning",
+                    uid,
+                    item.document_prefix,
+                    "has been modified since last review (run 'jamb review mark' to re-approve)",
                 )
-
-    return issues
+            )
 
 
-def _check_children(dag: DocumentDAG, graph: TraceabilityGraph, skip: set[str]) -> list[ValidationIssue]:
+class _ChildrenRule(_Rule):
     """Check that non-leaf document items have children linking to them.
 
-    For every active normative item that belongs to a non-leaf document
-    (i.e., a document that has child documents in the DAG), verifies
-    that at least one active item in the graph links to it.  Items in
-    leaf documents are excluded because they have no child documents
-    from which links would originate.
+    Normative items of documents that have child documents in the DAG
+    need at least one active item (in any document, skipped or not)
+    linking to them. The links are only known once every item has been
+    visited, so candidates are checked in :meth:`finish`.
+    """
 
-    Args:
-        dag: The document DAG, used to identify leaf documents.
-        graph: The traceability graph containing all items and their
-            links.
-        skip: Set of document prefixes to exclude from validation.
+    name = "children"
+
+    def __init__(self) -> None:
+        """Start with no candidates."""
+        super().__init__()
+        self._candidates: list[Item] = []
+        self._leaf_docs: set[str] | None = None
+
+    def check_item(self, ctx: _ValidationContext, uid: str, item: Item) -> None:
+        """Remember normative items of non-leaf documents."""
+        if self._leaf_docs is None:
+            self._leaf_docs = set(ctx.dag.get_leaf_documents())
+        if item.type == "requirement" and item.document_prefix not in self._leaf_docs:
+            self._candidates.append(item)
+
+    def finish(self, ctx: _ValidationContext) -> None:
+        """Flag candidates that no active item links to."""
+        self.issues.extend(
+            ValidationIssue(
+                "warning",
+                item.uid,
+                item.document_prefix,
+                "has no children linking to it from child documents",
+            )
+            for item in self._candidates
+            if item.uid not in ctx.linked_to
+        )
 
-    Returns:
-        A list of ``ValidationIssue`` objects with level ``warning`` for
-        each non-leaf-document item that has no children linking to it.
+
+class _EmptyDocumentRule(_Rule):
+    """Check for documents that contain no items.
+
+    Empty documents may indicate a misconfiguration or an incomplete
+    import. Inactive items count as content.
     """
-    issues = []
-    leaf_docs = set(dag.get_leaf_documents())
 
-    # Build set of UIDs that are linked to (only from active items)
-    linked_to: set[str] = set()
-    for item in graph.items.values():
-        if not item.active:
-            continue
-        for link in item.links:
-            linked_to.add(link)
+    name = "empty_documents"
 
-    for uid, item in graph.items.items():
-        if item.document_prefix in skip:
-            continue
-        if not item.active:
-            continue
-        if item.type != "requirement":
-            continue
-        if item.document_prefix in leaf_docs:
-            continue
+    def finish(self, ctx: _ValidationContext) -> None:
+        """Flag DAG documents without any item."""
+        self.issues.extend(
+            ValidationIssue("warning", None, prefix, "document contains no items")
+            for prefix in ctx.dag.documents
+            if prefix not in ctx.skip and prefix not in ctx.prefixes_with_items
+        )
 
-        # Check if any child document item links to this item
-        if uid not in linked_to:
-            issues.append(
-                ValidationIssue(
-                    "warning",
-                    uid,
-                    item.document_prefix,
-                    "has no children linking to it from child documents",
-                )
-            )
 
-    return issues
+class _EmptyTextRule(_Rule):
+    """Check for items with empty or whitespace-only text."""
 
+    name = "empty_text"
+    cacheable = True
 
-def _check_empty_documents(dag: DocumentDAG, graph: TraceabilityGraph, skip: set[str]) -> list[ValidationIssue]:
-    """Check for documents that contain no items.
+    def check_item(self, ctx: _ValidationContext, uid: str, item: Item) -> None:
+        """Flag *item* if its text is blank."""
+        if not item.text or not item.text.strip():
+            self.issues.append(ValidationIssue("warning", uid, item.document_prefix, "has empty text"))
 
-    Iterates over every document registered in the DAG and flags those
-    that have zero items in the traceability graph.  Empty documents
-    may indicate a misconfiguration or an incomplete import.
 
-    Args:
-        dag: The document DAG, providing the set of known document
-            prefixes.
-        graph: The traceability graph containing all items.
-        skip: Set of document prefixes to exclude from validation.
+class _ItemLinkCycleRule(_Rule):
+    """Detect cycles in the item-to-item link graph.
 
-    Returns:
-        A list of ``ValidationIssue`` objects with level ``warning`` for
-        each document that contains no items.
+    Each active, non-skipped item is a node and each link between two
+    such items is an edge. Every strongly connected component that
+    contains a cycle is reported once, with a shortest cycle through its
+    first item as the path and all of its items as affected (see
+    :func:`jamb.core.cycles.find_cycles`).
     """
-    issues = []
 
-    prefixes_with_items = {item.document_prefix for item in graph.items.values()}
-
-    for prefix in dag.documents:
-        if prefix in skip:
-            continue
-        if prefix not in prefixes_with_items:
-            issues.append(
+    name = "item_cycles"
+
+    def __init__(self) -> None:
+        """Start with no nodes."""
+        super().__init__()
+        self._nodes: list[str] = []
+
+    def check_item(self, ctx: _ValidationContext, uid: str, item: Item) -> None:
+        """Record *item* as a node of the link graph."""
+        self._nodes.append(uid)
+
+    def finish(self, ctx: _ValidationContext) -> None:
+        """Search the recorded nodes for cycles."""
+        items = ctx.graph.items
+        # Links to items that are not nodes (inactive, skipped or missing)
+        # are not followed
+        for cycle in find_cycles(self._nodes, lambda uid: items[uid].links):
+            start = cycle.path[0]
+            self.issues.append(
                 ValidationIssue(
-                    "warning",
-                    None,
-                    prefix,
-                    "document contains no items",
+                    "error",
+                    start,
+                    items[start].document_prefix,
+                    f"cycle in item links: {' -> '.join(cycle.path)} -> {start} "
+                    f"(affects: {', '.join(sorted(cycle.members))})",
                 )
             )
 
-    return issues
-
 
-def _check_empty_text(graph: TraceabilityGraph, skip: set[str]) -> list[ValidationIssue]:
-    """Check for items with empty or whitespace-only text.
-
-    Flags every active item whose ``text`` field is empty or contains
-    only whitespace characters.  Such items are unlikely to be
-    intentional and may indicate incomplete authoring.
-
-    Args:
-        graph: The traceability graph containing all items.
-        skip: Set of document prefixes to exclude from validation.
+class _UnlinkedItemRule(_Rule):
+    """Check for normative non-derived items in child documents with no links.
 
-    Returns:
-        A list of ``ValidationIssue`` objects with level ``warning`` for
-        each item that has empty text.
+    In a well-formed traceability tree, every normative item in a child
+    document should link upward to at least one item in a parent
+    document, unless it is explicitly marked as derived.  Items in root
+    documents (no parents) are not checked.
     """
-    issues = []
 
-    for uid, item in graph.items.items():
-        if item.document_prefix in skip:
-            continue
-        if not item.active:
-            continue
-        if not item.text or not item.text.strip():
-            issues.append(
+    name = "unlinked"
+    cacheable = True
+
+    def check_item(self, ctx: _ValidationContext, uid: str, item: Item) -> None:
+        """Flag *item* if it should link upward but has no links."""
+        if item.type != "requirement" or item.derived or item.links:
+            return
+        if ctx.parents(item.document_prefix):
+            self.issues.append(
                 ValidationIssue(
                     "warning",
                     uid,
                     item.document_prefix,
-                    "has empty text",
+                    "normative non-derived item has no links to parent document"
+                    " (add links or set 'derived: true' to suppress)",
                 )
             )
 
-    return issues
-
-
-def _check_item_link_cycles(graph: TraceabilityGraph, skip: set[str]) -> list[ValidationIssue]:
-    """Detect cycles in the item-to-item link graph using DFS.
-
-    Builds a directed graph where each active, non-skipped item is a
-    node and each link from one item to another is an edge.  A
-    depth-first search with three-color marking (white/gray/black) is
-    used to detect back edges, which indicate cycles.
 
-    Each unique cycle (identified by its set of member UIDs) is reported
-    at most once.  The issue message includes the full cycle path.
+class _AttributeSchemaRule(_Rule):
+    """Check custom attributes against their document's schema.
 
-    Args:
-        graph: The traceability graph containing all items and their
-            links.
-        skip: Set of document prefixes to exclude from validation.
-
-    Returns:
-        A list of ``ValidationIssue`` objects with level ``error`` for
-        each distinct cycle found in the item link graph.
+    Each document's ``attributes`` schema is compiled once per run, on
+    first use, into one check per attribute (see
+    :func:`~jamb.storage.attribute_schema.compile_attribute_schema`), so
+    items of documents without a schema cost a dictionary lookup. Malformed
+    schemas are reported once per document in :meth:`finish`, and their
+    items are not checked.
     """
-    issues: list[ValidationIssue] = []
-    reported_cycles: set[frozenset[str]] = set()
-
-    # Build adjacency: item -> items it links to (only active, non-skipped)
-    active_uids = {uid for uid, item in graph.items.items() if item.active and item.document_prefix not in skip}
 
-    adjacency: dict[str, list[str]] = {}
-    for uid in active_uids:
-        adjacency[uid] = [lk for lk in graph.items[uid].links if lk in active_uids]
-
-    white, gray, black = 0, 1, 2
-    color: dict[str, int] = {uid: white for uid in active_uids}
-    path: list[str] = []
-
-    for start_uid in active_uids:
-        if color[start_uid] != white:
-            continue
-
-        # Stack of (uid, iterator_over_links)
-        stack: list[tuple[str, int]] = [(start_uid, 0)]
-        color[start_uid] = gray
-        path.append(start_uid)
-
-        while stack:
-            uid, link_idx = stack[-1]
-            active_links = adjacency[uid]
-
-            if link_idx < len(active_links):
-                # Advance the index for the current frame
-                stack[-1] = (uid, link_idx + 1)
-                link = active_links[link_idx]
-
-                if color[link] == gray:
-                    # Found a cycle — extract it
-                    cycle_start = path.index(link)
-                    cycle_members = frozenset(path[cycle_start:])
-                    if cycle_members not in reported_cycles:
-                        reported_cycles.add(cycle_members)
-                        cycle_uids = path[cycle_start:]
-                        # Report all UIDs involved in the cycle for clarity
-                        affected_uids = ", ".join(sorted(cycle_members))
-                        issues.append(
-                            ValidationIssue(
-                                "error",
-                                link,
-                                graph.items[link].document_prefix,
-                                f"cycle in item links: {' -> '.join(cycle_uids)} -> {link} (affects: {affected_uids})",
-                            )
-                        )
-                elif color[link] == white:
-                    color[link] = gray
-                    path.append(link)
-                    stack.append((link, 0))
-            else:
-                # All links processed, backtrack
-                stack.pop()
-                path.pop()
-                color[uid] = black
-
-    return issues
-
-
-def _check_unlinked_items(dag: DocumentDAG, graph: TraceabilityGraph, skip: set[str]) -> list[ValidationIssue]:
-    """Check for normative non-derived items in child documents with no links.
-
-    In a well-formed traceability tree, every normative item in a child
-    document should link upward to at least one item in a parent
-    document (unless it is explicitly marked as derived).  This check
-    flags active normative items that belong to a document with parent
-    documents in the DAG yet have an empty links list.
-
-    Derived items are excluded because they intentionally lack upward
-    links.  Items in root documents (no parents) are also excluded.
-
-    Args:
-        dag: The document DAG, used to determine whether an item's
-            document has parent documents.
-        graph: The traceability graph containing all items and their
-            links.
-        skip: Set of document prefixes to exclude from validation.
+    name = "attributes"
+    cacheable = True
+
+    def __init__(self) -> None:
+        """Start with no compiled schemas."""
+        super().__init__()
+        self._checks: dict[str, list[AttributeCheck]] = {}
+
+    def _compiled(self, ctx: _ValidationContext, prefix: str) -> list[AttributeCheck]:
+        checks = self._checks.get(prefix)
+        if checks is None:
+            config = ctx.dag.documents.get(prefix)
+            try:
+                checks = compile_attribute_schema(config.attributes) if config is not None and config.attributes else []
+            except ValueError:
+                checks = []
+            self._checks[prefix] = checks
+        return checks
+
+    def check_item(self, ctx: _ValidationContext, uid: str, item: Item) -> None:
+        """Flag custom attributes of *item* that break the schema."""
+        for check in self._compiled(ctx, item.document_prefix):
+            message = check(item.custom_attributes)
+            if message is not None:
+                self.issues.append(ValidationIssue("error", uid, item.document_prefix, message))
+
+    def finish(self, ctx: _ValidationContext) -> None:
+        """Report documents whose schema cannot be compiled."""
+        for prefix, config in ctx.dag.documents.items():
+            if prefix in ctx.skip or not config.attributes:
+                continue
+            try:
+                compile_attribute_schema(config.attributes)
+            except ValueError as e:
+                self.issues.append(ValidationIssue("error", None, prefix, f"invalid attribute schema: {e}"))
 
-    Returns:
-        A list of ``ValidationIssue`` objects with level ``warning`` for
-        each unlinked normative non-derived item in a child document.
-    """
-    issues = []
 
-    for uid, item in graph.items.items():
-        if item.document_prefix in skip:
-            continue
-        if not item.active:
-            continue
-        if item.type != "requirement":
-            continue
-        if item.derived:
-            continue
+class _HeadingLevelRule(_Rule):
+    """Check that the 'level' field is only used on heading items and is >= 1."""
 
-        # Check if this document has parents (i.e., it's a child document)
-        parents = dag.get_parents(item.document_prefix) if item.document_prefix in dag.documents else []
-        if not parents:
-            continue
+    name = "heading_level"
+    cacheable = True
 
-        if not item.links:
-            issues.append(
+    def check_item(self, ctx: _ValidationContext, uid: str, item: Item) -> None:
+        """Flag a misplaced or invalid ``level`` on *item*."""
+        if item.level is None:
+            return
+        if item.type != "heading":
+            self.issues.append(
                 ValidationIssue(
                     "warning",
                     uid,
                     item.document_prefix,
-                    "normative non-derived item has no links to parent document"
-                    " (add links or set 'derived: true' to suppress)",
+                    "'level' field is only meaningful on heading items",
+                )
+            )
+        elif item.level < 1:
+            self.issues.append(
+                ValidationIssue(
+                    "warning",
+                    uid,
+                    item.document_prefix,
+                    f"'level' must be >= 1, got {item.level}",
                 )
             )
-
-    return issues
@@ -0,0 +1,207 @@
+"""Incremental validation cache for ``jamb validate --cache``.
+
+The cache file (``.jamb-cache/validation.json``) keeps two things between
+runs:
+
+* the parsed content of every item file, keyed by its path, modification
+  time and size, so unchanged files are not parsed again;
+* the per-item issues of each validation rule, keyed by a fingerprint of
+  the item and of the items it links to. Any change to the document
+  configuration or to the enabled checks discards these issues.
+
+An edited item gets a new fingerprint, and so does every item linking to
+it, so only those are checked again. Checks that depend on the whole
+graph (cycles, empty documents, child links) always run.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import warnings
+from pathlib import Path
+from typing import Any
+
+from jamb.storage.items import read_item
+
+CACHE_DIR = ".jamb-cache"
+VALIDATION_CACHE = "validation.json"
+
+# Bump when the cached data or the issue rules change meaning
+CACHE_VERSION = 2
+
+
+class ValidationCache:
+    """Item file and per-item issue cache for validation.
+
+    Attributes:
+        path (Path): The cache file.
+        files_read (int): Item files parsed during this run.
+        files_reused (int): Item files served from the cache.
+        items_checked (int): Items whose issues were computed during this run.
+        items_reused (int): Items whose issues were served from the cache.
+    """
+
+    def __init__(self, path: str | os.PathLike[str] = Path(CACHE_DIR) / VALIDATION_CACHE) -> None:
+        """Create an empty cache that will be saved to *path*.
+
+        Args:
+            path: Cache file (default: ``.jamb-cache/validation.json``).
+        """
+        self.path = Path(path)
+        self.files_read = 0
+        self.files_reused = 0
+        self.items_checked = 0
+        self.items_reused = 0
+        self._files: dict[str, list[Any]] = {}
+        self._issues: dict[str, list[Any]] = {}
+        self._settings: str | None = None
+        self._seen_files: dict[str, list[Any]] = {}
+        self._seen_issues: dict[str, list[Any]] = {}
+
+    @classmethod
+    def load(cls, path: str | os.PathLike[str] = Path(CACHE_DIR) / VALIDATION_CACHE) -> ValidationCache:
+        """Load the cache from *path*.
+
+        A missing, unreadable or outdated cache file gives an empty cache.
+
+        Args:
+            path: Cache file (default: ``.jamb-cache/validation.json``).
+
+        Returns:
+            The cache.
+        """
+        cache = cls(path)
+        try:
+            data = json.loads(cache.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return cache
+        if not isinstance(data, dict) or data.get("version") != CACHE_VERSION:
+            return cache
+        cache._files = data.get("files", {})
+        cache._issues = data.get("issues", {})
+        cache._settings = data.get("settings")
+        return cache
+
+    def save(self) -> None:
+        """Write the entries used during this run to the cache file.
+
+        Entries of deleted files and items are dropped.
+
+        Raises:
+            OSError: If the cache file cannot be written.
+        """
+        data = {
+            "version": CACHE_VERSION,
+            "settings": self._settings,
+            "files": self._seen_files,
+            "issues": self._seen_issues,
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=self.path.parent, prefix=".tmp_", suffix=".json")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(temp_path, self.path)
+        except BaseException:
+            Path(temp_path).unlink(missing_ok=True)
+            raise
+
+    def read_item(self, path: Path, document_prefix: str) -> dict[str, Any]:
+        """Read an item file like :func:`~jamb.storage.items.read_item`.
+
+        The parsed content is reused while the file's modification time
+        and size are unchanged. Warnings raised while parsing are stored
+        and raised again on reuse. Content that does not survive a JSON
+        round trip (e.g. YAML dates) is not cached.
+
+        Args:
+            path: Path to the item YAML file.
+            document_prefix: The document prefix this item belongs to.
+
+        Returns:
+            The normalized item dict. Do not modify it.
+
+        Raises:
+            OSError: If the file cannot be read.
+            ValueError: If the file contains invalid YAML or has an empty UID.
+        """
+        key = str(path)
+        try:
+            stat = path.stat()
+        except OSError:
+            return read_item(path, document_prefix)
+
+        entry = self._files.get(key)
+        if entry is not None and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+            raw, messages = entry[2], entry[3]
+            if raw.get("document_prefix") == document_prefix:
+                self.files_reused += 1
+                self._seen_files[key] = entry
+                for message in messages:
+                    warnings.warn(message, stacklevel=2)
+                return raw
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            raw = read_item(path, document_prefix)
+        messages = [str(w.message) for w in caught]
+        for w in caught:
+            warnings.warn_explicit(w.message, w.category, w.filename, w.lineno)
+        self.files_read += 1
+
+        try:
+            cacheable = json.loads(json.dumps(raw)) == raw
+        except (TypeError, ValueError):
+            cacheable = False
+        if cacheable:
+            self._seen_files[key] = [stat.st_mtime_ns, stat.st_size, raw, messages]
+        return raw
+
+    def use_settings(self, settings: dict[str, Any]) -> None:
+        """Discard cached issues unless they were computed with *settings*.
+
+        Args:
+            settings: Description of everything the per-item issues
+                depend on besides the items themselves (document
+                configuration, enabled checks, skipped documents). Values
+                JSON cannot encode, such as dates, are fingerprinted by
+                their string form.
+        """
+        # default=str: schemas may hold YAML dates, e.g. in an enum
+        data = json.dumps([CACHE_VERSION, settings], sort_keys=True, default=str)
+        fingerprint = hashlib.sha256(data.encode("utf-8")).hexdigest()
+        if fingerprint != self._settings:
+            self._issues = {}
+            self._settings = fingerprint
+
+    def lookup_issues(self, uid: str, key: str) -> list[list[str]] | None:
+        """Return the cached issues of item *uid* if its fingerprint is *key*.
+
+        Args:
+            uid: Item UID.
+            key: Current fingerprint of the item.
+
+        Returns:
+            ``[rule, level, message]`` entries in reporting order, or
+            ``None`` on a cache miss.
+        """
+        entry = self._issues.get(uid)
+        if entry is None or entry[0] != key:
+            return None
+        self.items_reused += 1
+        self._seen_issues[uid] = entry
+        return entry[1]
+
+    def store_issues(self, uid: str, key: str, issues: list[list[str]]) -> None:
+        """Record the issues computed for item *uid*.
+
+        Args:
+            uid: Item UID.
+            key: Fingerprint of the item.
+            issues: ``[rule, level, message]`` entries in reporting order.
+        """
+        self.items_checked += 1
+        self._seen_issues[uid] = [key, issues]
@@ -0,0 +1,226 @@
+"""Machine-readable validation reports for ``jamb validate --format``.
+
+Each writer streams issues to its file as they are reported, flushing
+after every issue, so CI jobs can surface results while validation is
+still running:
+
+* ``json`` -- JSON Lines: one object per issue with ``level``, ``uid``,
+  ``prefix``, ``rule``, ``message`` and ``path``;
+* ``sarif`` -- a SARIF 2.1.0 log for code-scanning tools, with one result
+  per issue located at the item's YAML file;
+* ``junit`` -- JUnit XML with one test case per issue; errors are
+  failures, warnings and info are passing cases with the message as
+  output.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, TextIO
+from xml.sax.saxutils import escape, quoteattr
+
+if TYPE_CHECKING:
+    from jamb.storage.document_dag import DocumentDAG
+    from jamb.storage.validation import ValidationIssue
+
+REPORT_FORMATS = ("json", "sarif", "junit")
+
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+
+_SARIF_LEVELS = {"error": "error", "warning": "warning", "info": "note"}
+
+
+class IssueWriter(ABC):
+    """Base class of the streaming report writers.
+
+    Use as a context manager, or call :meth:`close` when done.
+
+    Attributes:
+        path (Path): The report file.
+        count (int): Issues written so far.
+    """
+
+    def __init__(self, path: str | os.PathLike[str], dag: DocumentDAG | None = None) -> None:
+        """Open *path* for writing and write the report header.
+
+        Args:
+            path: The report file.
+            dag: Used to locate item files; without it issues have no path.
+
+        Raises:
+            OSError: If the file cannot be opened.
+        """
+        self.path = Path(path)
+        self.count = 0
+        self._dag = dag
+        self._file: TextIO = open(self.path, "w", encoding="utf-8")  # noqa: SIM115 - closed by close()
+        self._write_header()
+        self._file.flush()
+
+    def write(self, issue: ValidationIssue) -> None:
+        """Append *issue* to the report.
+
+        Args:
+            issue: The issue, with its final level.
+        """
+        self._write_issue(issue)
+        self.count += 1
+        self._file.flush()
+
+    def close(self) -> None:
+        """Write the report footer and close the file."""
+        if self._file.closed:
+            return
+        try:
+            self._write_footer()
+        finally:
+            self._file.close()
+
+    def __enter__(self) -> IssueWriter:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def issue_path(self, issue: ValidationIssue) -> str | None:
+        """Return the file an issue refers to, relative to the current directory.
+
+        Item issues point to the item's YAML file, document issues to the
+        document's ``.jamb.yml``.
+
+        Args:
+            issue: The issue.
+
+        Returns:
+            A POSIX-style path, or ``None`` if the document is unknown.
+        """
+        if self._dag is None or issue.prefix is None:
+            return None
+        doc_path = self._dag.document_paths.get(issue.prefix)
+        if doc_path is None:
+            return None
+        path = doc_path / (f"{issue.uid}.yml" if issue.uid else ".jamb.yml")
+        with contextlib.suppress(ValueError):
+            # Different drive on Windows
+            path = Path(os.path.relpath(path))
+        return path.as_posix()
+
+    def _write_header(self) -> None:  # noqa: B027 - optional hook
+        pass
+
+    @abstractmethod
+    def _write_issue(self, issue: ValidationIssue) -> None:
+        """Write one issue in the report's format."""
+
+    def _write_footer(self) -> None:  # noqa: B027 - optional hook
+        pass
+
+
+class JsonIssueWriter(IssueWriter):
+    """Write issues as JSON Lines."""
+
+    def _write_issue(self, issue: ValidationIssue) -> None:
+        record = {
+            "level": issue.level,
+            "uid": issue.uid,
+            "prefix": issue.prefix,
+            "rule": issue.rule,
+            "message": issue.message,
+            "path": self.issue_path(issue),
+        }
+        self._file.write(json.dumps(record) + "\n")
+
+
+class SarifIssueWriter(IssueWriter):
+    """Write issues as a SARIF 2.1.0 log with a single run."""
+
+    def _write_header(self) -> None:
+        from jamb import __version__
+
+        driver = {
+            "name": "jamb",
+            "version": __version__,
+            "informationUri": "https://github.com/vanandrew/jamb",
+        }
+        # The header is written up to the opening of the results array
+        header = json.dumps(
+            {"version": "2.1.0", "$schema": SARIF_SCHEMA, "runs": [{"tool": {"driver": driver}, "results": []}]},
+            indent=None,
+        )
+        self._file.write(header[: -len("]}]}")] + "\n")
+
+    def _write_issue(self, issue: ValidationIssue) -> None:
+        result: dict[str, Any] = {
+            "ruleId": issue.rule or "validation",
+            "level": _SARIF_LEVELS.get(issue.level, "warning"),
+            "message": {"text": str(issue)},
+        }
+        path = self.issue_path(issue)
+        if path is not None:
+            result["locations"] = [{"physicalLocation": {"artifactLocation": {"uri": path}}}]
+        if issue.uid:
+            result.setdefault("locations", [{}])[0]["logicalLocations"] = [
+                {"name": issue.uid, "fullyQualifiedName": f"{issue.prefix}:{issue.uid}" if issue.prefix else issue.uid}
+            ]
+        self._file.write(("," if self.count else "") + json.dumps(result) + "\n")
+
+    def _write_footer(self) -> None:
+        self._file.write("]}]}\n")
+
+
+class JunitIssueWriter(IssueWriter):
+    """Write issues as JUnit XML test cases of one ``jamb validate`` suite.
+
+    The suite carries no test counts, since they are unknown while the
+    report is being streamed.
+    """
+
+    def _write_header(self) -> None:
+        self._file.write('<?xml version="1.0" encoding="UTF-8"?>\n<testsuites>\n<testsuite name="jamb validate">\n')
+
+    def _write_issue(self, issue: ValidationIssue) -> None:
+        name = f"{issue.prefix}:{issue.uid}" if issue.uid and issue.prefix else issue.uid or issue.prefix or "tree"
+        attrs = f"classname={quoteattr('jamb.validate.' + (issue.rule or 'validation'))} name={quoteattr(name)}"
+        path = self.issue_path(issue)
+        if path is not None:
+            attrs += f" file={quoteattr(path)}"
+        if issue.level == "error":
+            body = f"<failure type={quoteattr(issue.level)} message={quoteattr(issue.message)}>{escape(str(issue))}</failure>"
+        else:
+            body = f"<system-out>{escape(str(issue))}</system-out>"
+        self._file.write(f"<testcase {attrs}>{body}</testcase>\n")
+
+    def _write_footer(self) -> None:
+        self._file.write("</testsuite>\n</testsuites>\n")
+
+
+_WRITERS: dict[str, type[IssueWriter]] = {
+    "json": JsonIssueWriter,
+    "sarif": SarifIssueWriter,
+    "junit": JunitIssueWriter,
+}
+
+
+def open_issue_writer(report_format: str, path: str | os.PathLike[str], dag: DocumentDAG | None = None) -> IssueWriter:
+    """Open a streaming report writer.
+
+    Args:
+        report_format: One of :data:`REPORT_FORMATS`.
+        path: The report file.
+        dag: Used to locate item files in the report.
+
+    Returns:
+        The writer, with its header written.
+
+    Raises:
+        ValueError: If the format is unknown.
+        OSError: If the file cannot be opened.
+    """
+    writer = _WRITERS.get(report_format)
+    if writer is None:
+        raise ValueError(f"Unknown report format '{report_format}' (expected one of: {', '.join(REPORT_FORMATS)})")
+    return writer(path, dag)
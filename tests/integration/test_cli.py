@@ -1436,6 +1436,8 @@ class TestCheckWithConfigDocuments:
         """Test check command uses test_documents from config."""
         from unittest.mock import MagicMock, patch
 
+        monkeypatch.chdir(tmp_path)
+
         mock_config = MagicMock()
         mock_config.test_documents = ["SRS", "UT"]
 
@@ -1457,10 +1459,12 @@ class TestCheckWithConfigDocuments:
         assert result.exit_code == 0
         assert "SRS, UT" in result.output
 
-    def test_check_falls_back_to_leaf_documents(self, runner, monkeypatch):
+    def test_check_falls_back_to_leaf_documents(self, runner, monkeypatch, tmp_path):
         """Test check command falls back to leaf documents when no config."""
         from unittest.mock import MagicMock, patch
 
+        monkeypatch.chdir(tmp_path)
+
         mock_config = MagicMock()
         mock_config.test_documents = []
 
@@ -2148,6 +2152,88 @@ class TestValidateWithFlags:
         result = runner.invoke(cli, ["validate", "--error-all"])
         assert result.exit_code in (0, 1)
 
+    def test_validate_cache(self, runner, validate_project):
+        """Test validate --cache reuses results and matches an uncached run."""
+        uncached = runner.invoke(cli, ["validate", "-v"])
+        first = runner.invoke(cli, ["validate", "-v", "--cache"])
+        second = runner.invoke(cli, ["validate", "-v", "--cache"])
+
+        assert (validate_project / ".jamb-cache" / "validation.json").exists()
+        assert "reused 0 of 2 item files" in first.output
+        assert "reused 2 of 2 item files, 2 of 2 item checks" in second.output
+        for result in (first, second):
+            assert result.exit_code == uncached.exit_code
+            lines = [line for line in result.output.splitlines() if "Validation cache" not in line]
+            assert lines == uncached.output.splitlines()
+
+    def test_validate_jobs(self, runner, validate_project):
+        """Test validate --jobs gives the same output as a serial run."""
+        serial = runner.invoke(cli, ["validate", "-v"])
+        parallel = runner.invoke(cli, ["validate", "-v", "--jobs", "2"])
+        assert parallel.exit_code == serial.exit_code
+        assert parallel.output == serial.output
+
+    def test_validate_jobs_with_cache_rejected(self, runner, validate_project):
+        """Test validate refuses --cache with --jobs."""
+        result = runner.invoke(cli, ["validate", "--cache", "--jobs", "2"])
+        assert result.exit_code == 1
+        assert "--cache cannot be combined with --jobs" in result.output
+
+    def test_validate_max_issues(self, runner, validate_project):
+        """Test validate --max-issues stops after the given number of issues."""
+        result = runner.invoke(cli, ["validate", "--max-issues", "1"])
+        assert result.exit_code == 0
+        assert result.output.count("[WARNING]") == 1
+        assert "Validation stopped after 1 issues (--max-issues)" in result.output
+
+    def test_validate_fail_fast(self, runner, validate_project):
+        """Test validate --fail-fast stops at the first error."""
+        (validate_project / "srs" / "SRS002.yml").write_text("active: true\ntext: req\nlinks:\n- NOPE\n")
+        (validate_project / "srs" / "SRS003.yml").write_text("active: true\ntext: req\nlinks:\n- NOPE\n")
+
+        full = runner.invoke(cli, ["validate"])
+        result = runner.invoke(cli, ["validate", "--fail-fast"])
+
+        assert full.output.count("[ERROR]") == 2
+        assert result.exit_code == 1
+        assert result.output.count("[ERROR]") == 1
+        assert "Validation stopped after" in result.output
+        assert "(--fail-fast)" in result.output
+
+    def test_validate_fail_fast_without_errors(self, runner, validate_project):
+        """Test validate --fail-fast runs every check when there are only warnings."""
+        full = runner.invoke(cli, ["validate"])
+        result = runner.invoke(cli, ["validate", "--fail-fast"])
+        assert result.exit_code == 0
+        assert result.output == full.output
+
+    def test_validate_format_json(self, runner, validate_project):
+        """Test validate --format json writes one record per reported issue."""
+        import json
+
+        result = runner.invoke(cli, ["validate", "--format", "json", "-o", "report.json"])
+
+        assert result.exit_code == 0
+        records = [json.loads(line) for line in (validate_project / "report.json").read_text().splitlines()]
+        assert len(records) == result.output.count("[WARNING]")
+        assert {r["path"] for r in records} == {"UN001.yml", "srs/SRS001.yml"}
+
+    def test_validate_format_sarif(self, runner, validate_project):
+        """Test validate --format sarif writes a complete log when stopped early."""
+        import json
+
+        result = runner.invoke(cli, ["validate", "--format", "sarif", "-o", "report.sarif", "--max-issues", "2"])
+
+        assert result.exit_code == 0
+        log = json.loads((validate_project / "report.sarif").read_text())
+        assert len(log["runs"][0]["results"]) == 2
+
+    def test_validate_format_requires_output(self, runner, validate_project):
+        """Test validate refuses --format without --output."""
+        result = runner.invoke(cli, ["validate", "--format", "junit"])
+        assert result.exit_code == 1
+        assert "--format and --output must be used together" in result.output
+
 
 class TestItemEditWithTool:
     """Tests for item edit command with --tool option (still uses subprocess)."""
@@ -2207,7 +2293,7 @@ class TestScanTestsForRequirements:
         """Test _is_requirement_marker returns False for non-requirement markers."""
         import ast
 
-        from jamb.cli.commands import _is_requirement_marker
+        from jamb.storage.test_index import _is_requirement_marker
 
         # Create an AST node for a different function call
         code = "some_function(arg1, arg2)"
@@ -2220,7 +2306,7 @@ class TestScanTestsForRequirements:
         """Test _is_requirement_marker returns True for requirement markers."""
         import ast
 
-        from jamb.cli.commands import _is_requirement_marker
+        from jamb.storage.test_index import _is_requirement_marker
 
         # Create an AST node for pytest.mark.requirement call
         code = "pytest.mark.requirement('SRS001')"
@@ -2747,6 +2833,7 @@ def test_example():
             # Verify file was NOT modified
             content = test_file.read_text()
             assert "@pytest.mark.tc_id" not in content
+            assert not (tmp_path / ".jamb-cache").exists()
         finally:
             os.chdir(original_cwd)
 
@@ -2779,6 +2866,7 @@ def test_example():
             # Verify file WAS modified
             content = test_file.read_text()
             assert "@pytest.mark.tc_id" in content
+            assert (tmp_path / ".jamb-cache" / "test-references.json").exists()
         finally:
             os.chdir(original_cwd)
 
@@ -1,5 +1,7 @@
 """Integration tests for jamb pytest plugin."""
 
+import pytest
+
 pytest_plugins = ["pytester"]
 
 
@@ -655,6 +657,35 @@ class TestJambLogFixture:
         assert "Login succeeds" in test["expected_results"]
 
 
+class TestArtifactStore:
+    """Tests for spilling large evidence to .jamb-artifacts/."""
+
+    def test_failure_and_attachment_stored_and_linked(self, pytester):
+        """Full failure text and attachments are stored once and linked from the matrix."""
+        pytester.makepyfile(
+            """
+            import pytest
+
+            @pytest.mark.requirement("SRS001")
+            def test_evidence(jamb_log):
+                jamb_log.attach(b"captured bytes", name="capture")
+                assert False, "x" * 2000
+            """
+        )
+        _setup_jamb(pytester)
+
+        result = pytester.runpytest("--jamb", "--jamb-test-matrix", "docs/records.html")
+
+        assert result.ret == 1
+        artifacts = pytester.path / ".jamb-artifacts"
+        contents = [p.read_bytes() for p in artifacts.iterdir()]
+        assert b"captured bytes" in contents
+        assert any(b"x" * 2000 in c for c in contents)
+        assert len((pytester.path / ".jamb").read_text()) < 5000
+        html = (pytester.path / "docs" / "records.html").read_text()
+        assert 'href="../.jamb-artifacts/' in html
+
+
 class TestMatrixMetadataIntegration:
     """Integration tests for matrix metadata (IEC 62304 5.7.5)."""
 
@@ -781,3 +812,569 @@ class TestMatrixMetadataIntegration:
         content = matrix_path.read_text()
         assert "QA Team" in content
         assert "Test Records" in content
+
+
+class TestJambUpdate:
+    """Tests for --jamb-update incremental coverage updates."""
+
+    def test_rerun_subset_keeps_other_results(self, pytester, monkeypatch):
+        """Rerunning one test patches its result into the existing .jamb file."""
+        import json
+
+        pytester.makepyfile(
+            test_reqs="""
+            import os
+            import pytest
+
+            @pytest.mark.requirement("SRS001")
+            def test_one():
+                assert os.environ.get("JAMB_FIXED") == "1"
+
+            @pytest.mark.requirement("SRS002")
+            def test_two():
+                assert True
+            """
+        )
+        pytester.makefile(".yml", **{".jamb": "settings:\n  digits: 3\n  prefix: SRS\n  sep: ''"})
+        pytester.makefile(".yml", SRS001="active: true\ntext: One\nlinks: []")
+        pytester.makefile(".yml", SRS002="active: true\ntext: Two\nlinks: []")
+
+        result = pytester.runpytest("--jamb")
+        assert result.ret == 1
+
+        monkeypatch.setenv("JAMB_FIXED", "1")
+        result = pytester.runpytest("--jamb", "--jamb-update", "-k", "test_one")
+        assert result.ret == 0
+
+        data = json.loads((pytester.path / ".jamb").read_text())
+        outcomes = {nodeid: result["test_outcome"] for nodeid, result in data["test_results"].items()}
+        assert outcomes == {
+            "test_reqs.py::test_one": "passed",
+            "test_reqs.py::test_two": "passed",
+        }
+
+    def test_without_update_overwrites(self, pytester):
+        """Without --jamb-update, a partial rerun replaces the .jamb file."""
+        import json
+
+        pytester.makepyfile(
+            test_reqs="""
+            import pytest
+
+            @pytest.mark.requirement("SRS001")
+            def test_one():
+                pass
+
+            @pytest.mark.requirement("SRS002")
+            def test_two():
+                pass
+            """
+        )
+        pytester.makefile(".yml", **{".jamb": "settings:\n  digits: 3\n  prefix: SRS\n  sep: ''"})
+        pytester.makefile(".yml", SRS001="active: true\ntext: One\nlinks: []")
+        pytester.makefile(".yml", SRS002="active: true\ntext: Two\nlinks: []")
+
+        pytester.runpytest("--jamb")
+        pytester.runpytest("--jamb", "-k", "test_one")
+
+        data = json.loads((pytester.path / ".jamb").read_text())
+        assert data["coverage"]["SRS002"]["linked_tests"] == []
+
+
+class TestJambSelect:
+    """Tests for requirement-scoped selection with --jamb-select."""
+
+    @pytest.fixture
+    def selection_project(self, pytester):
+        """SYS -> SRS project with one test per SRS item and an unmarked test."""
+        pytester.makepyfile(
+            test_reqs="""
+            import pytest
+
+            @pytest.mark.requirement("SRS001")
+            def test_srs001():
+                pass
+
+            @pytest.mark.requirement("SRS002")
+            def test_srs002():
+                pass
+
+            @pytest.mark.requirement("SYS002")
+            def test_sys002():
+                pass
+
+            def test_unmarked():
+                pass
+            """
+        )
+        sys_dir = pytester.mkdir("sys")
+        (sys_dir / ".jamb.yml").write_text("settings:\n  digits: 3\n  prefix: SYS\n  sep: ''\n")
+        (sys_dir / "SYS001.yml").write_text("active: true\ntext: One\nlinks: []\n")
+        (sys_dir / "SYS002.yml").write_text("active: true\ntext: Two\nlinks: []\n")
+        srs_dir = pytester.mkdir("srs")
+        (srs_dir / ".jamb.yml").write_text("settings:\n  digits: 3\n  parents:\n  - SYS\n  prefix: SRS\n  sep: ''\n")
+        (srs_dir / "SRS001.yml").write_text("active: true\ntext: One\nlinks:\n- SYS001\n")
+        (srs_dir / "SRS002.yml").write_text("active: true\ntext: Two\nlinks:\n- SYS002\n")
+        return pytester
+
+    def test_select_uid_runs_descendant_tests(self, selection_project):
+        """Selecting SYS002 runs tests for SYS002 and SRS002 only."""
+        result = selection_project.runpytest("--jamb", "--jamb-select", "SYS002", "-v")
+
+        assert result.ret == 0
+        result.assert_outcomes(passed=2, deselected=2)
+        result.stdout.fnmatch_lines(["*test_srs002 PASSED*", "*test_sys002 PASSED*"])
+
+    def test_select_glob(self, selection_project):
+        """Glob patterns select matching UIDs."""
+        result = selection_project.runpytest("--jamb", "--jamb-select", "SRS*")
+
+        result.assert_outcomes(passed=2, deselected=2)
+
+    def test_select_document(self, selection_project):
+        """--jamb-select-document selects every item in the document."""
+        result = selection_project.runpytest("--jamb", "--jamb-select-document", "SRS")
+
+        result.assert_outcomes(passed=2, deselected=2)
+
+    def test_unknown_selection_is_usage_error(self, selection_project):
+        """A selection that matches nothing stops the run."""
+        result = selection_project.runpytest("--jamb", "--jamb-select", "NOPE*")
+
+        assert result.ret == pytest.ExitCode.USAGE_ERROR
+        result.stderr.fnmatch_lines(["*--jamb-select: Requirement selection 'NOPE*' matched no items*"])
+
+    def test_deselected_tests_not_recorded(self, selection_project):
+        """Deselected tests do not appear in the saved coverage file."""
+        import json
+
+        selection_project.runpytest("--jamb", "--jamb-select", "SRS001")
+
+        data = json.loads((selection_project.path / ".jamb").read_text())
+        nodeids = {lt["test_nodeid"] for cov in data["coverage"].values() for lt in cov["linked_tests"]}
+        assert nodeids == {"test_reqs.py::test_srs001"}
+
+
+class TestJambAffectedSince:
+    """Tests for change-impact selection with --jamb-affected-since."""
+
+    @pytest.fixture
+    def git_project(self, pytester):
+        """Committed SYS -> SRS project with tests in two modules."""
+        import subprocess
+
+        def git(*args):
+            subprocess.run(
+                ["git", "-c", "user.name=Test", "-c", "user.email=test@example.com", *args],
+                cwd=pytester.path,
+                check=True,
+                capture_output=True,
+            )
+
+        pytester.makepyfile(
+            test_reqs="""
+            import pytest
+
+            @pytest.mark.requirement("SRS001")
+            def test_srs001():
+                pass
+
+            @pytest.mark.requirement("SRS002")
+            def test_srs002():
+                pass
+            """,
+            test_other="""
+            def test_unmarked():
+                pass
+            """,
+        )
+        sys_dir = pytester.mkdir("sys")
+        (sys_dir / ".jamb.yml").write_text("settings:\n  digits: 3\n  prefix: SYS\n  sep: ''\n")
+        (sys_dir / "SYS001.yml").write_text("active: true\ntext: One\nlinks: []\n")
+        (sys_dir / "SYS002.yml").write_text("active: true\ntext: Two\nlinks: []\n")
+        srs_dir = pytester.mkdir("srs")
+        (srs_dir / ".jamb.yml").write_text("settings:\n  digits: 3\n  parents:\n  - SYS\n  prefix: SRS\n  sep: ''\n")
+        (srs_dir / "SRS001.yml").write_text("active: true\ntext: One\nlinks:\n- SYS001\n")
+        (srs_dir / "SRS002.yml").write_text("active: true\ntext: Two\nlinks:\n- SYS002\n")
+        git("init", "-q")
+        git("add", ".")
+        git("commit", "-q", "-m", "initial")
+        return pytester
+
+    def test_changed_parent_selects_descendant_tests(self, git_project):
+        """Editing SYS002 runs only the test tracing to its child SRS002."""
+        (git_project.path / "sys" / "SYS002.yml").write_text("active: true\ntext: Two, revised\nlinks: []\n")
+
+        result = git_project.runpytest("--jamb", "--jamb-affected-since", "HEAD", "-v")
+
+        result.assert_outcomes(passed=1, deselected=2)
+        result.stdout.fnmatch_lines(["*test_srs002 PASSED*"])
+
+    def test_changed_test_module_is_selected(self, git_project):
+        """A changed test module runs even without requirement markers."""
+        (git_project.path / "test_other.py").write_text("def test_unmarked():\n    assert True\n")
+
+        result = git_project.runpytest("--jamb", "--jamb-affected-since", "HEAD", "-v")
+
+        result.assert_outcomes(passed=1, deselected=2)
+        result.stdout.fnmatch_lines(["*test_unmarked PASSED*"])
+
+    def test_no_changes_deselects_everything(self, git_project):
+        """With a clean working tree nothing is selected."""
+        result = git_project.runpytest("--jamb", "--jamb-affected-since", "HEAD")
+
+        result.assert_outcomes(deselected=3)
+
+    def test_bad_ref_is_usage_error(self, git_project):
+        """An unknown ref stops the run with a usage error."""
+        result = git_project.runpytest("--jamb", "--jamb-affected-since", "no-such-ref")
+
+        assert result.ret == pytest.ExitCode.USAGE_ERROR
+        result.stderr.fnmatch_lines(["*--jamb-affected-since: git diff*"])
+
+
+class TestJambSelectNodeids:
+    """Tests for node ID file selection with --jamb-select-nodeids."""
+
+    def test_runs_only_listed_tests(self, pytester):
+        """Listed tests run, a bare node ID selects every parametrization, and durations are recorded."""
+        import json
+
+        pytester.makepyfile(
+            test_nodes="""
+            import pytest
+
+            @pytest.mark.requirement("SRS001")
+            def test_listed():
+                pass
+
+            @pytest.mark.requirement("SRS001")
+            @pytest.mark.parametrize("n", [1, 2])
+            def test_param(n):
+                pass
+
+            def test_unlisted():
+                pass
+            """
+        )
+        _setup_jamb(pytester)
+        (pytester.path / "plan.txt").write_text("# smoke\ntest_nodes.py::test_listed\ntest_nodes.py::test_param\n")
+
+        result = pytester.runpytest("--jamb", "--jamb-select-nodeids", "plan.txt")
+
+        result.assert_outcomes(passed=3, deselected=1)
+        data = json.loads((pytester.path / ".jamb").read_text())
+        durations = [
+            data["test_results"][lt["test_nodeid"]]["duration"] for lt in data["coverage"]["SRS001"]["linked_tests"]
+        ]
+        assert len(durations) == 3
+        assert all(isinstance(d, float) for d in durations)
+
+    def test_missing_file_is_usage_error(self, pytester):
+        """An unreadable node ID file stops the run."""
+        pytester.makepyfile("def test_x():\n    pass\n")
+        _setup_jamb(pytester)
+
+        result = pytester.runpytest("--jamb", "--jamb-select-nodeids", "missing.txt")
+
+        assert result.ret == pytest.ExitCode.USAGE_ERROR
+        result.stderr.fnmatch_lines(["*--jamb-select-nodeids:*missing.txt*"])
+
+
+class TestFailUncoveredEarly:
+    """Tests for the collection-time coverage gate --jamb-fail-uncovered-early."""
+
+    def test_stops_before_running_tests(self, pytester):
+        """Uncovered and unknown UIDs abort the session before any test runs."""
+        pytester.makepyfile(
+            """
+            import pytest
+
+            @pytest.mark.requirement("SRS999")
+            def test_unknown():
+                raise AssertionError("must not run")
+            """
+        )
+        _setup_jamb(pytester)
+
+        result = pytester.runpytest("--jamb", "--jamb-fail-uncovered-early")
+
+        assert result.ret == pytest.ExitCode.TESTS_FAILED
+        result.stdout.fnmatch_lines(
+            ["*Uncovered test spec items:*", "*- SRS001: Test requirement*", "*Unknown items*", "*- SRS999*"]
+        )
+        result.stdout.no_fnmatch_line("*must not run*")
+        assert not (pytester.path / ".jamb").exists()
+
+    def test_closes_event_stream(self, pytester):
+        """An aborted session still ends the --jamb-events stream."""
+        import json
+
+        pytester.makepyfile(
+            """
+            def test_untraced():
+                pass
+            """
+        )
+        _setup_jamb(pytester)
+
+        result = pytester.runpytest("--jamb", "--jamb-fail-uncovered-early", "--jamb-events=file:events.jsonl")
+
+        assert result.ret == pytest.ExitCode.TESTS_FAILED
+        events = [json.loads(line) for line in (pytester.path / "events.jsonl").read_text().splitlines()]
+        assert events[-1] == {"event": "session_finish", "exitstatus": 1, "dropped": 0}
+
+    def test_runs_tests_when_markers_cover_everything(self, pytester):
+        """A suite whose markers cover every requirement runs normally."""
+        pytester.makepyfile(
+            """
+            import pytest
+
+            @pytest.mark.requirement("SRS001")
+            def test_covered():
+                pass
+            """
+        )
+        _setup_jamb(pytester)
+
+        result = pytester.runpytest("--jamb", "--jamb-fail-uncovered-early")
+
+        result.assert_outcomes(passed=1)
+        assert (pytester.path / ".jamb").exists()
+
+
+class TestMarkerCaching:
+    """Tests for memoized marker extraction and the overhead summary."""
+
+    def test_parametrized_variants_keep_their_own_marks(self, pytester):
+        """Per-variant requirement marks are not shared with other variants."""
+        import json
+
+        pytester.makepyfile(
+            """
+            import pytest
+
+            @pytest.mark.requirement("SRS001")
+            @pytest.mark.parametrize("n", [1, 2, pytest.param(3, marks=pytest.mark.requirement("SRS002"))])
+            def test_param(n):
+                pass
+            """
+        )
+        _setup_jamb(pytester)
+        pytester.makefile(".yml", SRS002="active: true\ntext: Second requirement\nlinks: []")
+
+        result = pytester.runpytest("--jamb")
+
+        result.assert_outcomes(passed=3)
+        result.stdout.fnmatch_lines(["*jamb overhead: loaded requirements in *, processed 3 collected tests in *"])
+        data = json.loads((pytester.path / ".jamb").read_text())
+        linked = {uid: [lt["test_nodeid"] for lt in cov["linked_tests"]] for uid, cov in data["coverage"].items()}
+        assert len(linked["SRS001"]) == 3
+        assert linked["SRS002"] == ["test_parametrized_variants_keep_their_own_marks.py::test_param[3]"]
+
+
+class TestBackgroundMatrices:
+    """Tests for writing matrices in a background process."""
+
+    def test_matrix_written_after_session(self, pytester):
+        """The matrix appears once the detached worker finishes."""
+        import time
+
+        pytester.makepyfile(
+            """
+            import pytest
+
+            @pytest.mark.requirement("SRS001")
+            def test_covered():
+                pass
+            """
+        )
+        _setup_jamb(pytester)
+
+        result = pytester.runpytest("--jamb", "--jamb-background-matrices", "--jamb-test-matrix", "records.json")
+
+        result.assert_outcomes(passed=1)
+        assert (pytester.path / ".jamb").exists()
+        matrix = pytester.path / "records.json"
+        deadline = time.monotonic() + 30
+        while not (matrix.exists() and "SRS001" in matrix.read_text()):
+            assert time.monotonic() < deadline, "background worker did not write the matrix"
+            time.sleep(0.1)
+
+
+class TestJambEvents:
+    """Tests for the --jamb-events live event stream."""
+
+    def test_file_stream(self, pytester):
+        """A collection event, one event per report and a session_finish event are written."""
+        import json
+
+        pytester.makepyfile(
+            """
+            import pytest
+
+            @pytest.mark.requirement("SRS001")
+            def test_covered():
+                pass
+
+            def test_unlinked():
+                assert False
+            """
+        )
+        _setup_jamb(pytester)
+
+        result = pytester.runpytest("--jamb", "--jamb-events=file:events.jsonl")
+
+        result.assert_outcomes(passed=1, failed=1)
+        events = [json.loads(line) for line in (pytester.path / "events.jsonl").read_text().splitlines()]
+        assert events[0] == {"event": "collection", "documents": {"SRS": ["SRS001"]}, "tests": 2}
+        reports = [e for e in events if e["event"] == "report"]
+        assert [(e["when"], e["outcome"]) for e in reports if e["nodeid"].endswith("test_covered")] == [
+            ("setup", "passed"),
+            ("call", "passed"),
+            ("teardown", "passed"),
+        ]
+        assert reports[0]["uids"] == ["SRS001"]
+        unlinked = {e["when"]: e["outcome"] for e in reports if e["nodeid"].endswith("test_unlinked")}
+        assert unlinked["call"] == "failed"
+        assert all(e["uids"] == [] for e in reports if e["nodeid"].endswith("test_unlinked"))
+        assert events[-1] == {"event": "session_finish", "exitstatus": 1, "dropped": 0}
+
+    def test_invalid_target_is_usage_error(self, pytester):
+        """A malformed target stops the run before collection."""
+        pytester.makepyfile("def test_x():\n    pass\n")
+        _setup_jamb(pytester)
+
+        result = pytester.runpytest("--jamb", "--jamb-events=events.jsonl")
+
+        assert result.ret == pytest.ExitCode.USAGE_ERROR
+        result.stderr.fnmatch_lines(["*--jamb-events: Invalid event target*"])
+
+
+class TestJambHistory:
+    """Tests for recording runs with --jamb-history."""
+
+    def test_runs_are_appended(self, pytester):
+        """Each session adds one run to .jamb-history/."""
+        from jamb.coverage.history import HistoryStore
+
+        pytester.makepyfile(
+            """
+            import pytest
+
+            @pytest.mark.requirement("SRS001")
+            def test_covered():
+                pass
+            """
+        )
+        _setup_jamb(pytester)
+
+        pytester.runpytest("--jamb", "--jamb-history").assert_outcomes(passed=1)
+        pytester.runpytest("--jamb", "--jamb-history").assert_outcomes(passed=1)
+
+        with HistoryStore(pytester.path / ".jamb-history" / "history.sqlite3") as store:
+            assert store.run_count() == 2
+            assert [r.status for r in store.requirement("SRS001")] == ["passed", "passed"]
+
+
+class TestJambOrder:
+    """Tests for risk-based ordering with --jamb-order."""
+
+    @pytest.fixture
+    def order_project(self, pytester):
+        """Project with a flaky test, a class C requirement and plain tests."""
+        pytester.makepyfile(
+            test_order="""
+            import os
+            import pytest
+
+            @pytest.mark.requirement("SRS001")
+            def test_plain():
+                pass
+
+            @pytest.mark.requirement("SRS002")
+            def test_class_c():
+                pass
+
+            @pytest.mark.requirement("SRS003")
+            def test_flaky():
+                assert not os.path.exists("fail.flag")
+            """
+        )
+        srs_dir = pytester.mkdir("srs")
+        (srs_dir / ".jamb.yml").write_text("settings:\n  digits: 3\n  prefix: SRS\n  sep: ''\n")
+        (srs_dir / "SRS001.yml").write_text("active: true\ntext: One\nlinks: []\n")
+        (srs_dir / "SRS002.yml").write_text("active: true\ntext: Two\nlinks: []\nsafety_class: C\n")
+        (srs_dir / "SRS003.yml").write_text("active: true\ntext: Three\nlinks: []\n")
+        return pytester
+
+    def test_previous_failures_then_safety_class(self, order_project):
+        """Tests of failed requirements run first, then by safety class."""
+        (order_project.path / "fail.flag").write_text("")
+        order_project.runpytest("--jamb").assert_outcomes(passed=2, failed=1)
+        (order_project.path / "fail.flag").unlink()
+
+        result = order_project.runpytest("--jamb", "--jamb-order=risk", "-v")
+
+        result.assert_outcomes(passed=3)
+        result.stdout.fnmatch_lines(["*test_flaky PASSED*", "*test_class_c PASSED*", "*test_plain PASSED*"])
+
+    def test_default_keeps_collection_order(self, order_project):
+        """Without --jamb-order the collection order is kept."""
+        result = order_project.runpytest("--jamb", "-v")
+
+        result.stdout.fnmatch_lines(["*test_plain PASSED*", "*test_class_c PASSED*", "*test_flaky PASSED*"])
+
+
+class TestJambRerunFailedRequirements:
+    """Tests for --jamb-rerun-failed-requirements."""
+
+    def test_reruns_all_tests_of_failed_requirements(self, pytester):
+        """Passing tests of a failed requirement and its descendants run again."""
+        pytester.makepyfile(
+            test_reqs="""
+            import os
+            import pytest
+
+            @pytest.mark.requirement("SYS001")
+            def test_sys001():
+                pass
+
+            @pytest.mark.requirement("SRS001")
+            def test_srs001_fails():
+                assert not os.path.exists("fail.flag")
+
+            @pytest.mark.requirement("SRS001")
+            def test_srs001_passes():
+                pass
+
+            @pytest.mark.requirement("SRS002")
+            def test_srs002():
+                pass
+            """
+        )
+        sys_dir = pytester.mkdir("sys")
+        (sys_dir / ".jamb.yml").write_text("settings:\n  digits: 3\n  prefix: SYS\n  sep: ''\n")
+        (sys_dir / "SYS001.yml").write_text("active: true\ntext: One\nlinks: []\n")
+        srs_dir = pytester.mkdir("srs")
+        (srs_dir / ".jamb.yml").write_text("settings:\n  digits: 3\n  parents:\n  - SYS\n  prefix: SRS\n  sep: ''\n")
+        (srs_dir / "SRS001.yml").write_text("active: true\ntext: One\nlinks:\n- SYS001\n")
+        (srs_dir / "SRS002.yml").write_text("active: true\ntext: Two\nlinks:\n- SYS001\n")
+        (pytester.path / "fail.flag").write_text("")
+        pytester.runpytest("--jamb").assert_outcomes(passed=3, failed=1)
+        (pytester.path / "fail.flag").unlink()
+
+        result = pytester.runpytest("--jamb", "--jamb-rerun-failed-requirements", "-v")
+
+        result.assert_outcomes(passed=2, deselected=2)
+        result.stdout.fnmatch_lines(["*test_srs001_fails PASSED*", "*test_srs001_passes PASSED*"])
+
+    def test_missing_coverage_file_is_usage_error(self, pytester):
+        """Without a previous .jamb file there is nothing to rerun."""
+        pytester.makepyfile("def test_one():\n    pass\n")
+        _setup_jamb(pytester)
+
+        result = pytester.runpytest("--jamb", "--jamb-rerun-failed-requirements")
+
+        assert result.ret == pytest.ExitCode.USAGE_ERROR
+        result.stderr.fnmatch_lines(["*--jamb-rerun-failed-requirements: Coverage file not found*"])
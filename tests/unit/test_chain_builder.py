@@ -1007,8 +1007,8 @@ class TestDeepHierarchyTraversal:
         assert len(paths) == 1
         assert paths[0] == ["A", "B", "C"]
 
-    def test_get_document_paths_max_depth_warning(self):
-        """Test that MAX_RECURSION_DEPTH warning is emitted on deep cycles."""
+    def test_get_document_paths_cycle_warning(self):
+        """Test that a cycle in the hierarchy is cut and reported once."""
         from unittest.mock import patch
 
         graph = TraceabilityGraph()
@@ -1027,7 +1027,6 @@ class TestDeepHierarchyTraversal:
             # Return empty so traverse never terminates early
             return []
 
-        # This should trigger the max recursion depth warning
         with (
             patch.object(graph, "get_document_children", side_effect=mock_get_children),
             patch.object(graph, "get_leaf_documents", side_effect=mock_get_leaf_documents),
@@ -1036,12 +1035,26 @@ class TestDeepHierarchyTraversal:
             warnings.simplefilter("always")
             paths = get_document_paths(graph, "A")
 
-            # Due to the cycle, should emit warning when MAX_RECURSION_DEPTH is hit
-            assert paths is not None  # Should not crash
+        assert paths == [["A"]]
+        cycle_warnings = [x for x in w if "Cycle in document hierarchy: A -> A" in str(x.message)]
+        assert len(cycle_warnings) == 1
 
-            # Check that warning was emitted about max recursion depth
-            depth_warnings = [x for x in w if "Maximum recursion depth" in str(x.message)]
-            assert len(depth_warnings) > 0
+    def test_get_document_paths_cycle_through_several_documents(self):
+        """Paths stop before revisiting a document of a longer cycle."""
+        graph = TraceabilityGraph()
+        graph.set_document_parents("A", [])
+        graph.set_document_parents("B", ["A", "C"])
+        graph.set_document_parents("C", ["B"])
+        graph.set_document_parents("D", ["C"])
+
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            paths = get_document_paths(graph, "A")
+
+        assert paths == [["A", "B", "C", "D"]]
+        assert [str(x.message) for x in w] == [
+            "Cycle in document hierarchy: B -> C -> B. Paths through it stop before revisiting a document."
+        ]
 
 
 class TestStatusUnknownOutcome:
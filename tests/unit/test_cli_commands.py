@@ -1,5 +1,6 @@
 """Tests for CLI command behavior not covered by integration tests."""
 
+import json
 import os
 import subprocess
 from pathlib import Path
@@ -1147,6 +1148,28 @@ class TestCheckCommand:
         assert "test_broken.py" in r.output
         assert "syntax" in r.output.lower()
 
+    def test_check_caches_test_references(self, tmp_path):
+        """check keeps parsed test files in .jamb-cache and sees later edits."""
+        _init_project(tmp_path)
+        runner = CliRunner()
+        _invoke(runner, ["item", "add", "SRS"], cwd=tmp_path)
+        tests_dir = tmp_path / "tests"
+        tests_dir.mkdir()
+        test_file = tests_dir / "test_z.py"
+        test_file.write_text("import pytest\n\n@pytest.mark.requirement('SRS001')\ndef test_c():\n    pass\n")
+
+        r = _invoke(runner, ["check", "--documents", "SRS", "--root", str(tmp_path)])
+        assert r.exit_code == 0
+        cache = json.loads((tmp_path / ".jamb-cache" / "test-references.json").read_text())
+        assert str(test_file) in cache["files"]
+
+        stat = test_file.stat()
+        test_file.write_text("import pytest\n\n@pytest.mark.requirement('SRS009')\ndef test_c():\n    pass\n")
+        os.utime(test_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        r = _invoke(runner, ["check", "--documents", "SRS", "--root", str(tmp_path)])
+        assert r.exit_code == 1
+        assert "SRS009" in r.output
+
 
 # =========================================================================
 # Gap 1 — _add_jamb_config_to_pyproject() error branches
@@ -1287,39 +1310,39 @@ class TestIsRequirementMarker:
         return tree.body  # the Call node
 
     def test_matching_marker_returns_true(self):
-        from jamb.cli.commands import _is_requirement_marker
+        from jamb.storage.test_index import _is_requirement_marker
 
         node = self._parse_call("pytest.mark.requirement('SRS001')")
         assert _is_requirement_marker(node) is True
 
     def test_wrong_attr_name_returns_false(self):
-        from jamb.cli.commands import _is_requirement_marker
+        from jamb.storage.test_index import _is_requirement_marker
 
         node = self._parse_call("pytest.mark.skip('reason')")
         assert _is_requirement_marker(node) is False
 
     def test_bare_requirement_returns_true(self):
         """Support @requirement(...) style for `from pytest.mark import requirement`."""
-        from jamb.cli.commands import _is_requirement_marker
+        from jamb.storage.test_index import _is_requirement_marker
 
         node = self._parse_call("requirement('SRS001')")
         assert _is_requirement_marker(node) is True
 
     def test_mark_requirement_returns_true(self):
         """Support @mark.requirement(...) style for `from pytest import mark`."""
-        from jamb.cli.commands import _is_requirement_marker
+        from jamb.storage.test_index import _is_requirement_marker
 
         node = self._parse_call("mark.requirement('SRS001')")
         assert _is_requirement_marker(node) is True
 
     def test_different_module_returns_false(self):
-        from jamb.cli.commands import _is_requirement_marker
+        from jamb.storage.test_index import _is_requirement_marker
 
         node = self._parse_call("other.mark.requirement('SRS001')")
         assert _is_requirement_marker(node) is False
 
     def test_missing_mark_level_returns_false(self):
-        from jamb.cli.commands import _is_requirement_marker
+        from jamb.storage.test_index import _is_requirement_marker
 
         node = self._parse_call("pytest.requirement('SRS001')")
         assert _is_requirement_marker(node) is False
@@ -1,6 +1,7 @@
 """Tests for jamb.pytest_plugin.collector module."""
 
 import contextlib
+import re
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -679,6 +680,10 @@ class TestPytestCollectionModifyItems:
         config = MagicMock()
         config.option.jamb = True
         config.option.jamb_documents = None
+        config.option.jamb_affected_since = None
+        config.option.jamb_rerun_failed_requirements = None
+        config.option.jamb_fail_uncovered_early = None
+        config.option.jamb_select_nodeids = None
         config.option.jamb_fail_uncovered = False
 
         collector = RequirementCollector(config)
@@ -692,6 +697,7 @@ class TestPytestCollectionModifyItems:
         assert len(collector.test_links) == 2
         assert collector.test_links[0].item_uid == "SRS001"
         assert collector.test_links[1].item_uid == "SRS002"
+        assert collector.test_links[0].result is collector.test_links[1].result
 
     @patch("jamb.storage.discover_documents")
     @patch("jamb.storage.build_traceability_graph")
@@ -708,6 +714,10 @@ class TestPytestCollectionModifyItems:
         config = MagicMock()
         config.option.jamb = True
         config.option.jamb_documents = None
+        config.option.jamb_affected_since = None
+        config.option.jamb_rerun_failed_requirements = None
+        config.option.jamb_fail_uncovered_early = None
+        config.option.jamb_select_nodeids = None
         config.option.jamb_fail_uncovered = False
 
         collector = RequirementCollector(config)
@@ -720,6 +730,42 @@ class TestPytestCollectionModifyItems:
         assert "UNKNOWN001" in collector.unknown_items
 
 
+class TestCollectionFinishCoverageGate:
+    """Tests for the --jamb-fail-uncovered-early gate in pytest_collection_finish."""
+
+    @patch("jamb.storage.discover_documents")
+    @patch("jamb.storage.build_traceability_graph")
+    def test_gate_disabled_by_default(self, mock_build_graph, mock_discover, mock_graph):
+        """Without the option, unknown UIDs do not stop the session."""
+        mock_build_graph.return_value = mock_graph
+        config = MagicMock()
+        config.option.jamb_fail_uncovered_early = False
+
+        collector = RequirementCollector(config)
+        collector.unknown_items.add("UNKNOWN001")
+        collector.pytest_collection_finish(MagicMock())
+
+        config.pluginmanager.unregister.assert_not_called()
+
+    @patch("jamb.storage.discover_documents")
+    @patch("jamb.storage.build_traceability_graph")
+    def test_gate_exits_and_unregisters(self, mock_build_graph, mock_discover, mock_graph):
+        """Uncovered or unknown UIDs exit with status 1 and skip session output."""
+        mock_build_graph.return_value = mock_graph
+        config = MagicMock()
+        config.option.jamb_fail_uncovered_early = True
+        config.option.jamb_documents = "SRS"
+
+        collector = RequirementCollector(config)
+        collector.unknown_items.add("UNKNOWN001")
+        with pytest.raises(pytest.exit.Exception) as excinfo:
+            collector.pytest_collection_finish(MagicMock())
+
+        assert excinfo.value.returncode == pytest.ExitCode.TESTS_FAILED
+        assert "UNKNOWN001" in excinfo.value.msg
+        config.pluginmanager.unregister.assert_called_once_with(collector)
+
+
 class TestPytestRunTestMakeReport:
     """Tests for pytest_runtest_makereport hook."""
 
@@ -751,6 +797,7 @@ class TestPytestRunTestMakeReport:
         mock_report.outcome = "passed"
         mock_report.failed = False
         mock_report.skipped = False
+        mock_report.duration = 0.5
 
         mock_outcome = MagicMock()
         mock_outcome.get_result.return_value = mock_report
@@ -762,6 +809,7 @@ class TestPytestRunTestMakeReport:
             gen.send(mock_outcome)
 
         assert collector.test_links[0].test_outcome == "passed"
+        assert collector.test_links[0].duration == 0.5
 
     @patch("jamb.storage.discover_documents")
     @patch("jamb.storage.build_traceability_graph")
@@ -804,8 +852,11 @@ class TestPytestRunTestMakeReport:
 
     @patch("jamb.storage.discover_documents")
     @patch("jamb.storage.build_traceability_graph")
-    def test_makereport_truncates_long_failure(self, mock_build_graph, mock_discover, mock_graph):
+    def test_makereport_truncates_long_failure(
+        self, mock_build_graph, mock_discover, mock_graph, tmp_path, monkeypatch
+    ):
         """Test makereport hook truncates long failure messages."""
+        monkeypatch.chdir(tmp_path)
         mock_discover.return_value = MagicMock()
         mock_build_graph.return_value = mock_graph
 
@@ -838,9 +889,11 @@ class TestPytestRunTestMakeReport:
         with contextlib.suppress(StopIteration):
             gen.send(mock_outcome)
 
-        # Message should be truncated
+        # Message should be truncated, with the full text in the artifact store
         failure_msg = next(m for m in collector.test_links[0].notes if "[FAILURE]" in m)
         assert "(truncated)" in failure_msg
+        artifact = re.search(r"\[artifact: ([^\]]+)\]", failure_msg).group(1)
+        assert (tmp_path / artifact).read_text() == "X" * 1000
 
     @patch("jamb.storage.discover_documents")
     @patch("jamb.storage.build_traceability_graph")
@@ -973,9 +1026,12 @@ class TestMakeReportTruncationPrecision:
 
     @patch("jamb.storage.discover_documents")
     @patch("jamb.storage.build_traceability_graph")
-    def test_makereport_truncation_preserves_first_500_chars(self, mock_build_graph, mock_discover):
+    def test_makereport_truncation_preserves_first_500_chars(
+        self, mock_build_graph, mock_discover, tmp_path, monkeypatch
+    ):
         """Truncated note contains first 500 chars and
         '(truncated)' but not chars beyond."""
+        monkeypatch.chdir(tmp_path)
         graph = TraceabilityGraph()
         item = Item(uid="SRS001", text="req", document_prefix="SRS", active=True)
         graph.add_item(item)
@@ -1180,6 +1236,42 @@ class TestMakeReportSetupTeardown:
         assert link.test_outcome == "error"
         assert any("[TEARDOWN FAILURE]" in n for n in link.notes)
 
+    @patch("jamb.storage.discover_documents")
+    @patch("jamb.storage.build_traceability_graph")
+    def test_records_duration_of_every_phase(self, mock_build_graph, mock_discover):
+        """Setup, call and teardown durations are stored on the link."""
+        collector = self._make_collector_with_link(mock_build_graph, mock_discover)
+
+        for when, duration in (("setup", 0.25), ("call", 1.0), ("teardown", 0.5)):
+            report = MagicMock()
+            report.when = when
+            report.outcome = "passed"
+            report.failed = False
+            report.skipped = False
+            report.duration = duration
+            self._send_report(collector, report)
+
+        link = collector.test_links[0]
+        assert (link.setup_duration, link.duration, link.teardown_duration) == (0.25, 1.0, 0.5)
+        assert link.total_duration == 1.75
+
+    @patch("jamb.storage.discover_documents")
+    @patch("jamb.storage.build_traceability_graph")
+    def test_teardown_failure_noted_once_for_shared_result(self, mock_build_graph, mock_discover):
+        """Links sharing a result get a single teardown note, not one per link."""
+        collector = self._make_collector_with_link(mock_build_graph, mock_discover)
+        shared = collector.test_links[0].result
+        collector.test_links.append(LinkedTest(test_nodeid="test.py::test_one", item_uid="SRS002", result=shared))
+
+        report = MagicMock()
+        report.when = "teardown"
+        report.failed = True
+        report.longreprtext = "cleanup failed"
+        self._send_report(collector, report)
+
+        assert collector.test_links[1].test_outcome == "error"
+        assert collector.test_links[1].notes == ["[TEARDOWN FAILURE] cleanup failed"]
+
     @patch("jamb.storage.discover_documents")
     @patch("jamb.storage.build_traceability_graph")
     def test_teardown_failure_does_not_overwrite_call_failure(self, mock_build_graph, mock_discover):
@@ -21,6 +21,7 @@ class TestJambConfig:
         assert config.fail_uncovered is False
         assert config.require_all_pass is True
         assert config.test_matrix_output is None
+        assert config.test_matrix_durations is False
         assert config.trace_matrix_output is None
         assert config.exclude_patterns == []
         assert config.trace_to_ignore == []
@@ -143,6 +144,7 @@ test_documents = ["SRS", "SYS", "REQ"]
 fail_uncovered = true
 require_all_pass = false
 test_matrix_output = "output/test-records.html"
+test_matrix_durations = true
 trace_matrix_output = "output/traceability.md"
 exclude_patterns = ["**/skip_*.py"]
 trace_to_ignore = ["PRJ", "UN"]
@@ -156,6 +158,7 @@ trace_to_ignore = ["PRJ", "UN"]
         assert config.fail_uncovered is True
         assert config.require_all_pass is False
         assert config.test_matrix_output == "output/test-records.html"
+        assert config.test_matrix_durations is True
         assert config.trace_matrix_output == "output/traceability.md"
         assert config.exclude_patterns == ["**/skip_*.py"]
         assert config.trace_to_ignore == ["PRJ", "UN"]
@@ -0,0 +1,104 @@
+"""Tests for jamb.core.cycles module."""
+
+import random
+
+from jamb.core.cycles import Cycle, find_cycles, strongly_connected_components, topological_order
+
+
+def _successors(edges):
+    return lambda node: edges.get(node, [])
+
+
+def _reachable(edges, start):
+    seen, stack = set(), [start]
+    while stack:
+        for succ in edges.get(stack.pop(), []):
+            if succ not in seen:
+                seen.add(succ)
+                stack.append(succ)
+    return seen
+
+
+class TestStronglyConnectedComponents:
+    def test_acyclic_graph_gives_singletons_in_reverse_topological_order(self):
+        edges = {"A": ["B", "C"], "B": ["D"], "C": ["D"]}
+        components = strongly_connected_components("ABCD", _successors(edges))
+        assert sorted(components) == [["A"], ["B"], ["C"], ["D"]]
+        position = {c[0]: i for i, c in enumerate(components)}
+        assert position["D"] < position["B"] < position["A"]
+        assert position["C"] < position["A"]
+
+    def test_members_in_input_order(self):
+        edges = {"C": ["A"], "A": ["B"], "B": ["C"]}
+        assert strongly_connected_components(["B", "C", "A"], _successors(edges)) == [["B", "C", "A"]]
+
+    def test_edges_to_unknown_nodes_ignored(self):
+        edges = {"A": ["X", "B"], "B": ["A", "Y"]}
+        assert strongly_connected_components("AB", _successors(edges)) == [["A", "B"]]
+
+    def test_matches_mutual_reachability(self):
+        for seed in range(200):
+            rng = random.Random(seed)
+            nodes = list(range(rng.randint(1, 15)))
+            edges = {n: rng.sample(nodes, rng.randint(0, min(3, len(nodes)))) for n in nodes}
+            reach = {n: _reachable(edges, n) for n in nodes}
+            components = strongly_connected_components(nodes, _successors(edges))
+
+            assert sorted(n for c in components for n in c) == nodes
+            for component in components:
+                expected = [
+                    m for m in nodes if m == component[0] or (m in reach[component[0]] and component[0] in reach[m])
+                ]
+                assert component == expected
+
+    def test_deep_chain_does_not_recurse(self):
+        n = 100_000
+        edges = {i: [i + 1] for i in range(n - 1)}
+        edges[n - 1] = [0]
+        components = strongly_connected_components(range(n), _successors(edges))
+        assert len(components) == 1
+        assert len(components[0]) == n
+
+
+class TestFindCycles:
+    def test_no_cycles(self):
+        assert find_cycles("ABC", _successors({"A": ["B"], "B": ["C"]})) == []
+
+    def test_self_loop(self):
+        assert find_cycles("AB", _successors({"A": ["A", "B"]})) == [Cycle(["A"], ["A"])]
+
+    def test_every_component_reported_in_input_order(self):
+        edges = {"A": ["B"], "B": ["A"], "C": ["D"], "D": ["E"], "E": ["C"], "F": ["A"]}
+        cycles = find_cycles("FEDCBA", _successors(edges))
+        assert [c.members for c in cycles] == [["E", "D", "C"], ["B", "A"]]
+        assert [c.path for c in cycles] == [["E", "C", "D"], ["B", "A"]]
+
+    def test_path_is_shortest_cycle_through_first_member(self):
+        # A -> B -> C -> D -> A and the shortcut C -> A
+        edges = {"A": ["B"], "B": ["C"], "C": ["D", "A"], "D": ["A"]}
+        (cycle,) = find_cycles("ABCD", _successors(edges))
+        assert cycle.members == ["A", "B", "C", "D"]
+        assert cycle.path == ["A", "B", "C"]
+
+    def test_paths_are_cycles(self):
+        for seed in range(200):
+            rng = random.Random(seed)
+            nodes = list(range(rng.randint(1, 15)))
+            edges = {n: rng.sample(nodes, rng.randint(0, min(3, len(nodes)))) for n in nodes}
+            for cycle in find_cycles(nodes, _successors(edges)):
+                path = cycle.path
+                assert path[0] == cycle.members[0]
+                assert len(set(path)) == len(path)
+                assert set(path) <= set(cycle.members)
+                for a, b in zip(path, path[1:] + path[:1], strict=True):
+                    assert b in edges[a]
+
+
+class TestTopologicalOrder:
+    def test_kahn_order(self):
+        edges = {"PRJ": ["UN", "HAZ"], "UN": ["SRS"], "HAZ": ["SRS"]}
+        assert topological_order(["PRJ", "UN", "HAZ", "SRS"], _successors(edges)) == ["PRJ", "UN", "HAZ", "SRS"]
+
+    def test_cycle_members_kept_together_after_predecessors(self):
+        edges = {"ROOT": ["A"], "A": ["B"], "B": ["A", "LEAF"]}
+        assert topological_order(["LEAF", "B", "A", "ROOT"], _successors(edges)) == ["ROOT", "B", "A", "LEAF"]
@@ -1,6 +1,6 @@
 """Tests for jamb.core.models module."""
 
-from jamb.core.models import Item, ItemCoverage, LinkedTest, TraceabilityGraph
+from jamb.core.models import Item, ItemCoverage, LinkedTest, TestResult, TraceabilityGraph
 
 
 class TestItem:
@@ -96,6 +96,30 @@ class TestLinkedTestClass:
         assert len(test_link_with_failure_message.notes) == 1
         assert test_link_with_failure_message.notes[0].startswith("[FAILURE]")
 
+    def test_result_attributes_shared_between_links(self):
+        """Test that links sharing a TestResult see each other's updates."""
+        result = TestResult()
+        first = LinkedTest(test_nodeid="test.py::test_foo", item_uid="SRS001", result=result)
+        second = LinkedTest(test_nodeid="test.py::test_foo", item_uid="SRS002", result=result)
+
+        first.test_outcome = "failed"
+        first.notes.append("boom")
+
+        assert second.test_outcome == "failed"
+        assert second.notes == ["boom"]
+
+    def test_total_duration_none_when_not_recorded(self):
+        """Test that total_duration is None without any phase durations."""
+        link = LinkedTest(test_nodeid="test.py::test_foo", item_uid="SRS001")
+
+        assert link.total_duration is None
+
+    def test_total_duration_sums_recorded_phases(self):
+        """Test that total_duration sums the phases that were recorded."""
+        link = LinkedTest(test_nodeid="test.py::test_foo", item_uid="SRS001", duration=1.0, setup_duration=0.5)
+
+        assert link.total_duration == 1.5
+
 
 class TestItemCoverage:
     """Tests for ItemCoverage dataclass."""
@@ -316,6 +340,27 @@ class TestTraceabilityGraph:
 class TestTraceabilityGraphDescendantsAndNeighbors:
     """Tests for get_descendants and get_neighbors methods."""
 
+    def test_get_descendant_uids_unions_roots(self):
+        """get_descendant_uids returns the roots plus all their descendants."""
+        graph = TraceabilityGraph()
+        graph.add_item(Item(uid="UN001", text="Need", document_prefix="UN"))
+        graph.add_item(Item(uid="SYS001", text="Sys", document_prefix="SYS", links=["UN001"]))
+        graph.add_item(Item(uid="SYS002", text="Sys", document_prefix="SYS"))
+        graph.add_item(Item(uid="SRS001", text="Sw", document_prefix="SRS", links=["SYS001", "SYS002"]))
+        graph.add_item(Item(uid="SRS002", text="Sw", document_prefix="SRS", links=["SYS002"]))
+
+        assert graph.get_descendant_uids(["UN001", "SYS001"]) == {"UN001", "SYS001", "SRS001"}
+        assert graph.get_descendant_uids(["SYS002"]) == {"SYS002", "SRS001", "SRS002"}
+        assert graph.get_descendant_uids([]) == set()
+
+    def test_get_descendant_uids_skips_dangling_children(self):
+        """Children missing from the graph are not returned."""
+        graph = TraceabilityGraph()
+        graph.add_item(Item(uid="UN001", text="Need", document_prefix="UN"))
+        graph.item_children["UN001"] = ["NONEXIST"]
+
+        assert graph.get_descendant_uids(["UN001"]) == {"UN001"}
+
     def test_get_descendants_basic(self):
         """Test get_descendants returns child items."""
         graph = TraceabilityGraph()
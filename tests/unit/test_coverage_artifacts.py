@@ -0,0 +1,66 @@
+"""Unit tests for the content-addressed artifact store."""
+
+import hashlib
+from pathlib import Path
+
+from jamb.coverage.artifacts import ArtifactStore, relink_artifact_refs
+
+
+class TestArtifactStore:
+    """Tests for ArtifactStore."""
+
+    def test_put_names_file_by_content_hash(self, tmp_path: Path):
+        """Content is stored under its SHA-256 with the given suffix."""
+        store = ArtifactStore(tmp_path / "artifacts")
+
+        path = store.put(b"evidence", ".log")
+
+        assert Path(path).name == hashlib.sha256(b"evidence").hexdigest() + ".log"
+        assert Path(path).read_bytes() == b"evidence"
+
+    def test_identical_content_stored_once(self, tmp_path: Path):
+        """Storing the same content twice returns the same path."""
+        store = ArtifactStore(tmp_path / "artifacts")
+
+        assert store.put_text("same") == store.put_text("same")
+        assert len(list((tmp_path / "artifacts").iterdir())) == 1
+
+    def test_directory_created_lazily(self, tmp_path: Path):
+        """Short text is not spilled, so no directory is created."""
+        store = ArtifactStore(tmp_path / "artifacts")
+
+        assert store.spill("short", limit=10) == "short"
+        assert not (tmp_path / "artifacts").exists()
+
+    def test_spill_keeps_excerpt_and_reference(self, tmp_path: Path):
+        """Long text keeps an excerpt inline and the full text on disk."""
+        store = ArtifactStore(tmp_path / "artifacts")
+
+        spilled = store.spill("x" * 20, limit=5)
+
+        excerpt, reference = spilled.split("\n... (truncated) ")
+        assert excerpt == "xxxxx"
+        assert Path(reference.removeprefix("[artifact: ").removesuffix("]")).read_text() == "x" * 20
+
+    def test_put_file_keeps_extension(self, tmp_path: Path):
+        """Files keep their extension so viewers recognize them."""
+        source = tmp_path / "screen.png"
+        source.write_bytes(b"\x89PNG")
+
+        path = ArtifactStore(tmp_path / "artifacts").put_file(source)
+
+        assert path.endswith(".png")
+
+
+class TestRelinkArtifactRefs:
+    """Tests for relink_artifact_refs."""
+
+    def test_relative_to_output_directory(self):
+        """References are rewritten relative to the matrix directory."""
+        text = "[FAILURE] boom [artifact: .jamb-artifacts/abc.txt]"
+
+        assert relink_artifact_refs(text, "docs") == "[FAILURE] boom [artifact: ../.jamb-artifacts/abc.txt]"
+
+    def test_text_without_reference_unchanged(self):
+        """Plain text is returned as is."""
+        assert relink_artifact_refs("plain [note]", "docs") == "plain [note]"
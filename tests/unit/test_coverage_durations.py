@@ -0,0 +1,122 @@
+"""Unit tests for rolling test durations up the traceability graph."""
+
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from jamb.cli.commands import cli
+from jamb.core.models import Item, ItemCoverage, LinkedTest, TraceabilityGraph
+from jamb.coverage.durations import rollup_durations
+from jamb.coverage.serializer import save_coverage
+
+
+def _graph() -> TraceabilityGraph:
+    graph = TraceabilityGraph()
+    graph.set_document_parents("SYS", [])
+    graph.set_document_parents("SRS", ["SYS"])
+    graph.add_item(Item(uid="SYS001", text="System", document_prefix="SYS"))
+    graph.add_item(Item(uid="SYS002", text="Other system", document_prefix="SYS"))
+    graph.add_item(Item(uid="SRS001", text="A", document_prefix="SRS", links=["SYS001"]))
+    graph.add_item(Item(uid="SRS002", text="B", document_prefix="SRS", links=["SYS001"]))
+    graph.add_item(Item(uid="SRS003", text="C", document_prefix="SRS", links=["SYS002"]))
+    return graph
+
+
+def _coverage(graph: TraceabilityGraph) -> dict[str, ItemCoverage]:
+    links = {
+        "SRS001": [LinkedTest("t.py::test_shared", "SRS001", duration=2.0, setup_duration=1.0)],
+        "SRS002": [
+            LinkedTest("t.py::test_shared", "SRS002", duration=2.0, setup_duration=1.0),
+            LinkedTest("t.py::test_b", "SRS002", duration=4.0),
+        ],
+        "SRS003": [LinkedTest("t.py::test_c", "SRS003", duration=0.5), LinkedTest("t.py::test_untimed", "SRS003")],
+    }
+    return {uid: ItemCoverage(item=graph.items[uid], linked_tests=tests) for uid, tests in links.items()}
+
+
+class TestRollupDurations:
+    """Tests for the rollup_durations function."""
+
+    def test_parents_are_charged_for_descendant_tests_once(self):
+        """A test linked to two children counts once for the parent."""
+        graph = _graph()
+        rows = {r.uid: r for r in rollup_durations(_coverage(graph), graph)}
+
+        assert rows["SYS001"].test_count == 2
+        assert rows["SYS001"].total_duration == 7.0
+        assert rows["SYS001"].direct_duration == 0.0
+        assert rows["SRS002"].total_duration == 7.0
+        assert rows["SRS002"].direct_duration == 7.0
+
+    def test_untimed_tests_count_without_time(self):
+        """Tests without durations add to the count but not the time."""
+        graph = _graph()
+        rows = {r.uid: r for r in rollup_durations(_coverage(graph), graph)}
+
+        assert rows["SYS002"].test_count == 2
+        assert rows["SYS002"].total_duration == 0.5
+
+    def test_sorted_longest_first(self):
+        """Rows are ordered by total duration, then UID."""
+        graph = _graph()
+
+        assert [r.uid for r in rollup_durations(_coverage(graph), graph)] == [
+            "SRS002",
+            "SYS001",
+            "SRS001",
+            "SRS003",
+            "SYS002",
+        ]
+
+    def test_items_without_tests_are_omitted(self):
+        """Items with no linked tests beneath them are not listed."""
+        graph = _graph()
+        graph.add_item(Item(uid="SYS003", text="Untested", document_prefix="SYS"))
+
+        assert "SYS003" not in {r.uid for r in rollup_durations(_coverage(graph), graph)}
+
+    def test_items_in_a_link_cycle_share_their_tests(self):
+        """Items that link to each other are each charged for all tests of the cycle."""
+        graph = _graph()
+        graph.add_item(Item(uid="SRS004", text="D", document_prefix="SRS", links=["SRS005", "SRS001"]))
+        graph.add_item(Item(uid="SRS005", text="E", document_prefix="SRS", links=["SRS004"]))
+        coverage = _coverage(graph)
+        coverage["SRS005"] = ItemCoverage(
+            item=graph.items["SRS005"], linked_tests=[LinkedTest("t.py::test_e", "SRS005", duration=1.0)]
+        )
+        rows = {r.uid: r for r in rollup_durations(coverage, graph)}
+
+        assert rows["SRS004"].total_duration == rows["SRS005"].total_duration == 1.0
+        assert rows["SRS004"].direct_duration == 0.0
+        assert rows["SRS001"].test_count == 2
+        assert rows["SYS001"].test_count == 3
+        assert rows["SYS001"].total_duration == 8.0
+
+
+class TestReportDurationsCommand:
+    """Tests for the ``jamb report durations`` command."""
+
+    def test_lists_document_items(self, tmp_path: Path):
+        """--document filters rows and --top limits them."""
+        graph = _graph()
+        path = tmp_path / ".jamb"
+        save_coverage(_coverage(graph), graph, str(path))
+
+        result = CliRunner().invoke(
+            cli, ["report", "durations", "--coverage", str(path), "--document", "SYS", "--top", "1"]
+        )
+
+        assert result.exit_code == 0, result.output
+        lines = result.output.splitlines()
+        assert lines[0].split() == ["UID", "Tests", "Total", "Direct"]
+        assert lines[1].split() == ["SYS001", "2", "7.00s", "0ms"]
+        assert len(lines) == 2
+
+    def test_missing_coverage_file(self, tmp_path: Path, monkeypatch):
+        """Without a .jamb file the command asks for a pytest run."""
+        monkeypatch.chdir(tmp_path)
+
+        result = CliRunner().invoke(cli, ["report", "durations"])
+
+        assert result.exit_code == 1
+        assert "pytest --jamb" in result.output
@@ -0,0 +1,115 @@
+"""Unit tests for the cross-run coverage history."""
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from jamb.cli.commands import cli
+from jamb.core.models import Item, ItemCoverage, LinkedTest, MatrixMetadata, TraceabilityGraph
+from jamb.coverage.history import HistoryStore
+from jamb.coverage.serializer import save_coverage
+
+
+def _save_run(path: Path, outcomes: dict[str, str], timestamp: str) -> Path:
+    """Save a .jamb file with SRS001 linked to test_a and SRS002 to test_b."""
+    graph = TraceabilityGraph()
+    links = {"SRS001": "t.py::test_a", "SRS002": "t.py::test_b", "SRS003": None}
+    coverage = {}
+    for uid, nodeid in links.items():
+        item = Item(uid=uid, text=uid, document_prefix="SRS")
+        graph.add_item(item)
+        linked = [LinkedTest(nodeid, uid, outcomes[nodeid], duration=0.5)] if nodeid in outcomes else []
+        coverage[uid] = ItemCoverage(item=item, linked_tests=linked)
+    save_coverage(coverage, graph, str(path), MatrixMetadata(execution_timestamp=timestamp))
+    return path
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> Iterator[HistoryStore]:
+    """A history with three runs in which test_a flips twice."""
+    store = HistoryStore(tmp_path / "history" / "history.sqlite3")
+    for n, outcome_a in enumerate(["passed", "failed", "passed"]):
+        run = _save_run(
+            tmp_path / f"run{n}.jamb",
+            {"t.py::test_a": outcome_a, "t.py::test_b": "passed"},
+            f"2026-01-0{n + 1}T00:00:00Z",
+        )
+        store.ingest(run)
+    yield store
+    store.close()
+
+
+class TestHistoryStore:
+    """Tests for ingesting runs and querying the history."""
+
+    def test_ingest_is_idempotent(self, store: HistoryStore, tmp_path: Path):
+        """Ingesting the same file content again adds no run."""
+        assert store.ingest(tmp_path / "run0.jamb") is None
+        assert store.run_count() == 3
+
+    def test_trend(self, store: HistoryStore):
+        """Coverage totals are reported per run, oldest first."""
+        rows = store.trend()
+
+        assert [(r.run_id, r.timestamp) for r in rows] == [
+            (1, "2026-01-01T00:00:00Z"),
+            (2, "2026-01-02T00:00:00Z"),
+            (3, "2026-01-03T00:00:00Z"),
+        ]
+        assert [(r.testable, r.covered, r.passed) for r in rows] == [(3, 2, 2), (3, 2, 1), (3, 2, 2)]
+        assert [r.run_id for r in store.trend(runs=2)] == [2, 3]
+        assert store.trend(documents=["SYS"])[0].testable == 0
+
+    def test_flaky(self, store: HistoryStore):
+        """Pass/fail flips are counted per test over the recent runs."""
+        (flaky,) = store.flaky()
+
+        assert (flaky.nodeid, flaky.flips, flaky.runs, flaky.passed, flaky.failed) == ("t.py::test_a", 2, 3, 2, 1)
+        assert flaky.uids == ["SRS001"]
+        assert store.flaky(min_flips=3) == []
+        assert store.flaky(runs=1) == []
+        assert store.flaky(uid="SRS002") == []
+
+    def test_requirement(self, store: HistoryStore):
+        """A requirement's linked-test results are listed per run."""
+        assert [r.status for r in store.requirement("SRS001")] == ["passed", "failed", "passed"]
+        assert [r.status for r in store.requirement("SRS003")] == ["not covered"] * 3
+
+
+class TestHistoryCommands:
+    """Tests for the ``jamb history`` commands."""
+
+    def test_ingest_then_report(self, tmp_path: Path):
+        """Ingested runs show up in trend, flaky and requirement output."""
+        db = str(tmp_path / "h.sqlite3")
+        runs = [
+            str(_save_run(tmp_path / f"run{n}.jamb", {"t.py::test_a": o}, f"2026-01-0{n + 1}T00:00:00Z"))
+            for n, o in enumerate(["passed", "failed"])
+        ]
+        runner = CliRunner()
+
+        result = runner.invoke(cli, ["history", "ingest", *runs, "--db", db])
+        assert result.exit_code == 0, result.output
+        assert "as run 2" in result.output
+
+        result = runner.invoke(cli, ["history", "trend", "--db", db])
+        assert result.exit_code == 0, result.output
+        assert "1 (33.3%)" in result.output.splitlines()[1]
+
+        result = runner.invoke(cli, ["history", "flaky", "--db", db])
+        assert result.exit_code == 0, result.output
+        assert "t.py::test_a  [SRS001]" in result.output
+
+        result = runner.invoke(cli, ["history", "requirement", "SRS001", "--db", db])
+        assert result.exit_code == 0, result.output
+        assert result.output.splitlines()[2].endswith("failed")
+        assert "Flaky tests linked to SRS001" in result.output
+
+    def test_missing_database(self, tmp_path: Path):
+        """Reports without a database point to ingestion."""
+        result = CliRunner().invoke(cli, ["history", "trend", "--db", str(tmp_path / "none.sqlite3")])
+
+        assert result.exit_code == 1
+        assert "jamb history ingest" in result.output
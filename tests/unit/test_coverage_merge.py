@@ -0,0 +1,238 @@
+"""Unit tests for merging sharded coverage files."""
+
+import json
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from jamb.cli.commands import cli
+from jamb.core.models import (
+    Item,
+    ItemCoverage,
+    LinkedTest,
+    MatrixMetadata,
+    TestEnvironment,
+    TraceabilityGraph,
+)
+from jamb.coverage.merge import merge_coverage, merge_metadata
+from jamb.coverage.serializer import load_coverage, save_coverage
+
+
+def _graph(text: str = "Software req") -> TraceabilityGraph:
+    graph = TraceabilityGraph()
+    graph.set_document_parents("SYS", [])
+    graph.set_document_parents("SRS", ["SYS"])
+    graph.add_item(Item(uid="SYS001", text="System req", document_prefix="SYS"))
+    graph.add_item(Item(uid="SRS001", text=text, document_prefix="SRS", links=["SYS001"]))
+    graph.add_item(Item(uid="SRS002", text="Other req", document_prefix="SRS", links=["SYS001"]))
+    return graph
+
+
+def _environment(hostname: str) -> TestEnvironment:
+    return TestEnvironment(
+        os_name="Linux",
+        os_version="6.0",
+        python_version="3.12.0",
+        platform="x86_64",
+        processor="x86_64",
+        hostname=hostname,
+        cpu_count=4,
+        test_tools={"pytest": "8.0.0"},
+    )
+
+
+def _write_shard(
+    path: Path,
+    links: list[LinkedTest],
+    graph: TraceabilityGraph | None = None,
+    metadata: MatrixMetadata | None = None,
+    manual_tc_ids: dict[str, str] | None = None,
+) -> str:
+    graph = graph or _graph()
+    coverage = {
+        uid: ItemCoverage(
+            item=graph.items[uid],
+            linked_tests=[lt for lt in links if lt.item_uid == uid],
+        )
+        for uid in ("SRS001", "SRS002")
+    }
+    save_coverage(coverage, graph, str(path), metadata, manual_tc_ids=manual_tc_ids)
+    return str(path)
+
+
+class TestMergeCoverage:
+    """Tests for the merge_coverage function."""
+
+    def test_unions_links_from_all_shards(self, tmp_path: Path):
+        """Links recorded by different shards are combined per item."""
+        a = _write_shard(tmp_path / "a.jamb", [LinkedTest("t/a.py::test_a", "SRS001", "passed")])
+        b = _write_shard(
+            tmp_path / "b.jamb",
+            [
+                LinkedTest("t/b.py::test_b", "SRS001", "passed"),
+                LinkedTest("t/b.py::test_c", "SRS002", "failed"),
+            ],
+        )
+        out = tmp_path / "merged.jamb"
+
+        stats = merge_coverage([a, b], str(out))
+
+        coverage, graph, _, _ = load_coverage(str(out))
+        assert [lt.test_nodeid for lt in coverage["SRS001"].linked_tests] == ["t/a.py::test_a", "t/b.py::test_b"]
+        assert [lt.test_outcome for lt in coverage["SRS002"].linked_tests] == ["failed"]
+        assert set(graph.items) == {"SYS001", "SRS001", "SRS002"}
+        assert stats == {"shards": 2, "items": 2, "links": 3, "conflicts": 0}
+
+    def test_most_severe_outcome_wins(self, tmp_path: Path):
+        """A failure on any shard overrides a pass on another."""
+        a = _write_shard(tmp_path / "a.jamb", [LinkedTest("t.py::test_x", "SRS001", "passed", notes=["ok"])])
+        b = _write_shard(tmp_path / "b.jamb", [LinkedTest("t.py::test_x", "SRS001", "failed", notes=["boom"])])
+        c = _write_shard(tmp_path / "c.jamb", [LinkedTest("t.py::test_x", "SRS001", "skipped")])
+        out = tmp_path / "merged.jamb"
+
+        stats = merge_coverage([a, b, c], str(out))
+
+        coverage, _, _, _ = load_coverage(str(out))
+        (link,) = coverage["SRS001"].linked_tests
+        assert link.test_outcome == "failed"
+        assert link.notes == ["boom"]
+        assert stats["conflicts"] == 1
+
+    def test_conflicts_are_counted_per_test(self, tmp_path: Path):
+        """A test linked to several items counts as one conflict."""
+        a = _write_shard(
+            tmp_path / "a.jamb",
+            [LinkedTest("t.py::test_x", "SRS001", "passed"), LinkedTest("t.py::test_x", "SRS002", "passed")],
+        )
+        b = _write_shard(
+            tmp_path / "b.jamb",
+            [LinkedTest("t.py::test_x", "SRS001", "failed"), LinkedTest("t.py::test_x", "SRS002", "failed")],
+        )
+
+        stats = merge_coverage([a, b], str(tmp_path / "merged.jamb"))
+
+        assert stats["links"] == 2
+        assert stats["conflicts"] == 1
+
+    def test_tie_keeps_first_shard(self, tmp_path: Path):
+        """Identical outcomes keep the record from the earliest shard."""
+        a = _write_shard(tmp_path / "a.jamb", [LinkedTest("t.py::test_x", "SRS001", "passed", notes=["first"])])
+        b = _write_shard(tmp_path / "b.jamb", [LinkedTest("t.py::test_x", "SRS001", "passed", notes=["second"])])
+        out = tmp_path / "merged.jamb"
+
+        stats = merge_coverage([a, b], str(out))
+
+        coverage, _, _, _ = load_coverage(str(out))
+        assert coverage["SRS001"].linked_tests[0].notes == ["first"]
+        assert stats["conflicts"] == 0
+
+    def test_graph_mismatch_raises(self, tmp_path: Path):
+        """Shards built from different requirement trees are rejected."""
+        a = _write_shard(tmp_path / "a.jamb", [])
+        b = _write_shard(tmp_path / "b.jamb", [], graph=_graph(text="Changed text"))
+
+        with pytest.raises(ValueError, match=r"differs from .*SRS001"):
+            merge_coverage([a, b], str(tmp_path / "merged.jamb"))
+
+    def test_document_hierarchy_mismatch_raises(self, tmp_path: Path):
+        """Shards with different document DAGs are rejected."""
+        other = _graph()
+        other.set_document_parents("SRS", [])
+        a = _write_shard(tmp_path / "a.jamb", [])
+        b = _write_shard(tmp_path / "b.jamb", [], graph=other)
+
+        with pytest.raises(ValueError, match="Document hierarchy"):
+            merge_coverage([a, b], str(tmp_path / "merged.jamb"))
+
+    def test_conflicting_manual_tc_ids_raise(self, tmp_path: Path):
+        """The same test cannot carry different manual TC IDs."""
+        a = _write_shard(tmp_path / "a.jamb", [], manual_tc_ids={"t.py::test_x": "TC-1"})
+        b = _write_shard(tmp_path / "b.jamb", [], manual_tc_ids={"t.py::test_x": "TC-2"})
+
+        with pytest.raises(ValueError, match="Conflicting tc_id"):
+            merge_coverage([a, b], str(tmp_path / "merged.jamb"))
+
+    def test_manual_tc_ids_are_unioned(self, tmp_path: Path):
+        """Manual TC IDs from every shard are kept."""
+        a = _write_shard(tmp_path / "a.jamb", [], manual_tc_ids={"t.py::test_a": "TC-1"})
+        b = _write_shard(tmp_path / "b.jamb", [], manual_tc_ids={"t.py::test_b": "TC-2"})
+        out = tmp_path / "merged.jamb"
+
+        merge_coverage([a, b], str(out))
+
+        _, _, _, manual_tc_ids = load_coverage(str(out))
+        assert manual_tc_ids == {"t.py::test_a": "TC-1", "t.py::test_b": "TC-2"}
+
+    def test_no_inputs_raises(self, tmp_path: Path):
+        """Merging nothing is an error."""
+        with pytest.raises(ValueError, match="No coverage files"):
+            merge_coverage([], str(tmp_path / "merged.jamb"))
+
+
+class TestMergeMetadata:
+    """Tests for combining shard metadata."""
+
+    def test_empty_returns_none(self):
+        """No shard metadata yields no merged metadata."""
+        assert merge_metadata([]) is None
+
+    def test_joins_differing_fields(self):
+        """Differing values are joined and the earliest timestamp is kept."""
+        merged = merge_metadata(
+            [
+                MatrixMetadata("1.0", "CI", "2026-01-02T00:00:00Z", _environment("ci-1")),
+                MatrixMetadata("1.0", "CI", "2026-01-01T00:00:00Z", _environment("ci-2")),
+            ]
+        )
+
+        assert merged is not None
+        assert merged.software_version == "1.0"
+        assert merged.tester_id == "CI"
+        assert merged.execution_timestamp == "2026-01-01T00:00:00Z"
+        assert merged.environment is not None
+        assert merged.environment.hostname == "ci-1, ci-2"
+        assert merged.environment.os_name == "Linux"
+        assert merged.environment.cpu_count == 4
+        assert merged.environment.test_tools == {"pytest": "8.0.0"}
+
+    def test_differing_cpu_counts_become_none(self):
+        """CPU count is dropped when shards disagree."""
+        env_a = _environment("a")
+        env_b = _environment("b")
+        env_b.cpu_count = 8
+        env_b.test_tools = {"pytest": "8.1.0", "jamb": "1.0"}
+
+        merged = merge_metadata([MatrixMetadata(environment=env_a), MatrixMetadata(environment=env_b)])
+
+        assert merged is not None and merged.environment is not None
+        assert merged.environment.cpu_count is None
+        assert merged.environment.test_tools == {"pytest": "8.0.0, 8.1.0", "jamb": "1.0"}
+
+
+class TestCoverageMergeCommand:
+    """Tests for the ``jamb coverage merge`` command."""
+
+    def test_merge_command_writes_output(self, tmp_path: Path):
+        """The command merges shards and reports counts."""
+        a = _write_shard(tmp_path / "a.jamb", [LinkedTest("t.py::test_x", "SRS001", "passed")])
+        b = _write_shard(tmp_path / "b.jamb", [LinkedTest("t.py::test_x", "SRS001", "error")])
+        out = tmp_path / "merged.jamb"
+
+        result = CliRunner().invoke(cli, ["coverage", "merge", a, b, "-o", str(out)])
+
+        assert result.exit_code == 0, result.output
+        assert "Merged 2 coverage files" in result.output
+        assert "Resolved conflicting outcomes of 1 test(s)" in result.output
+        data = json.loads(out.read_text())
+        assert data["test_results"]["t.py::test_x"]["test_outcome"] == "error"
+
+    def test_merge_command_reports_graph_mismatch(self, tmp_path: Path):
+        """Graph disagreement exits with an error."""
+        a = _write_shard(tmp_path / "a.jamb", [])
+        b = _write_shard(tmp_path / "b.jamb", [], graph=_graph(text="Changed"))
+
+        result = CliRunner().invoke(cli, ["coverage", "merge", a, b, "-o", str(tmp_path / "m.jamb")])
+
+        assert result.exit_code == 1
+        assert "differs from" in result.output
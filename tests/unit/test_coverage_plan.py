@@ -0,0 +1,193 @@
+"""Unit tests for covering-set test planning."""
+
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from jamb.cli.commands import cli
+from jamb.core.models import Item, ItemCoverage, LinkedTest, TraceabilityGraph
+from jamb.coverage.plan import parse_duration, plan_cover_all, read_nodeid_file
+from jamb.coverage.serializer import save_coverage
+
+
+def _coverage(links: dict[str, list[tuple[str, float | None]]], **item_kwargs) -> dict[str, ItemCoverage]:
+    """Build coverage from ``{uid: [(nodeid, duration), ...]}``."""
+    return {
+        uid: ItemCoverage(
+            item=Item(uid=uid, text=uid, document_prefix="SRS", **item_kwargs.get(uid, {})),
+            linked_tests=[LinkedTest(nodeid, uid, "passed", duration=duration) for nodeid, duration in tests],
+        )
+        for uid, tests in links.items()
+    }
+
+
+class TestParseDuration:
+    """Tests for budget parsing."""
+
+    @pytest.mark.parametrize(
+        ("text", "seconds"),
+        [("90", 90.0), ("120s", 120.0), ("2m", 120.0), ("1m30s", 90.0), ("1h", 3600.0), ("250ms", 0.25)],
+    )
+    def test_valid(self, text: str, seconds: float):
+        """Numbers with optional units are converted to seconds."""
+        assert parse_duration(text) == pytest.approx(seconds)
+
+    @pytest.mark.parametrize("text", ["", "fast", "2x", "1 m 30"])
+    def test_invalid(self, text: str):
+        """Malformed durations raise ValueError."""
+        with pytest.raises(ValueError, match="Invalid duration"):
+            parse_duration(text)
+
+
+class TestPlanCoverAll:
+    """Tests for the greedy covering-set planner."""
+
+    def test_prefers_test_covering_most_per_second(self):
+        """One broad test replaces several narrow ones of similar speed."""
+        coverage = _coverage(
+            {
+                "SRS001": [("t.py::test_all", 1.0), ("t.py::test_1", 1.0)],
+                "SRS002": [("t.py::test_all", 1.0), ("t.py::test_2", 1.0)],
+                "SRS003": [("t.py::test_all", 1.0), ("t.py::test_3", 1.0)],
+            }
+        )
+
+        plan = plan_cover_all(coverage)
+
+        assert plan.nodeids == ["t.py::test_all"]
+        assert plan.covered_uids == {"SRS001", "SRS002", "SRS003"}
+        assert plan.estimated_duration == 1.0
+
+    def test_duration_weighting_avoids_slow_test(self):
+        """A slow broad test loses to fast narrow ones when weighting by time."""
+        coverage = _coverage(
+            {
+                "SRS001": [("t.py::test_slow", 60.0), ("t.py::test_1", 1.0)],
+                "SRS002": [("t.py::test_slow", 60.0), ("t.py::test_2", 1.0)],
+            }
+        )
+
+        assert plan_cover_all(coverage).nodeids == ["t.py::test_1", "t.py::test_2"]
+        assert plan_cover_all(coverage, weight_by_duration=False).nodeids == ["t.py::test_slow"]
+
+    def test_ignores_non_testable_items(self):
+        """Inactive, non-testable and non-requirement items need no coverage."""
+        coverage = _coverage(
+            {
+                "SRS001": [("t.py::test_1", 1.0)],
+                "SRS002": [("t.py::test_2", 1.0)],
+                "SRS003": [("t.py::test_3", 1.0)],
+                "SRS004": [("t.py::test_4", 1.0)],
+            },
+            SRS002={"active": False},
+            SRS003={"testable": False},
+            SRS004={"type": "info"},
+        )
+
+        assert plan_cover_all(coverage).nodeids == ["t.py::test_1"]
+
+    def test_reports_uncoverable_items(self):
+        """Requirements without any linked test are reported separately."""
+        plan = plan_cover_all(_coverage({"SRS001": [("t.py::test_1", 1.0)], "SRS002": []}))
+
+        assert plan.uncoverable_uids == {"SRS002"}
+        assert plan.dropped_uids == set()
+
+    def test_budget_drops_requirements_that_do_not_fit(self):
+        """Tests that exceed the remaining budget are skipped."""
+        coverage = _coverage(
+            {
+                "SRS001": [("t.py::test_1", 5.0)],
+                "SRS002": [("t.py::test_2", 20.0)],
+                "SRS003": [("t.py::test_3", 4.0)],
+            }
+        )
+
+        plan = plan_cover_all(coverage, budget=10.0)
+
+        assert plan.nodeids == ["t.py::test_3", "t.py::test_1"]
+        assert plan.dropped_uids == {"SRS002"}
+        assert plan.estimated_duration == 9.0
+
+    def test_missing_durations_use_median(self):
+        """Tests without a recorded duration are estimated at the median."""
+        coverage = _coverage(
+            {
+                "SRS001": [("t.py::test_1", 2.0)],
+                "SRS002": [("t.py::test_2", 4.0)],
+                "SRS003": [("t.py::test_3", None)],
+            }
+        )
+
+        assert plan_cover_all(coverage).estimated_duration == 9.0
+
+    def test_budget_without_durations_raises(self):
+        """A budget cannot be honoured without recorded durations."""
+        with pytest.raises(ValueError, match="durations"):
+            plan_cover_all(_coverage({"SRS001": [("t.py::test_1", None)]}), budget=10.0)
+
+
+class TestReadNodeidFile:
+    """Tests for reading node ID files."""
+
+    def test_skips_blank_lines_and_comments(self, tmp_path: Path):
+        """Blank lines and comments are ignored."""
+        path = tmp_path / "plan.txt"
+        path.write_text("# smoke run\nt.py::test_1\n\n  t.py::test_2[a]  \n")
+
+        assert read_nodeid_file(str(path)) == {"t.py::test_1", "t.py::test_2[a]"}
+
+
+class TestPlanCommand:
+    """Tests for the ``jamb plan`` command."""
+
+    @pytest.fixture
+    def coverage_file(self, tmp_path: Path) -> Path:
+        """A .jamb file where one fast test covers both requirements."""
+        graph = TraceabilityGraph()
+        coverage = _coverage(
+            {
+                "SRS001": [("t.py::test_both", 1.0), ("t.py::test_1", 3.0)],
+                "SRS002": [("t.py::test_both", 1.0)],
+            }
+        )
+        for cov in coverage.values():
+            graph.add_item(cov.item)
+        path = tmp_path / ".jamb"
+        save_coverage(coverage, graph, str(path))
+        return path
+
+    def test_prints_plan(self, coverage_file: Path):
+        """Node IDs go to stdout and a summary to stderr."""
+        result = CliRunner().invoke(cli, ["plan", "--cover-all", "--coverage", str(coverage_file)])
+
+        assert result.exit_code == 0, result.output
+        assert result.stdout.splitlines() == ["t.py::test_both"]
+        assert "covering 2 of 2 testable requirements" in result.stderr
+
+    def test_writes_output_file(self, coverage_file: Path, tmp_path: Path):
+        """--output writes a node ID file for --jamb-select-nodeids."""
+        out = tmp_path / "smoke.txt"
+
+        result = CliRunner().invoke(
+            cli, ["plan", "--cover-all", "--budget", "30s", "--coverage", str(coverage_file), "-o", str(out)]
+        )
+
+        assert result.exit_code == 0, result.output
+        assert out.read_text() == "t.py::test_both\n"
+        assert result.stdout == ""
+
+    def test_requires_strategy(self, coverage_file: Path):
+        """Running without --cover-all is an error."""
+        result = CliRunner().invoke(cli, ["plan", "--coverage", str(coverage_file)])
+
+        assert result.exit_code == 1
+        assert "--cover-all" in result.output
+
+    def test_invalid_budget(self, coverage_file: Path):
+        """A malformed budget is rejected by option parsing."""
+        result = CliRunner().invoke(cli, ["plan", "--cover-all", "--budget", "soon", "--coverage", str(coverage_file)])
+
+        assert result.exit_code == 2
+        assert "Invalid duration" in result.output
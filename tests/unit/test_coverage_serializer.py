@@ -12,6 +12,7 @@ from jamb.core.models import (
     LinkedTest,
     MatrixMetadata,
     TestEnvironment,
+    TestResult,
     TraceabilityGraph,
 )
 from jamb.coverage.serializer import (
@@ -53,7 +54,7 @@ class TestSaveCoverage:
         content = output_path.read_text()
         data = json.loads(content)
         assert "version" in data
-        assert data["version"] == 2
+        assert data["version"] == 3
 
     def test_save_includes_coverage_data(self, tmp_path: Path):
         """Test that coverage data is serialized correctly."""
@@ -166,6 +167,7 @@ class TestLoadCoverage:
             item_uid="SRS001",
             test_outcome="passed",
             notes=["Note 1"],
+            duration=1.25,
         )
 
         original_coverage = {
@@ -188,6 +190,7 @@ class TestLoadCoverage:
         assert loaded_coverage["SRS001"].item.header == "Test Header"
         assert len(loaded_coverage["SRS001"].linked_tests) == 1
         assert loaded_coverage["SRS001"].linked_tests[0].test_outcome == "passed"
+        assert loaded_coverage["SRS001"].linked_tests[0].duration == 1.25
 
         assert loaded_graph.document_parents.get("SRS") == ["SYS"]
         assert "SRS001" in loaded_graph.items
@@ -196,6 +199,46 @@ class TestLoadCoverage:
         assert loaded_metadata.software_version == "1.0.0"
         assert loaded_metadata.tester_id == "CI"
 
+    def test_shared_result_written_once_and_shared_on_load(self, tmp_path: Path):
+        """Links of one test store its result once and share it after loading."""
+        output_path = tmp_path / ".jamb"
+        graph = TraceabilityGraph()
+        items = [Item(uid=uid, text=uid, document_prefix="SRS") for uid in ("SRS001", "SRS002")]
+        for item in items:
+            graph.add_item(item)
+        result = TestResult(test_outcome="failed", notes=["[FAILURE] boom"])
+        coverage = {
+            item.uid: ItemCoverage(item=item, linked_tests=[LinkedTest("t.py::test_x", item.uid, result=result)])
+            for item in items
+        }
+
+        save_coverage(coverage, graph, str(output_path))
+
+        data = json.loads(output_path.read_text())
+        assert data["test_results"]["t.py::test_x"]["notes"] == ["[FAILURE] boom"]
+        assert data["coverage"]["SRS001"]["linked_tests"] == [{"test_nodeid": "t.py::test_x", "item_uid": "SRS001"}]
+        loaded, _, _, _ = load_coverage(str(output_path))
+        assert loaded["SRS001"].linked_tests[0].result is loaded["SRS002"].linked_tests[0].result
+        assert loaded["SRS002"].linked_tests[0].test_outcome == "failed"
+
+    def test_divergent_results_kept_inline(self, tmp_path: Path):
+        """A link whose result differs from its test's first result keeps its own copy."""
+        output_path = tmp_path / ".jamb"
+        graph = TraceabilityGraph()
+        items = [Item(uid=uid, text=uid, document_prefix="SRS") for uid in ("SRS001", "SRS002")]
+        for item in items:
+            graph.add_item(item)
+        coverage = {
+            "SRS001": ItemCoverage(item=items[0], linked_tests=[LinkedTest("t.py::test_x", "SRS001", "passed")]),
+            "SRS002": ItemCoverage(item=items[1], linked_tests=[LinkedTest("t.py::test_x", "SRS002", "failed")]),
+        }
+
+        save_coverage(coverage, graph, str(output_path))
+
+        loaded, _, _, _ = load_coverage(str(output_path))
+        assert loaded["SRS001"].linked_tests[0].test_outcome == "passed"
+        assert loaded["SRS002"].linked_tests[0].test_outcome == "failed"
+
     def test_load_with_environment(self, tmp_path: Path):
         """Test that environment data is deserialized correctly."""
         output_path = tmp_path / ".jamb"
@@ -501,4 +544,4 @@ class TestSaveCoverageAtomicWrite:
         # File should still be created via fallback
         assert output_path.exists()
         data = json.loads(output_path.read_text())
-        assert data["version"] == 2
+        assert data["version"] == 3
@@ -0,0 +1,70 @@
+"""Unit tests for the end-of-session coverage snapshot."""
+
+from jamb.core.models import Item, ItemCoverage, LinkedTest
+from jamb.coverage.snapshot import CoverageSnapshot, DocumentCoverageStats
+
+
+def _cov(uid: str, prefix: str = "SRS", outcomes: tuple[str, ...] = (), **item_kwargs) -> ItemCoverage:
+    return ItemCoverage(
+        item=Item(uid=uid, text=uid, document_prefix=prefix, **item_kwargs),
+        linked_tests=[LinkedTest(f"t.py::test_{uid}_{n}", uid, outcome) for n, outcome in enumerate(outcomes)],
+    )
+
+
+class TestCoverageSnapshot:
+    """Tests for CoverageSnapshot.from_coverage."""
+
+    def test_counts_per_document_and_totals(self):
+        """Testable, covered and passing items are counted per document."""
+        coverage = {
+            cov.item.uid: cov
+            for cov in [
+                _cov("SRS001", outcomes=("passed",)),
+                _cov("SRS002", outcomes=("passed", "failed")),
+                _cov("SRS003"),
+                _cov("UT001", prefix="UT", outcomes=("passed",)),
+            ]
+        }
+
+        snapshot = CoverageSnapshot.from_coverage(coverage)
+
+        assert snapshot.documents["SRS"] == DocumentCoverageStats(
+            prefix="SRS", total=3, testable=3, covered=2, passed=1
+        )
+        assert snapshot.documents["UT"] == DocumentCoverageStats(prefix="UT", total=1, testable=1, covered=1, passed=1)
+        assert snapshot.totals == DocumentCoverageStats(prefix="", total=4, testable=4, covered=3, passed=2)
+        assert snapshot.uncovered_uids == ("SRS003",)
+        assert snapshot.failing_uids == ("SRS002",)
+
+    def test_excluded_items_are_broken_down(self):
+        """Headings, info, inactive and non-testable items are counted, not required."""
+        coverage = {
+            cov.item.uid: cov
+            for cov in [
+                _cov("SRS001", type="heading"),
+                _cov("SRS002", type="info"),
+                _cov("SRS003", active=False),
+                _cov("SRS004", testable=False),
+            ]
+        }
+
+        totals = CoverageSnapshot.from_coverage(coverage).totals
+
+        assert (totals.testable, totals.excluded) == (0, 4)
+        assert (totals.heading, totals.info, totals.inactive, totals.untestable) == (1, 1, 1, 1)
+
+    def test_all_covered_honours_require_all_pass(self):
+        """Failing tests only matter when all tests must pass."""
+        snapshot = CoverageSnapshot.from_coverage({"SRS001": _cov("SRS001", outcomes=("failed",))})
+
+        assert snapshot.all_covered(require_all_pass=False)
+        assert not snapshot.all_covered(require_all_pass=True)
+        assert not CoverageSnapshot.from_coverage({"SRS001": _cov("SRS001")}).all_covered(require_all_pass=False)
+
+    def test_links_by_uid_default_to_coverage_links(self):
+        """Without explicit links, the links in the coverage are indexed."""
+        coverage = {"SRS001": _cov("SRS001", outcomes=("passed",)), "SRS002": _cov("SRS002")}
+
+        snapshot = CoverageSnapshot.from_coverage(coverage)
+
+        assert snapshot.links_by_uid == {"SRS001": coverage["SRS001"].linked_tests}
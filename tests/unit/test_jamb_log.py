@@ -49,6 +49,15 @@ class TestJambLog:
         returned.append("extra")
         assert log.expected_results == ["a result"]
 
+    def test_entries_returns_everything_logged(self):
+        log = JambLog()
+        log.note("a note")
+        log.test_action("an action")
+        log.expected_result("expected")
+        log.actual_result("actual")
+        assert log.entries() == (["a note"], ["an action"], ["expected"], ["actual"])
+        assert log.entries().notes is log.entries().notes
+
     def test_note_converts_non_string_to_str(self):
         log = JambLog()
         log.note(42)
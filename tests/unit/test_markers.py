@@ -4,7 +4,7 @@ from unittest.mock import MagicMock
 
 import pytest
 
-from jamb.pytest_plugin.markers import get_requirement_markers, get_tc_id_marker
+from jamb.pytest_plugin.markers import get_requirement_markers, get_tc_id_marker, marker_cache_key
 
 
 class TestGetRequirementMarkers:
@@ -250,3 +250,55 @@ class TestGetTcIdMarker:
         tc_id = get_tc_id_marker(mock_item)
 
         assert tc_id == "TC-AUTH_001"
+
+
+def _function_item(parent: object, name: str = "test_a", own_markers: list | None = None) -> MagicMock:
+    item = MagicMock(spec=pytest.Function)
+    item.parent = parent
+    item.originalname = name
+    item.own_markers = own_markers or []
+    return item
+
+
+class TestMarkerCacheKey:
+    """Tests for marker_cache_key function."""
+
+    def test_variants_share_key(self):
+        """Variants of one function with the same decorator marks share a key."""
+        parent = object()
+        mark = pytest.mark.requirement("SRS001").mark
+
+        assert marker_cache_key(_function_item(parent, own_markers=[mark])) == marker_cache_key(
+            _function_item(parent, own_markers=[mark])
+        )
+
+    def test_variant_marks_give_separate_key(self):
+        """A variant with its own requirement mark is keyed separately."""
+        parent = object()
+        mark = pytest.mark.requirement("SRS001").mark
+        variant_mark = pytest.mark.requirement("SRS002").mark
+
+        assert marker_cache_key(_function_item(parent, own_markers=[mark, variant_mark])) != marker_cache_key(
+            _function_item(parent, own_markers=[mark])
+        )
+
+    def test_other_marks_do_not_split_key(self):
+        """Marks other than requirement and tc_id do not affect the key."""
+        parent = object()
+        mark = pytest.mark.requirement("SRS001").mark
+
+        assert marker_cache_key(_function_item(parent, own_markers=[mark, pytest.mark.skip.mark])) == marker_cache_key(
+            _function_item(parent, own_markers=[mark])
+        )
+
+    def test_functions_have_separate_keys(self):
+        """Different functions or parents never share a key."""
+        parent = object()
+
+        assert marker_cache_key(_function_item(parent, "test_a")) != marker_cache_key(_function_item(parent, "test_b"))
+        assert marker_cache_key(_function_item(parent)) != marker_cache_key(_function_item(object()))
+
+    def test_non_function_items_are_not_cached(self):
+        """Items that are not Python test functions return None."""
+        assert marker_cache_key(MagicMock()) is None
+        assert marker_cache_key(_function_item(None)) is None
@@ -647,3 +647,87 @@ class TestExtraColumnsRendering:
         assert "Safety Class" in values
         assert "Not Reviewed" in values
         assert "B" in values
+
+
+# =============================================================================
+# Duration Column Tests
+# =============================================================================
+
+
+class TestDurationColumnRendering:
+    """Tests for the optional Duration column in test records formats."""
+
+    @pytest.fixture
+    def timed_records(self, sample_test_records):
+        """Sample records with one timed and one untimed test."""
+        sample_test_records[0].duration = 1.5
+        return sample_test_records
+
+    def test_omitted_by_default(self, timed_records):
+        """No format shows durations unless asked."""
+        assert "Duration" not in render_test_records_html(timed_records)
+        assert "Duration" not in render_test_records_markdown(timed_records)
+        assert "Duration" not in render_test_records_csv(timed_records)
+        assert "duration" not in json.loads(render_test_records_json(timed_records))["tests"][0]
+
+    def test_html_duration(self, timed_records):
+        """HTML adds a Duration header and formatted cells."""
+        html = render_test_records_html(timed_records, show_duration=True)
+        assert "<th>Duration</th>" in html
+        assert '<td class="duration">1.50s</td>' in html
+        assert '<td class="duration">-</td>' in html
+
+    def test_markdown_duration(self, timed_records):
+        """Markdown rows end with the formatted duration."""
+        lines = render_test_records_markdown(timed_records, show_duration=True).splitlines()
+        assert lines[-4].endswith("| Timestamp | Duration |")
+        assert lines[-2].endswith("| 1.50s |")
+        assert lines[-1].endswith("| - |")
+
+    def test_csv_duration(self, timed_records):
+        """CSV writes seconds with millisecond precision."""
+        rows = list(csv.reader(io.StringIO(render_test_records_csv(timed_records, show_duration=True))))
+        assert rows[-3][-1] == "Duration"
+        assert rows[-2][-1] == "1.500"
+        assert rows[-1][-1] == ""
+
+    def test_json_duration(self, timed_records):
+        """JSON records carry the raw duration in seconds."""
+        tests = json.loads(render_test_records_json(timed_records, show_duration=True))["tests"]
+        assert [t["duration"] for t in tests] == [1.5, None]
+
+    def test_xlsx_duration(self, timed_records):
+        """XLSX adds a numeric Duration column."""
+        wb = load_workbook(io.BytesIO(render_test_records_xlsx(timed_records, show_duration=True)))
+        values = [cell.value for row in wb.active.iter_rows() for cell in row if cell.value is not None]
+        assert "Duration (s)" in values
+        assert 1.5 in values
+
+
+class TestArtifactLinks:
+    """Tests for links to spilled evidence in test records formats."""
+
+    @pytest.fixture
+    def linked_records(self, sample_test_records):
+        """Sample records whose first test has a spilled failure note."""
+        sample_test_records[0].notes = ["[FAILURE] boom\n... (truncated) [artifact: .jamb-artifacts/abc.txt]"]
+        return sample_test_records
+
+    def test_html_links_artifacts(self, linked_records):
+        """HTML renders artifact references as anchors."""
+        html = render_test_records_html(linked_records)
+        assert '<a class="artifact" href=".jamb-artifacts/abc.txt">.jamb-artifacts/abc.txt</a>' in html
+
+    def test_markdown_links_artifacts(self, linked_records):
+        """Markdown appends artifact references as links."""
+        markdown = render_test_records_markdown(linked_records)
+        assert "\\[FAILURE\\] boom ... (truncated) [artifact](.jamb-artifacts/abc.txt)" in markdown
+
+    def test_generator_relinks_relative_to_output(self, linked_records, tmp_path, monkeypatch):
+        """References are rewritten relative to the matrix location."""
+        from jamb.matrix.generator import generate_test_records_matrix
+
+        monkeypatch.chdir(tmp_path)
+        generate_test_records_matrix(linked_records, "docs/records.html")
+
+        assert 'href="../.jamb-artifacts/abc.txt"' in (tmp_path / "docs" / "records.html").read_text()
@@ -0,0 +1,47 @@
+"""Unit tests for the background matrix worker."""
+
+import pickle
+from pathlib import Path
+from unittest.mock import patch
+
+from jamb.matrix.worker import MatrixJob, main
+
+
+def _write_jobs(path: Path, jobs: list[MatrixJob]) -> str:
+    path.write_bytes(pickle.dumps(jobs))
+    return str(path)
+
+
+class TestMatrixWorker:
+    """Tests for running pickled matrix jobs."""
+
+    def test_runs_jobs_and_removes_job_file(self, tmp_path: Path):
+        """Every job calls its generator function; the job file is deleted."""
+        job_file = _write_jobs(tmp_path / "jobs.pickle", [MatrixJob("generate_test_records_matrix", ([], "out.html"))])
+
+        with patch("jamb.matrix.generator.generate_test_records_matrix") as mock_generate:
+            assert main([job_file]) == 0
+
+        mock_generate.assert_called_once_with([], "out.html")
+        assert not Path(job_file).exists()
+
+    def test_failed_job_does_not_stop_others(self, tmp_path: Path, capsys):
+        """A failing job is reported and the remaining jobs still run."""
+        job_file = _write_jobs(
+            tmp_path / "jobs.pickle",
+            [MatrixJob("generate_full_chain_matrix"), MatrixJob("generate_test_records_matrix")],
+        )
+
+        with (
+            patch("jamb.matrix.generator.generate_full_chain_matrix", side_effect=OSError("disk full")),
+            patch("jamb.matrix.generator.generate_test_records_matrix") as mock_records,
+        ):
+            assert main([job_file]) == 1
+
+        mock_records.assert_called_once()
+        assert "generate_full_chain_matrix failed: disk full" in capsys.readouterr().err
+
+    def test_missing_job_file(self, tmp_path: Path, capsys):
+        """An unreadable job file is an error."""
+        assert main([str(tmp_path / "missing.pickle")]) == 1
+        assert "cannot read matrix jobs" in capsys.readouterr().err
@@ -317,8 +317,9 @@ class TestOutcomeHandling:
 class TestFailureMessageTruncation:
     """Tests for failure message truncation."""
 
-    def test_long_failure_message_truncated(self):
+    def test_long_failure_message_truncated(self, tmp_path, monkeypatch):
         """Test that failure messages longer than 500 chars are truncated."""
+        monkeypatch.chdir(tmp_path)
         from jamb.core.models import LinkedTest, TraceabilityGraph
         from jamb.pytest_plugin.collector import RequirementCollector
 
@@ -375,8 +376,11 @@ class TestFailureMessageTruncation:
             assert len(test_link.notes) == 1
             note = test_link.notes[0]
             assert "... (truncated)" in note
-            # The total length should be limited
-            assert len(note) < 600
+            # Only an excerpt is kept inline; the full text is in the artifact store
+            assert note.startswith("[FAILURE] " + "A" * 500 + "\n")
+            assert "A" * 501 not in note
+            stored = list((tmp_path / ".jamb-artifacts").iterdir())
+            assert [p.read_text() for p in stored] == [long_message]
 
 
 class TestBuildTestEnvironmentExceptions:
@@ -708,6 +712,10 @@ class TestManualTcIdCollection:
         mock_config = MagicMock()
         mock_config.option = MagicMock()
         mock_config.option.jamb_documents = None
+        mock_config.option.jamb_affected_since = None
+        mock_config.option.jamb_rerun_failed_requirements = None
+        mock_config.option.jamb_fail_uncovered_early = None
+        mock_config.option.jamb_select_nodeids = None
 
         with (
             patch("jamb.pytest_plugin.collector.load_config") as mock_load_config,
@@ -764,6 +772,10 @@ class TestManualTcIdCollection:
         mock_config = MagicMock()
         mock_config.option = MagicMock()
         mock_config.option.jamb_documents = None
+        mock_config.option.jamb_affected_since = None
+        mock_config.option.jamb_rerun_failed_requirements = None
+        mock_config.option.jamb_fail_uncovered_early = None
+        mock_config.option.jamb_select_nodeids = None
 
         with (
             patch("jamb.pytest_plugin.collector.load_config") as mock_load_config,
@@ -804,6 +816,10 @@ class TestManualTcIdCollection:
         mock_config = MagicMock()
         mock_config.option = MagicMock()
         mock_config.option.jamb_documents = None
+        mock_config.option.jamb_affected_since = None
+        mock_config.option.jamb_rerun_failed_requirements = None
+        mock_config.option.jamb_fail_uncovered_early = None
+        mock_config.option.jamb_select_nodeids = None
 
         with (
             patch("jamb.pytest_plugin.collector.load_config") as mock_load_config,
@@ -909,6 +925,10 @@ class TestDuplicateTcIdDetection:
         mock_config = MagicMock()
         mock_config.option = MagicMock()
         mock_config.option.jamb_documents = None
+        mock_config.option.jamb_affected_since = None
+        mock_config.option.jamb_rerun_failed_requirements = None
+        mock_config.option.jamb_fail_uncovered_early = None
+        mock_config.option.jamb_select_nodeids = None
 
         with (
             patch("jamb.pytest_plugin.collector.load_config") as mock_load_config,
@@ -952,6 +972,10 @@ class TestDuplicateTcIdDetection:
         mock_config = MagicMock()
         mock_config.option = MagicMock()
         mock_config.option.jamb_documents = None
+        mock_config.option.jamb_affected_since = None
+        mock_config.option.jamb_rerun_failed_requirements = None
+        mock_config.option.jamb_fail_uncovered_early = None
+        mock_config.option.jamb_select_nodeids = None
 
         with (
             patch("jamb.pytest_plugin.collector.load_config") as mock_load_config,
@@ -988,3 +1012,251 @@ class TestDuplicateTcIdDetection:
             # Both should have the same tc_id recorded
             assert collector.manual_tc_ids["test.py::test_foo[param1]"] == "TC001"
             assert collector.manual_tc_ids["test.py::test_foo[param2]"] == "TC001"
+
+
+class TestMergePreviousCoverage:
+    """Tests for merge_previous_coverage (--jamb-update)."""
+
+    def _make_collector(self, graph):
+        from jamb.pytest_plugin.collector import RequirementCollector
+
+        mock_config = MagicMock()
+        mock_config.option = MagicMock()
+        mock_config.option.jamb_documents = "SRS"
+
+        with (
+            patch("jamb.pytest_plugin.collector.load_config") as mock_load_config,
+            patch("jamb.storage.discover_documents"),
+            patch("jamb.storage.build_traceability_graph") as mock_build_graph,
+        ):
+            mock_jamb_config = MagicMock()
+            mock_jamb_config.exclude_patterns = None
+            mock_load_config.return_value = mock_jamb_config
+            mock_build_graph.return_value = graph
+            return RequirementCollector(mock_config)
+
+    def _write_previous(self, path, graph, links, manual_tc_ids=None):
+        from jamb.core.models import ItemCoverage
+        from jamb.coverage.serializer import save_coverage
+
+        coverage = {
+            uid: ItemCoverage(item=item, linked_tests=[lk for lk in links if lk.item_uid == uid])
+            for uid, item in graph.items.items()
+        }
+        save_coverage(coverage, graph, str(path), manual_tc_ids=manual_tc_ids)
+
+    def _graph(self):
+        from jamb.core.models import Item, TraceabilityGraph
+
+        graph = TraceabilityGraph()
+        graph.set_document_parents("SRS", [])
+        graph.add_item(Item(uid="SRS001", text="One", document_prefix="SRS"))
+        graph.add_item(Item(uid="SRS002", text="Two", document_prefix="SRS"))
+        return graph
+
+    def test_replaces_executed_and_keeps_others(self, tmp_path):
+        """Executed tests replace previous results; others are carried over."""
+        from jamb.core.models import LinkedTest
+
+        graph = self._graph()
+        previous = tmp_path / ".jamb"
+        self._write_previous(
+            previous,
+            graph,
+            [
+                LinkedTest("t.py::test_a", "SRS001", "failed"),
+                LinkedTest("t.py::test_b", "SRS002", "passed"),
+            ],
+            manual_tc_ids={"t.py::test_b": "TC-B"},
+        )
+
+        collector = self._make_collector(graph)
+        collector.test_links = [LinkedTest("t.py::test_a", "SRS001", "passed")]
+        collector.executed_nodeids = {"t.py::test_a"}
+
+        collector.merge_previous_coverage(str(previous))
+
+        coverage = collector.get_coverage()
+        assert [(lk.test_nodeid, lk.test_outcome) for lk in coverage["SRS001"].linked_tests] == [
+            ("t.py::test_a", "passed")
+        ]
+        assert [(lk.test_nodeid, lk.test_outcome) for lk in coverage["SRS002"].linked_tests] == [
+            ("t.py::test_b", "passed")
+        ]
+        assert collector.manual_tc_ids == {"t.py::test_b": "TC-B"}
+        assert collector._links_by_nodeid["t.py::test_b"][0].item_uid == "SRS002"
+
+    def test_executed_test_with_changed_markers_drops_old_links(self, tmp_path):
+        """A rerun test's previous links are dropped even for UIDs it no longer marks."""
+        from jamb.core.models import LinkedTest
+
+        graph = self._graph()
+        previous = tmp_path / ".jamb"
+        self._write_previous(previous, graph, [LinkedTest("t.py::test_a", "SRS001", "passed")])
+
+        collector = self._make_collector(graph)
+        collector.test_links = [LinkedTest("t.py::test_a", "SRS002", "passed")]
+        collector.executed_nodeids = {"t.py::test_a"}
+
+        collector.merge_previous_coverage(str(previous))
+
+        coverage = collector.get_coverage()
+        assert coverage["SRS001"].linked_tests == []
+        assert len(coverage["SRS002"].linked_tests) == 1
+
+    def test_collected_but_not_run_keeps_previous_result(self, tmp_path):
+        """A collected test that never ran keeps its previous outcome."""
+        from jamb.core.models import LinkedTest
+
+        graph = self._graph()
+        previous = tmp_path / ".jamb"
+        self._write_previous(previous, graph, [LinkedTest("t.py::test_a", "SRS001", "passed")])
+
+        collector = self._make_collector(graph)
+        collector.test_links = [LinkedTest("t.py::test_a", "SRS001")]
+
+        collector.merge_previous_coverage(str(previous))
+
+        links = collector.get_coverage()["SRS001"].linked_tests
+        assert [lk.test_outcome for lk in links] == ["passed"]
+
+    def test_missing_previous_file_warns(self, tmp_path):
+        """A missing previous file warns and keeps this session's links."""
+        from jamb.core.models import LinkedTest
+
+        collector = self._make_collector(self._graph())
+        link = LinkedTest("t.py::test_a", "SRS001", "passed")
+        collector.test_links = [link]
+
+        with pytest.warns(UserWarning, match="--jamb-update"):
+            collector.merge_previous_coverage(str(tmp_path / "missing.jamb"))
+
+        assert collector.test_links == [link]
+
+    def test_makereport_records_executed_nodeid(self):
+        """Every report marks the test as executed in this session."""
+        collector = self._make_collector(self._graph())
+        mock_item = MagicMock()
+        mock_item.nodeid = "t.py::test_a"
+        mock_report = MagicMock()
+        mock_report.when = "setup"
+        mock_report.failed = False
+        mock_report.skipped = False
+        mock_outcome = MagicMock()
+        mock_outcome.get_result.return_value = mock_report
+
+        generator = collector.pytest_runtest_makereport(mock_item, MagicMock())
+        next(generator)
+        with contextlib.suppress(StopIteration):
+            generator.send(mock_outcome)
+
+        assert collector.executed_nodeids == {"t.py::test_a"}
+
+
+def _make_srs_collector():
+    """Create a collector whose graph holds a single SRS001 requirement."""
+    from jamb.core.models import Item, TraceabilityGraph
+    from jamb.pytest_plugin.collector import RequirementCollector
+
+    mock_config = MagicMock()
+    mock_config.option = MagicMock()
+    mock_config.option.jamb_documents = None
+    mock_config.option.jamb_affected_since = None
+    mock_config.option.jamb_rerun_failed_requirements = None
+    mock_config.option.jamb_fail_uncovered_early = None
+    mock_config.option.jamb_select_nodeids = None
+
+    with (
+        patch("jamb.pytest_plugin.collector.load_config") as mock_load_config,
+        patch("jamb.storage.discover_documents"),
+        patch("jamb.storage.build_traceability_graph") as mock_build_graph,
+    ):
+        mock_jamb_config = MagicMock()
+        mock_jamb_config.exclude_patterns = None
+        mock_load_config.return_value = mock_jamb_config
+        graph = TraceabilityGraph()
+        graph.add_item(Item(uid="SRS001", text="Test req", document_prefix="SRS"))
+        mock_build_graph.return_value = graph
+        return RequirementCollector(mock_config)
+
+
+class TestMarkerMemoization:
+    """Tests for per-function marker caching in pytest_collection_modifyitems."""
+
+    def test_variants_resolve_markers_once(self):
+        """Variants of one parametrized function share a single marker lookup."""
+        collector = _make_srs_collector()
+        parent = MagicMock()
+        items = []
+        for n in range(3):
+            item = MagicMock(spec=pytest.Function)
+            item.parent = parent
+            item.originalname = "test_param"
+            item.own_markers = []
+            item.nodeid = f"test_a.py::test_param[{n}]"
+            items.append(item)
+
+        with (
+            patch("jamb.pytest_plugin.collector.get_requirement_markers", return_value=["SRS001"]) as mock_get,
+            patch("jamb.pytest_plugin.collector.get_tc_id_marker", return_value=None),
+        ):
+            generator = collector.pytest_collection_modifyitems(items=items)
+            next(generator)
+            with contextlib.suppress(StopIteration):
+                next(generator)
+
+        mock_get.assert_called_once()
+        assert [lk.test_nodeid for lk in collector.test_links] == [item.nodeid for item in items]
+        assert "processed 3 collected tests" in collector.timing_summary()
+
+    def test_timing_summary_before_collection(self):
+        """Before collection only the requirement loading time is reported."""
+        collector = _make_srs_collector()
+
+        assert collector.timing_summary().startswith("jamb overhead: loaded requirements in ")
+        assert "collected" not in collector.timing_summary()
+
+
+class TestCoverageSnapshotReuse:
+    """Tests for sharing one coverage snapshot across end-of-session consumers."""
+
+    def test_snapshot_is_reused_until_next_report(self):
+        """The snapshot is built once and rebuilt after a new test report."""
+        collector = _make_srs_collector()
+
+        with patch.object(collector, "get_coverage", wraps=collector.get_coverage) as mock_get:
+            first = collector.coverage_snapshot()
+            collector.all_test_items_covered()
+            assert collector.coverage_snapshot() is first
+            assert mock_get.call_count == 1
+
+            item = MagicMock()
+            item.nodeid = "t.py::test_a"
+            generator = collector.pytest_runtest_makereport(item, MagicMock())
+            next(generator)
+            outcome = MagicMock()
+            outcome.get_result.return_value.when = "setup"
+            outcome.get_result.return_value.failed = False
+            outcome.get_result.return_value.skipped = False
+            with contextlib.suppress(StopIteration):
+                generator.send(outcome)
+
+            assert collector.coverage_snapshot() is not first
+
+    def test_deferred_matrices_go_to_one_worker(self):
+        """Deferred matrix calls are queued and handed to a single worker."""
+        collector = _make_srs_collector()
+        collector.defer_matrices()
+
+        with (
+            patch("jamb.matrix.generator.generate_test_records_matrix") as mock_generate,
+            patch("jamb.pytest_plugin.collector.spawn_matrix_worker") as mock_spawn,
+        ):
+            collector.generate_test_records_matrix("out.html", "html")
+            collector.generate_trace_matrix("trace.html", "html", trace_from="SRS")
+            mock_generate.assert_not_called()
+            collector.start_matrix_worker()
+
+        jobs = mock_spawn.call_args.args[0]
+        assert [job.function for job in jobs] == ["generate_test_records_matrix", "generate_full_chain_matrix"]
+        assert jobs[0].args[1:] == ("out.html", "html")
@@ -0,0 +1,236 @@
+"""Unit tests for the live test outcome event stream."""
+
+import io
+import json
+import socket
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+
+from jamb.cli.commands import cli
+from jamb.pytest_plugin.events import EventTarget, EventWriter, RunProgress, parse_event_target, read_events
+
+
+def _report(nodeid: str, uids: list[str], when: str, outcome: str) -> dict:
+    return {"event": "report", "nodeid": nodeid, "uids": uids, "when": when, "outcome": outcome, "duration": 0.1}
+
+
+def _write_events(path: Path, events: list[dict]) -> None:
+    path.write_text("".join(json.dumps(e) + "\n" for e in events))
+
+
+class TestParseEventTarget:
+    """Tests for parsing --jamb-events targets."""
+
+    @pytest.mark.parametrize(
+        ("value", "target"),
+        [
+            ("file:events.jsonl", EventTarget("file", "events.jsonl")),
+            ("unix:/tmp/j.sock", EventTarget("unix", "/tmp/j.sock")),
+        ],
+    )
+    def test_valid(self, value: str, target: EventTarget):
+        """Supported schemes are split into kind and path."""
+        assert parse_event_target(value) == target
+
+    @pytest.mark.parametrize("value", ["events.jsonl", "tcp:localhost:9000", "file:"])
+    def test_invalid(self, value: str):
+        """Unknown schemes and empty paths raise ValueError."""
+        with pytest.raises(ValueError, match="Invalid event target"):
+            parse_event_target(value)
+
+
+class TestEventWriter:
+    """Tests for the background event writer."""
+
+    def test_writes_events_in_order(self, tmp_path: Path):
+        """Events are appended to a file target as JSON Lines."""
+        path = tmp_path / "events.jsonl"
+        writer = EventWriter(EventTarget("file", str(path)))
+
+        writer.emit({"event": "a"})
+        writer.emit({"event": "b"})
+        writer.close()
+
+        assert [json.loads(line)["event"] for line in path.read_text().splitlines()] == ["a", "b"]
+        assert writer.error is None
+
+    def test_full_queue_drops_instead_of_blocking(self):
+        """emit never blocks; events beyond the queue size are counted as dropped."""
+        opened = threading.Event()
+        release = threading.Event()
+        stream = io.StringIO()
+
+        def slow_open(self):
+            opened.set()
+            release.wait(5)
+            return stream, None
+
+        with patch.object(EventWriter, "_open", slow_open):
+            writer = EventWriter(EventTarget("file", "unused"), maxsize=2)
+            opened.wait(5)
+            for n in range(5):
+                writer.emit({"event": "report", "n": n})
+            release.set()
+            writer.close()
+
+        assert writer.dropped == 3
+
+    def test_final_event_waits_for_full_queue(self):
+        """The event passed to close is written even when the queue is full."""
+        release = threading.Event()
+        stream = io.StringIO()
+        stream.close = lambda: None  # type: ignore[method-assign]
+
+        def slow_open(self):
+            release.wait(5)
+            return stream, None
+
+        with patch.object(EventWriter, "_open", slow_open):
+            writer = EventWriter(EventTarget("file", "unused"), maxsize=2)
+            for n in range(3):
+                writer.emit({"event": "report", "n": n})
+            threading.Timer(0.2, release.set).start()
+            writer.close({"event": "session_finish", "exitstatus": 0})
+
+        events = [json.loads(line)["event"] for line in stream.getvalue().splitlines()]
+        assert events == ["report", "report", "session_finish"]
+        assert writer.dropped == 1
+
+    def test_unreachable_socket_sets_error(self, tmp_path: Path):
+        """A socket nobody listens on is reported, and events are discarded."""
+        writer = EventWriter(EventTarget("unix", str(tmp_path / "missing.sock")))
+        writer.emit({"event": "a"})
+        writer.close()
+
+        assert writer.error is not None
+        assert "cannot open unix:" in writer.error
+
+
+class TestReadEvents:
+    """Tests for reading event streams."""
+
+    def test_file_stops_at_session_finish(self, tmp_path: Path):
+        """Reading ends at session_finish; malformed lines are skipped."""
+        path = tmp_path / "events.jsonl"
+        path.write_text('{"event": "collection"}\nnot json\n[1]\n{"event": "session_finish"}\n{"event": "late"}\n')
+
+        events = list(read_events(EventTarget("file", str(path)), follow=False))
+
+        assert [e["event"] for e in events] == ["collection", "session_finish"]
+
+    def test_follow_ignores_finished_stream(self, tmp_path: Path):
+        """A file left by a finished run is emptied instead of ending the viewer."""
+        path = tmp_path / "events.jsonl"
+        _write_events(path, [{"event": "collection"}, {"event": "session_finish", "exitstatus": 1}])
+        received: list[dict] = []
+        reader = threading.Thread(target=lambda: received.extend(read_events(EventTarget("file", str(path)))))
+        reader.start()
+        deadline = time.monotonic() + 5
+        while path.stat().st_size:
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+
+        writer = EventWriter(EventTarget("file", str(path)))
+        writer.emit({"event": "report"})
+        writer.close({"event": "session_finish", "exitstatus": 0})
+        reader.join(5)
+
+        assert [e["event"] for e in received] == ["report", "session_finish"]
+        assert received[-1]["exitstatus"] == 0
+
+    @pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="requires Unix domain sockets")
+    def test_unix_socket_round_trip(self, tmp_path: Path):
+        """Events written by EventWriter arrive at a listening reader."""
+        sock_path = tmp_path / "j.sock"
+        received: list[dict] = []
+        reader = threading.Thread(target=lambda: received.extend(read_events(EventTarget("unix", str(sock_path)))))
+        reader.start()
+        deadline = time.monotonic() + 5
+        while not sock_path.exists():
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+
+        writer = EventWriter(EventTarget("unix", str(sock_path)))
+        writer.emit({"event": "collection"})
+        writer.emit({"event": "session_finish", "exitstatus": 0})
+        writer.close()
+        reader.join(5)
+
+        assert [e["event"] for e in received] == ["collection", "session_finish"]
+        assert not sock_path.exists()
+
+
+class TestRunProgress:
+    """Tests for aggregating events into live per-document coverage."""
+
+    def test_document_progress(self):
+        """Requirements count as covered once a linked test has finished."""
+        progress = RunProgress()
+        for event in [
+            {"event": "collection", "documents": {"SRS": ["SRS001", "SRS002", "SRS003"]}, "tests": 3},
+            _report("t.py::test_a", ["SRS001"], "call", "passed"),
+            _report("t.py::test_a", ["SRS001"], "teardown", "passed"),
+            _report("t.py::test_b", ["SRS002"], "call", "failed"),
+            _report("t.py::test_b", ["SRS002"], "teardown", "failed"),
+            _report("t.py::test_c", ["SRS003"], "call", "passed"),
+        ]:
+            progress.update(event)
+
+        (srs,) = progress.document_progress()
+        assert (srs.testable, srs.covered, srs.passing, srs.failing) == (3, 2, 1, 1)
+        assert progress.outcome_counts() == {"passed": 1, "failed": 1}
+        assert not progress.finished
+
+    def test_outcome_follows_phases(self):
+        """Setup and teardown failures are errors; a passing teardown keeps the call outcome."""
+        progress = RunProgress()
+        for event in [
+            _report("t.py::test_call_failed", [], "call", "failed"),
+            _report("t.py::test_call_failed", [], "teardown", "passed"),
+            _report("t.py::test_setup_failed", [], "setup", "failed"),
+            _report("t.py::test_setup_failed", [], "teardown", "passed"),
+            _report("t.py::test_teardown_failed", [], "call", "passed"),
+            _report("t.py::test_teardown_failed", [], "teardown", "failed"),
+        ]:
+            progress.update(event)
+
+        assert progress.outcomes == {
+            "t.py::test_call_failed": "failed",
+            "t.py::test_setup_failed": "error",
+            "t.py::test_teardown_failed": "error",
+        }
+
+
+class TestWatchRunCommand:
+    """Tests for the ``jamb watch-run`` command."""
+
+    def test_summarizes_event_file(self, tmp_path: Path):
+        """A finished event file is summarized per document."""
+        path = tmp_path / "events.jsonl"
+        _write_events(
+            path,
+            [
+                {"event": "collection", "documents": {"SRS": ["SRS001", "SRS002"]}, "tests": 1},
+                _report("t.py::test_a", ["SRS001"], "teardown", "passed"),
+                {"event": "session_finish", "exitstatus": 0, "dropped": 0},
+            ],
+        )
+
+        result = CliRunner().invoke(cli, ["watch-run", f"file:{path}", "--no-follow"])
+
+        assert result.exit_code == 0, result.output
+        assert "Tests finished: 1/1 (1 passed)" in result.output
+        assert "SRS" in result.output and "1 (50.0%)" in result.output
+        assert "Session finished with exit status 0" in result.output
+
+    def test_invalid_source(self):
+        """A malformed source is rejected by option parsing."""
+        result = CliRunner().invoke(cli, ["watch-run", "events.jsonl"])
+
+        assert result.exit_code == 2
+        assert "Invalid event target" in result.output
@@ -2,6 +2,7 @@
 
 import pytest
 
+from jamb.coverage.artifacts import ArtifactStore
 from jamb.pytest_plugin.log import JAMB_LOG_KEY, JambLog
 
 
@@ -173,3 +174,35 @@ class TestJambLogActualResults:
         results.append("Modified")
 
         assert log.actual_results == ["Original"]
+
+
+class TestJambLogAttach:
+    """Tests for JambLog.attach()."""
+
+    def test_attach_without_store_is_noop(self):
+        """Without --jamb there is no store, so nothing is recorded."""
+        log = JambLog()
+
+        assert log.attach(b"data") is None
+        assert log.notes == []
+
+    def test_attach_bytes(self, tmp_path):
+        """Raw bytes are stored and linked from an ATTACHMENT note."""
+        log = JambLog(ArtifactStore(tmp_path / "artifacts"))
+
+        path = log.attach(b"payload", name="response body")
+
+        assert path is not None
+        assert (tmp_path / "artifacts").joinpath(path.rsplit("/", 1)[1]).read_bytes() == b"payload"
+        assert log.notes == [f"[ATTACHMENT] response body [artifact: {path}]"]
+
+    def test_attach_file_uses_file_name(self, tmp_path):
+        """A file path is copied and labelled with its file name."""
+        source = tmp_path / "capture.pcap"
+        source.write_bytes(b"packets")
+        log = JambLog(ArtifactStore(tmp_path / "artifacts"))
+
+        path = log.attach(source)
+
+        assert path is not None and path.endswith(".pcap")
+        assert log.notes[0].startswith("[ATTACHMENT] capture.pcap [artifact: ")
@@ -0,0 +1,128 @@
+"""Unit tests for requirement-aware test ordering."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from jamb.core.models import Item, ItemCoverage, LinkedTest, TraceabilityGraph
+from jamb.pytest_plugin.ordering import RiskRanker, failed_requirement_uids, order_by_risk, safety_class_rank
+from jamb.storage.items import compute_content_hash
+
+
+def _reviewed(item: Item) -> Item:
+    item.reviewed = compute_content_hash(
+        {"text": item.text, "header": item.header, "links": item.links, "type": item.type}
+    )
+    return item
+
+
+@pytest.fixture
+def graph():
+    """SYS -> SRS graph with a class C system requirement and a suspect item."""
+    g = TraceabilityGraph()
+    g.set_document_parents("SYS", [])
+    g.set_document_parents("SRS", ["SYS"])
+    g.add_item(Item(uid="SYS001", text="Sys one", document_prefix="SYS"))
+    g.add_item(Item(uid="SYS002", text="Sys two", document_prefix="SYS", custom_attributes={"safety_class": "C"}))
+    g.add_item(_reviewed(Item(uid="SRS001", text="Sw one", document_prefix="SRS", links=["SYS001"])))
+    g.add_item(Item(uid="SRS002", text="Sw two", document_prefix="SRS", links=["SYS002"]))
+    suspect = _reviewed(Item(uid="SRS003", text="Sw three", document_prefix="SRS", links=["SYS001"]))
+    suspect.text = "Sw three, changed"
+    g.add_item(suspect)
+    g.add_item(
+        Item(
+            uid="SRS004",
+            text="Sw four",
+            document_prefix="SRS",
+            links=["SYS001"],
+            custom_attributes={"safety_class": "B"},
+        )
+    )
+    return g
+
+
+class TestSafetyClassRank:
+    """Tests for safety_class_rank."""
+
+    @pytest.mark.parametrize(
+        ("value", "rank"),
+        [("A", 1), ("b", 2), ("Class C", 3), (5, 5), (None, 0), ("high", 0), (True, 0)],
+    )
+    def test_rank(self, value, rank):
+        """IEC 62304 classes and integers are ranked; anything else is 0."""
+        assert safety_class_rank(value) == rank
+
+
+class TestFailedRequirementUids:
+    """Tests for failed_requirement_uids."""
+
+    def test_failed_and_error_count(self):
+        """Items with a failed or errored test are returned."""
+        item = Item(uid="X", text="x", document_prefix="SRS")
+        coverage = {
+            "A": ItemCoverage(item, [LinkedTest("t1", "A", test_outcome="passed")]),
+            "B": ItemCoverage(
+                item, [LinkedTest("t2", "B", test_outcome="passed"), LinkedTest("t3", "B", test_outcome="failed")]
+            ),
+            "C": ItemCoverage(item, [LinkedTest("t4", "C", test_outcome="error")]),
+            "D": ItemCoverage(item, [LinkedTest("t5", "D", test_outcome="skipped")]),
+        }
+        assert failed_requirement_uids(coverage) == {"B", "C"}
+
+
+class TestRiskRanker:
+    """Tests for RiskRanker."""
+
+    def test_criteria(self, graph):
+        """Rank is (failed, suspect, safety class)."""
+        ranker = RiskRanker(graph, {"SRS001"})
+        assert ranker.rank("SRS001") == (1, 0, 0)
+        assert ranker.rank("SRS003") == (0, 1, 0)
+        assert ranker.rank("SRS004") == (0, 0, 2)
+
+    def test_safety_class_inherited_from_ancestors(self, graph):
+        """An item without its own class takes the highest ancestor class."""
+        assert RiskRanker(graph).rank("SRS002") == (0, 0, 3)
+
+    def test_unknown_uid_ranks_by_failure_only(self, graph):
+        """UIDs missing from the graph only rank by previous failure."""
+        assert RiskRanker(graph, {"GONE"}).rank("GONE") == (1, 0, 0)
+
+    def test_test_rank_takes_max_per_criterion(self, graph):
+        """Each criterion comes from the riskiest linked requirement."""
+        ranker = RiskRanker(graph, {"SRS001"})
+        assert ranker.test_rank(["SRS001", "SRS002"]) == (1, 0, 3)
+        assert ranker.test_rank([]) == (0, 0, 0)
+
+
+class TestOrderByRisk:
+    """Tests for order_by_risk."""
+
+    def test_order_is_stable(self, graph):
+        """Riskiest tests move first; equal ranks keep collection order."""
+        links = {
+            "t_plain": ["SYS001"],
+            "t_unlinked": [],
+            "t_class_b": ["SRS004"],
+            "t_class_c": ["SRS002"],
+            "t_suspect": ["SRS003"],
+            "t_failed": ["SRS001"],
+            "t_plain2": ["SYS001"],
+        }
+        items = []
+        for nodeid in links:
+            item = MagicMock(spec=pytest.Function)
+            item.nodeid = nodeid
+            items.append(item)
+
+        order_by_risk(items, RiskRanker(graph, {"SRS001"}), lambda item: links[item.nodeid])
+
+        assert [i.nodeid for i in items] == [
+            "t_failed",
+            "t_suspect",
+            "t_class_c",
+            "t_class_b",
+            "t_plain",
+            "t_unlinked",
+            "t_plain2",
+        ]
@@ -4,6 +4,8 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from jamb.coverage.snapshot import CoverageSnapshot
+
 # ============================================================================
 # Fixtures for common mock configurations
 # ============================================================================
@@ -17,6 +19,7 @@ def mock_session():
     session.config.option.jamb_test_matrix = None
     session.config.option.jamb_trace_matrix = None
     session.config.option.jamb_fail_uncovered = False
+    session.config.option.jamb_update = False
     session.config.option.jamb_tester_id = "tester"
     session.config.option.jamb_software_version = None
     session.config.option.trace_from = None
@@ -60,6 +63,11 @@ class TestPytestAddoption:
 
         assert "--jamb" in option_names
         assert "--jamb-fail-uncovered" in option_names
+        assert "--jamb-update" in option_names
+        assert "--jamb-select" in option_names
+        assert "--jamb-select-document" in option_names
+        assert "--jamb-affected-since" in option_names
+        assert "--jamb-select-nodeids" in option_names
         assert "--jamb-test-matrix" in option_names
         assert "--jamb-trace-matrix" in option_names
         assert "--jamb-documents" in option_names
@@ -91,6 +99,12 @@ class TestPytestConfigure:
 
         mock_config = MagicMock()
         mock_config.option.jamb = False
+        mock_config.option.jamb_select = None
+        mock_config.option.jamb_select_document = None
+        mock_config.option.jamb_affected_since = None
+        mock_config.option.jamb_rerun_failed_requirements = None
+        mock_config.option.jamb_fail_uncovered_early = None
+        mock_config.option.jamb_select_nodeids = None
 
         pytest_configure(mock_config)
 
@@ -114,6 +128,7 @@ class TestPytestConfigure:
         # Not a distributed run: no xdist worker, no --dist mode.
         del mock_config.workerinput
         mock_config.option.dist = "no"
+        mock_config.option.jamb_events = None
 
         pytest_configure(mock_config)
 
@@ -126,12 +141,59 @@ class TestPytestConfigure:
 
         mock_config = MagicMock()
         mock_config.option.jamb = False
+        mock_config.option.jamb_select = None
+        mock_config.option.jamb_select_document = None
+        mock_config.option.jamb_affected_since = None
+        mock_config.option.jamb_rerun_failed_requirements = None
+        mock_config.option.jamb_fail_uncovered_early = None
+        mock_config.option.jamb_select_nodeids = None
 
         pytest_configure(mock_config)
 
         mock_config.pluginmanager.register.assert_not_called()
 
 
+class TestSelectionRequiresJamb:
+    """Tests for the --jamb-select guard in pytest_configure."""
+
+    def test_select_without_jamb_raises(self):
+        """--jamb-select without --jamb is a usage error."""
+        from types import SimpleNamespace
+
+        from jamb.pytest_plugin.plugin import pytest_configure
+
+        config = SimpleNamespace(option=SimpleNamespace(jamb=False, jamb_select="SRS001", jamb_select_document=None))
+
+        with pytest.raises(pytest.UsageError, match="require --jamb"):
+            pytest_configure(config)
+
+    def test_select_document_without_jamb_raises(self):
+        """--jamb-select-document without --jamb is a usage error."""
+        from types import SimpleNamespace
+
+        from jamb.pytest_plugin.plugin import pytest_configure
+
+        config = SimpleNamespace(option=SimpleNamespace(jamb=False, jamb_select=None, jamb_select_document="SRS"))
+
+        with pytest.raises(pytest.UsageError, match="require --jamb"):
+            pytest_configure(config)
+
+    def test_select_nodeids_without_jamb_raises(self):
+        """--jamb-select-nodeids without --jamb is a usage error."""
+        from types import SimpleNamespace
+
+        from jamb.pytest_plugin.plugin import pytest_configure
+
+        config = SimpleNamespace(
+            option=SimpleNamespace(
+                jamb=False, jamb_select=None, jamb_select_document=None, jamb_select_nodeids="plan.txt"
+            )
+        )
+
+        with pytest.raises(pytest.UsageError, match="require --jamb"):
+            pytest_configure(config)
+
+
 class TestXdistGuard:
     """Tests for the pytest-xdist guard in pytest_configure.
 
@@ -172,6 +234,12 @@ class TestXdistGuard:
 
         mock_config = MagicMock()
         mock_config.option.jamb = False
+        mock_config.option.jamb_select = None
+        mock_config.option.jamb_select_document = None
+        mock_config.option.jamb_affected_since = None
+        mock_config.option.jamb_rerun_failed_requirements = None
+        mock_config.option.jamb_fail_uncovered_early = None
+        mock_config.option.jamb_select_nodeids = None
         mock_config.option.dist = "load"
 
         # Should not raise; jamb is off so the collector is never created.
@@ -225,6 +293,29 @@ class TestPytestSessionfinish:
         )
         mock_collector.generate_trace_matrix.assert_not_called()
 
+    def test_update_merges_previous_coverage_before_saving(self, mock_session, mock_collector):
+        """Test that --jamb-update merges the previous .jamb before writing outputs."""
+        from jamb.pytest_plugin.plugin import pytest_sessionfinish
+
+        mock_session.config.option.jamb_update = True
+        mock_session.config.pluginmanager.get_plugin.return_value = mock_collector
+
+        pytest_sessionfinish(mock_session, 0)
+
+        mock_collector.merge_previous_coverage.assert_called_once_with()
+        call_names = [c[0] for c in mock_collector.method_calls]
+        assert call_names.index("merge_previous_coverage") < call_names.index("save_coverage_file")
+
+    def test_no_merge_without_update_flag(self, mock_session, mock_collector):
+        """Test that the previous .jamb is ignored without --jamb-update."""
+        from jamb.pytest_plugin.plugin import pytest_sessionfinish
+
+        mock_session.config.pluginmanager.get_plugin.return_value = mock_collector
+
+        pytest_sessionfinish(mock_session, 0)
+
+        mock_collector.merge_previous_coverage.assert_not_called()
+
     def test_fails_when_uncovered_and_flag_set(self, mock_session, mock_collector):
         """Test that exit status is 1 when uncovered items and flag is set."""
         from jamb.pytest_plugin.plugin import pytest_sessionfinish
@@ -511,7 +602,7 @@ class TestPytestTerminalSummary:
         mock_config.option.jamb = True
 
         mock_collector = MagicMock()
-        mock_collector.get_coverage.return_value = {}
+        mock_collector.coverage_snapshot.return_value = CoverageSnapshot.from_coverage({})
         mock_config.pluginmanager.get_plugin.return_value = mock_collector
 
         pytest_terminal_summary(mock_terminal, 0, mock_config)
@@ -556,7 +647,7 @@ class TestPytestTerminalSummaryCoverage:
         cov1.item = item1
 
         mock_collector = MagicMock()
-        mock_collector.get_coverage.return_value = {"SRS001": cov1}
+        mock_collector.coverage_snapshot.return_value = CoverageSnapshot.from_coverage({"SRS001": cov1})
         mock_collector.unknown_items = set()
         mock_config.pluginmanager.get_plugin.return_value = mock_collector
 
@@ -586,7 +677,7 @@ class TestPytestTerminalSummaryCoverage:
         cov1.item = item1
 
         mock_collector = MagicMock()
-        mock_collector.get_coverage.return_value = {"SRS001": cov1}
+        mock_collector.coverage_snapshot.return_value = CoverageSnapshot.from_coverage({"SRS001": cov1})
         mock_collector.unknown_items = set()
         mock_config.pluginmanager.get_plugin.return_value = mock_collector
 
@@ -617,7 +708,7 @@ class TestPytestTerminalSummaryCoverage:
         cov1.item = item1
 
         mock_collector = MagicMock()
-        mock_collector.get_coverage.return_value = {"SRS001": cov1}
+        mock_collector.coverage_snapshot.return_value = CoverageSnapshot.from_coverage({"SRS001": cov1})
         mock_collector.unknown_items = {"UNKNOWN001", "UNKNOWN002"}
         mock_config.pluginmanager.get_plugin.return_value = mock_collector
 
@@ -659,7 +750,7 @@ class TestPytestTerminalSummaryCoverage:
         cov2.item = item2
 
         mock_collector = MagicMock()
-        mock_collector.get_coverage.return_value = {"SRS001": cov1, "SRS002": cov2}
+        mock_collector.coverage_snapshot.return_value = CoverageSnapshot.from_coverage({"SRS001": cov1, "SRS002": cov2})
         mock_collector.unknown_items = set()
         mock_config.pluginmanager.get_plugin.return_value = mock_collector
 
@@ -714,7 +805,7 @@ class TestPytestTerminalSummaryNonTestable:
         cov2.item = item2
 
         mock_collector = MagicMock()
-        mock_collector.get_coverage.return_value = {"SRS001": cov1, "SRS002": cov2}
+        mock_collector.coverage_snapshot.return_value = CoverageSnapshot.from_coverage({"SRS001": cov1, "SRS002": cov2})
         mock_collector.unknown_items = set()
         mock_config.pluginmanager.get_plugin.return_value = mock_collector
 
@@ -750,7 +841,7 @@ class TestPytestTerminalSummaryNonTestable:
         cov1.item = item1
 
         mock_collector = MagicMock()
-        mock_collector.get_coverage.return_value = {"SRS001": cov1}
+        mock_collector.coverage_snapshot.return_value = CoverageSnapshot.from_coverage({"SRS001": cov1})
         mock_collector.unknown_items = set()
         mock_config.pluginmanager.get_plugin.return_value = mock_collector
 
@@ -784,7 +875,7 @@ class TestPytestTerminalSummaryNonTestable:
         cov1.item = item1
 
         mock_collector = MagicMock()
-        mock_collector.get_coverage.return_value = {"SRS001": cov1}
+        mock_collector.coverage_snapshot.return_value = CoverageSnapshot.from_coverage({"SRS001": cov1})
         mock_collector.unknown_items = set()
         mock_config.pluginmanager.get_plugin.return_value = mock_collector
 
@@ -818,7 +909,7 @@ class TestPytestTerminalSummaryNonTestable:
         cov1.item = item1
 
         mock_collector = MagicMock()
-        mock_collector.get_coverage.return_value = {"SRS001": cov1}
+        mock_collector.coverage_snapshot.return_value = CoverageSnapshot.from_coverage({"SRS001": cov1})
         mock_collector.unknown_items = set()
         mock_config.pluginmanager.get_plugin.return_value = mock_collector
 
@@ -852,7 +943,7 @@ class TestPytestTerminalSummaryNonTestable:
         cov1.item = item1
 
         mock_collector = MagicMock()
-        mock_collector.get_coverage.return_value = {"SRS001": cov1}
+        mock_collector.coverage_snapshot.return_value = CoverageSnapshot.from_coverage({"SRS001": cov1})
         mock_collector.unknown_items = set()
         mock_config.pluginmanager.get_plugin.return_value = mock_collector
 
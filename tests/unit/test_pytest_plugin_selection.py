@@ -0,0 +1,92 @@
+"""Unit tests for requirement-scoped test selection."""
+
+import pytest
+
+from jamb.core.models import Item, ItemCoverage, LinkedTest, TraceabilityGraph
+from jamb.pytest_plugin.selection import (
+    expand_requirement_selection,
+    failed_requirement_selection,
+    split_option_list,
+)
+
+
+@pytest.fixture
+def graph():
+    """SYS -> SRS graph with two system requirements."""
+    g = TraceabilityGraph()
+    g.set_document_parents("SYS", [])
+    g.set_document_parents("SRS", ["SYS"])
+    g.add_item(Item(uid="SYS001", text="Sys one", document_prefix="SYS"))
+    g.add_item(Item(uid="SYS012", text="Sys twelve", document_prefix="SYS"))
+    g.add_item(Item(uid="SRS001", text="Sw one", document_prefix="SRS", links=["SYS001"]))
+    g.add_item(Item(uid="SRS002", text="Sw two", document_prefix="SRS", links=["SYS012"]))
+    g.add_item(Item(uid="SRS003", text="Sw three", document_prefix="SRS", links=["SYS012"]))
+    return g
+
+
+class TestSplitOptionList:
+    """Tests for split_option_list."""
+
+    def test_none_and_empty(self):
+        """Missing or empty values produce no entries."""
+        assert split_option_list(None) == []
+        assert split_option_list("") == []
+
+    def test_strips_and_drops_blanks(self):
+        """Whitespace is stripped and empty entries dropped."""
+        assert split_option_list(" SYS012 , ,SRS0*") == ["SYS012", "SRS0*"]
+
+
+class TestExpandRequirementSelection:
+    """Tests for expand_requirement_selection."""
+
+    def test_uid_includes_descendants(self, graph):
+        """Selecting a UID selects it and everything beneath it."""
+        assert expand_requirement_selection(graph, ["SYS012"]) == {"SYS012", "SRS002", "SRS003"}
+
+    def test_glob_matches_uids(self, graph):
+        """Glob patterns are matched against graph UIDs."""
+        assert expand_requirement_selection(graph, ["SRS00[12]"]) == {"SRS001", "SRS002"}
+
+    def test_document_selects_all_items(self, graph):
+        """A document prefix selects all of its items and their descendants."""
+        assert expand_requirement_selection(graph, documents=["SYS"]) == set(graph.items)
+
+    def test_unmatched_pattern_raises(self, graph):
+        """A pattern that matches nothing is reported."""
+        with pytest.raises(ValueError, match="matched no items"):
+            expand_requirement_selection(graph, ["HAZ*"])
+
+    def test_unknown_document_raises(self, graph):
+        """An unknown document prefix is reported."""
+        with pytest.raises(ValueError, match="Unknown document 'HAZ'"):
+            expand_requirement_selection(graph, documents=["HAZ"])
+
+
+class TestFailedRequirementSelection:
+    """Tests for failed_requirement_selection."""
+
+    @staticmethod
+    def _coverage(graph, outcomes):
+        return {
+            uid: ItemCoverage(
+                graph.items[uid],
+                [LinkedTest(f"test_{uid}_{i}", uid, test_outcome=o) for i, o in enumerate(results)],
+            )
+            for uid, results in outcomes.items()
+        }
+
+    def test_failed_item_includes_descendants(self, graph):
+        """A failed system requirement selects everything beneath it."""
+        coverage = self._coverage(graph, {"SYS012": ["failed"], "SRS001": ["passed"]})
+        assert failed_requirement_selection(graph, coverage) == {"SYS012", "SRS002", "SRS003"}
+
+    def test_partial_items_are_selected(self, graph):
+        """Items with both passing and failing tests are selected."""
+        coverage = self._coverage(graph, {"SRS001": ["passed", "error"], "SRS002": ["passed"]})
+        assert failed_requirement_selection(graph, coverage) == {"SRS001"}
+
+    def test_passed_skipped_and_uncovered_are_not_selected(self, graph):
+        """Passed, skipped and uncovered items need no rerun."""
+        coverage = self._coverage(graph, {"SRS001": ["passed"], "SRS002": ["skipped"], "SRS003": []})
+        assert failed_requirement_selection(graph, coverage) == set()
@@ -0,0 +1,71 @@
+"""Tests for jamb.storage.attribute_schema module."""
+
+import datetime
+
+import pytest
+
+from jamb.storage.attribute_schema import compile_attribute_schema
+
+
+def _messages(schema, attributes):
+    return [m for check in compile_attribute_schema(schema) if (m := check(attributes)) is not None]
+
+
+class TestCompileAttributeSchema:
+    def test_valid_attributes_pass(self):
+        schema = {
+            "safety_class": {"type": "str", "enum": ["A", "B", "C"], "required": True},
+            "owner": {"pattern": "^[a-z]+$"},
+            "risk": {"type": "int"},
+        }
+        assert _messages(schema, {"safety_class": "B", "owner": "alice", "risk": 3}) == []
+
+    def test_missing_required(self):
+        schema = {"safety_class": {"required": True}, "owner": {}}
+        assert _messages(schema, {}) == ["missing required attribute 'safety_class'"]
+        assert _messages(schema, {"safety_class": None}) == ["missing required attribute 'safety_class'"]
+
+    def test_wrong_type(self):
+        assert _messages({"risk": {"type": "int"}}, {"risk": "high"}) == [
+            "attribute 'risk' must be of type int, got str: 'high'"
+        ]
+
+    def test_bool_is_not_a_number(self):
+        assert _messages({"risk": {"type": "int"}}, {"risk": True})
+        assert not _messages({"flag": {"type": "bool"}}, {"flag": False})
+
+    def test_float_accepts_int(self):
+        assert not _messages({"weight": {"type": "float"}}, {"weight": 2})
+
+    def test_date(self):
+        schema = {"due": {"type": "date"}}
+        assert not _messages(schema, {"due": datetime.date(2026, 1, 31)})
+        assert _messages(schema, {"due": datetime.datetime(2026, 1, 31, 12, 0)})
+        assert _messages(schema, {"due": "2026-01-31"})
+
+    def test_enum(self):
+        assert _messages({"safety_class": {"enum": ["A", "B", "C"]}}, {"safety_class": "D"}) == [
+            "attribute 'safety_class' must be one of A, B, C, got 'D'"
+        ]
+
+    def test_pattern(self):
+        schema = {"owner": {"pattern": "^[a-z]+$"}}
+        assert _messages(schema, {"owner": "Alice"}) == ["attribute 'owner' does not match pattern '^[a-z]+$': 'Alice'"]
+        assert _messages(schema, {"owner": 42})
+
+    @pytest.mark.parametrize(
+        ("schema", "match"),
+        [
+            (["safety_class"], "expected a mapping of attribute names"),
+            ({"x": "str"}, "attribute 'x': expected a mapping"),
+            ({"x": {"kind": "str"}}, "unknown keys kind"),
+            ({"x": {"type": "string"}}, "unknown type 'string'"),
+            ({"x": {"type": ["str"]}}, "unknown type"),
+            ({"x": {"enum": "A"}}, "'enum' must be a list"),
+            ({"x": {"required": "yes"}}, "'required' must be true or false"),
+            ({"x": {"pattern": "("}}, "invalid pattern"),
+        ],
+    )
+    def test_malformed_schema_raises(self, schema, match):
+        with pytest.raises(ValueError, match=match):
+            compile_attribute_schema(schema)
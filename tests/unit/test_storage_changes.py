@@ -0,0 +1,409 @@
+"""Unit tests for git-based change detection."""
+
+import os
+import subprocess
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from jamb.cli.commands import cli
+from jamb.core.models import Item, ItemCoverage, LinkedTest, TraceabilityGraph
+from jamb.coverage.serializer import save_coverage
+from jamb.storage.changes import ChangeSet, classify_changes, git_changed_files, git_staged_files, suspect_impact
+from jamb.storage.document_config import DocumentConfig
+from jamb.storage.document_dag import DocumentDAG
+from jamb.storage.items import compute_content_hash
+
+
+def _git(cwd: Path, *args: str) -> None:
+    subprocess.run(
+        ["git", "-c", "user.name=Test", "-c", "user.email=test@example.com", *args],
+        cwd=cwd,
+        check=True,
+        capture_output=True,
+    )
+
+
+def _dag(tmp_path: Path) -> DocumentDAG:
+    return DocumentDAG(
+        documents={
+            "SYS": DocumentConfig(prefix="SYS"),
+            "SRS": DocumentConfig(prefix="SRS", parents=["SYS"], sep="-"),
+        },
+        document_paths={"SYS": tmp_path / "sys", "SRS": tmp_path / "srs"},
+    )
+
+
+def _graph() -> TraceabilityGraph:
+    graph = TraceabilityGraph()
+    graph.set_document_parents("SYS", [])
+    graph.set_document_parents("SRS", ["SYS"])
+    graph.add_item(Item(uid="SYS001", text="System", document_prefix="SYS"))
+    graph.add_item(Item(uid="SYS002", text="Other system", document_prefix="SYS"))
+    graph.add_item(Item(uid="SRS-001", text="Software", document_prefix="SRS", links=["SYS001"]))
+    graph.add_item(Item(uid="SRS-002", text="Other software", document_prefix="SRS", links=["SYS002"]))
+    return graph
+
+
+@pytest.fixture
+def git_repo(tmp_path: Path) -> Path:
+    """A git repository with one committed file."""
+    _git(tmp_path, "init", "-q")
+    (tmp_path / "committed.txt").write_text("v1\n")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-q", "-m", "initial")
+    return tmp_path
+
+
+class TestClassifyChanges:
+    """Tests for mapping changed paths to items and documents."""
+
+    def test_item_files_map_to_uids(self, tmp_path: Path):
+        """Item YAML files in a document directory map to their UID."""
+        changes = classify_changes([tmp_path / "sys" / "SYS001.yml", tmp_path / "srs" / "SRS-002.yml"], _dag(tmp_path))
+
+        assert changes.item_uids == {"SYS001", "SRS-002"}
+        assert changes.documents == set()
+
+    def test_document_config_maps_to_document(self, tmp_path: Path):
+        """A changed .jamb.yml marks the whole document as changed."""
+        changes = classify_changes([tmp_path / "srs" / ".jamb.yml"], _dag(tmp_path))
+
+        assert changes.documents == {"SRS"}
+
+    def test_python_files_are_collected(self, tmp_path: Path):
+        """Every .py file is recorded regardless of location."""
+        changes = classify_changes([tmp_path / "tests" / "test_a.py"], _dag(tmp_path))
+
+        assert changes.python_files == {tmp_path / "tests" / "test_a.py"}
+
+    def test_unrelated_files_are_ignored(self, tmp_path: Path):
+        """YAML that is not an item file, or lives elsewhere, is ignored."""
+        changes = classify_changes(
+            [tmp_path / "sys" / "notes.yml", tmp_path / "other" / "SYS001.yml", tmp_path / "README.md"],
+            _dag(tmp_path),
+        )
+
+        assert changes == ChangeSet()
+
+
+class TestChangeSet:
+    """Tests for ChangeSet queries."""
+
+    def test_affected_uids_include_descendants(self):
+        """A changed parent affects its children but not its siblings."""
+        assert ChangeSet(item_uids={"SYS001"}).affected_uids(_graph()) == {"SYS001", "SRS-001"}
+
+    def test_changed_document_affects_all_items(self):
+        """A changed document config affects every item in it."""
+        assert ChangeSet(documents={"SRS"}).affected_uids(_graph()) == {"SRS-001", "SRS-002"}
+
+    def test_touches_changed_test_file(self, tmp_path: Path):
+        """A changed test module is touched."""
+        test_file = tmp_path / "tests" / "test_a.py"
+        changes = ChangeSet(python_files={test_file.resolve()})
+
+        assert changes.touches_test_file(test_file)
+        assert not changes.touches_test_file(tmp_path / "tests" / "test_b.py")
+
+    def test_touches_via_parent_conftest(self, tmp_path: Path):
+        """A changed conftest.py touches every test module beneath it."""
+        changes = ChangeSet(python_files={(tmp_path / "tests" / "conftest.py").resolve()})
+
+        assert changes.touches_test_file(tmp_path / "tests" / "unit" / "test_a.py")
+        assert not changes.touches_test_file(tmp_path / "other" / "test_a.py")
+
+
+def _hash(item: Item) -> str:
+    return compute_content_hash({"text": item.text, "header": item.header, "links": item.links, "type": item.type})
+
+
+class TestSuspectImpact:
+    """Tests for the downstream impact of suspect links."""
+
+    def _graph(self) -> TraceabilityGraph:
+        graph = TraceabilityGraph()
+        graph.add_item(Item(uid="UN001", text="Need", document_prefix="UN"))
+        graph.add_item(Item(uid="UN002", text="Other need", document_prefix="UN"))
+        graph.add_item(Item(uid="SYS001", text="System", document_prefix="SYS", links=["UN001", "UN002"]))
+        graph.add_item(Item(uid="SRS001", text="Software", document_prefix="SRS", links=["SYS001"]))
+        graph.add_item(Item(uid="SRS002", text="Other software", document_prefix="SRS", links=["SYS001"]))
+        for uid in ("SYS001", "SRS001", "SRS002"):
+            item = graph.items[uid]
+            item.link_hashes = {link: _hash(graph.items[link]) for link in item.links}
+        return graph
+
+    def test_no_suspect_links(self):
+        """A fully verified tree has no impact."""
+        assert suspect_impact(self._graph()) == []
+
+    def test_changed_root_propagates_by_depth(self):
+        """Descendants of a changed item are listed by distance."""
+        graph = self._graph()
+        graph.items["UN001"].text = "Need, changed"
+
+        impacted = suspect_impact(graph)
+
+        assert [(e.uid, e.depth, e.suspect_links, e.via) for e in impacted] == [
+            ("UN001", 0, [], None),
+            ("SYS001", 1, ["UN001"], "UN001"),
+            ("SRS001", 2, [], "SYS001"),
+            ("SRS002", 2, [], "SYS001"),
+        ]
+
+    def test_nearest_change_wins(self):
+        """An item below several changed items gets its smallest depth."""
+        graph = self._graph()
+        graph.items["UN001"].text = "Need, changed"
+        graph.items["SYS001"].text = "System, changed"
+
+        impacted = {e.uid: e for e in suspect_impact(graph)}
+
+        assert impacted["SYS001"].depth == 0
+        assert impacted["SYS001"].suspect_links == ["UN001"]
+        assert impacted["SRS001"].depth == 1
+        assert impacted["SRS001"].suspect_links == ["SYS001"]
+
+    def test_inactive_items_are_skipped(self):
+        """Inactive items neither propagate nor appear in the impact."""
+        graph = self._graph()
+        graph.items["UN001"].text = "Need, changed"
+        graph.items["SYS001"].active = False
+
+        assert suspect_impact(graph) == []
+
+
+class TestGitChangedFiles:
+    """Tests for listing changed files with git."""
+
+    def test_reports_modified_and_untracked_files(self, git_repo: Path):
+        """Unstaged edits and untracked files are both reported."""
+        (git_repo / "committed.txt").write_text("v2\n")
+        (git_repo / "new.txt").write_text("new\n")
+
+        changed = git_changed_files("HEAD", git_repo)
+
+        assert set(changed) == {(git_repo / "committed.txt").resolve(), (git_repo / "new.txt").resolve()}
+
+    def test_unknown_ref_raises(self, git_repo: Path):
+        """An unresolvable ref raises ValueError."""
+        with pytest.raises(ValueError, match="git diff"):
+            git_changed_files("no-such-ref", git_repo)
+
+    def test_outside_repository_raises(self, tmp_path: Path):
+        """A directory outside any repository raises ValueError."""
+        with pytest.raises(ValueError, match="git rev-parse"):
+            git_changed_files("HEAD", tmp_path)
+
+
+class TestGitStagedFiles:
+    """Tests for listing staged files with git."""
+
+    def test_reports_only_staged_files(self, git_repo: Path):
+        """Staged additions and deletions are reported, unstaged edits are not."""
+        (git_repo / "other.txt").write_text("v1\n")
+        _git(git_repo, "add", ".")
+        _git(git_repo, "commit", "-q", "-m", "other")
+        (git_repo / "new.txt").write_text("new\n")
+        _git(git_repo, "add", "new.txt")
+        _git(git_repo, "rm", "-q", "other.txt")
+        (git_repo / "committed.txt").write_text("v2\n")
+
+        staged = git_staged_files(git_repo)
+
+        assert set(staged) == {(git_repo / "new.txt").resolve(), (git_repo / "other.txt").resolve()}
+
+    def test_outside_repository_raises(self, tmp_path: Path):
+        """A directory outside any repository raises ValueError."""
+        with pytest.raises(ValueError, match="git rev-parse"):
+            git_staged_files(tmp_path)
+
+
+class TestImpactCommand:
+    """Tests for the ``jamb impact`` command."""
+
+    @pytest.fixture
+    def project(self, git_repo: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+        """A committed project with two requirements and a .jamb file."""
+        (git_repo / "sys").mkdir()
+        (git_repo / "sys" / ".jamb.yml").write_text("settings:\n  prefix: SYS\n  digits: 3\n")
+        (git_repo / "sys" / "SYS001.yml").write_text("active: true\ntext: System A\n")
+        (git_repo / "sys" / "SYS002.yml").write_text("active: true\ntext: System B\n")
+        (git_repo / "tests").mkdir()
+        (git_repo / "tests" / "test_a.py").write_text("def test_a():\n    pass\n")
+        (git_repo / "tests" / "test_b.py").write_text("def test_b():\n    pass\n")
+        _git(git_repo, "add", ".")
+        _git(git_repo, "commit", "-q", "-m", "project")
+
+        graph = _graph()
+        coverage = {
+            uid: ItemCoverage(item=graph.items[uid], linked_tests=[LinkedTest(nodeid, uid, "passed")])
+            for uid, nodeid in [("SYS001", "tests/test_a.py::test_a"), ("SYS002", "tests/test_b.py::test_b")]
+        }
+        save_coverage(coverage, graph, str(git_repo / ".jamb"))
+        monkeypatch.chdir(git_repo)
+        return git_repo
+
+    def test_prints_tests_for_changed_item(self, project: Path):
+        """Tests tracing to a changed item are listed."""
+        (project / "sys" / "SYS002.yml").write_text("active: true\ntext: System B changed\n")
+
+        result = CliRunner().invoke(cli, ["impact", "HEAD"])
+
+        assert result.exit_code == 0, result.output
+        assert result.stdout.splitlines() == ["tests/test_b.py::test_b"]
+
+    def test_prints_changed_and_new_test_files(self, project: Path):
+        """Changed linked tests and new test modules are listed."""
+        (project / "tests" / "test_a.py").write_text("def test_a():\n    assert True\n")
+        (project / "tests" / "test_new.py").write_text("def test_new():\n    pass\n")
+
+        result = CliRunner().invoke(cli, ["impact", "HEAD"])
+
+        assert result.exit_code == 0, result.output
+        assert result.stdout.splitlines() == ["tests/test_a.py::test_a", os.path.join("tests", "test_new.py")]
+
+    def test_missing_coverage_file_errors(self, project: Path):
+        """Without a .jamb file the command asks for a pytest run."""
+        (project / ".jamb").unlink()
+
+        result = CliRunner().invoke(cli, ["impact", "HEAD"])
+
+        assert result.exit_code == 1
+        assert "pytest --jamb" in result.output
+
+
+class TestImpactSuspectCommand:
+    """Tests for ``jamb impact --suspect``."""
+
+    @pytest.fixture
+    def project(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+        """A verified three-level project whose top item then changes."""
+        (tmp_path / "sys").mkdir()
+        (tmp_path / "sys" / ".jamb.yml").write_text("settings:\n  prefix: SYS\n  digits: 3\n")
+        (tmp_path / "sys" / "SYS001.yml").write_text("active: true\ntext: System A\n")
+        (tmp_path / "srs").mkdir()
+        (tmp_path / "srs" / ".jamb.yml").write_text("settings:\n  prefix: SRS\n  digits: 3\n  parents:\n  - SYS\n")
+        (tmp_path / "srs" / "SRS001.yml").write_text("active: true\ntext: Software A\nlinks:\n- SYS001\n")
+        (tmp_path / "ut").mkdir()
+        (tmp_path / "ut" / ".jamb.yml").write_text("settings:\n  prefix: UT\n  digits: 3\n  parents:\n  - SRS\n")
+        (tmp_path / "ut" / "UT001.yml").write_text("active: true\ntext: Unit A\nlinks:\n- SRS001\n")
+        monkeypatch.chdir(tmp_path)
+        for prefix in ("SRS", "UT"):
+            result = CliRunner().invoke(cli, ["review", "clear", prefix])
+            assert result.exit_code == 0, result.output
+        (tmp_path / "sys" / "SYS001.yml").write_text("active: true\ntext: System A, changed\n")
+        return tmp_path
+
+    def test_lists_downstream_items_by_depth(self, project: Path):
+        """Text output lists each affected item with its depth and reason."""
+        result = CliRunner().invoke(cli, ["impact", "--suspect"])
+
+        assert result.exit_code == 0, result.output
+        assert result.stdout.splitlines() == [
+            "0  SYS:SYS001  changed",
+            "1  SRS:SRS001  suspect link to SYS001",
+            "2  UT:UT001  via SRS001",
+        ]
+
+    def test_json_includes_linked_tests(self, project: Path):
+        """JSON output adds tests from the .jamb file, nearest first."""
+        import json
+
+        graph = TraceabilityGraph()
+        graph.add_item(Item(uid="SRS001", text="Software A", document_prefix="SRS"))
+        graph.add_item(Item(uid="UT001", text="Unit A", document_prefix="UT"))
+        coverage = {
+            uid: ItemCoverage(item=graph.items[uid], linked_tests=[LinkedTest(nodeid, uid, "passed")])
+            for uid, nodeid in [("UT001", "tests/test_unit.py::test_a"), ("SRS001", "tests/test_sw.py::test_a")]
+        }
+        save_coverage(coverage, graph, str(project / ".jamb"))
+
+        result = CliRunner().invoke(cli, ["impact", "--suspect", "--format", "json"])
+
+        assert result.exit_code == 0, result.output
+        data = json.loads(result.stdout)
+        assert [(i["uid"], i["depth"]) for i in data["items"]] == [("SYS001", 0), ("SRS001", 1), ("UT001", 2)]
+        assert data["items"][1]["tests"] == ["tests/test_sw.py::test_a"]
+        assert data["tests"] == ["tests/test_sw.py::test_a", "tests/test_unit.py::test_a"]
+
+    def test_ref_and_suspect_are_exclusive(self, project: Path):
+        """REF cannot be combined with --suspect, and one of them is required."""
+        both = CliRunner().invoke(cli, ["impact", "HEAD", "--suspect"])
+        neither = CliRunner().invoke(cli, ["impact"])
+
+        assert both.exit_code == 1
+        assert "cannot be combined with --suspect" in both.output
+        assert neither.exit_code == 1
+        assert "Missing argument 'REF'" in neither.output
+
+
+class TestValidateStagedCommand:
+    """Tests for ``jamb validate --staged``."""
+
+    @pytest.fixture
+    def project(self, git_repo: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+        """A committed project with a system and a software document."""
+        (git_repo / "sys").mkdir()
+        (git_repo / "sys" / ".jamb.yml").write_text("settings:\n  prefix: SYS\n  digits: 3\n")
+        (git_repo / "sys" / "SYS001.yml").write_text("active: true\ntext: System A\n")
+        (git_repo / "sys" / "SYS002.yml").write_text("active: true\ntext: System B\n")
+        (git_repo / "srs").mkdir()
+        (git_repo / "srs" / ".jamb.yml").write_text("settings:\n  prefix: SRS\n  digits: 3\n  parents:\n  - SYS\n")
+        (git_repo / "srs" / "SRS001.yml").write_text("active: true\ntext: Software A\nlinks:\n- SYS001\n")
+        (git_repo / "srs" / "SRS002.yml").write_text("active: true\ntext: ''\nlinks:\n- SYS002\n")
+        _git(git_repo, "add", ".")
+        _git(git_repo, "commit", "-q", "-m", "project")
+        monkeypatch.chdir(git_repo)
+        return git_repo
+
+    def test_no_staged_items(self, project: Path):
+        """Nothing staged means nothing to check."""
+        result = CliRunner().invoke(cli, ["validate", "--staged"])
+
+        assert result.exit_code == 0, result.output
+        assert "no staged items" in result.output
+
+    def test_checks_staged_item_and_children(self, project: Path):
+        """A staged parent item is checked together with the items linking to it."""
+        (project / "sys" / "SYS001.yml").write_text("active: true\ntext: System A changed\n")
+        _git(project, "add", "sys/SYS001.yml")
+
+        result = CliRunner().invoke(cli, ["validate", "--staged"])
+
+        assert "SYS:SYS001" in result.output
+        assert "SRS:SRS001" in result.output
+        assert "SYS002" not in result.output
+        assert "SRS002" not in result.output
+
+    def test_staged_deletion_breaks_children(self, project: Path):
+        """Children of a staged deleted item report the broken link."""
+        _git(project, "rm", "-q", "sys/SYS002.yml")
+
+        result = CliRunner().invoke(cli, ["validate", "--staged"])
+
+        assert result.exit_code == 1
+        assert "SRS:SRS002 links to non-existent item: SYS002" in result.output
+        assert "SRS:SRS002 has empty text" in result.output
+        assert "SRS001" not in result.output
+
+    def test_staged_config_validates_whole_tree(self, project: Path):
+        """A staged .jamb.yml falls back to a full run."""
+        full = CliRunner().invoke(cli, ["validate"])
+        (project / "srs" / ".jamb.yml").write_text(
+            "settings:\n  prefix: SRS\n  digits: 3\n  parents:\n  - SYS\n  sep: ''\n"
+        )
+        _git(project, "add", "srs/.jamb.yml")
+
+        result = CliRunner().invoke(cli, ["validate", "--staged"])
+
+        assert "validating the whole tree" in result.output
+        assert result.output.splitlines()[1:] == full.output.splitlines()
+
+    def test_staged_with_cache_rejected(self, project: Path):
+        """--staged cannot reuse or update the validation cache."""
+        result = CliRunner().invoke(cli, ["validate", "--staged", "--cache"])
+
+        assert result.exit_code == 1
+        assert "--cache cannot be combined with --staged" in result.output
@@ -44,6 +44,18 @@ class TestLoadDocumentConfig:
         with pytest.raises(ValueError, match="Invalid config"):
             load_document_config(config_path)
 
+    def test_loads_attribute_schema(self, tmp_path):
+        config_path = tmp_path / ".jamb.yml"
+        config_path.write_text("settings:\n  prefix: SRS\nattributes:\n  safety_class:\n    enum: [A, B, C]\n")
+        config = load_document_config(config_path)
+        assert config.attributes == {"safety_class": {"enum": ["A", "B", "C"]}}
+
+    def test_raises_on_non_mapping_attributes(self, tmp_path):
+        config_path = tmp_path / ".jamb.yml"
+        config_path.write_text("settings:\n  prefix: SRS\nattributes:\n- safety_class\n")
+        with pytest.raises(ValueError, match="'attributes' must be a mapping"):
+            load_document_config(config_path)
+
     def test_raises_on_missing_prefix(self, tmp_path):
         config_path = tmp_path / ".jamb.yml"
         config_path.write_text("settings:\n  digits: 3\n")
@@ -82,3 +94,8 @@ class TestSaveDocumentConfig:
         assert loaded.prefix == original.prefix
         assert loaded.parents == original.parents
         assert loaded.digits == original.digits
+
+    def test_roundtrip_attribute_schema(self, tmp_path):
+        original = DocumentConfig(prefix="SRS", attributes={"risk": {"type": "int", "required": True}})
+        save_document_config(original, tmp_path)
+        assert load_document_config(tmp_path / ".jamb.yml").attributes == original.attributes
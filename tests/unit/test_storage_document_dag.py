@@ -107,6 +107,19 @@ class TestDocumentDAG:
         for node in ["A", "B", "C"]:
             assert node in errors[0]
 
+    def test_validate_acyclic_reports_every_cycle(self):
+        """Each cycle gets its own error with a chain of parent references."""
+        dag = DocumentDAG()
+        dag.documents["A"] = DocumentConfig(prefix="A", parents=["B"])
+        dag.documents["B"] = DocumentConfig(prefix="B", parents=["A"])
+        dag.documents["C"] = DocumentConfig(prefix="C", parents=["A"])
+        dag.documents["D"] = DocumentConfig(prefix="D", parents=["D"])
+        errors = dag.validate_acyclic()
+        assert errors == [
+            "Cycle detected among documents: A, B (parents: A -> B -> A)",
+            "Cycle detected among documents: D (parents: D -> D)",
+        ]
+
     def test_get_leaf_documents_all_parents(self):
         """Mutual parent cycle means no leaves; assert empty list."""
         dag = DocumentDAG()
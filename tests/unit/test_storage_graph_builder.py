@@ -4,7 +4,7 @@ import yaml
 
 from jamb.storage.document_config import DocumentConfig
 from jamb.storage.document_dag import DocumentDAG
-from jamb.storage.graph_builder import build_traceability_graph
+from jamb.storage.graph_builder import build_link_closure_graph, build_traceability_graph, index_item_files
 
 
 class TestBuildTraceabilityGraph:
@@ -150,3 +150,56 @@ class TestBuildTraceabilityGraph:
         assert "SRS001" not in graph.items
         # Document parents for SYS should be set
         assert "SYS" in graph.document_parents
+
+
+class TestBuildLinkClosureGraph:
+    def _setup_docs(self, tmp_path):
+        dag = DocumentDAG()
+        for prefix, parents in (("SYS", []), ("SRS", ["SYS"]), ("UT", ["SRS"])):
+            doc_dir = tmp_path / prefix.lower()
+            doc_dir.mkdir()
+            dag.documents[prefix] = DocumentConfig(prefix=prefix, parents=parents)
+            dag.document_paths[prefix] = doc_dir
+        (tmp_path / "sys" / "SYS001.yml").write_text("active: true\ntext: System A\n")
+        (tmp_path / "sys" / "SYS002.yml").write_text("active: true\ntext: System B\n")
+        (tmp_path / "srs" / "SRS001.yml").write_text("active: true\ntext: Software\nlinks:\n- SYS001\n- SYS002\n")
+        (tmp_path / "srs" / "SRS002.yml").write_text("active: true\ntext: Mentions SYS001 only in text\n")
+        (tmp_path / "srs" / "SRS003.yml").write_text("active: true\ntext: Other\nlinks:\n- SYS002\n")
+        (tmp_path / "ut" / "UT001.yml").write_text("active: true\ntext: Unit\nlinks:\n- SRS001\n")
+        return dag
+
+    def test_index_lists_files_without_reading_them(self, tmp_path):
+        dag = self._setup_docs(tmp_path)
+        (tmp_path / "srs" / "SRS004.yml").write_text("text: [unclosed\n")
+
+        index = index_item_files(dag)
+
+        assert index["SRS004"] == ("SRS", tmp_path / "srs" / "SRS004.yml")
+        assert len(index) == 7
+
+    def test_loads_children_and_link_targets(self, tmp_path):
+        dag = self._setup_docs(tmp_path)
+
+        graph, checked = build_link_closure_graph(dag, ["SYS001"])
+
+        assert checked == ["SYS001", "SRS001"]
+        # SYS002 is a link target of the child, UT001 is not loaded
+        assert set(graph.items) == {"SYS001", "SRS001", "SYS002"}
+        assert graph.document_parents["SRS"] == ["SYS"]
+
+    def test_missing_item_still_loads_children(self, tmp_path):
+        dag = self._setup_docs(tmp_path)
+        (tmp_path / "sys" / "SYS002.yml").unlink()
+
+        graph, checked = build_link_closure_graph(dag, ["SYS002"])
+
+        assert checked == ["SRS001", "SRS003"]
+        assert "SYS002" not in graph.items
+
+    def test_similar_uids_are_not_children(self, tmp_path):
+        dag = self._setup_docs(tmp_path)
+        (tmp_path / "srs" / "SRS005.yml").write_text("active: true\ntext: Near miss\nlinks:\n- SYS0010\n")
+
+        _, checked = build_link_closure_graph(dag, ["SYS001"])
+
+        assert "SRS005" not in checked
@@ -0,0 +1,67 @@
+"""Tests for jamb.storage.parallel module."""
+
+import warnings
+
+import pytest
+
+from jamb.storage.parallel import run_in_pool, shard_by_document
+
+
+def _square_warning_on_odd(n):
+    if n % 2:
+        warnings.warn(f"odd {n}", UserWarning, stacklevel=1)
+    return n * n
+
+
+def _fail_on_three(n):
+    if n == 3:
+        raise ValueError("three")
+    warnings.warn(f"task {n}", UserWarning, stacklevel=1)
+    return n
+
+
+_offset = 0
+
+
+def _set_offset(offset):
+    global _offset
+    _offset = offset
+
+
+def _add_offset(n):
+    return n + _offset
+
+
+class TestShardByDocument:
+    def test_small_documents_are_one_shard_each(self):
+        shards = shard_by_document([("A", [1]), ("B", [2, 3]), ("C", [])], jobs=1)
+        assert shards == [("A", [1]), ("B", [2]), ("B", [3])]
+
+    def test_shards_never_span_documents_and_keep_order(self):
+        documents = [("A", list(range(10))), ("B", list(range(10, 13)))]
+        shards = shard_by_document(documents, jobs=2)
+        assert all(len(entries) <= 2 for _, entries in shards)
+        assert [e for _, entries in shards for e in entries] == list(range(13))
+        assert [prefix for prefix, _ in shards] == ["A"] * 5 + ["B"] * 2
+
+    def test_no_entries(self):
+        assert shard_by_document([("A", [])], jobs=4) == []
+
+
+class TestRunInPool:
+    def test_results_and_warnings_in_task_order(self):
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            results = run_in_pool(_square_warning_on_odd, list(range(8)), jobs=2)
+        assert results == [n * n for n in range(8)]
+        assert [str(w.message) for w in caught] == ["odd 1", "odd 3", "odd 5", "odd 7"]
+
+    def test_first_exception_raised_after_earlier_warnings(self):
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            with pytest.raises(ValueError, match="three"):
+                run_in_pool(_fail_on_three, [1, 2, 3, 4], jobs=2)
+        assert [str(w.message) for w in caught][:2] == ["task 1", "task 2"]
+
+    def test_initializer_sets_worker_state(self):
+        assert run_in_pool(_add_offset, [1, 2], jobs=2, initializer=_set_offset, initargs=(10,)) == [11, 12]
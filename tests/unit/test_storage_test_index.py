@@ -0,0 +1,236 @@
+"""Tests for jamb.storage.test_index module."""
+
+import json
+import os
+
+from jamb.storage.test_index import INDEX_VERSION, FunctionSpan, ReferenceIndex, index_source
+from jamb.storage.test_references import find_test_references, remove_test_reference
+
+SOURCE = """\
+import pytest
+
+
+@pytest.mark.tc_id("TC007")
+@pytest.mark.requirement("SRS001", "SRS002")
+def test_one():
+    pass
+
+
+class TestGroup:
+    @pytest.mark.requirement(uid="SRS003")
+    def test_two(self):
+        pass
+
+    def helper(self):
+        pass
+"""
+
+
+def _touch(path, text):
+    """Rewrite *path* and move its mtime forward so the change is detected."""
+    stat = path.stat()
+    path.write_text(text)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def _write_tests(tmp_path, count=3):
+    for i in range(1, count + 1):
+        (tmp_path / f"test_{i}.py").write_text(f"@pytest.mark.requirement('SRS00{i}')\ndef test_{i}():\n    pass\n")
+
+
+class TestIndexSource:
+    def test_records_references_with_enclosing_function(self, tmp_path):
+        indexed = index_source(SOURCE, tmp_path / "test_x.py")
+        assert indexed.error is None
+        assert sorted((line, uid, name) for line, _, _, uid, name in indexed.references) == [
+            (5, "SRS001", "test_one"),
+            (5, "SRS002", "test_one"),
+            (11, "SRS003", "test_two"),
+        ]
+
+    def test_records_decorator_inclusive_function_spans(self, tmp_path):
+        indexed = index_source(SOURCE, tmp_path / "test_x.py")
+        spans = {span.name: span for span in indexed.functions}
+        assert spans["test_one"] == FunctionSpan("test_one", 4, 7, 0, "TC007")
+        assert spans["test_two"] == FunctionSpan("test_two", 11, 13, 4, None)
+        assert spans["helper"] == FunctionSpan("helper", 15, 16, 4, None)
+
+    def test_references_belong_to_innermost_function(self, tmp_path):
+        source = """\
+def outer():
+    @requirement("SRS001")
+    def inner():
+        requirement("SRS002")
+
+    requirement("SRS003")
+
+
+requirement("SRS004")
+
+
+@requirement(
+    "SRS005",
+)
+def last():
+    pass
+"""
+        indexed = index_source(source, tmp_path / "test_x.py")
+        assert {uid: name for _, _, _, uid, name in indexed.references} == {
+            "SRS001": "inner",
+            "SRS002": "inner",
+            "SRS003": "outer",
+            "SRS004": None,
+            "SRS005": "last",
+        }
+
+    def test_tc_id_marker_without_string_argument(self, tmp_path):
+        indexed = index_source("@pytest.mark.tc_id(ID)\ndef test_a():\n    pass\n", tmp_path / "test_x.py")
+        assert indexed.functions[0].tc_id == ""
+
+
+class TestReferenceIndex:
+    def test_second_run_reuses_unchanged_files(self, tmp_path):
+        _write_tests(tmp_path)
+        cache_path = tmp_path / ".jamb-cache" / "test-references.json"
+
+        first = ReferenceIndex.load(cache_path)
+        assert len(first.scan(tmp_path)) == 3
+        first.save()
+        assert first.files_parsed == 3
+
+        second = ReferenceIndex.load(cache_path)
+        indexed = second.scan(tmp_path)
+        assert second.files_parsed == 0
+        assert second.files_reused == 3
+        assert {ref[3] for entry in indexed for ref in entry.references} == {"SRS001", "SRS002", "SRS003"}
+
+    def test_changed_file_is_parsed_again(self, tmp_path):
+        _write_tests(tmp_path)
+        cache_path = tmp_path / "cache.json"
+        first = ReferenceIndex.load(cache_path)
+        first.scan(tmp_path)
+        first.save()
+
+        _touch(tmp_path / "test_2.py", "@pytest.mark.requirement('SRS009')\ndef test_2():\n    pass\n")
+        second = ReferenceIndex.load(cache_path)
+        uids = {ref[3] for entry in second.scan(tmp_path) for ref in entry.references}
+        assert second.files_parsed == 1
+        assert second.files_reused == 2
+        assert uids == {"SRS001", "SRS009", "SRS003"}
+
+    def test_touched_file_with_same_content_is_reused(self, tmp_path):
+        _write_tests(tmp_path, count=1)
+        cache_path = tmp_path / "cache.json"
+        first = ReferenceIndex.load(cache_path)
+        first.scan(tmp_path)
+        first.save()
+
+        test_file = tmp_path / "test_1.py"
+        _touch(test_file, test_file.read_text())
+        second = ReferenceIndex.load(cache_path)
+        second.scan(tmp_path)
+        second.save()
+        assert second.files_parsed == 0
+        assert second.files_reused == 1
+
+        # The new modification time is recorded
+        third = ReferenceIndex.load(cache_path)
+        third.scan(tmp_path)
+        assert third.files_reused == 1
+
+    def test_syntax_error_is_cached(self, tmp_path):
+        (tmp_path / "test_bad.py").write_text("def broken(\n")
+        cache_path = tmp_path / "cache.json"
+        first = ReferenceIndex.load(cache_path)
+        [indexed] = first.scan(tmp_path)
+        assert indexed.error.startswith("syntax error:")
+        first.save()
+
+        second = ReferenceIndex.load(cache_path)
+        [indexed] = second.scan(tmp_path)
+        assert second.files_reused == 1
+        assert indexed.error.startswith("syntax error:")
+        assert indexed.references == []
+
+    def test_encoding_error(self, tmp_path):
+        (tmp_path / "test_bad.py").write_bytes(b"\x80\x81\x82")
+        [indexed] = ReferenceIndex().scan(tmp_path)
+        assert indexed.error.startswith("encoding error:")
+
+    def test_deleted_files_are_dropped_on_save(self, tmp_path):
+        _write_tests(tmp_path, count=2)
+        cache_path = tmp_path / "cache.json"
+        first = ReferenceIndex.load(cache_path)
+        first.scan(tmp_path)
+        first.save()
+
+        (tmp_path / "test_2.py").unlink()
+        second = ReferenceIndex.load(cache_path)
+        second.scan(tmp_path)
+        second.save()
+        files = json.loads(cache_path.read_text())["files"]
+        assert list(files) == [str(tmp_path / "test_1.py")]
+
+    def test_each_file_is_indexed_once_per_run(self, tmp_path):
+        _write_tests(tmp_path, count=2)
+        index = ReferenceIndex()
+        index.scan(tmp_path)
+        index.scan(tmp_path)
+        assert index.files_parsed == 2
+
+    def test_discard_indexes_file_again(self, tmp_path):
+        _write_tests(tmp_path, count=1)
+        index = ReferenceIndex()
+        index.scan(tmp_path)
+        test_file = tmp_path / "test_1.py"
+        test_file.write_text("@pytest.mark.requirement('SRS005')\ndef test_1():\n    pass\n")
+        index.discard(test_file)
+        assert index.get(test_file).references[0][3] == "SRS005"
+        assert index.files_parsed == 2
+
+    def test_outdated_or_malformed_cache_is_ignored(self, tmp_path):
+        _write_tests(tmp_path, count=1)
+        cache_path = tmp_path / "cache.json"
+        key = str(tmp_path / "test_1.py")
+
+        cache_path.write_text(json.dumps({"version": INDEX_VERSION + 1, "files": {key: []}}))
+        index = ReferenceIndex.load(cache_path)
+        index.scan(tmp_path)
+        assert index.files_parsed == 1
+
+        stat = (tmp_path / "test_1.py").stat()
+        cache_path.write_text(
+            json.dumps({"version": INDEX_VERSION, "files": {key: [stat.st_mtime_ns, stat.st_size, "", {}]}})
+        )
+        index = ReferenceIndex.load(cache_path)
+        [indexed] = index.scan(tmp_path)
+        assert index.files_parsed == 1
+        assert indexed.references[0][3] == "SRS001"
+
+        cache_path.write_text("not json")
+        index = ReferenceIndex.load(cache_path)
+        index.scan(tmp_path)
+        assert index.files_parsed == 1
+
+    def test_in_memory_index_is_not_saved(self, tmp_path):
+        _write_tests(tmp_path, count=1)
+        index = ReferenceIndex()
+        index.scan(tmp_path)
+        index.save()
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["test_1.py"]
+
+
+class TestSharedIndex:
+    def test_find_then_remove_parses_each_file_once(self, tmp_path):
+        _write_tests(tmp_path)
+        index = ReferenceIndex()
+        refs = find_test_references(tmp_path, "SRS002", index)
+        assert [ref.file.name for ref in refs] == ["test_2.py"]
+
+        changes = remove_test_reference("SRS002", tmp_path, index=index)
+        assert list(changes) == [tmp_path / "test_2.py"]
+        assert index.files_parsed == 3
+
+        # The modified file is indexed again
+        assert find_test_references(tmp_path, "SRS002", index) == []
+        assert index.files_parsed == 4
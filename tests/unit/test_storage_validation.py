@@ -8,7 +8,7 @@ from jamb.core.models import Item, TraceabilityGraph
 from jamb.storage.document_config import DocumentConfig
 from jamb.storage.document_dag import DocumentDAG
 from jamb.storage.items import compute_content_hash
-from jamb.storage.validation import ValidationIssue, validate
+from jamb.storage.validation import ValidationIssue, iter_validate, validate
 
 
 class TestValidationIssue:
@@ -579,6 +579,36 @@ class TestValidate:
         cycle_issues = [i for i in issues if "cycle in item links" in str(i)]
         assert len(cycle_issues) == 2
 
+    def test_overlapping_cycles_reported_once(self):
+        """A -> B -> A and A -> C -> A form one component and one issue."""
+        dag = DocumentDAG()
+        dag.documents["SRS"] = DocumentConfig(prefix="SRS")
+        graph = TraceabilityGraph()
+        for uid, links in [
+            ("SRS001", ["SRS002", "SRS003"]),
+            ("SRS002", ["SRS001"]),
+            ("SRS003", ["SRS001"]),
+        ]:
+            graph.add_item(Item(uid=uid, text=uid, document_prefix="SRS", links=links, reviewed="h"))
+        graph.set_document_parents("SRS", [])
+        issues = validate(
+            dag,
+            graph,
+            check_links=False,
+            check_suspect=False,
+            check_review=False,
+            check_children=False,
+            check_empty_docs=False,
+            check_empty_text=False,
+            check_unlinked=False,
+        )
+        cycle_issues = [i for i in issues if "cycle in item links" in str(i)]
+        assert len(cycle_issues) == 1
+        assert cycle_issues[0].uid == "SRS001"
+        assert cycle_issues[0].message == (
+            "cycle in item links: SRS001 -> SRS002 -> SRS001 (affects: SRS001, SRS002, SRS003)"
+        )
+
     def test_whitespace_tab_text_warning(self):
         """Tab and \\r\\n whitespace-only text triggers empty text warning."""
         dag = DocumentDAG()
@@ -1049,6 +1079,175 @@ class TestValidate:
         assert len(unlinked) == 1
         assert "SRS001" in str(unlinked[0])
 
+    def test_issues_grouped_by_check(self):
+        """Issues come out grouped by check, not by item."""
+        dag = DocumentDAG()
+        dag.documents["SYS"] = DocumentConfig(prefix="SYS")
+        dag.documents["SRS"] = DocumentConfig(prefix="SRS", parents=["SYS"])
+        graph = TraceabilityGraph()
+        graph.set_document_parents("SYS", [])
+        graph.set_document_parents("SRS", ["SYS"])
+        graph.add_item(Item(uid="SRS001", text="", document_prefix="SRS", links=["NOPE1"]))
+        graph.add_item(Item(uid="SRS002", text="", document_prefix="SRS", links=["NOPE2"]))
+
+        issues = validate(dag, graph, check_suspect=False, check_review=False)
+
+        assert [(i.uid, i.message) for i in issues] == [
+            ("SRS001", "links to non-existent item: NOPE1"),
+            ("SRS002", "links to non-existent item: NOPE2"),
+            (None, "document contains no items"),
+            ("SRS001", "has empty text"),
+            ("SRS002", "has empty text"),
+        ]
+
+    def test_suspect_check_uses_loaded_link_hashes(self, tmp_path):
+        """Link hashes loaded with the item are used without rereading its file."""
+        from unittest.mock import patch
+
+        dag = DocumentDAG()
+        dag.documents["SYS"] = DocumentConfig(prefix="SYS")
+        dag.documents["SRS"] = DocumentConfig(prefix="SRS", parents=["SYS"])
+        dag.document_paths["SRS"] = tmp_path / "missing"
+        graph = TraceabilityGraph()
+        graph.add_item(Item(uid="SYS001", text="Target", document_prefix="SYS"))
+        graph.add_item(
+            Item(
+                uid="SRS001",
+                text="Source",
+                document_prefix="SRS",
+                links=["SYS001"],
+                link_hashes={"SYS001": "stale"},
+            )
+        )
+
+        with patch("jamb.storage.validation.read_item") as mock_read:
+            issues = validate(dag, graph, check_review=False, check_children=False)
+
+        mock_read.assert_not_called()
+        assert [str(i) for i in issues if "suspect" in i.message] == [
+            "[WARNING] SRS:SRS001 suspect link to SYS001 (content may have changed; run 'jamb review clear' to re-verify)"
+        ]
+
+
+class TestIterValidate:
+    def _make_dag_and_graph(self):
+        dag = DocumentDAG()
+        dag.documents["SYS"] = DocumentConfig(prefix="SYS")
+        dag.documents["SRS"] = DocumentConfig(prefix="SRS", parents=["SYS"])
+        graph = TraceabilityGraph()
+        graph.set_document_parents("SYS", [])
+        graph.set_document_parents("SRS", ["SYS"])
+        graph.add_item(Item(uid="SRS001", text="", document_prefix="SRS", links=["NOPE1"]))
+        graph.add_item(Item(uid="SRS002", text="", document_prefix="SRS", links=["NOPE2"]))
+        return dag, graph
+
+    def test_issues_in_discovery_order(self):
+        """Per-item issues come item by item, then whole-graph checks."""
+        dag, graph = self._make_dag_and_graph()
+
+        issues = list(iter_validate(dag, graph, check_suspect=False, check_review=False))
+
+        assert [(i.uid, i.message) for i in issues] == [
+            ("SRS001", "links to non-existent item: NOPE1"),
+            ("SRS001", "has empty text"),
+            ("SRS002", "links to non-existent item: NOPE2"),
+            ("SRS002", "has empty text"),
+            (None, "document contains no items"),
+        ]
+
+    def test_same_issues_as_validate(self):
+        dag, graph = self._make_dag_and_graph()
+
+        streamed = list(iter_validate(dag, graph))
+        grouped = validate(dag, graph)
+
+        assert sorted(map(str, streamed)) == sorted(map(str, grouped))
+
+    def test_issues_carry_rule_name(self):
+        dag, graph = self._make_dag_and_graph()
+
+        issues = list(iter_validate(dag, graph, check_suspect=False, check_review=False))
+
+        assert [i.rule for i in issues] == ["links", "empty_text", "links", "empty_text", "empty_documents"]
+        assert {i.rule for i in validate(dag, graph)} >= {"links", "empty_text", "empty_documents"}
+
+    def test_stopping_early_skips_remaining_checks(self):
+        """Closing the generator after the first issue leaves later items unchecked."""
+        from unittest.mock import patch
+
+        dag, graph = self._make_dag_and_graph()
+        issues = iter_validate(dag, graph, check_suspect=False, check_review=False)
+
+        with patch("jamb.storage.validation._EmptyDocumentRule.finish") as mock_finish:
+            first = next(issues)
+            issues.close()
+
+        assert first.uid == "SRS001"
+        mock_finish.assert_not_called()
+
+    def test_only_given_items_are_checked(self):
+        """With uids, only those items get the per-item checks."""
+        dag, graph = self._make_dag_and_graph()
+
+        issues = validate(dag, graph, check_suspect=False, check_review=False, uids=["SRS002"])
+
+        assert [(i.uid, i.message) for i in issues] == [
+            ("SRS002", "links to non-existent item: NOPE2"),
+            ("SRS002", "has empty text"),
+        ]
+
+    def test_uids_with_cache_rejected(self, tmp_path):
+        from jamb.storage.validation_cache import ValidationCache
+
+        dag, graph = self._make_dag_and_graph()
+        with pytest.raises(ValueError, match="only some items"):
+            validate(dag, graph, cache=ValidationCache(tmp_path / "cache.json"), uids=["SRS001"])
+
+    def test_invalid_options_raise_eagerly(self):
+        dag, graph = self._make_dag_and_graph()
+        with pytest.raises(ValueError):
+            iter_validate(dag, graph, cache=object(), jobs=2)
+
+
+class TestAttributeSchema:
+    def _dag_and_graph(self, attributes):
+        dag = DocumentDAG()
+        dag.documents["SRS"] = DocumentConfig(prefix="SRS", attributes=attributes)
+        graph = TraceabilityGraph()
+        graph.set_document_parents("SRS", [])
+        graph.add_item(Item(uid="SRS001", text="Ok", document_prefix="SRS", custom_attributes={"safety_class": "B"}))
+        graph.add_item(Item(uid="SRS002", text="Bad", document_prefix="SRS", custom_attributes={"safety_class": "X"}))
+        graph.add_item(Item(uid="SRS003", text="Unset", document_prefix="SRS"))
+        return dag, graph
+
+    def _attribute_issues(self, dag, graph):
+        return [(i.level, i.uid, i.message) for i in validate(dag, graph) if i.rule == "attributes"]
+
+    def test_reports_schema_violations(self):
+        dag, graph = self._dag_and_graph({"safety_class": {"enum": ["A", "B", "C"], "required": True}})
+
+        assert self._attribute_issues(dag, graph) == [
+            ("error", "SRS002", "attribute 'safety_class' must be one of A, B, C, got 'X'"),
+            ("error", "SRS003", "missing required attribute 'safety_class'"),
+        ]
+
+    def test_documents_without_schema_are_not_checked(self):
+        dag, graph = self._dag_and_graph({})
+        assert self._attribute_issues(dag, graph) == []
+
+    def test_malformed_schema_reported_once(self):
+        dag, graph = self._dag_and_graph({"safety_class": {"type": "enum"}})
+
+        issues = self._attribute_issues(dag, graph)
+
+        assert len(issues) == 1
+        assert issues[0][:2] == ("error", None)
+        assert "invalid attribute schema" in issues[0][2]
+
+    def test_can_be_disabled(self):
+        dag, graph = self._dag_and_graph({"safety_class": {"required": True}})
+        assert not [i for i in validate(dag, graph, check_attributes=False) if i.rule == "attributes"]
+
 
 class TestCheckHeadingLevel:
     def _make_dag(self):
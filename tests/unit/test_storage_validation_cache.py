@@ -0,0 +1,180 @@
+"""Tests for jamb.storage.validation_cache module."""
+
+import json
+import os
+import warnings
+
+import pytest
+
+from jamb.storage import build_traceability_graph, discover_documents
+from jamb.storage.items import compute_content_hash
+from jamb.storage.validation import validate
+from jamb.storage.validation_cache import CACHE_VERSION, ValidationCache
+
+
+def _touch(path, text):
+    """Rewrite *path* and move its mtime forward so the change is detected."""
+    stat = path.stat()
+    path.write_text(text)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """A SYS <- SRS tree with one reviewed and one unreviewed item."""
+    sys_dir = tmp_path / "sys"
+    sys_dir.mkdir()
+    (sys_dir / ".jamb.yml").write_text("settings:\n  digits: 3\n  prefix: SYS\n  sep: ''\n")
+    sys_hash = compute_content_hash({"text": "System req", "header": None, "links": [], "type": "requirement"})
+    (sys_dir / "SYS001.yml").write_text(f"active: true\ntext: System req\nreviewed: {sys_hash}\n")
+    (sys_dir / "SYS002.yml").write_text("active: true\ntext: Other req\n")
+
+    srs_dir = tmp_path / "srs"
+    srs_dir.mkdir()
+    (srs_dir / ".jamb.yml").write_text("settings:\n  digits: 3\n  parents:\n  - SYS\n  prefix: SRS\n  sep: ''\n")
+    (srs_dir / "SRS001.yml").write_text(f"active: true\ntext: Software req\nlinks:\n- SYS001: {sys_hash}\n")
+    (srs_dir / "SRS002.yml").write_text("active: true\ntext: Other software req\nlinks:\n- SYS002\n")
+
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def _run(cache, **kwargs):
+    dag = discover_documents()
+    graph = build_traceability_graph(dag, include_inactive=True, cache=cache)
+    return validate(dag, graph, cache=cache, **kwargs)
+
+
+def _run_cached(**kwargs):
+    cache = ValidationCache.load()
+    issues = _run(cache, **kwargs)
+    cache.save()
+    return cache, issues
+
+
+class TestValidationCache:
+    def test_second_run_reuses_files_and_issues(self, project):
+        first, issues = _run_cached()
+        assert first.files_read == 4
+        assert first.items_checked == 4
+
+        second, cached_issues = _run_cached()
+        assert second.files_read == 0
+        assert second.files_reused == 4
+        assert second.items_checked == 0
+        assert second.items_reused == 4
+        assert cached_issues == issues
+
+    def test_results_match_uncached_run(self, project):
+        _run_cached()
+        _, cached_issues = _run_cached()
+        assert cached_issues == _run(None)
+
+    def test_edited_item_and_linking_items_are_rechecked(self, project):
+        _run_cached()
+        _touch(project / "sys" / "SYS001.yml", "active: true\ntext: Changed req\n")
+
+        cache, issues = _run_cached()
+        assert cache.files_read == 1
+        assert cache.items_checked == 2  # SYS001 and SRS001, which links to it
+        assert issues == _run(None)
+        assert any(i.uid == "SRS001" and "suspect link" in i.message for i in issues)
+
+    def test_removed_item_dropped_from_cache(self, project):
+        _run_cached()
+        (project / "srs" / "SRS002.yml").unlink()
+        _run_cached()
+
+        data = json.loads((project / ".jamb-cache" / "validation.json").read_text())
+        assert "SRS002" not in data["issues"]
+        assert not any(key.endswith("SRS002.yml") for key in data["files"])
+
+    def test_settings_change_discards_issues(self, project):
+        _run_cached()
+        cache, issues = _run_cached(check_suspect=False)
+        assert cache.items_reused == 0
+        assert cache.files_reused == 4
+        assert issues == _run(None, check_suspect=False)
+
+    def test_attribute_changes_are_rechecked(self, project):
+        """Custom attributes are part of the fingerprint, and the schema of the settings."""
+        config = "settings:\n  digits: 3\n  parents:\n  - SYS\n  prefix: SRS\n  sep: ''\n"
+        _touch(project / "srs" / ".jamb.yml", config + "attributes:\n  risk:\n    type: int\n")
+        _run_cached()
+        srs001 = (project / "srs" / "SRS001.yml").read_text()
+        _touch(project / "srs" / "SRS001.yml", srs001 + "risk: high\n")
+
+        cache, issues = _run_cached()
+        assert cache.items_checked == 1
+        assert any(i.uid == "SRS001" and i.rule == "attributes" for i in issues)
+
+        _touch(project / "srs" / ".jamb.yml", config)
+        cache, issues = _run_cached()
+        assert cache.items_reused == 0
+        assert not any(i.rule == "attributes" for i in issues)
+
+    def test_schema_with_dates(self, project):
+        """A schema holding YAML dates can be part of the settings fingerprint."""
+        config = "settings:\n  digits: 3\n  parents:\n  - SYS\n  prefix: SRS\n  sep: ''\n"
+        schema = "attributes:\n  released:\n    type: date\n    enum: [2024-01-01]\n"
+        _touch(project / "srs" / ".jamb.yml", config + schema)
+        _touch(project / "srs" / "SRS002.yml", (project / "srs" / "SRS002.yml").read_text() + "released: 2024-02-01\n")
+
+        _, issues = _run_cached()
+        assert [i.uid for i in issues if i.rule == "attributes"] == ["SRS002"]
+
+        cache, reused = _run_cached()
+        assert cache.items_reused == 4
+        assert reused == issues
+
+        _touch(project / "srs" / ".jamb.yml", config + schema.replace("2024-01-01", "2024-02-01"))
+        cache, issues = _run_cached()
+        assert cache.items_reused == 0
+        assert not any(i.rule == "attributes" for i in issues)
+
+    def test_warnings_replayed_on_reuse(self, project):
+        (project / "srs" / "SRS003.yml").write_text("active: true\ntext: Bad links\nlinks: SYS001\n")
+        for _ in range(2):
+            with warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter("always")
+                _run_cached()
+            assert any("SRS003" in str(w.message) for w in caught)
+
+    def test_non_json_content_not_cached(self, project):
+        (project / "srs" / "SRS003.yml").write_text("active: true\ntext: Dated\nreleased: 2024-01-01\n")
+        _run_cached()
+        cache, _ = _run_cached()
+        assert cache.files_read == 1
+
+    def test_corrupt_cache_file_ignored(self, project):
+        cache_file = project / ".jamb-cache" / "validation.json"
+        cache_file.parent.mkdir()
+        cache_file.write_text("{not json")
+        cache, _ = _run_cached()
+        assert cache.files_read == 4
+        assert json.loads(cache_file.read_text())["version"] == CACHE_VERSION
+
+    def test_outdated_version_ignored(self, tmp_path):
+        cache_file = tmp_path / "validation.json"
+        cache_file.write_text(json.dumps({"version": CACHE_VERSION + 1, "files": {"x": []}}))
+        cache = ValidationCache.load(cache_file)
+        assert cache._files == {}
+
+
+class TestParallelValidation:
+    def test_jobs_match_serial_run(self, project):
+        (project / "srs" / "SRS003.yml").write_text("active: true\ntext: ''\nlinks:\n- SYS009\n")
+        dag = discover_documents()
+        serial = validate(dag, build_traceability_graph(dag, include_inactive=True))
+        graph = build_traceability_graph(dag, include_inactive=True, jobs=2)
+        assert graph.items == build_traceability_graph(dag, include_inactive=True).items
+        assert validate(dag, graph, jobs=2) == serial
+        assert validate(dag, graph, jobs=2, skip_prefixes=["SYS"]) == validate(dag, graph, skip_prefixes=["SYS"])
+
+    def test_jobs_cannot_use_cache(self, project):
+        dag = discover_documents()
+        graph = build_traceability_graph(dag, include_inactive=True)
+        with pytest.raises(ValueError, match="more than one job"):
+            validate(dag, graph, cache=ValidationCache(), jobs=2)
+        with pytest.raises(ValueError, match="more than one job"):
+            build_traceability_graph(dag, cache=ValidationCache(), jobs=2)
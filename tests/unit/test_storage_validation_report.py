@@ -0,0 +1,118 @@
+"""Tests for jamb.storage.validation_report module."""
+
+import json
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+import pytest
+
+from jamb.storage.document_config import DocumentConfig
+from jamb.storage.document_dag import DocumentDAG
+from jamb.storage.validation import ValidationIssue
+from jamb.storage.validation_report import REPORT_FORMATS, SARIF_SCHEMA, IssueWriter, open_issue_writer
+
+
+@pytest.fixture
+def dag(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    dag = DocumentDAG()
+    dag.documents["SRS"] = DocumentConfig(prefix="SRS")
+    dag.document_paths["SRS"] = tmp_path / "srs"
+    return dag
+
+
+def _issues():
+    return [
+        ValidationIssue("error", "SRS001", "SRS", "links to non-existent item: SYS999", rule="links"),
+        ValidationIssue("warning", "SRS002", "SRS", "has not been reviewed <&>", rule="review"),
+        ValidationIssue("warning", None, "SRS", "contains no active items", rule="empty_documents"),
+    ]
+
+
+def _write(report_format, path, dag):
+    with open_issue_writer(report_format, path, dag) as writer:
+        for issue in _issues():
+            writer.write(issue)
+    return writer
+
+
+class TestIssueWriters:
+    def test_json_lines(self, dag, tmp_path):
+        writer = _write("json", tmp_path / "report.json", dag)
+        assert writer.count == 3
+
+        records = [json.loads(line) for line in (tmp_path / "report.json").read_text().splitlines()]
+        assert records[0] == {
+            "level": "error",
+            "uid": "SRS001",
+            "prefix": "SRS",
+            "rule": "links",
+            "message": "links to non-existent item: SYS999",
+            "path": "srs/SRS001.yml",
+        }
+        assert records[2]["path"] == "srs/.jamb.yml"
+
+    def test_sarif(self, dag, tmp_path):
+        _write("sarif", tmp_path / "report.sarif", dag)
+
+        log = json.loads((tmp_path / "report.sarif").read_text())
+        assert log["version"] == "2.1.0"
+        assert log["$schema"] == SARIF_SCHEMA
+        (run,) = log["runs"]
+        assert run["tool"]["driver"]["name"] == "jamb"
+        results = run["results"]
+        assert [r["ruleId"] for r in results] == ["links", "review", "empty_documents"]
+        assert [r["level"] for r in results] == ["error", "warning", "warning"]
+        location = results[0]["locations"][0]
+        assert location["physicalLocation"]["artifactLocation"]["uri"] == "srs/SRS001.yml"
+        assert location["logicalLocations"][0]["fullyQualifiedName"] == "SRS:SRS001"
+
+    def test_sarif_without_issues_is_valid(self, dag, tmp_path):
+        with open_issue_writer("sarif", tmp_path / "report.sarif", dag):
+            pass
+        log = json.loads((tmp_path / "report.sarif").read_text())
+        assert log["runs"][0]["results"] == []
+
+    def test_junit(self, dag, tmp_path):
+        _write("junit", tmp_path / "report.xml", dag)
+
+        root = ET.parse(tmp_path / "report.xml").getroot()
+        cases = root.findall("testsuite/testcase")
+        assert [c.get("name") for c in cases] == ["SRS:SRS001", "SRS:SRS002", "SRS"]
+        assert cases[0].get("classname") == "jamb.validate.links"
+        assert cases[0].get("file") == "srs/SRS001.yml"
+        assert cases[0].find("failure") is not None
+        assert cases[1].find("failure") is None
+        assert "<&>" in cases[1].find("system-out").text
+
+    def test_without_dag_issues_have_no_path(self, tmp_path):
+        _write("json", tmp_path / "report.json", None)
+        records = [json.loads(line) for line in (tmp_path / "report.json").read_text().splitlines()]
+        assert all(r["path"] is None for r in records)
+
+    def test_issues_are_flushed_as_written(self, dag, tmp_path):
+        writer = open_issue_writer("json", tmp_path / "report.json", dag)
+        try:
+            writer.write(_issues()[0])
+            assert json.loads((tmp_path / "report.json").read_text())["uid"] == "SRS001"
+        finally:
+            writer.close()
+
+    def test_close_is_idempotent(self, dag, tmp_path):
+        writer = _write("junit", tmp_path / "report.xml", dag)
+        writer.close()
+        assert (tmp_path / "report.xml").read_text().count("</testsuites>") == 1
+
+    def test_every_format_has_a_writer(self, dag, tmp_path):
+        for report_format in REPORT_FORMATS:
+            _write(report_format, tmp_path / f"report.{report_format}", dag)
+
+    def test_base_class_is_abstract(self, tmp_path):
+        with pytest.raises(TypeError, match="_write_issue"):
+            IssueWriter(tmp_path / "report.txt")  # type: ignore[abstract]
+        assert not (tmp_path / "report.txt").exists()
+
+    def test_unknown_format(self, tmp_path):
+        with pytest.raises(ValueError, match="Unknown report format 'html'"):
+            open_issue_writer("html", tmp_path / "report.html")
+        assert not Path(tmp_path / "report.html").exists()
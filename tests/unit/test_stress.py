@@ -1,13 +1,18 @@
 """Stress and scale tests for jamb."""
 
+import time
 from pathlib import Path
 
 import yaml
 
+from jamb.core.cycles import find_cycles
 from jamb.core.models import Item, TraceabilityGraph
+from jamb.storage.changes import suspect_impact
 from jamb.storage.document_config import DocumentConfig
 from jamb.storage.document_dag import DocumentDAG
-from jamb.storage.items import read_document_items, write_item
+from jamb.storage.items import compute_content_hash, read_document_items, write_item
+from jamb.storage.test_index import index_source
+from jamb.storage.validation import validate
 
 
 class TestStress:
@@ -83,3 +88,109 @@ class TestStress:
         for p in prefixes:
             items = graph.get_items_by_document(p)
             assert len(items) == 100
+
+    def test_validate_50k_items(self):
+        """Validation of 50,000 reviewed, linked items visits each item once."""
+        dag = DocumentDAG()
+        dag.documents["SYS"] = DocumentConfig(prefix="SYS", parents=[], digits=5)
+        dag.documents["SRS"] = DocumentConfig(prefix="SRS", parents=["SYS"], digits=5)
+        graph = TraceabilityGraph()
+        graph.set_document_parents("SYS", [])
+        graph.set_document_parents("SRS", ["SYS"])
+        for prefix, count in (("SYS", 10_000), ("SRS", 40_000)):
+            for i in range(count):
+                links = [f"SYS{(i * 7 + k) % 10_000:05d}" for k in range(2)] if prefix == "SRS" else []
+                item = Item(uid=f"{prefix}{i:05d}", text=f"Requirement {i}", document_prefix=prefix, links=links)
+                item.reviewed = compute_content_hash(
+                    {"text": item.text, "header": item.header, "links": item.links, "type": item.type}
+                )
+                item.link_hashes = {}
+                graph.add_item(item)
+
+        start = time.perf_counter()
+        issues = validate(dag, graph)
+        elapsed = time.perf_counter() - start
+
+        # Every SRS link lacks a stored hash; nothing else is wrong
+        assert len(issues) == 80_000
+        assert all("has no stored hash" in issue.message for issue in issues)
+        assert elapsed < 30
+
+    def test_find_cycles_100k_links(self):
+        """Cycle detection on 50k items with 100k links runs in linear time."""
+        n = 50_000
+        # A chain whose every block of 100 items links back to the block's
+        # first item, plus 100 two-item cycles on the side
+        links: dict[str, list[str]] = {}
+        for i in range(n):
+            links[f"I{i}"] = [f"I{i + 1}"] if i + 1 < n else []
+            links[f"I{i}"].append(f"I{i - i % 100}" if i % 100 == 99 else f"J{i % 100}")
+        for j in range(100):
+            links[f"J{j}"] = [f"K{j}"]
+            links[f"K{j}"] = [f"J{j}"]
+        assert sum(len(v) for v in links.values()) >= 100_000
+
+        start = time.perf_counter()
+        cycles = find_cycles(links, links.__getitem__)
+        elapsed = time.perf_counter() - start
+
+        assert len(cycles) == n // 100 + 100
+        assert elapsed < 10
+
+    def test_suspect_impact_100k_items(self):
+        """Suspect impact of changed roots over 100k items runs in linear time."""
+        graph = TraceabilityGraph()
+        # 10 levels of 10k items, each linking to two items of the level above
+        width, levels = 10_000, 10
+        for level in range(levels):
+            for i in range(width):
+                links = [] if level == 0 else [f"L{level - 1}-{i}", f"L{level - 1}-{(i + 1) % width}"]
+                graph.add_item(Item(uid=f"L{level}-{i}", text=f"Item {i}", document_prefix=f"L{level}", links=links))
+        # Every level 1 link was verified before its level 0 target changed
+        for i in range(width):
+            item = graph.items[f"L1-{i}"]
+            item.link_hashes = dict.fromkeys(item.links, "stale")
+
+        start = time.perf_counter()
+        impacted = suspect_impact(graph)
+        elapsed = time.perf_counter() - start
+
+        assert sum(1 for entry in impacted if entry.depth == 0) == width
+        assert [entry.depth for entry in impacted] == sorted(entry.depth for entry in impacted)
+        assert len(impacted) == width * levels
+        assert elapsed < 10
+
+    def test_index_5000_test_file(self, tmp_path):
+        """Indexing a test file takes time linear in its number of tests."""
+
+        def source(count):
+            classes = [
+                f"class TestGroup{c}:\n"
+                + "".join(
+                    f"    @pytest.mark.requirement('SRS{i:05d}', 'SYS{i:05d}')\n"
+                    f"    @pytest.mark.tc_id('TC{i:05d}')\n"
+                    f"    def test_{i:05d}(self):\n"
+                    f"        assert {i} == {i}\n\n"
+                    for i in range(c * 100, (c + 1) * 100)
+                )
+                for c in range(count // 100)
+            ]
+            return "import pytest\n\n\n" + "\n".join(classes)
+
+        def best_time(text):
+            times = []
+            for _ in range(3):
+                start = time.perf_counter()
+                indexed = index_source(text, tmp_path / "test_big.py")
+                times.append(time.perf_counter() - start)
+            return min(times), indexed
+
+        small, _ = best_time(source(1_000))
+        elapsed, indexed = best_time(source(5_000))
+
+        assert len(indexed.references) == 10_000
+        assert len(indexed.functions) == 5_000
+        assert all(uid[3:] == name[5:] for _, _, _, uid, name in indexed.references)
+        # 5x the tests: about 5x the time, where a quadratic lookup takes 25x
+        assert elapsed < small * 12
+        assert elapsed < 10
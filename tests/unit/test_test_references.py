@@ -2,11 +2,13 @@
 
 import pytest
 
-from jamb.storage.test_references import (
-    RequirementReference,
+from jamb.storage.test_index import (
     _find_enclosing_function,
     _find_uid_positions_in_source,
     _is_requirement_marker,
+)
+from jamb.storage.test_references import (
+    RequirementReference,
     detect_reference_collisions,
     find_orphaned_references,
     find_test_references,